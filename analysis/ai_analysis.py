@@ -2,89 +2,64 @@
 AI 분석 모듈
 """
 
-import json
-import base64
-import requests
+import time
+import threading
 from datetime import datetime
-from typing import Optional, Dict, Any, List
-from .models import TradingDecision
+from typing import Optional, Dict, Any, List, Callable, Tuple
+from .structured_output import trading_decision_schema, decode_decision
+from .ollama_client import GenerateResult, get_ollama_client
+from .model_router import get_model_router
+from .prompt_builder import build_decision_prompt
+from .decision_cache import cached_generation, market_fingerprint, image_dhash
+from .inference import run_with_deadline
 from config.settings import (
-    OLLAMA_BASE_URL, OLLAMA_MODEL, OLLAMA_VISION_MODEL, VISION_API_TIMEOUT, VISION_API_MAX_TOKENS, 
-    VISION_API_TEMPERATURE, STRATEGY_IMPROVEMENT_ENABLED
+    STRUCTURED_OUTPUT_MAX_TOKENS,
+    VISION_API_TEMPERATURE, STRATEGY_IMPROVEMENT_ENABLED, INFERENCE_DEADLINE
 )
 
-def call_ollama_api(prompt: str, model: str = None, temperature: float = 0.7, max_tokens: int = 1000) -> str:
-    """Ollama API 호출"""
+def call_ollama_api(prompt: str, model: str = None, temperature: float = 0.7, max_tokens: int = 1000,
+                    stop_on_json: bool = False, json_format: Any = None,
+                    cancel: Optional[threading.Event] = None, deadline: float = INFERENCE_DEADLINE,
+                    on_result: Optional[Callable[[GenerateResult], None]] = None) -> str:
+    """Ollama API 호출 (공용 세션 스트리밍, stop_on_json이면 JSON 객체 완성 시 조기 종료, json_format은 응답 스키마, 실패/취소 시 빈 문자열)"""
+    options = dict(temperature=temperature, max_tokens=max_tokens, stop_on_json=stop_on_json,
+                   json_format=json_format, cancel=cancel)
     if model is None:
-        model = OLLAMA_MODEL
-    
-    url = f"{OLLAMA_BASE_URL}/api/generate"
-    
-    payload = {
-        "model": model,
-        "prompt": prompt,
-        "stream": False,
-        "options": {
-            "temperature": temperature,
-            "num_predict": max_tokens
-        }
-    }
-    
-    try:
-        response = requests.post(url, json=payload, timeout=VISION_API_TIMEOUT)
-        response.raise_for_status()
-        
-        result = response.json()
-        return result.get('response', '')
-        
-    except Exception as e:
-        print(f"❌ Ollama API 호출 중 오류: {e}")
-        return ""
+        # 모델을 지정하지 않으면 라우터가 deadline 안에 끝낼 수 있는 후보를 선택
+        result = get_model_router().generate('text', prompt, deadline=deadline, **options)
+    else:
+        result = get_ollama_client().generate(prompt, model=model, **options)
+    if on_result is not None:
+        on_result(result)  # 라우터가 실제로 응답한 모델 확인용
+    return "" if result.error else result.text
 
-def call_ollama_vision_api(prompt: str, image_base64: str, model: str = None, temperature: float = 0.7, max_tokens: int = 1000) -> str:
-    """Ollama Vision API 호출 (이미지 분석)"""
-    if model is None:
-        model = OLLAMA_VISION_MODEL
-    
-    url = f"{OLLAMA_BASE_URL}/api/generate"
-    
-    # 이미지 데이터 준비 (base64 디코딩)
-    import base64
-    try:
-        image_bytes = base64.b64decode(image_base64)
-        image_data = base64.b64encode(image_bytes).decode('utf-8')
-    except Exception as e:
-        print(f"⚠️ 이미지 데이터 처리 중 오류: {e}")
+def call_ollama_vision_api(prompt: str, image_base64: str, model: str = None, temperature: float = 0.7,
+                           max_tokens: int = 1000, stop_on_json: bool = False, json_format: Any = None,
+                           cancel: Optional[threading.Event] = None, deadline: float = INFERENCE_DEADLINE,
+                           on_result: Optional[Callable[[GenerateResult], None]] = None) -> str:
+    """Ollama Vision API 호출 (이미지 분석, 모델 미지정 시 라우터가 Vision 후보 중 선택)"""
+    # 이미지는 이미 base64로 인코딩된 문자열을 그대로 전달 (재인코딩 없음)
+    if not image_base64:
+        print("⚠️ 이미지 데이터가 없습니다")
         return ""
     
-    payload = {
-        "model": model,
-        "prompt": prompt,
-        "images": [image_data],
-        "stream": False,
-        "options": {
-            "temperature": temperature,
-            "num_predict": max_tokens
-        }
-    }
-    
-    try:
-        response = requests.post(url, json=payload, timeout=VISION_API_TIMEOUT)
-        response.raise_for_status()
-        
-        result = response.json()
-        return result.get('response', '')
-        
-    except Exception as e:
-        print(f"❌ Ollama Vision API 호출 중 오류: {e}")
-        return ""
+    options = dict(images=[image_base64], temperature=temperature, max_tokens=max_tokens,
+                   stop_on_json=stop_on_json, json_format=json_format, cancel=cancel)
+    if model is None:
+        result = get_model_router().generate('vision', prompt, deadline=deadline, **options)
+    else:
+        result = get_ollama_client().generate(prompt, model=model, **options)
+    if on_result is not None:
+        on_result(result)
+    return "" if result.error else result.text
 
-def create_market_analysis_data(daily_df, minute_df, current_price, orderbook, fear_greed_data, analyzed_news):
-    """AI 분석용 시장 데이터 생성"""
+def create_market_analysis_data(daily_df, minute_df, current_price, orderbook, fear_greed_data, analyzed_news,
+                                symbol: Optional[str] = None):
+    """AI 분석용 시장 데이터 생성 (symbol을 주면 프롬프트/결정 캐시에서 심볼 구분)"""
     # 최근 기술적 지표 요약
     technical_summary = {}
     
-    if not daily_df.empty:
+    if daily_df is not None and not daily_df.empty:
         # 일봉 데이터의 최근 기술적 지표
         latest_daily = daily_df.iloc[-1] if len(daily_df) > 0 else None
         if latest_daily is not None:
@@ -108,7 +83,7 @@ def create_market_analysis_data(daily_df, minute_df, current_price, orderbook, f
                 'roc': float(latest_daily.get('ROC', 0))
             }
     
-    if not minute_df.empty:
+    if minute_df is not None and not minute_df.empty:
         # 분봉 데이터의 최근 기술적 지표
         latest_minute = minute_df.iloc[-1] if len(minute_df) > 0 else None
         if latest_minute is not None:
@@ -141,14 +116,16 @@ def create_market_analysis_data(daily_df, minute_df, current_price, orderbook, f
     
     analysis_data = {
         "current_price": current_price,
-        "daily_data": daily_df.to_dict('records') if not daily_df.empty else [],
-        "minute_data": minute_df.tail(100).to_dict('records') if not minute_df.empty else [],
+        "daily_data": daily_df.to_dict('records') if daily_df is not None and not daily_df.empty else [],
+        "minute_data": minute_df.tail(100).to_dict('records') if minute_df is not None and not minute_df.empty else [],
         "technical_indicators": technical_summary,
         "fear_greed_index": fear_greed_data,
         "news_analysis": news_summary,
         "orderbook": orderbook if orderbook and isinstance(orderbook, dict) else None,
         "analysis_time": datetime.now().isoformat()
     }
+    if symbol:
+        analysis_data["symbol"] = symbol
     
     return analysis_data
 
@@ -182,11 +159,15 @@ def analyze_market_sentiment(market_data: Dict[str, Any]) -> Dict[str, Any]:
         - 신뢰도: (0.0-1.0)
         """
         
-        # Ollama API 호출
-        analysis_text = call_ollama_api(
-            prompt=analysis_prompt,
-            temperature=0.7,
-            max_tokens=500
+        # Ollama API 호출 (양자화한 시장 상태가 같으면 캐시된 응답 사용)
+        def request_sentiment():
+            answered = []
+            text = call_ollama_api(prompt=analysis_prompt, temperature=0.7, max_tokens=500,
+                                   on_result=lambda result: answered.append(result.model))
+            return text, answered[0] if answered else None
+        
+        analysis_text = cached_model_response(
+            'sentiment', 'text', market_fingerprint(market_data), request_sentiment
         )
         
         if not analysis_text:
@@ -323,9 +304,7 @@ def generate_improvement_suggestions(performance_analysis: Dict[str, Any]) -> Li
 def get_active_strategy_improvements() -> List[Dict[str, Any]]:
     """활성화된 전략 개선 제안 조회"""
     try:
-        from database.connection import get_db_connection
-        connection = get_db_connection()
-        cursor = connection.cursor(dictionary=True)
+        from database.connection import pooled_connection
         
         query = """
         SELECT * FROM strategy_improvements 
@@ -334,10 +313,11 @@ def get_active_strategy_improvements() -> List[Dict[str, Any]]:
         LIMIT 10
         """
         
-        cursor.execute(query)
-        improvements = cursor.fetchall()
-        cursor.close()
-        connection.close()
+        with pooled_connection() as connection:
+            cursor = connection.cursor(dictionary=True)
+            cursor.execute(query)
+            improvements = cursor.fetchall()
+            cursor.close()
         
         return improvements
         
@@ -388,62 +368,168 @@ def apply_strategy_improvements(decision: Dict[str, Any], improvements: List[Dic
     
     return decision
 
-def ai_trading_decision_with_indicators(market_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-    """기술적 지표를 포함한 AI 매매 결정 함수"""
-    print("=== AI 매매 결정 분석 중 (기술적 지표 포함) ===")
-    
-    # 간소화된 시스템 메시지
-    system_message = """
-    You are a Bitcoin trading expert. Analyze the market data and provide a trading decision.
+TEXT_SYSTEM_MESSAGE = """
+    You are a Bitcoin trading expert. Analyze the market summary and provide a trading decision.
     Focus on: RSI, MACD, Bollinger Bands, Fear & Greed Index, news sentiment.
-    Decision: buy/sell/hold with brief reasoning.
+    Respond only with a JSON object matching the TradingDecision schema (decision: buy/sell/hold, confidence 0.0-1.0, brief reason).
+    """
+
+VISION_PROMPT = """
+            비트코인 차트를 분석하여 매매 결정을 JSON으로 제공해주세요.
+            decision(buy/sell/hold), confidence(0.0-1.0), risk_level(low/medium/high), expected_price_range,
+            key_indicators, chart_analysis(price_action, support_level, resistance_level, chart_pattern, volume_analysis)를 포함하고
+            reason은 한국어로 간단히 작성해주세요.
+            """
+
+def request_structured_decision(prompt: str, image_base64: Optional[str] = None,
+                                cancel: Optional[threading.Event] = None,
+                                deadline: float = INFERENCE_DEADLINE) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """TradingDecision 스키마로 제한한 모델 응답과 응답한 모델 (검증 실패 시 한 번 수정 요청, 그래도 실패하면 결정은 None)"""
+    schema = trading_decision_schema()
+    started = time.perf_counter()
+    answered: List[str] = []
+    
+    def remember(result: GenerateResult) -> None:
+        answered.append(result.model)
+    
+    if image_base64:
+        raw = call_ollama_vision_api(prompt=prompt, image_base64=image_base64, temperature=0.2,
+                                     max_tokens=STRUCTURED_OUTPUT_MAX_TOKENS, stop_on_json=True,
+                                     json_format=schema, cancel=cancel, deadline=deadline, on_result=remember)
+    else:
+        raw = call_ollama_api(prompt=prompt, temperature=VISION_API_TEMPERATURE,
+                              max_tokens=STRUCTURED_OUTPUT_MAX_TOKENS, stop_on_json=True,
+                              json_format=schema, cancel=cancel, deadline=deadline, on_result=remember)
+    model = answered[0] if answered else None
+    if not raw:
+        return None, model
+    
+    # 수정 요청은 이미지 없이 짧은 프롬프트로 텍스트 모델에 한 번만 보냄 (남은 마감 시간 안에서)
+    def repair(repair_prompt: str) -> str:
+        remaining = max(0.0, deadline - (time.perf_counter() - started))
+        return call_ollama_api(prompt=repair_prompt, temperature=0.0, max_tokens=STRUCTURED_OUTPUT_MAX_TOKENS,
+                               stop_on_json=True, json_format=schema, cancel=cancel, deadline=remaining)
+    
+    decision = decode_decision(raw, repair=repair)
+    return (decision.model_dump() if decision is not None else None), model
+
+def cached_model_response(kind: str, task: str, fingerprint: Dict[str, Any],
+                          request: Callable[[], Tuple[Any, Optional[str]]]) -> Any:
+    """
+    LLM 응답 캐시를 거쳐 모델 호출 (request는 (응답, 응답한 모델) 반환)
+
+    캐시 키는 라우터의 task 1순위 후보 모델 기준이며, 라우터가 대체 모델로 응답하면
+    그 키로 저장하지 않아 TTL 동안 품질 낮은 응답이 재사용되지 않습니다.
     """
+    model = get_model_router().primary(task)
+    answered: Dict[str, Optional[str]] = {}
+    
+    def compute() -> Any:
+        value, answered['model'] = request()
+        if value and answered['model'] != model:
+            print(f"ℹ️ 대체 모델 응답은 캐시하지 않음 ({kind}: {answered['model']})")
+        return value
+    
+    return cached_generation(kind, model, fingerprint, compute,
+                             cacheable=lambda value: answered.get('model') == model)
+
+def request_text_decision(market_data: Dict[str, Any], cancel: Optional[threading.Event] = None,
+                          deadline: float = INFERENCE_DEADLINE) -> Optional[Dict[str, Any]]:
+    """텍스트 모델 매매 결정 (캐시 적중 시 호출 생략, 실패/취소 시 None)"""
+    # 전체 market_data 대신 토큰 예산 안의 요약만 전달 (프롬프트 평가 시간 단축)
+    built = build_decision_prompt(TEXT_SYSTEM_MESSAGE, market_data)
+    print(f"📝 프롬프트 {built.tokens} tokens (섹션: {built.section_tokens}"
+          f"{', 잘림: ' + ', '.join(built.truncated) if built.truncated else ''})")
+    
+    return cached_model_response(
+        'decision', 'text', market_fingerprint(market_data),
+        lambda: request_structured_decision(built.text, cancel=cancel, deadline=deadline)
+    )
+
+def request_vision_decision(chart_image_base64: str, current_price: Optional[float] = None,
+                            cancel: Optional[threading.Event] = None,
+                            deadline: float = INFERENCE_DEADLINE) -> Optional[Dict[str, Any]]:
+    """Vision 모델 차트 분석 매매 결정 (응답이 없거나 검증 실패 시 None)"""
+    prompt = VISION_PROMPT
+    if current_price:
+        prompt += f"\n현재 가격: {current_price:,.0f}원"
+    
+    def request():
+        return request_structured_decision(prompt, image_base64=chart_image_base64, cancel=cancel, deadline=deadline)
+    
+    # 차트 지각 해시가 같으면 이전 분석 재사용
+    chart_hash = image_dhash(chart_image_base64)
+    if chart_hash:
+        vision_decision = cached_model_response('vision_decision', 'vision', {'chart': chart_hash}, request)
+    else:
+        vision_decision, _ = request()
+    
+    print(f"🤖 Vision API 분석 결과: {vision_decision}")
+    return vision_decision
+
+def decision_signal(decision: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """TradingDecision을 integrate_vision_and_market_analysis 입력 형식(한글 신호/신뢰도 단계)으로 변환"""
+    if not decision:
+        return None
+    confidence = decision.get('confidence', 0.5)
+    chart = decision.get('chart_analysis') or {}
+    return {
+        "trend": {"bullish": "상승", "bearish": "하락"}.get(chart.get('price_action'), "횡보"),
+        "trading_signal": {"buy": "매수", "sell": "매도"}.get(decision.get('decision'), "보유"),
+        "confidence": "높음" if confidence >= 0.7 else "낮음" if confidence < 0.4 else "중간",
+        "support_level": chart.get('support_level'),
+        "resistance_level": chart.get('resistance_level'),
+        "analysis_summary": decision.get('reason', ''),
+    }
+
+def build_text_decision(market_data: Dict[str, Any], text_decision: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """텍스트 모델 결정 반환 (없으면 공포탐욕지수 기반 기본 분석으로 보유 결정)"""
+    if text_decision:
+        print(f"🤖 AI 분석 결과: {text_decision.get('decision')} ({text_decision.get('confidence')}) {text_decision.get('reason')}")
+        return dict(text_decision)
+    
+    # API 호출/검증 실패 시 기본 분석 사용
+    current_price = market_data.get('current_price', 0)
+    fear_greed_data = market_data.get('fear_greed_index', {})
+    fear_greed = fear_greed_data.get('value', 50) if isinstance(fear_greed_data, dict) else 50
+    
+    if fear_greed > 70:
+        analysis_text = f"Fear & Greed Index가 {fear_greed}로 높음. 과매수 상태일 수 있으므로 보수적 접근 권장."
+    elif fear_greed < 30:
+        analysis_text = f"Fear & Greed Index가 {fear_greed}로 낮음. 과매도 상태일 수 있으므로 매수 기회 고려."
+    else:
+        analysis_text = f"Fear & Greed Index가 {fear_greed}로 중립. 현재 가격 {current_price:,}원 기준으로 관망."
+    
+    print(f"🤖 AI 분석 결과: {analysis_text}")
+    
+    # 기본 결정 구조 생성
+    return {
+        "decision": "hold",  # 기본값
+        "confidence": 0.5,
+        "risk_level": "medium",
+        "expected_price_range": {
+            "min": market_data.get('current_price', 0) * 0.95,
+            "max": market_data.get('current_price', 0) * 1.05
+        },
+        "key_indicators": {
+            "rsi_signal": "neutral",
+            "macd_signal": "neutral",
+            "bb_signal": "neutral",
+            "trend_strength": "neutral",
+            "market_sentiment": "neutral",
+            "news_sentiment": "neutral"
+        },
+        "reason": analysis_text
+    }
+
+def ai_trading_decision_with_indicators(market_data: Dict[str, Any],
+                                        deadline: float = INFERENCE_DEADLINE) -> Optional[Dict[str, Any]]:
+    """기술적 지표를 포함한 AI 매매 결정 함수 (deadline초 안에 모델 응답이 없으면 기본 분석)"""
+    print("=== AI 매매 결정 분석 중 (기술적 지표 포함) ===")
     
     try:
         # Ollama API 호출 (타임아웃 시 기본 분석 사용)
-        prompt = f"{system_message}\n\nAnalyze Bitcoin market data: {json.dumps(market_data, default=str)}"
-        
-        analysis_text = call_ollama_api(
-            prompt=prompt,
-            temperature=VISION_API_TEMPERATURE,
-            max_tokens=VISION_API_MAX_TOKENS
-        )
-        
-        if not analysis_text:
-            # API 호출 실패 시 기본 분석 사용
-            current_price = market_data.get('current_price', 0)
-            fear_greed_data = market_data.get('fear_greed_index', {})
-            fear_greed = fear_greed_data.get('value', 50) if isinstance(fear_greed_data, dict) else 50
-            rsi = market_data.get('technical_indicators', {}).get('daily_indicators', {}).get('rsi', 50)
-            
-            if fear_greed > 70:
-                analysis_text = f"Fear & Greed Index가 {fear_greed}로 높음. 과매수 상태일 수 있으므로 보수적 접근 권장."
-            elif fear_greed < 30:
-                analysis_text = f"Fear & Greed Index가 {fear_greed}로 낮음. 과매도 상태일 수 있으므로 매수 기회 고려."
-            else:
-                analysis_text = f"Fear & Greed Index가 {fear_greed}로 중립. 현재 가격 {current_price:,}원 기준으로 관망."
-        
-        print(f"🤖 AI 분석 결과: {analysis_text}")
-        
-        # 기본 결정 구조 생성
-        decision = {
-            "decision": "hold",  # 기본값
-            "confidence": 0.5,
-            "risk_level": "medium",
-            "expected_price_range": {
-                "min": market_data.get('current_price', 0) * 0.95,
-                "max": market_data.get('current_price', 0) * 1.05
-            },
-            "key_indicators": {
-                "rsi_signal": "neutral",
-                "macd_signal": "neutral",
-                "bb_signal": "neutral",
-                "trend_strength": "neutral",
-                "market_sentiment": "neutral",
-                "news_sentiment": "neutral"
-            },
-            "reason": analysis_text
-        }
+        decision = build_text_decision(market_data, request_text_decision(market_data, deadline=deadline))
         
         # 전략 개선 적용
         if STRATEGY_IMPROVEMENT_ENABLED:
@@ -462,69 +548,33 @@ def ai_trading_decision_with_indicators(market_data: Dict[str, Any]) -> Optional
         print(f"❌ AI 분석 중 오류 발생: {e}")
         return None
 
-def ai_trading_decision_with_vision(market_data: Dict[str, Any], chart_image_base64: Optional[str] = None) -> Optional[Dict[str, Any]]:
-    """Vision API를 사용한 AI 매매 결정 함수 (개선된 버전)"""
-    print("=== AI 매매 결정 분석 중 (Vision API 포함) ===")
+def ai_trading_decision_with_vision(market_data: Dict[str, Any], chart_image_base64: Optional[str] = None,
+                                    deadline: float = INFERENCE_DEADLINE) -> Optional[Dict[str, Any]]:
+    """Vision 모델과 텍스트 모델을 공통 마감 시간 안에서 병렬 실행한 AI 매매 결정 함수"""
+    print("=== AI 매매 결정 분석 중 (Vision + 텍스트 모델 병렬) ===")
+    
+    # 라우터도 같은 마감 시간으로 모델을 고르도록 전달 (마감 초과 시 취소)
+    tasks = {'text': lambda cancel: request_text_decision(market_data, cancel, deadline)}
+    if chart_image_base64:
+        tasks['vision'] = lambda cancel: request_vision_decision(
+            chart_image_base64, market_data.get('current_price'), cancel, deadline
+        )
+    
+    started = time.perf_counter()
+    outcomes = run_with_deadline(tasks, deadline)
+    timings = ', '.join(
+        f"{name} {'마감 초과' if outcome.timed_out else f'{outcome.seconds:.1f}초'}{' (오류)' if outcome.error else ''}"
+        for name, outcome in outcomes.items()
+    )
+    print(f"⏱️ 병렬 추론 완료: {time.perf_counter() - started:.1f}초 ({timings})")
+    
+    vision_outcome = outcomes.get('vision')
+    vision_decision = vision_outcome.value if vision_outcome is not None and vision_outcome.ok else None
+    text_decision = outcomes['text'].value if outcomes['text'].ok else None
+    if not chart_image_base64:
+        print("⚠️ 차트 이미지 없음 (텍스트 모델 결과만 사용)")
     
     try:
-        if chart_image_base64:
-            # Vision API를 사용한 차트 분석
-            vision_prompt = """
-            비트코인 차트를 분석하여 다음 정보를 JSON 형태로 제공해주세요:
-            
-            {
-                "trend": "상승/하락/횡보",
-                "bollinger_position": "상단/중간/하단",
-                "support_level": "주요 지지선 위치",
-                "resistance_level": "주요 저항선 위치",
-                "volume_pattern": "거래량 패턴",
-                "trading_signal": "매수/매도/보유",
-                "confidence": "높음/중간/낮음",
-                "analysis_summary": "간단한 분석 요약"
-            }
-            
-            한국어로 응답해주세요.
-            """
-            
-            vision_analysis = call_ollama_vision_api(
-                prompt=vision_prompt,
-                image_base64=chart_image_base64,
-                temperature=0.2,
-                max_tokens=300
-            )
-            
-            print(f"🤖 Vision API 분석 결과: {vision_analysis}")
-            
-            # Vision 분석 결과 파싱 시도
-            try:
-                import json
-                # JSON 형태가 아닌 경우 텍스트에서 키워드 추출
-                if vision_analysis and '{' in vision_analysis and '}' in vision_analysis:
-                    # JSON 부분 추출 시도
-                    start = vision_analysis.find('{')
-                    end = vision_analysis.rfind('}') + 1
-                    json_str = vision_analysis[start:end]
-                    vision_data = json.loads(json_str)
-                else:
-                    # 텍스트에서 키워드 추출
-                    vision_data = parse_vision_text(vision_analysis)
-            except:
-                # 파싱 실패 시 기본값 사용
-                vision_data = {
-                    "trend": "횡보",
-                    "trading_signal": "보유",
-                    "confidence": "중간",
-                    "analysis_summary": vision_analysis or "차트 분석 완료"
-                }
-        else:
-            # 이미지가 없는 경우 기본 분석
-            vision_data = {
-                "trend": "횡보",
-                "trading_signal": "보유",
-                "confidence": "중간",
-                "analysis_summary": "차트 이미지 없음"
-            }
-        
         # 시장 데이터 분석
         current_price = market_data.get('current_price', 0)
         fear_greed_data = market_data.get('fear_greed_index', {})
@@ -541,8 +591,12 @@ def ai_trading_decision_with_vision(market_data: Dict[str, Any], chart_image_bas
         # 종합 분석
         market_analysis = analyze_market_indicators(rsi, macd, bb_position, fear_greed)
         
-        # Vision 분석과 시장 데이터 통합
-        final_decision = integrate_vision_and_market_analysis(vision_data, market_analysis, current_price)
+        # Vision/텍스트 모델 신호를 합친 뒤 시장 데이터와 통합
+        model_signal = merge_model_signals(decision_signal(vision_decision), decision_signal(text_decision))
+        final_decision = integrate_vision_and_market_analysis(model_signal, market_analysis, current_price)
+        if text_decision:
+            final_decision['text_analysis'] = text_decision.get('reason', '')
+            final_decision['reason'] += f" | Text: {text_decision.get('decision')} - {text_decision.get('reason', '')}"
         
         print(f"🎯 최종 매매 결정: {final_decision['decision']}")
         print(f"📊 신뢰도: {final_decision['confidence']}")
@@ -552,8 +606,40 @@ def ai_trading_decision_with_vision(market_data: Dict[str, Any], chart_image_bas
             
     except Exception as e:
         print(f"❌ Vision API 분석 중 오류 발생: {e}")
-        # 오류 발생 시 기본 분석 사용
-        return ai_trading_decision_with_indicators(market_data)
+        # 오류 발생 시 이미 받은 텍스트 모델 결정 사용 (모델 재호출 없음)
+        return build_text_decision(market_data, text_decision)
+
+def merge_model_signals(vision_signal: Optional[Dict[str, Any]], text_signal: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Vision 모델 신호와 텍스트 모델 신호(decision_signal 형식)를 하나로 통합
+
+    한쪽만 있으면 그 결과를 사용합니다. 같은 방향이면 신뢰도를 한 단계 올리고,
+    반대 방향이면 보유(낮음), Vision이 보유인데 텍스트 모델만 방향을 제시하면 그 방향을 한 단계 낮은 신뢰도로 사용합니다.
+    """
+    if vision_signal is None and text_signal is None:
+        return {"trend": "횡보", "trading_signal": "보유", "confidence": "중간", "analysis_summary": "모델 응답 없음"}
+    if text_signal is None:
+        return vision_signal
+    if vision_signal is None:
+        return text_signal
+    
+    levels = ["낮음", "중간", "높음"]
+    merged = dict(vision_signal)
+    vision_direction = vision_signal.get('trading_signal', '보유')
+    text_direction = text_signal.get('trading_signal', '보유')
+    level = levels.index(vision_signal.get('confidence')) if vision_signal.get('confidence') in levels else 1
+    
+    if vision_direction == text_direction:
+        if vision_direction != '보유':
+            level = min(level + 1, 2)
+    elif vision_direction == '보유':
+        merged['trading_signal'] = text_direction
+        level = max(level - 1, 0)
+    elif text_direction != '보유':
+        merged['trading_signal'] = '보유'
+        level = 0
+    merged['confidence'] = levels[level]
+    return merged
 
 def parse_vision_text(vision_text: str) -> Dict[str, str]:
     """Vision 분석 텍스트에서 키워드 추출"""
@@ -0,0 +1,217 @@
+"""
+LLM 응답 캐시 모듈
+시장 상태를 양자화한 특징(fingerprint)을 키로 Ollama 응답을 캐시합니다.
+
+- 특징: RSI/Stochastic/MACD/볼린저 위치/공포탐욕지수/뉴스 감정/가격을 구간화, 차트는 dHash
+- 사이클 간 시장 상태가 사실상 같으면 10~300초 걸리는 모델 호출을 생략
+- TTL + LRU 제거, CACHE_DIR 아래 JSON 파일로 저장하여 재시작 후에도 사용
+"""
+
+import io
+import os
+import json
+import math
+import time
+import base64
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Union
+from PIL import Image
+from utils.cache import CacheEntry
+from config.settings import (
+    CACHE_DIR, LLM_CACHE_ENABLED, LLM_CACHE_TTL, LLM_CACHE_MAX_ENTRIES, LLM_CACHE_FILE, LLM_CACHE_BUCKETS
+)
+
+def _bucket(value: Any, step: float) -> Optional[float]:
+    """값을 step 간격 구간의 하한으로 양자화 (값이 없으면 None)"""
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    if not math.isfinite(number):
+        return None
+    return round(math.floor(number / step) * step, 6)
+
+def market_fingerprint(market_data: Dict[str, Any], buckets: Optional[Dict[str, float]] = None) -> Dict[str, Any]:
+    """create_market_analysis_data 결과에서 양자화한 시장 상태 특징"""
+    steps = {**LLM_CACHE_BUCKETS, **(buckets or {})}
+    indicators = market_data.get('technical_indicators') or {}
+    daily = indicators.get('daily_indicators') or {}
+    minute = indicators.get('minute_indicators') or {}
+    price = market_data.get('current_price')
+
+    fingerprint: Dict[str, Any] = {
+        'rsi_d': _bucket(daily.get('rsi'), steps['rsi']),
+        'rsi_m': _bucket(minute.get('rsi'), steps['rsi']),
+        'stoch_d': _bucket(daily.get('stoch_k'), steps['stoch']),
+        'bb_d': _bucket(daily.get('bb_position'), steps['bb_position']),
+        'bb_m': _bucket(minute.get('bb_position'), steps['bb_position']),
+    }
+    macd, signal = daily.get('macd'), daily.get('macd_signal')
+    if macd is not None and signal is not None and price:
+        fingerprint['macd_hist'] = _bucket((macd - signal) / price * 100, steps['macd_hist_pct'])
+    if price:
+        fingerprint['price'] = _bucket(math.log(price) * 100, steps['price_pct'])
+
+    fear_greed = market_data.get('fear_greed_index')
+    if isinstance(fear_greed, dict):
+        fingerprint['fng'] = _bucket(fear_greed.get('current_value', fear_greed.get('value')), steps['fear_greed'])
+    news = market_data.get('news_analysis')
+    if isinstance(news, dict):
+        fingerprint['news'] = _bucket(news.get('average_sentiment'), steps['news_sentiment'])
+    if market_data.get('symbol'):
+        fingerprint['symbol'] = market_data['symbol']  # 심볼이 다르면 같은 지표라도 별도 결정
+    return fingerprint
+
+def image_dhash(image: Union[str, bytes, Image.Image], hash_size: int = 8) -> Optional[str]:
+    """
+    차트 이미지 지각 해시 (dHash, 16진수)
+
+    흑백 (hash_size+1)×hash_size 축소본의 인접 픽셀 밝기 비교라서
+    라벨/시각 표기 같은 작은 차이에는 같은 값이 나옵니다. base64 문자열/바이트/이미지 허용.
+    """
+    try:
+        if isinstance(image, str):
+            image = base64.b64decode(image)
+        if isinstance(image, (bytes, bytearray)):
+            image = Image.open(io.BytesIO(image))
+        pixels = image.convert('L').resize((hash_size + 1, hash_size), Image.Resampling.LANCZOS).tobytes()
+    except Exception as e:
+        print(f"⚠️ 차트 이미지 해시 실패: {e}")
+        return None
+    bits = 0
+    for row in range(hash_size):
+        for col in range(hash_size):
+            left = pixels[row * (hash_size + 1) + col]
+            right = pixels[row * (hash_size + 1) + col + 1]
+            bits = (bits << 1) | int(left > right)
+    return f"{bits:0{hash_size * hash_size // 4}x}"
+
+def fingerprint_key(kind: str, model: str, fingerprint: Dict[str, Any]) -> str:
+    """호출 종류/모델/특징으로 캐시 키 생성"""
+    canonical = json.dumps(fingerprint, sort_keys=True, separators=(',', ':'))
+    return f"{kind}:{model}:{hashlib.sha1(canonical.encode('utf-8')).hexdigest()[:20]}"
+
+class DecisionCache:
+    """TTL + LRU LLM 응답 캐시 (파일 저장)"""
+
+    def __init__(self, path: Optional[str] = os.path.join(CACHE_DIR, LLM_CACHE_FILE) if CACHE_DIR else None,
+                 ttl: float = LLM_CACHE_TTL, max_entries: int = LLM_CACHE_MAX_ENTRIES,
+                 clock: Callable[[], float] = time.time):
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.clock = clock
+        self.stats = {'hits': 0, 'misses': 0, 'expired': 0, 'evictions': 0, 'stores': 0}
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()  # 동시 호출 시 임시 파일 충돌 방지
+        self._load()
+
+    def get(self, key: str) -> Any:
+        """캐시 값 (없거나 만료면 None)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and not entry.is_fresh(self.clock()):
+                del self._entries[key]
+                self.stats['expired'] += 1
+                entry = None
+            if entry is None:
+                self.stats['misses'] += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats['hits'] += 1
+            return entry.value
+
+    def put(self, key: str, value: Any) -> None:
+        """값 저장 후 LRU 초과분 제거 및 파일 기록"""
+        with self._lock:
+            self._entries[key] = CacheEntry(value, self.clock(), self.ttl)
+            self._entries.move_to_end(key)
+            self.stats['stores'] += 1
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats['evictions'] += 1
+            snapshot = [(k, e.stored_at, e.value) for k, e in self._entries.items()]
+        self._save(snapshot)
+
+    def get_or_compute(self, kind: str, model: str, fingerprint: Dict[str, Any],
+                       compute: Callable[[], Any], cacheable: Optional[Callable[[Any], bool]] = None) -> Any:
+        """캐시 적중 시 저장된 응답, 아니면 compute 결과 저장 (빈 응답이나 cacheable이 거짓인 응답은 저장하지 않음)"""
+        key = fingerprint_key(kind, model, fingerprint)
+        value = self.get(key)
+        if value is not None:
+            print(f"♻️ LLM 응답 캐시 적중 ({kind}, 적중률 {self.hit_rate:.0%})")
+            return value
+        value = compute()
+        if value and (cacheable is None or cacheable(value)):
+            self.put(key, value)
+        return value
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.stats['hits'] + self.stats['misses']
+        return self.stats['hits'] / lookups if lookups else 0.0
+
+    def metrics(self) -> Dict[str, Any]:
+        """적중률 및 통계"""
+        with self._lock:
+            size = len(self._entries)
+        return {**self.stats, 'size': size, 'hit_rate': self.hit_rate}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+        self._save([])
+
+    # ---- 파일 저장 ----
+
+    def _load(self) -> None:
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                stored = json.load(f)
+        except Exception as e:
+            print(f"⚠️ LLM 캐시 파일 읽기 실패: {e}")
+            return
+        now = self.clock()
+        for item in stored.get('entries', []):
+            entry = CacheEntry(item['value'], float(item['stored_at']), self.ttl)
+            if entry.is_fresh(now):
+                self._entries[item['key']] = entry
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _save(self, snapshot) -> None:
+        if not self.path:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            temp_path = f"{self.path}.tmp"
+            with self._save_lock:
+                with open(temp_path, 'w', encoding='utf-8') as f:
+                    json.dump({'entries': [{'key': k, 'stored_at': t, 'value': v} for k, t, v in snapshot]},
+                              f, ensure_ascii=False)
+                os.replace(temp_path, self.path)
+        except Exception as e:
+            print(f"⚠️ LLM 캐시 파일 저장 실패: {e}")
+
+_cache: Optional[DecisionCache] = None
+_cache_lock = threading.Lock()
+
+def get_decision_cache() -> DecisionCache:
+    """공용 LLM 응답 캐시 반환"""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = DecisionCache()
+        return _cache
+
+def cached_generation(kind: str, model: str, fingerprint: Dict[str, Any], compute: Callable[[], Any],
+                      cacheable: Optional[Callable[[Any], bool]] = None) -> Any:
+    """설정에 따라 캐시를 거쳐 LLM 호출 (비활성화 시 바로 호출)"""
+    if not LLM_CACHE_ENABLED:
+        return compute()
+    return get_decision_cache().get_or_compute(kind, model, fingerprint, compute, cacheable)
@@ -0,0 +1,349 @@
+"""
+증분 기술적 지표 계산 모듈
+새로 추가된 캔들만 반영하여 기술적 지표를 갱신합니다.
+
+ta 라이브러리 계산(calculate_technical_indicators_ta)과 동일한 컬럼과 값을 만들도록
+ta의 계산식(EWM 가중치, ATR/ADX 초기화 방식 포함)을 행 단위 점화식으로 옮겼습니다.
+"""
+
+from typing import Dict, Optional
+import numpy as np
+import pandas as pd
+from .technical_indicators import calculate_technical_indicators, normalize_ohlcv_columns
+from .indicator_kernel import (
+    INDICATOR_COLUMNS, MIN_ROWS, SMA_SHORT, SMA_LONG, EMA_FAST, EMA_SLOW, MACD_SIGNAL,
+    RSI_WINDOW, BB_WINDOW, BB_DEV, STOCH_WINDOW, STOCH_SMOOTH, WILLIAMS_LBP,
+    ATR_WINDOW, ADX_WINDOW, ROC_WINDOW, CCI_WINDOW, CCI_CONSTANT, span_alpha, direct_alpha
+)
+
+# 내부 상태 컬럼 (행 단위로 저장하여 진행 중인 캔들 되감기에 사용)
+_RAW_COLUMNS = ['Open', 'High', 'Low', 'Close', 'Volume']
+_STATE_COLUMNS = [
+    '_ema12', '_ema26', '_signal', '_up', '_down', '_tr',
+    '_dmm', '_pos', '_neg', '_trs', '_dip', '_din', '_dx', '_tp', '_obv'
+]
+
+_ALPHA_FAST = span_alpha(EMA_FAST)
+_ALPHA_SLOW = span_alpha(EMA_SLOW)
+_ALPHA_SIGNAL = span_alpha(MACD_SIGNAL)
+_ALPHA_RSI = direct_alpha(1.0 / RSI_WINDOW)
+
+def _ewm_step(prev, cur, alpha: float):
+    """pandas ewm(adjust=False) 한 단계"""
+    if prev != prev:  # 첫 관측값
+        return cur
+    if cur != cur:
+        return prev
+    old_wt = 1.0 - alpha
+    if prev != cur:
+        prev = old_wt * prev + alpha * cur
+        prev /= (old_wt + alpha)
+    return prev
+
+class IncrementalIndicatorEngine:
+    """
+    증분 기술적 지표 엔진
+
+    마지막으로 처리한 캔들은 아직 형성 중일 수 있으므로 다음 갱신 때 되감아 다시 계산합니다.
+    같은 시작점의 이력에 캔들이 추가되는 경우 ta 전체 재계산과 같은 값을 냅니다.
+    조회 구간이 밀려나는(슬라이딩) 경우 OBV는 구간 시작점 기준으로 보정되며,
+    EMA/RSI/ATR/ADX처럼 과거 전체에 의존하는 지표는 엔진이 보유한 이력으로 이어서 계산됩니다.
+    """
+
+    def __init__(self, max_rows: int = 4096):
+        self.max_rows = max(max_rows, 2 * SMA_LONG)
+        self.stats = {'seeds': 0, 'incremental_updates': 0, 'rows_advanced': 0, 'fallbacks': 0}
+        self.last_new_rows = 0
+        self.reset()
+
+    def reset(self) -> None:
+        """상태 초기화"""
+        self._size = 0
+        self._offset = 0  # 잘라낸 과거 행 수 (시작점 기준 절대 위치 계산용)
+        self._capacity = 0
+        self._index = None
+        self._arrays: Dict[str, np.ndarray] = {}
+
+    def _ensure_capacity(self, needed: int, index_dtype) -> None:
+        """배열 용량 확보 (2배씩 증가)"""
+        if self._index is None:
+            capacity = max(needed, 256)
+            self._index = np.empty(capacity, dtype=index_dtype)
+            self._arrays = {
+                name: np.full(capacity, np.nan)
+                for name in _RAW_COLUMNS + INDICATOR_COLUMNS + _STATE_COLUMNS
+            }
+            self._capacity = capacity
+            return
+        if needed <= self._capacity:
+            return
+        capacity = max(needed, self._capacity * 2)
+        index = np.empty(capacity, dtype=self._index.dtype)
+        index[:self._size] = self._index[:self._size]
+        self._index = index
+        for name, values in self._arrays.items():
+            grown = np.full(capacity, np.nan)
+            grown[:self._size] = values[:self._size]
+            self._arrays[name] = grown
+        self._capacity = capacity
+
+    def _trim(self) -> None:
+        """오래된 행 정리 (윈도우 계산에 필요한 최근 행은 유지)"""
+        if self._size <= self.max_rows * 2:
+            return
+        drop = self._size - self.max_rows
+        keep = self._size - drop
+        self._index[:keep] = self._index[drop:self._size]
+        for values in self._arrays.values():
+            values[:keep] = values[drop:self._size]
+        self._size = keep
+        self._offset += drop
+
+    def _advance(self, timestamp, o, h, l, c, v) -> None:
+        """캔들 한 개 반영"""
+        a = self._arrays
+        i = self._size
+        n = self._offset + i  # 시작점 기준 절대 위치
+        self._index[i] = timestamp
+        a['Open'][i], a['High'][i], a['Low'][i], a['Close'][i], a['Volume'][i] = o, h, l, c, v
+        close = a['Close']
+        high = a['High']
+        low = a['Low']
+        nan = np.nan
+
+        # 1. 이동평균선
+        a['SMA_20'][i] = close[i - SMA_SHORT + 1:i + 1].mean() if n >= SMA_SHORT - 1 else nan
+        a['SMA_50'][i] = close[i - SMA_LONG + 1:i + 1].mean() if n >= SMA_LONG - 1 else nan
+        prev = i - 1
+        a['_ema12'][i] = c if n == 0 else _ewm_step(a['_ema12'][prev], c, _ALPHA_FAST)
+        a['_ema26'][i] = c if n == 0 else _ewm_step(a['_ema26'][prev], c, _ALPHA_SLOW)
+        ema12 = a['_ema12'][i] if n >= EMA_FAST - 1 else nan
+        ema26 = a['_ema26'][i] if n >= EMA_SLOW - 1 else nan
+        a['EMA_12'][i] = ema12
+        a['EMA_26'][i] = ema26
+
+        # 2. MACD (MACD 값이 생기는 시점부터 시그널 EWM 시작)
+        macd = ema12 - ema26
+        signal_prev = a['_signal'][prev] if n > 0 else nan
+        a['_signal'][i] = _ewm_step(signal_prev, macd, _ALPHA_SIGNAL)
+        signal_obs = n - (EMA_SLOW - 1) + 1
+        signal = a['_signal'][i] if signal_obs >= MACD_SIGNAL else nan
+        a['MACD'][i] = macd
+        a['MACD_Signal'][i] = signal
+        a['MACD_Histogram'][i] = macd - signal
+
+        # 3. RSI
+        if n == 0:
+            up, down = 0.0, 0.0
+        else:
+            diff = c - close[prev]
+            up = diff if diff > 0 else 0.0
+            down = -(diff if diff < 0 else 0.0)
+        a['_up'][i] = up if n == 0 else _ewm_step(a['_up'][prev], up, _ALPHA_RSI)
+        a['_down'][i] = down if n == 0 else _ewm_step(a['_down'][prev], down, _ALPHA_RSI)
+        if n < RSI_WINDOW - 1:
+            a['RSI'][i] = nan
+        elif a['_down'][i] == 0:
+            a['RSI'][i] = 100.0
+        else:
+            a['RSI'][i] = 100 - (100 / (1 + a['_up'][i] / a['_down'][i]))
+
+        # 4. 볼린저 밴드
+        if n >= BB_WINDOW - 1:
+            window = close[i - BB_WINDOW + 1:i + 1]
+            mavg = window.mean()
+            mstd = window.std()
+            hband = mavg + BB_DEV * mstd
+            lband = mavg - BB_DEV * mstd
+            a['BB_Upper'][i] = hband
+            a['BB_Middle'][i] = mavg
+            a['BB_Lower'][i] = lband
+            a['BB_Width'][i] = ((hband - lband) / mavg) * 100
+            a['BB_Position'][i] = (c - lband) / (hband - lband) if hband != lband else nan
+        else:
+            for name in ('BB_Upper', 'BB_Middle', 'BB_Lower', 'BB_Width', 'BB_Position'):
+                a[name][i] = nan
+
+        # 5. 스토캐스틱 / 6. 윌리엄스 %R
+        if n >= STOCH_WINDOW - 1:
+            smin = low[i - STOCH_WINDOW + 1:i + 1].min()
+            smax = high[i - STOCH_WINDOW + 1:i + 1].max()
+            a['Stoch_K'][i] = 100 * (c - smin) / (smax - smin)
+        else:
+            a['Stoch_K'][i] = nan
+        if n >= STOCH_WINDOW + STOCH_SMOOTH - 2:
+            a['Stoch_D'][i] = a['Stoch_K'][i - STOCH_SMOOTH + 1:i + 1].mean()
+        else:
+            a['Stoch_D'][i] = nan
+        if n >= WILLIAMS_LBP - 1:
+            highest_high = high[i - WILLIAMS_LBP + 1:i + 1].max()
+            lowest_low = low[i - WILLIAMS_LBP + 1:i + 1].min()
+            a['Williams_R'][i] = -100 * (highest_high - c) / (highest_high - lowest_low)
+        else:
+            a['Williams_R'][i] = nan
+
+        # 7. ATR (ta: 처음 window-1개는 0, 이후 Wilder 평활)
+        if n == 0:
+            a['_tr'][i] = h - l
+        else:
+            prev_close = close[prev]
+            a['_tr'][i] = max(h - l, abs(h - prev_close), abs(l - prev_close))
+        if n < ATR_WINDOW - 1:
+            a['ATR'][i] = 0.0
+        elif n == ATR_WINDOW - 1:
+            a['ATR'][i] = a['_tr'][i - ATR_WINDOW + 1:i + 1].mean()
+        else:
+            a['ATR'][i] = (a['ATR'][prev] * (ATR_WINDOW - 1) + a['_tr'][i]) / float(ATR_WINDOW)
+
+        # 8. ADX (ta의 인덱스 배치를 그대로 따름)
+        w = ADX_WINDOW
+        if n == 0:
+            a['_dmm'][i] = a['_pos'][i] = a['_neg'][i] = nan
+        else:
+            prev_close = close[prev]
+            a['_dmm'][i] = max(h, prev_close) - min(l, prev_close)
+            diff_up = h - high[prev]
+            diff_down = low[prev] - l
+            a['_pos'][i] = diff_up if (diff_up > diff_down and diff_up > 0) else 0.0
+            a['_neg'][i] = diff_down if (diff_down > diff_up and diff_down > 0) else 0.0
+        if n < w:
+            a['_trs'][i] = a['_dip'][i] = a['_din'][i] = a['_dx'][i] = nan
+        else:
+            if n == w:
+                a['_trs'][i] = a['_dmm'][i - w + 1:i + 1].sum()
+                a['_dip'][i] = a['_pos'][i - w + 1:i + 1].sum()
+                a['_din'][i] = a['_neg'][i - w + 1:i + 1].sum()
+            else:
+                for state, source in (('_trs', '_dmm'), ('_dip', '_pos'), ('_din', '_neg')):
+                    previous = a[state][prev]
+                    a[state][i] = previous - (previous / float(w)) + a[source][i]
+            trs = a['_trs'][i]
+            dip = 100 * (a['_dip'][i] / trs) if trs != 0 else 0.0
+            din = 100 * (a['_din'][i] / trs) if trs != 0 else 0.0
+            a['_dx'][i] = 100 * np.abs((dip - din) / (dip + din)) if dip + din != 0 else 0.0
+        if n < 2 * w - 1:
+            a['ADX'][i] = 0.0
+        elif n == 2 * w - 1:
+            a['ADX'][i] = a['_dx'][i - w + 1:i + 1].mean()
+        else:
+            a['ADX'][i] = ((a['ADX'][prev] * (w - 1)) + a['_dx'][i]) / float(w)
+        if n >= w + 1:
+            trs = a['_trs'][i]
+            a['ADX_Pos'][i] = 100 * (a['_dip'][i] / trs) if trs != 0 else 0.0
+            a['ADX_Neg'][i] = 100 * (a['_din'][i] / trs) if trs != 0 else 0.0
+        else:
+            a['ADX_Pos'][i] = a['ADX_Neg'][i] = 0.0
+
+        # 9. OBV (시작점 기준 누적값, 출력 시 구간 시작점으로 보정)
+        if n == 0:
+            a['_obv'][i] = v
+        else:
+            a['_obv'][i] = a['_obv'][prev] + (-v if c < close[prev] else v)
+
+        # 10. ROC / CCI
+        if n >= ROC_WINDOW:
+            base = close[i - ROC_WINDOW]
+            a['ROC'][i] = ((c - base) / base) * 100
+        else:
+            a['ROC'][i] = nan
+        a['_tp'][i] = (h + l + c) / 3.0
+        if n >= CCI_WINDOW - 1:
+            window = a['_tp'][i - CCI_WINDOW + 1:i + 1]
+            mean = window.mean()
+            mad = np.mean(np.abs(window - np.mean(window)))
+            a['CCI'][i] = (a['_tp'][i] - mean) / (CCI_CONSTANT * mad)
+        else:
+            a['CCI'][i] = nan
+
+        self._size += 1
+
+    def _locate_update_start(self, index: np.ndarray, close: np.ndarray) -> Optional[int]:
+        """증분 갱신 시작 위치 (되감을 진행 중 캔들 위치), 재초기화가 필요하면 None"""
+        if self._size == 0:
+            return None
+        stored = self._index[:self._size]
+        if index[0] < stored[0]:
+            return None
+        provisional = stored[-1]
+        pos = int(np.searchsorted(index, provisional))
+        if pos >= len(index) or index[pos] != provisional:
+            return None
+        # 확정된 직전 캔들이 바뀌었다면 이력이 달라진 것으로 판단
+        if pos > 0 and self._size >= 2:
+            if index[pos - 1] != stored[-2] or close[pos - 1] != self._arrays['Close'][self._size - 2]:
+                return None
+        return pos
+
+    def update(self, df: pd.DataFrame) -> pd.DataFrame:
+        """OHLCV 데이터를 받아 새 캔들만 반영한 지표 DataFrame 반환"""
+        if df is None or df.empty:
+            return df
+
+        frame = normalize_ohlcv_columns(df)
+        if frame is None:
+            print("❌ 필수 OHLCV 컬럼을 찾을 수 없습니다.")
+            return df
+        if len(frame) < MIN_ROWS or not frame.index.is_monotonic_increasing or not frame.index.is_unique:
+            # 짧거나 정렬되지 않은 데이터는 전체 계산으로 처리
+            self.reset()
+            self.stats['fallbacks'] += 1
+            return calculate_technical_indicators(df)
+
+        try:
+            index = frame.index.values
+            ohlcv = frame[_RAW_COLUMNS].to_numpy(dtype=np.float64)
+            start = self._locate_update_start(index, ohlcv[:, 3])
+            if start is None:
+                self.reset()
+                start = 0
+                self.stats['seeds'] += 1
+            else:
+                self._size -= 1  # 진행 중이던 마지막 캔들 되감기
+                self.stats['incremental_updates'] += 1
+
+            self._ensure_capacity(self._size + len(frame) - start, index.dtype)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                for row in range(start, len(frame)):
+                    o, h, l, c, v = ohlcv[row]
+                    self._advance(index[row], o, h, l, c, v)
+            self.last_new_rows = len(frame) - start
+            self.stats['rows_advanced'] += self.last_new_rows
+
+            first = int(np.searchsorted(self._index[:self._size], index[0]))
+            if self._size - first != len(frame) or not np.array_equal(self._index[first:self._size], index):
+                # 보유 이력과 입력 구간이 맞지 않으면 입력 기준으로 재초기화
+                self.reset()
+                return self.update(df)
+
+            result = frame.copy()
+            arrays = self._arrays
+            end = self._size
+            for name in INDICATOR_COLUMNS:
+                if name == 'OBV':
+                    obv = arrays['_obv'][first:end]
+                    result[name] = obv - obv[0] + arrays['Volume'][first]
+                else:
+                    result[name] = arrays[name][first:end].copy()
+
+            self._trim()
+            print(f"✅ 기술적 지표 증분 계산 완료: 신규 {self.last_new_rows}개 캔들, {len(result.columns)}개 컬럼")
+            return result
+
+        except Exception as e:
+            print(f"⚠️ 증분 지표 계산 실패, 전체 계산으로 대체: {e}")
+            self.reset()
+            self.stats['fallbacks'] += 1
+            return calculate_technical_indicators(df)
+
+# 데이터 종류별 전역 엔진 (예: 'minute1', 'day')
+_indicator_engines: Dict[str, IncrementalIndicatorEngine] = {}
+
+def get_indicator_engine(key: str = 'default') -> IncrementalIndicatorEngine:
+    """데이터 종류별 증분 지표 엔진 반환"""
+    if key not in _indicator_engines:
+        _indicator_engines[key] = IncrementalIndicatorEngine()
+    return _indicator_engines[key]
+
+def calculate_technical_indicators_incremental(df: pd.DataFrame, key: str = 'default') -> pd.DataFrame:
+    """증분 기술적 지표 계산 (편의 함수)"""
+    return get_indicator_engine(key).update(df)
@@ -0,0 +1,270 @@
+"""
+NumPy 기술적 지표 커널
+전체 지표 세트를 연속된 float64 배열 위에서 한 번에 계산합니다.
+
+지표마다 ta 객체와 pandas 중간 Series를 만드는 대신, 미리 할당한 출력 배열
+(지표 x 행)에 직접 기록합니다. EMA/Wilder 평활 같은 점화식은 블록 단위
+행렬곱으로 벡터화하며, 결과는 ta 계산과 부동소수점 오차 범위 내에서 일치합니다.
+"""
+
+from typing import Optional
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+# 출력 컬럼 (calculate_technical_indicators와 동일한 순서)
+INDICATOR_COLUMNS = [
+    'SMA_20', 'SMA_50', 'EMA_12', 'EMA_26',
+    'MACD', 'MACD_Signal', 'MACD_Histogram', 'RSI',
+    'BB_Upper', 'BB_Middle', 'BB_Lower', 'BB_Width', 'BB_Position',
+    'Stoch_K', 'Stoch_D', 'Williams_R', 'ATR',
+    'ADX', 'ADX_Pos', 'ADX_Neg', 'OBV', 'ROC', 'CCI'
+]
+_COLUMN_INDEX = {name: position for position, name in enumerate(INDICATOR_COLUMNS)}
+
+# ta 기본 파라미터
+SMA_SHORT, SMA_LONG = 20, 50
+EMA_FAST, EMA_SLOW, MACD_SIGNAL = 12, 26, 9
+RSI_WINDOW = 14
+BB_WINDOW, BB_DEV = 20, 2
+STOCH_WINDOW, STOCH_SMOOTH = 14, 3
+WILLIAMS_LBP = 14
+ATR_WINDOW = 14
+ADX_WINDOW = 14
+ROC_WINDOW = 12
+CCI_WINDOW, CCI_CONSTANT = 20, 0.015
+
+# ADX 계산에 필요한 최소 행 수 (ta는 이보다 짧으면 예외 발생)
+MIN_ROWS = 2 * ADX_WINDOW
+
+# 점화식 벡터화 블록 크기
+_BLOCK = 64
+
+def span_alpha(span: int) -> float:
+    """pandas ewm(span=...)과 동일한 alpha"""
+    com = (span - 1) / 2.0
+    return 1.0 / (1.0 + com)
+
+def direct_alpha(alpha: float) -> float:
+    """pandas ewm(alpha=...)과 동일한 alpha (com 변환 포함)"""
+    com = (1.0 - alpha) / alpha
+    return 1.0 / (1.0 + com)
+
+def linear_recurrence(x: np.ndarray, decay: float, initial: float) -> np.ndarray:
+    """
+    y[t] = decay * y[t-1] + x[t] (y[-1] = initial) 를 벡터화하여 계산
+
+    블록 내부는 감쇠 가중치 하삼각 행렬과의 곱으로, 블록 간 이월값은
+    decay**블록크기 를 감쇠율로 하는 같은 점화식으로 재귀 계산합니다.
+    """
+    n = len(x)
+    if n == 0:
+        return np.empty(0)
+    if n <= _BLOCK:
+        y = np.empty(n)
+        previous = initial
+        for t in range(n):
+            previous = decay * previous + x[t]
+            y[t] = previous
+        return y
+
+    blocks = -(-n // _BLOCK)
+    padded = np.zeros(blocks * _BLOCK)
+    padded[:n] = x
+    padded = padded.reshape(blocks, _BLOCK)
+
+    powers = decay ** np.arange(_BLOCK + 1, dtype=np.float64)
+    offsets = np.arange(_BLOCK)
+    lags = offsets[:, None] - offsets[None, :]
+    weights = np.where(lags >= 0, powers[np.clip(lags, 0, _BLOCK)], 0.0)
+
+    # 블록별 0 초기값 결과
+    local = padded @ weights.T
+    # 블록 끝 값의 이월 (블록 단위 점화식)
+    carries = linear_recurrence(local[:, -1], powers[_BLOCK], initial)
+    carry_in = np.empty(blocks)
+    carry_in[0] = initial
+    carry_in[1:] = carries[:-1]
+    local += carry_in[:, None] * powers[1:_BLOCK + 1][None, :]
+    return local.reshape(-1)[:n]
+
+def ewm_adjust_false(values: np.ndarray, alpha: float) -> np.ndarray:
+    """pandas ewm(adjust=False).mean()과 동일 (마스킹 전 내부값, 입력에 NaN 없음)"""
+    result = np.empty(len(values))
+    if len(values) == 0:
+        return result
+    result[0] = values[0]
+    result[1:] = linear_recurrence(alpha * values[1:], 1.0 - alpha, values[0])
+    return result
+
+def _rolling_mean(values: np.ndarray, window: int, out: np.ndarray) -> None:
+    """rolling(window).mean() (min_periods=window)"""
+    out[:window - 1] = np.nan
+    if len(values) >= window:
+        out[window - 1:] = sliding_window_view(values, window).mean(axis=1)
+
+def _rolling_reduce(values: np.ndarray, window: int, reducer) -> np.ndarray:
+    """rolling(window).min()/max() 등 (앞부분 NaN)"""
+    result = np.full(len(values), np.nan)
+    if len(values) >= window:
+        result[window - 1:] = reducer(sliding_window_view(values, window), axis=1)
+    return result
+
+def _rolling_abs_dev(values: np.ndarray, window: int, means: np.ndarray, power: int) -> np.ndarray:
+    """윈도우 평균 대비 편차 합 (power=1: 절대편차, power=2: 제곱편차), 윈도우 크기만큼 패스"""
+    count = len(values) - window + 1
+    center = means[window - 1:]
+    total = np.zeros(count)
+    for offset in range(window):
+        deviation = values[offset:offset + count] - center
+        total += np.abs(deviation) if power == 1 else deviation * deviation
+    return total / window
+
+def compute_indicator_arrays(open_: np.ndarray, high: np.ndarray, low: np.ndarray,
+                             close: np.ndarray, volume: np.ndarray,
+                             out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    전체 지표 계산
+
+    Args:
+        open_, high, low, close, volume: float64 1차원 배열 (길이 MIN_ROWS 이상)
+        out: (len(INDICATOR_COLUMNS), 행 수) 크기의 미리 할당된 출력 배열 (선택)
+
+    Returns:
+        지표별 행으로 구성된 출력 배열 (행 순서는 INDICATOR_COLUMNS)
+    """
+    n = len(close)
+    if n < MIN_ROWS:
+        raise ValueError(f"지표 계산에 최소 {MIN_ROWS}개 캔들이 필요합니다: {n}개")
+    high = np.ascontiguousarray(high, dtype=np.float64)
+    low = np.ascontiguousarray(low, dtype=np.float64)
+    close = np.ascontiguousarray(close, dtype=np.float64)
+    volume = np.ascontiguousarray(volume, dtype=np.float64)
+    if out is None:
+        out = np.empty((len(INDICATOR_COLUMNS), n))
+    col = {name: out[position] for name, position in _COLUMN_INDEX.items()}
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # 공통 차분 (close, high, low 직전값)
+        prev_close = close[:-1]
+        diff = close[1:] - prev_close
+
+        # 1. 이동평균선
+        _rolling_mean(close, SMA_SHORT, col['SMA_20'])
+        _rolling_mean(close, SMA_LONG, col['SMA_50'])
+        ema_fast = ewm_adjust_false(close, span_alpha(EMA_FAST))
+        ema_slow = ewm_adjust_false(close, span_alpha(EMA_SLOW))
+        col['EMA_12'][:] = ema_fast
+        col['EMA_12'][:EMA_FAST - 1] = np.nan
+        col['EMA_26'][:] = ema_slow
+        col['EMA_26'][:EMA_SLOW - 1] = np.nan
+
+        # 2. MACD
+        macd = col['MACD']
+        np.subtract(col['EMA_12'], col['EMA_26'], out=macd)
+        signal = col['MACD_Signal']
+        signal[:] = np.nan
+        first = EMA_SLOW - 1
+        signal_raw = ewm_adjust_false(macd[first:], span_alpha(MACD_SIGNAL))
+        signal[first + MACD_SIGNAL - 1:] = signal_raw[MACD_SIGNAL - 1:]
+        np.subtract(macd, signal, out=col['MACD_Histogram'])
+
+        # 3. RSI
+        up = np.zeros(n)
+        down = np.zeros(n)
+        up[1:] = np.where(diff > 0, diff, 0.0)
+        down[1:] = -np.where(diff < 0, diff, 0.0)
+        rsi_alpha = direct_alpha(1.0 / RSI_WINDOW)
+        ema_up = ewm_adjust_false(up, rsi_alpha)
+        ema_down = ewm_adjust_false(down, rsi_alpha)
+        rsi = col['RSI']
+        rsi[:] = np.where(ema_down == 0, 100.0, 100 - (100 / (1 + ema_up / ema_down)))
+        rsi[:RSI_WINDOW - 1] = np.nan
+
+        # 4. 볼린저 밴드
+        mavg = col['BB_Middle']
+        _rolling_mean(close, BB_WINDOW, mavg)
+        mstd = np.full(n, np.nan)
+        mstd[BB_WINDOW - 1:] = np.sqrt(_rolling_abs_dev(close, BB_WINDOW, mavg, 2))
+        hband = col['BB_Upper']
+        lband = col['BB_Lower']
+        np.add(mavg, BB_DEV * mstd, out=hband)
+        np.subtract(mavg, BB_DEV * mstd, out=lband)
+        band = hband - lband
+        col['BB_Width'][:] = (band / mavg) * 100
+        col['BB_Position'][:] = (close - lband) / np.where(hband != lband, band, np.nan)
+
+        # 5. 스토캐스틱 / 6. 윌리엄스 %R (같은 윈도우 min/max 재사용)
+        lowest = _rolling_reduce(low, STOCH_WINDOW, np.min)
+        highest = _rolling_reduce(high, STOCH_WINDOW, np.max)
+        stoch_k = col['Stoch_K']
+        stoch_k[:] = 100 * (close - lowest) / (highest - lowest)
+        _rolling_mean(stoch_k, STOCH_SMOOTH, col['Stoch_D'])
+        if WILLIAMS_LBP != STOCH_WINDOW:
+            lowest = _rolling_reduce(low, WILLIAMS_LBP, np.min)
+            highest = _rolling_reduce(high, WILLIAMS_LBP, np.max)
+        col['Williams_R'][:] = -100 * (highest - close) / (highest - lowest)
+
+        # 7. ATR
+        range_ = high - low
+        true_range = range_.copy()
+        np.maximum(true_range[1:], np.abs(high[1:] - prev_close), out=true_range[1:])
+        np.maximum(true_range[1:], np.abs(low[1:] - prev_close), out=true_range[1:])
+        atr = col['ATR']
+        atr[:ATR_WINDOW - 1] = 0.0
+        seed = true_range[:ATR_WINDOW].mean()
+        atr[ATR_WINDOW - 1] = seed
+        atr[ATR_WINDOW:] = linear_recurrence(true_range[ATR_WINDOW:] / float(ATR_WINDOW),
+                                             (ATR_WINDOW - 1) / float(ATR_WINDOW), seed)
+
+        # 8. ADX (ta 인덱스 배치: 평활값은 window 행부터, ADX는 2*window-1 행부터)
+        w = ADX_WINDOW
+        decay = 1.0 - 1.0 / float(w)
+        dmm = np.maximum(high[1:], prev_close) - np.minimum(low[1:], prev_close)
+        diff_up = high[1:] - high[:-1]
+        diff_down = low[:-1] - low[1:]
+        pos = np.where((diff_up > diff_down) & (diff_up > 0), diff_up, 0.0)
+        neg = np.where((diff_down > diff_up) & (diff_down > 0), diff_down, 0.0)
+        # dmm/pos/neg의 k번째 값은 k+1 행에 해당
+        smoothed = []
+        for source in (dmm, pos, neg):
+            seed = source[:w].sum()
+            values = np.empty(n - w)
+            values[0] = seed
+            values[1:] = linear_recurrence(source[w:], decay, seed)
+            smoothed.append(values)
+        trs, dip, din = smoothed
+        nonzero = trs != 0
+        di_pos = np.where(nonzero, 100 * (dip / trs), 0.0)
+        di_neg = np.where(nonzero, 100 * (din / trs), 0.0)
+        di_sum = di_pos + di_neg
+        dx = np.where(di_sum != 0, 100 * np.abs((di_pos - di_neg) / di_sum), 0.0)
+        adx = col['ADX']
+        adx[:2 * w - 1] = 0.0
+        seed = dx[:w].mean()
+        adx[2 * w - 1] = seed
+        adx[2 * w:] = linear_recurrence(dx[w:] / float(w), (w - 1) / float(w), seed)
+        col['ADX_Pos'][:w + 1] = 0.0
+        col['ADX_Pos'][w + 1:] = di_pos[1:]
+        col['ADX_Neg'][:w + 1] = 0.0
+        col['ADX_Neg'][w + 1:] = di_neg[1:]
+
+        # 9. OBV
+        obv = col['OBV']
+        obv[0] = volume[0]
+        obv[1:] = np.where(close[1:] < prev_close, -volume[1:], volume[1:])
+        np.cumsum(obv, out=obv)
+
+        # 10. ROC / CCI
+        roc = col['ROC']
+        roc[:ROC_WINDOW] = np.nan
+        base = close[:-ROC_WINDOW]
+        roc[ROC_WINDOW:] = ((close[ROC_WINDOW:] - base) / base) * 100
+        typical = (high + low + close) / 3.0
+        typical_mean = np.empty(n)
+        _rolling_mean(typical, CCI_WINDOW, typical_mean)
+        cci = col['CCI']
+        cci[:CCI_WINDOW - 1] = np.nan
+        mad = _rolling_abs_dev(typical, CCI_WINDOW, typical_mean, 1)
+        cci[CCI_WINDOW - 1:] = (typical[CCI_WINDOW - 1:] - typical_mean[CCI_WINDOW - 1:]) / (CCI_CONSTANT * mad)
+
+    return out
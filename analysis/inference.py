@@ -0,0 +1,59 @@
+"""
+병렬 추론 모듈
+여러 모델 호출을 동시에 실행하고 공통 마감 시간까지 완료된 결과만 모읍니다.
+
+각 작업은 취소 이벤트를 인자로 받으며, 마감 시간이 지나면 이벤트가 설정되어
+스트리밍 중인 호출이 생성을 중단합니다. 최악의 지연은 각 호출 지연의 합이 아니라
+max(지연, 마감 시간)입니다.
+"""
+
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+from config.settings import INFERENCE_DEADLINE
+
+@dataclass
+class TaskOutcome:
+    """작업 결과"""
+    name: str
+    value: Any = None
+    error: Optional[str] = None
+    seconds: float = 0.0
+    timed_out: bool = False
+
+    @property
+    def ok(self) -> bool:
+        """마감 전에 오류 없이 비어 있지 않은 결과를 냈는지"""
+        return not self.timed_out and self.error is None and bool(self.value)
+
+def _timed(task: Callable[[threading.Event], Any], cancel: threading.Event) -> Any:
+    started = time.perf_counter()
+    try:
+        return task(cancel), None, time.perf_counter() - started
+    except Exception as e:
+        return None, str(e), time.perf_counter() - started
+
+def run_with_deadline(tasks: Dict[str, Callable[[threading.Event], Any]],
+                      deadline: float = INFERENCE_DEADLINE) -> Dict[str, TaskOutcome]:
+    """작업들을 동시에 실행하고 deadline초까지 완료된 결과 반환 (미완료 작업은 취소 요청)"""
+    cancel = threading.Event()
+    executor = ThreadPoolExecutor(max_workers=max(1, len(tasks)), thread_name_prefix="inference")
+    try:
+        futures = {name: executor.submit(_timed, task, cancel) for name, task in tasks.items()}
+        wait(futures.values(), timeout=deadline)
+        cancel.set()
+    finally:
+        # 마감 후에도 남은 호출은 취소 이벤트를 보고 스스로 종료 (기다리지 않음)
+        executor.shutdown(wait=False)
+
+    outcomes = {}
+    for name, future in futures.items():
+        if not future.done():
+            outcomes[name] = TaskOutcome(name, seconds=deadline, timed_out=True)
+            print(f"⏰ {name} 추론 마감 시간 초과 ({deadline:.0f}초)")
+            continue
+        value, error, seconds = future.result()
+        outcomes[name] = TaskOutcome(name, value, error, seconds)
+    return outcomes
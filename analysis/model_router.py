@@ -0,0 +1,215 @@
+"""
+모델 라우터 모듈
+작업(text/vision)별 후보 모델 목록에서 마감 시간 안에 끝낼 수 있는 모델을 골라 호출합니다.
+
+- 후보는 선호(품질) 순서, 뒤쪽은 작은 양자화 모델
+- 모델별 최근 지연 시간 p50/p95와 오류율을 기록하여, p95(+로딩 예상 시간)가 남은 시간 안에
+  드는 첫 후보를 선택하고, 맞는 후보가 없으면 가장 빠른 모델부터 시도
+- 메모리에 없는 모델(/api/ps 기준)은 로딩 시간을 더해 평가하고, 건너뛴 선호 모델은 백그라운드로 로드
+- 시도가 실패하거나 예산을 넘으면 다음 후보로 전환 (다음 후보가 끝낼 시간은 남겨 둠)
+"""
+
+import math
+import time
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, List, Optional, Set
+from .ollama_client import GenerateResult, OllamaClient, get_ollama_client
+from config.settings import (
+    OLLAMA_TEXT_MODELS, OLLAMA_VISION_MODELS, ROUTER_LATENCY_WINDOW, ROUTER_MAX_ERROR_RATE,
+    ROUTER_COLD_LOAD_PENALTY, ROUTER_LOADED_CHECK_INTERVAL, ROUTER_MIN_ATTEMPT_SECONDS, INFERENCE_DEADLINE
+)
+
+def _model_name(name: str) -> str:
+    """태그 없는 이름은 Ollama 기본 태그(latest)로 맞춤"""
+    return name if ':' in name else f"{name}:latest"
+
+def _percentile(values: List[float], q: float) -> Optional[float]:
+    """최근접 순위 백분위수 (값이 없으면 None)"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    index = max(0, math.ceil(q * len(ordered)) - 1)
+    return ordered[index]
+
+@dataclass
+class ModelStats:
+    """모델별 최근 호출 기록"""
+    latencies: Deque[float] = field(default_factory=deque)
+    outcomes: Deque[bool] = field(default_factory=deque)
+    load_seconds: float = 0.0  # 마지막으로 관측된 콜드 로딩 시간
+
+    @property
+    def p50(self) -> Optional[float]:
+        return _percentile(list(self.latencies), 0.5)
+
+    @property
+    def p95(self) -> Optional[float]:
+        return _percentile(list(self.latencies), 0.95)
+
+    @property
+    def error_rate(self) -> float:
+        return self.outcomes.count(False) / len(self.outcomes) if self.outcomes else 0.0
+
+class ModelRouter:
+    """지연 시간 기반 후보 모델 선택/대체"""
+
+    def __init__(self, candidates: Dict[str, List[str]], client: Optional[OllamaClient] = None,
+                 window: int = ROUTER_LATENCY_WINDOW, max_error_rate: float = ROUTER_MAX_ERROR_RATE,
+                 cold_load_penalty: float = ROUTER_COLD_LOAD_PENALTY,
+                 loaded_check_interval: float = ROUTER_LOADED_CHECK_INTERVAL,
+                 min_attempt_seconds: float = ROUTER_MIN_ATTEMPT_SECONDS,
+                 clock: Callable[[], float] = time.monotonic):
+        self.candidates = {task: list(models) for task, models in candidates.items()}
+        self.client = client
+        self.window = window
+        self.max_error_rate = max_error_rate
+        self.cold_load_penalty = cold_load_penalty
+        self.loaded_check_interval = loaded_check_interval
+        self.min_attempt_seconds = min_attempt_seconds
+        self.clock = clock
+        self._stats: Dict[str, ModelStats] = {}
+        self._loaded: Optional[Set[str]] = None
+        self._loaded_at: Optional[float] = None
+        self._warming: Set[str] = set()
+        self._lock = threading.Lock()
+
+    def _client(self) -> OllamaClient:
+        return self.client if self.client is not None else get_ollama_client()
+
+    def primary(self, task: str) -> str:
+        """작업의 선호(1순위) 후보 모델 (후보가 없으면 빈 문자열)"""
+        models = self.candidates.get(task) or []
+        return models[0] if models else ''
+
+    def _model_stats(self, model: str) -> ModelStats:
+        stats = self._stats.get(model)
+        if stats is None:
+            stats = self._stats[model] = ModelStats(deque(maxlen=self.window), deque(maxlen=self.window))
+        return stats
+
+    def loaded_models(self) -> Optional[Set[str]]:
+        """메모리에 로드된 모델 (loaded_check_interval 동안 재사용, 조회 실패 시 None)"""
+        now = self.clock()
+        with self._lock:
+            if self._loaded_at is not None and now - self._loaded_at < self.loaded_check_interval:
+                return self._loaded
+        names = self._client().loaded_models()
+        loaded = {_model_name(name) for name in names if name} if names is not None else None
+        with self._lock:
+            self._loaded, self._loaded_at = loaded, now
+        return loaded
+
+    def expected_latency(self, model: str, loaded: Optional[Set[str]] = None) -> Optional[float]:
+        """예상 지연 시간 (p95 + 로드되지 않았으면 로딩 시간, 기록도 로딩 정보도 없으면 None)"""
+        with self._lock:
+            stats = self._model_stats(model)
+            latency, load_seconds = stats.p95, stats.load_seconds
+        if loaded is not None and _model_name(model) not in loaded:
+            return (latency or 0.0) + (load_seconds or self.cold_load_penalty)
+        return latency
+
+    def plan(self, task: str, deadline: float) -> List[str]:
+        """시도 순서: 마감 안에 드는 후보(선호 순) → 나머지(빠른 순) → 오류율 초과 후보(빠른 순)"""
+        models = self.candidates.get(task) or []
+        loaded = self.loaded_models()
+        expected = {model: self.expected_latency(model, loaded) for model in models}
+        with self._lock:
+            unhealthy = {model for model in models if self._model_stats(model).error_rate > self.max_error_rate}
+
+        def speed(model: str) -> float:
+            return expected[model] if expected[model] is not None else 0.0
+
+        healthy = [model for model in models if model not in unhealthy]
+        fits = [model for model in healthy if expected[model] is None or expected[model] <= deadline]
+        slow = sorted((model for model in healthy if model not in fits), key=speed)
+        failing = sorted((model for model in models if model in unhealthy), key=speed)
+        order = fits + slow + failing
+
+        if order and models and order[0] != models[0] and loaded is not None and _model_name(models[0]) not in loaded:
+            # 로딩 중이라 건너뛴 선호 모델은 다음 사이클을 위해 백그라운드에서 로드
+            self._warm_in_background(models[0])
+        return order
+
+    def _warm_in_background(self, model: str) -> None:
+        with self._lock:
+            if model in self._warming:
+                return
+            self._warming.add(model)
+
+        def warm():
+            try:
+                self._client().warmup([model])
+            finally:
+                with self._lock:
+                    self._warming.discard(model)
+                    self._loaded_at = None  # 다음 계획에서 로드 상태 재조회
+
+        threading.Thread(target=warm, name=f"ollama-warmup-{model}", daemon=True).start()
+
+    def record(self, result: GenerateResult) -> None:
+        """호출 결과 반영 (외부 취소는 모델 성능과 무관하므로 제외)"""
+        if result.error == 'cancelled':
+            return
+        with self._lock:
+            stats = self._model_stats(result.model)
+            if result.error is None or result.error == 'timeout':
+                # 예산 초과는 오류가 아니라 최소한 그만큼 걸린 것으로 보고 p95에 반영
+                stats.outcomes.append(True)
+                stats.latencies.append(result.latency)
+            else:
+                stats.outcomes.append(False)
+            if result.load_duration > 1.0:
+                stats.load_seconds = result.load_duration
+
+    def _reserve(self, fallbacks: List[str], loaded: Optional[Set[str]]) -> float:
+        """뒤 후보 중 가장 빠른 모델이 끝내는 데 필요한 시간 (기록이 없으면 최소 시도 시간)"""
+        if not fallbacks:
+            return 0.0
+        estimates = [self.expected_latency(model, loaded) for model in fallbacks]
+        return min(self.min_attempt_seconds if latency is None else latency for latency in estimates)
+
+    def generate(self, task: str, prompt: str, deadline: float = INFERENCE_DEADLINE,
+                 cancel: Optional[threading.Event] = None, **kwargs: Any) -> GenerateResult:
+        """작업에 맞는 모델로 생성, 실패/예산 초과 시 다음 후보로 전환 (모두 실패하면 마지막 실패 결과)"""
+        started = self.clock()
+        order = self.plan(task, deadline)
+        loaded = self.loaded_models()
+        result = GenerateResult(text='', model=order[0] if order else '', error=f"no candidate model for {task}")
+        for index, model in enumerate(order):
+            if cancel is not None and cancel.is_set():
+                break
+            remaining = deadline - (self.clock() - started)
+            if remaining <= 0:
+                break
+            budget = remaining - self._reserve(order[index + 1:], loaded)
+            if budget < self.min_attempt_seconds:
+                budget = min(remaining, self.min_attempt_seconds)
+            result = self._client().generate(prompt, model=model, cancel=cancel, timeout=budget, **kwargs)
+            self.record(result)
+            if result.error is None or result.error == 'cancelled':
+                return result
+            if index + 1 < len(order):
+                print(f"🔀 {task} 모델 전환: {model} ({result.error}) → {order[index + 1]}")
+        return result
+
+    def metrics(self) -> Dict[str, Dict[str, Any]]:
+        """모델별 최근 지연 시간 p50/p95와 오류율"""
+        with self._lock:
+            return {
+                model: {'p50': stats.p50, 'p95': stats.p95, 'error_rate': stats.error_rate,
+                        'samples': len(stats.outcomes), 'load_seconds': stats.load_seconds}
+                for model, stats in self._stats.items()
+            }
+
+_router: Optional[ModelRouter] = None
+_router_lock = threading.Lock()
+
+def get_model_router() -> ModelRouter:
+    """공용 모델 라우터 반환 (text: 분석 모델 후보, vision: Vision 모델 후보)"""
+    global _router
+    with _router_lock:
+        if _router is None:
+            _router = ModelRouter({'text': OLLAMA_TEXT_MODELS, 'vision': OLLAMA_VISION_MODELS})
+        return _router
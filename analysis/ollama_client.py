@@ -0,0 +1,296 @@
+"""
+Ollama 클라이언트 모듈
+연결을 재사용하는 requests.Session으로 /api/generate를 스트리밍 호출합니다.
+
+- keep_alive: 사이클 간격(10분)보다 길게 모델을 메모리에 유지하여 매번 콜드 로딩 방지
+- 스트리밍: 토큰을 받는 즉시 누적하고, JSON 응답을 기다리는 호출은 완전한 JSON 객체가
+  만들어지면 연결을 끊어 생성을 조기 종료
+- warmup: 시작 시 빈 프롬프트로 모델을 미리 로드
+- 지표: 호출별 지연 시간, 첫 토큰 시간, 토큰 처리량
+"""
+
+import json
+import time
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+import requests
+from requests.adapters import HTTPAdapter
+from config.settings import (
+    OLLAMA_BASE_URL, OLLAMA_MODEL, OLLAMA_KEEP_ALIVE, OLLAMA_CONNECT_TIMEOUT,
+    OLLAMA_POOL_SIZE, VISION_API_TIMEOUT
+)
+
+class JsonObjectScanner:
+    """스트림으로 들어오는 텍스트에서 첫 번째 완전한 JSON 객체 감지 (증분 처리)"""
+
+    def __init__(self):
+        self.buffer: List[str] = []
+        self.depth = 0
+        self.in_string = False
+        self.escaped = False
+        self.started = False
+        self.result: Optional[Dict[str, Any]] = None
+
+    def feed(self, text: str) -> Optional[Dict[str, Any]]:
+        """텍스트 추가, 완전한 JSON 객체가 만들어지면 반환"""
+        if self.result is not None:
+            return self.result
+        for char in text:
+            if not self.started:
+                if char != '{':
+                    continue
+                self.started = True
+            self.buffer.append(char)
+            if self.in_string:
+                if self.escaped:
+                    self.escaped = False
+                elif char == '\\':
+                    self.escaped = True
+                elif char == '"':
+                    self.in_string = False
+            elif char == '"':
+                self.in_string = True
+            elif char == '{':
+                self.depth += 1
+            elif char == '}':
+                self.depth -= 1
+                if self.depth == 0:
+                    candidate = ''.join(self.buffer)
+                    try:
+                        parsed = json.loads(candidate)
+                    except ValueError:
+                        # 유효하지 않은 객체는 버리고 다음 '{'부터 다시 탐색
+                        self.__init__()
+                        continue
+                    if isinstance(parsed, dict):
+                        self.result = parsed
+                        return parsed
+        return None
+
+@dataclass
+class GenerateResult:
+    """generate 호출 결과"""
+    text: str
+    model: str
+    latency: float = 0.0  # 요청부터 마지막 토큰까지 (초)
+    first_token_latency: Optional[float] = None  # 요청부터 첫 토큰까지 (초)
+    eval_count: int = 0  # 생성 토큰 수
+    prompt_eval_count: int = 0  # 프롬프트 토큰 수 (Ollama 보고값)
+    prompt_eval_duration: float = 0.0  # 프롬프트 평가 시간 (초)
+    tokens_per_second: float = 0.0
+    load_duration: float = 0.0  # 모델 로딩 시간 (초, Ollama 보고값)
+    stopped_early: bool = False  # JSON 완성으로 조기 종료
+    parsed: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+
+@dataclass
+class ModelMetrics:
+    """모델별 누적 지표"""
+    calls: int = 0
+    errors: int = 0
+    early_stops: int = 0
+    cold_loads: int = 0
+    total_latency: float = 0.0
+    total_tokens: int = 0
+    total_prompt_tokens: int = 0
+    total_prompt_eval: float = 0.0  # 프롬프트 평가 시간 합계 (초)
+    last: Optional[GenerateResult] = field(default=None, repr=False)
+
+    @property
+    def avg_latency(self) -> float:
+        return self.total_latency / self.calls if self.calls else 0.0
+
+class OllamaClient:
+    """연결 재사용/스트리밍 Ollama 클라이언트"""
+
+    def __init__(self, base_url: str = OLLAMA_BASE_URL, keep_alive: str = OLLAMA_KEEP_ALIVE,
+                 connect_timeout: float = OLLAMA_CONNECT_TIMEOUT, read_timeout: float = VISION_API_TIMEOUT,
+                 pool_size: int = OLLAMA_POOL_SIZE):
+        self.base_url = base_url.rstrip('/')
+        self.keep_alive = keep_alive
+        self.timeout = (connect_timeout, read_timeout)  # 스트리밍에서는 토큰 간 최대 대기 시간
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self._metrics: Dict[str, ModelMetrics] = {}
+        self._lock = threading.Lock()
+
+    def generate(self, prompt: str, model: str = OLLAMA_MODEL, images: Optional[List[str]] = None,
+                 temperature: float = 0.7, max_tokens: int = 1000, stop_on_json: bool = False,
+                 options: Optional[Dict[str, Any]] = None, json_format: Any = None,
+                 cancel: Optional[threading.Event] = None, timeout: Optional[float] = None) -> GenerateResult:
+        """
+        스트리밍 생성 (실패 시 error가 설정된 빈 결과 반환)
+
+        Args:
+            stop_on_json: 첫 완전한 JSON 객체가 만들어지면 생성 중단
+            json_format: Ollama format 파라미터 ("json" 또는 JSON 스키마)
+            cancel: 설정되면 다음 토큰에서 연결을 끊고 생성 중단 (error='cancelled')
+            timeout: 호출 전체 시간 예산 (초, 넘으면 생성 중단 error='timeout')
+        """
+        payload: Dict[str, Any] = {
+            "model": model,
+            "prompt": prompt,
+            "stream": True,
+            "keep_alive": self.keep_alive,
+            "options": {"temperature": temperature, "num_predict": max_tokens, **(options or {})},
+        }
+        if images:
+            payload["images"] = images
+        if json_format is not None:
+            payload["format"] = json_format
+
+        result = GenerateResult(text='', model=model)
+        scanner = JsonObjectScanner() if stop_on_json else None
+        chunks: List[str] = []
+        request_timeout = self.timeout
+        if timeout is not None:
+            # 모델 로딩 중이면 첫 토큰이 오지 않으므로 읽기 타임아웃도 예산 안으로 제한
+            request_timeout = (min(self.timeout[0], timeout), min(self.timeout[1], timeout))
+        started = time.perf_counter()
+        try:
+            with self.session.post(f"{self.base_url}/api/generate", json=payload,
+                                   timeout=request_timeout, stream=True) as response:
+                response.raise_for_status()
+                for line in response.iter_lines():
+                    if cancel is not None and cancel.is_set():
+                        result.error = 'cancelled'
+                        break
+                    if timeout is not None and time.perf_counter() - started > timeout:
+                        result.error = 'timeout'
+                        break
+                    if not line:
+                        continue
+                    message = json.loads(line)
+                    if message.get('error'):
+                        raise RuntimeError(message['error'])
+                    token = message.get('response', '')
+                    if token:
+                        if result.first_token_latency is None:
+                            result.first_token_latency = time.perf_counter() - started
+                        chunks.append(token)
+                        result.eval_count += 1
+                        if scanner is not None and scanner.feed(token) is not None:
+                            result.parsed = scanner.result
+                            result.stopped_early = not message.get('done', False)
+                            break
+                    if message.get('done'):
+                        # break하지 않고 스트림 끝까지 읽어야 연결이 풀로 반환됨
+                        self._apply_final_stats(result, message)
+        except Exception as e:
+            # 스트리밍 중 읽기 타임아웃은 requests가 ConnectionError로 감싸므로 경과 시간으로 판단
+            if timeout is not None and time.perf_counter() - started >= timeout:
+                result.error = 'timeout'
+            else:
+                result.error = str(e)
+                print(f"❌ Ollama API 호출 중 오류 ({model}): {e}")
+
+        result.text = ''.join(chunks)
+        result.latency = time.perf_counter() - started
+        if result.tokens_per_second == 0.0 and result.eval_count and result.first_token_latency is not None:
+            generation_time = result.latency - result.first_token_latency
+            if generation_time > 0:
+                result.tokens_per_second = (result.eval_count - 1) / generation_time
+        if result.error in ('cancelled', 'timeout'):
+            reason = '취소됨' if result.error == 'cancelled' else '시간 예산 초과'
+            print(f"⏹️ Ollama {model}: {reason} ({result.latency:.2f}s, {result.eval_count} tokens)")
+        elif not result.error:
+            first_token = f"{result.first_token_latency:.2f}s" if result.first_token_latency is not None else "-"
+            print(f"⏱️ Ollama {model}: {result.latency:.2f}s (첫 토큰 {first_token}, "
+                  f"{result.eval_count} tokens, {result.tokens_per_second:.1f} tok/s"
+                  f"{f', 프롬프트 {result.prompt_eval_count} tokens/{result.prompt_eval_duration:.2f}s' if result.prompt_eval_count else ''}"
+                  f"{', JSON 완성 조기 종료' if result.stopped_early else ''})")
+        self._record(result)
+        return result
+
+    @staticmethod
+    def _apply_final_stats(result: GenerateResult, message: Dict[str, Any]) -> None:
+        """마지막 메시지의 Ollama 통계 반영 (시간 단위: ns)"""
+        eval_count = message.get('eval_count')
+        eval_duration = message.get('eval_duration')
+        if eval_count:
+            result.eval_count = int(eval_count)
+            if eval_duration:
+                result.tokens_per_second = eval_count / (eval_duration / 1e9)
+        result.load_duration = (message.get('load_duration') or 0) / 1e9
+        result.prompt_eval_count = int(message.get('prompt_eval_count') or 0)
+        result.prompt_eval_duration = (message.get('prompt_eval_duration') or 0) / 1e9
+
+    def warmup(self, models: List[str]) -> Dict[str, bool]:
+        """빈 프롬프트로 모델을 메모리에 로드 (keep_alive 유지)"""
+        loaded = {}
+        for model in dict.fromkeys(models):
+            started = time.perf_counter()
+            try:
+                response = self.session.post(f"{self.base_url}/api/generate",
+                                             json={"model": model, "prompt": "", "stream": False,
+                                                   "keep_alive": self.keep_alive},
+                                             timeout=self.timeout)
+                response.raise_for_status()
+                loaded[model] = True
+                print(f"🔥 Ollama 모델 준비 완료: {model} ({time.perf_counter() - started:.1f}초)")
+            except Exception as e:
+                loaded[model] = False
+                print(f"⚠️ Ollama 모델 준비 실패 ({model}): {e}")
+        return loaded
+
+    def loaded_models(self) -> Optional[List[str]]:
+        """현재 메모리에 로드된 모델 목록 (/api/ps, 조회 실패 시 None)"""
+        try:
+            response = self.session.get(f"{self.base_url}/api/ps", timeout=self.timeout[0])
+            response.raise_for_status()
+            return [entry.get('name') or entry.get('model') for entry in response.json().get('models', [])]
+        except Exception as e:
+            print(f"⚠️ Ollama 로드 모델 조회 실패: {e}")
+            return None
+
+    def _record(self, result: GenerateResult) -> None:
+        with self._lock:
+            metrics = self._metrics.setdefault(result.model, ModelMetrics())
+            metrics.calls += 1
+            metrics.last = result
+            if result.error:
+                metrics.errors += 1
+                return
+            metrics.total_latency += result.latency
+            metrics.total_tokens += result.eval_count
+            metrics.total_prompt_tokens += result.prompt_eval_count
+            metrics.total_prompt_eval += result.prompt_eval_duration
+            metrics.early_stops += int(result.stopped_early)
+            metrics.cold_loads += int(result.load_duration > 1.0)
+
+    def metrics(self) -> Dict[str, Dict[str, Any]]:
+        """모델별 누적 지표"""
+        with self._lock:
+            return {
+                model: {
+                    'calls': m.calls,
+                    'errors': m.errors,
+                    'early_stops': m.early_stops,
+                    'cold_loads': m.cold_loads,
+                    'avg_latency': m.avg_latency,
+                    'total_tokens': m.total_tokens,
+                    'total_prompt_tokens': m.total_prompt_tokens,
+                    'avg_prompt_eval': m.total_prompt_eval / m.calls if m.calls else 0.0,
+                    'last_latency': m.last.latency if m.last else None,
+                    'last_first_token_latency': m.last.first_token_latency if m.last else None,
+                    'last_tokens_per_second': m.last.tokens_per_second if m.last else None,
+                }
+                for model, m in self._metrics.items()
+            }
+
+    def close(self) -> None:
+        self.session.close()
+
+_client: Optional[OllamaClient] = None
+_client_lock = threading.Lock()
+
+def get_ollama_client() -> OllamaClient:
+    """공용 Ollama 클라이언트 반환"""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = OllamaClient()
+        return _client
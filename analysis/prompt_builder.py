@@ -0,0 +1,271 @@
+"""
+프롬프트 생성 모듈
+create_market_analysis_data 결과를 섹션별 토큰 예산 안의 간결한 요약 텍스트로 변환합니다.
+
+원본 market_data를 json.dumps로 그대로 보내면 일봉 30개·분봉 100개의 전체 지표 컬럼과
+오더북 전체가 포함되어 수천 토큰이 되므로, 의사결정에 쓰이는 값만 한 줄씩 요약합니다.
+각 섹션은 중요한 줄부터 채우고 예산을 넘는 줄은 버립니다.
+"""
+
+import math
+import re
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional
+from config.settings import (
+    PROMPT_TOKEN_BUDGET, PROMPT_SECTION_BUDGETS, PROMPT_CANDLE_ROWS, PROMPT_NEWS_TITLE_CHARS,
+    TRADING_SYMBOL
+)
+
+_TOKEN_PATTERN = re.compile(r"[A-Za-z]+|\d+|[가-힣]|[^\sA-Za-z\d가-힣]")
+
+def estimate_tokens(text: str) -> int:
+    """
+    토큰 수 추정 (토크나이저 없이 BPE 경향에 맞춘 근사치)
+
+    영문 단어는 4글자당 1토큰, 숫자는 3자리당 1토큰, 한글은 글자당 1토큰, 기호는 1토큰으로 셉니다.
+    """
+    tokens = 0
+    for piece in _TOKEN_PATTERN.findall(text):
+        if piece[0].isascii() and piece[0].isalpha():
+            tokens += math.ceil(len(piece) / 4)
+        elif piece[0].isdigit():
+            tokens += math.ceil(len(piece) / 3)
+        else:
+            tokens += 1
+    return tokens
+
+def _value(row: Optional[Dict[str, Any]], *names: str) -> Optional[float]:
+    """행에서 첫 번째로 존재하는 유한한 숫자 값 (대소문자 컬럼 모두 허용)"""
+    if not row:
+        return None
+    for name in names:
+        for key in (name, name.lower(), name.capitalize(), name.upper()):
+            value = row.get(key)
+            if value is None:
+                continue
+            try:
+                number = float(value)
+            except (TypeError, ValueError):
+                continue
+            if math.isfinite(number):
+                return number
+    return None
+
+def _pct(value: Optional[float], base: Optional[float]) -> Optional[float]:
+    if value is None or not base:
+        return None
+    return (value / base - 1) * 100
+
+def _join(items: Iterable[Optional[str]]) -> str:
+    return ' | '.join(item for item in items if item)
+
+def _fmt(label: str, value: Optional[float], spec: str = '.1f', suffix: str = '') -> Optional[str]:
+    return None if value is None else f"{label} {value:{spec}}{suffix}"
+
+def _price_section(data: Dict[str, Any]) -> List[str]:
+    price = _value(data, 'current_price')
+    daily = data.get('daily_data') or []
+    lines = []
+    if price is not None:
+        lines.append(f"price {price:,.0f} KRW")
+    if daily:
+        prev_close = _value(daily[-2], 'close') if len(daily) > 1 else None
+        highs = [v for v in (_value(row, 'high') for row in daily) if v is not None]
+        lows = [v for v in (_value(row, 'low') for row in daily) if v is not None]
+        reference = price if price is not None else _value(daily[-1], 'close')
+        lines.append(_join([
+            _fmt('1d', _pct(reference, prev_close), '+.2f', '%'),
+            _fmt(f'vs {len(daily)}d high', _pct(reference, max(highs)) if highs else None, '+.1f', '%'),
+            _fmt('low', _pct(reference, min(lows)) if lows else None, '+.1f', '%'),
+        ]))
+    return lines
+
+def _daily_section(data: Dict[str, Any]) -> List[str]:
+    indicators = (data.get('technical_indicators') or {}).get('daily_indicators') or {}
+    if not indicators:
+        return []
+    price = _value(data, 'current_price')
+    macd, signal = _value(indicators, 'macd'), _value(indicators, 'macd_signal')
+    macd_text = None
+    if macd is not None and signal is not None:
+        macd_text = f"MACD {macd:,.0f}/{signal:,.0f} ({'above' if macd >= signal else 'below'} signal)"
+    stoch_k, stoch_d = _value(indicators, 'stoch_k'), _value(indicators, 'stoch_d')
+    stoch_text = f"Stoch K/D {stoch_k:.0f}/{stoch_d:.0f}" if stoch_k is not None and stoch_d is not None else None
+    atr = _value(indicators, 'atr')
+    return [
+        _join([
+            _fmt('RSI', _value(indicators, 'rsi')),
+            macd_text,
+            _fmt('BB pos', _value(indicators, 'bb_position'), '.2f'),
+        ]),
+        _join([
+            _fmt('price vs SMA20', _pct(price, _value(indicators, 'sma_20')), '+.1f', '%'),
+            _fmt('SMA50', _pct(price, _value(indicators, 'sma_50')), '+.1f', '%'),
+            _fmt('EMA12/26', _pct(_value(indicators, 'ema_12'), _value(indicators, 'ema_26')), '+.2f', '%'),
+        ]),
+        _join([
+            stoch_text,
+            _fmt('W%R', _value(indicators, 'williams_r'), '.0f'),
+            _fmt('ADX', _value(indicators, 'adx'), '.0f'),
+        ]),
+        _join([
+            _fmt('CCI', _value(indicators, 'cci'), '.0f'),
+            _fmt('ROC', _value(indicators, 'roc'), '+.1f', '%'),
+            _fmt('ATR', atr / price * 100 if atr is not None and price else None, '.1f', '%'),
+        ]),
+    ]
+
+def _minute_section(data: Dict[str, Any]) -> List[str]:
+    indicators = (data.get('technical_indicators') or {}).get('minute_indicators') or {}
+    closes = [v for v in (_value(row, 'close') for row in data.get('minute_data') or []) if v is not None]
+    lines = []
+    if indicators:
+        lines.append(_join([
+            _fmt('RSI', _value(indicators, 'rsi')),
+            _fmt('BB pos', _value(indicators, 'bb_position'), '.2f'),
+            _fmt('Stoch K', _value(indicators, 'stoch_k'), '.0f'),
+            _fmt('W%R', _value(indicators, 'williams_r'), '.0f'),
+        ]))
+    if closes:
+        lines.append(_join(
+            _fmt(f'{bars}bar', _pct(closes[-1], closes[-1 - bars]), '+.2f', '%')
+            for bars in (5, 15, 60) if len(closes) > bars
+        ))
+    return lines
+
+def _sentiment_section(data: Dict[str, Any]) -> List[str]:
+    fear_greed = data.get('fear_greed_index')
+    if not isinstance(fear_greed, dict):
+        return []
+    value = _value(fear_greed, 'current_value', 'value')
+    if value is None:
+        return []
+    label = fear_greed.get('current_classification') or fear_greed.get('value_classification') or ''
+    change = _value(fear_greed, 'value_change')
+    return [_join([f"fear&greed {value:.0f} {label}".strip(), _fmt('chg', change, '+.0f')])]
+
+def _orderbook_section(data: Dict[str, Any]) -> List[str]:
+    orderbook = data.get('orderbook')
+    units = (orderbook or {}).get('orderbook_units') or []
+    if not units:
+        return []
+    ask, bid = _value(units[0], 'ask_price'), _value(units[0], 'bid_price')
+    top = units[:5]
+    ask_size = sum(_value(unit, 'ask_size') or 0 for unit in top)
+    bid_size = sum(_value(unit, 'bid_size') or 0 for unit in top)
+    total = ask_size + bid_size
+    return [_join([
+        _fmt('spread', (ask - bid) / ask * 100 if ask and bid else None, '.3f', '%'),
+        _fmt('top5 bid share', bid_size / total * 100 if total else None, '.0f', '%'),
+    ])]
+
+def _candles_section(data: Dict[str, Any]) -> List[str]:
+    daily = data.get('daily_data') or []
+    if len(daily) < 2:
+        return []
+    volumes = [v for v in (_value(row, 'volume') for row in daily) if v is not None]
+    avg_volume = sum(volumes) / len(volumes) if volumes else None
+    lines = []
+    # 최근 캔들부터 (예산 초과 시 오래된 캔들이 잘림)
+    for offset in range(1, min(PROMPT_CANDLE_ROWS, len(daily) - 1) + 1):
+        row, previous = daily[-offset], daily[-offset - 1]
+        close, high, low = _value(row, 'close'), _value(row, 'high'), _value(row, 'low')
+        volume = _value(row, 'volume')
+        change = _pct(close, _value(previous, 'close'))
+        if close is None or change is None:
+            continue
+        day_range = (high - low) / close * 100 if high is not None and low is not None else 0.0
+        volume_ratio = volume / avg_volume if volume is not None and avg_volume else 0.0
+        lines.append(f"d-{offset - 1}: {close:,.0f} {change:+.1f} {day_range:.1f} {volume_ratio:.1f}")
+    return ["day: close chg% range% vol/avg"] + lines if lines else []
+
+def _news_section(data: Dict[str, Any]) -> List[str]:
+    news = data.get('news_analysis')
+    if not news:
+        return []
+    lines = [_join([
+        f"{news.get('total_news', 0)} articles",
+        f"+{news.get('positive_count', 0)}/-{news.get('negative_count', 0)}/={news.get('neutral_count', 0)}",
+        _fmt('avg sentiment', _value(news, 'average_sentiment'), '+.2f'),
+    ])]
+    for item in news.get('recent_news') or []:
+        title = str(item.get('title', '')).strip()
+        if not title:
+            continue
+        if len(title) > PROMPT_NEWS_TITLE_CHARS:
+            title = title[:PROMPT_NEWS_TITLE_CHARS - 1] + '…'
+        lines.append(f"[{item.get('sentiment', '중립')}] {title}")
+    return lines
+
+SECTIONS: Dict[str, Callable[[Dict[str, Any]], List[str]]] = {
+    'price': _price_section,
+    'daily': _daily_section,
+    'minute': _minute_section,
+    'sentiment': _sentiment_section,
+    'orderbook': _orderbook_section,
+    'candles': _candles_section,
+    'news': _news_section,
+}
+
+@dataclass
+class BuiltPrompt:
+    """생성된 프롬프트와 섹션별 토큰 사용량"""
+    text: str
+    tokens: int
+    section_tokens: Dict[str, int] = field(default_factory=dict)
+    truncated: List[str] = field(default_factory=list)  # 예산 때문에 줄이 잘린 섹션
+
+class PromptBuilder:
+    """섹션별 토큰 예산을 적용한 시장 데이터 요약 생성기"""
+
+    def __init__(self, budgets: Optional[Dict[str, int]] = None, total_budget: int = PROMPT_TOKEN_BUDGET,
+                 counter: Callable[[str], int] = estimate_tokens):
+        self.budgets = dict(PROMPT_SECTION_BUDGETS if budgets is None else budgets)
+        self.total_budget = total_budget
+        self.counter = counter
+
+    def summarize(self, market_data: Dict[str, Any]) -> BuiltPrompt:
+        """market_data 요약 (예산 순서대로 섹션을 채우고, 남은 전체 예산으로 섹션 예산 제한)"""
+        blocks: List[str] = []
+        section_tokens: Dict[str, int] = {}
+        truncated: List[str] = []
+        remaining = self.total_budget
+
+        for name, budget in self.budgets.items():
+            render = SECTIONS.get(name)
+            if render is None or remaining <= 0:
+                continue
+            lines = [line for line in render(market_data) if line]
+            if not lines:
+                continue
+            limit = min(budget, remaining)
+            header = f"[{name}]"
+            used = self.counter(header)
+            kept = []
+            for line in lines:
+                cost = self.counter(line) + 1  # 줄바꿈
+                if used + cost > limit:
+                    break
+                kept.append(line)
+                used += cost
+            if len(kept) < len(lines):
+                truncated.append(name)
+            if not kept:
+                continue
+            blocks.append('\n'.join([header] + kept))
+            section_tokens[name] = used
+            remaining -= used
+
+        text = '\n'.join(blocks)
+        return BuiltPrompt(text, self.counter(text), section_tokens, truncated)
+
+    def build(self, instructions: str, market_data: Dict[str, Any]) -> BuiltPrompt:
+        """지시문 + 시장 데이터 요약 프롬프트"""
+        summary = self.summarize(market_data)
+        symbol = market_data.get('symbol') or TRADING_SYMBOL
+        text = f"{instructions.strip()}\n\n{symbol} market summary:\n{summary.text}"
+        return BuiltPrompt(text, self.counter(text), summary.section_tokens, summary.truncated)
+
+def build_decision_prompt(instructions: str, market_data: Dict[str, Any]) -> BuiltPrompt:
+    """설정된 예산으로 매매 결정 프롬프트 생성"""
+    return PromptBuilder().build(instructions, market_data)
@@ -9,7 +9,7 @@ from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass
 from mysql.connector import Error
 import numpy as np
-from database.connection import get_db_connection
+from database.connection import pooled_connection
 from analysis.ai_analysis import analyze_market_sentiment
 from utils.logger import get_logger
 
@@ -55,7 +55,6 @@ class TradingReflectionSystem:
     
     def __init__(self):
         self.logger = get_logger(__name__)
-        self.connection = get_db_connection()
     
     def create_immediate_reflection(self, trade_id: int, trade_data: Dict[str, Any], 
                                   market_data: Dict[str, Any]) -> bool:
@@ -344,29 +343,30 @@ class TradingReflectionSystem:
     def _save_reflection(self, reflection: TradeReflection) -> bool:
         """반성 데이터 저장"""
         try:
-            cursor = self.connection.cursor()
-            
-            insert_query = """
-            INSERT INTO trading_reflections (
-                trade_id, reflection_type, performance_score, profit_loss, profit_loss_percentage,
-                market_conditions, decision_quality_score, timing_score, risk_management_score,
-                ai_analysis, improvement_suggestions, lessons_learned, next_actions
-            ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-            """
-            
-            cursor.execute(insert_query, (
-                reflection.trade_id, reflection.reflection_type, reflection.performance_score,
-                reflection.profit_loss, reflection.profit_loss_percentage,
-                json.dumps(reflection.market_conditions, ensure_ascii=False),
-                reflection.decision_quality_score, reflection.timing_score, reflection.risk_management_score,
-                reflection.ai_analysis, reflection.improvement_suggestions,
-                reflection.lessons_learned, reflection.next_actions
-            ))
-            
-            self.connection.commit()
-            cursor.close()
+            with pooled_connection() as connection:
+                cursor = connection.cursor()
+            
+                insert_query = """
+                INSERT INTO trading_reflections (
+                    trade_id, reflection_type, performance_score, profit_loss, profit_loss_percentage,
+                    market_conditions, decision_quality_score, timing_score, risk_management_score,
+                    ai_analysis, improvement_suggestions, lessons_learned, next_actions
+                ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+                """
+            
+                cursor.execute(insert_query, (
+                    reflection.trade_id, reflection.reflection_type, reflection.performance_score,
+                    reflection.profit_loss, reflection.profit_loss_percentage,
+                    json.dumps(reflection.market_conditions, ensure_ascii=False),
+                    reflection.decision_quality_score, reflection.timing_score, reflection.risk_management_score,
+                    reflection.ai_analysis, reflection.improvement_suggestions,
+                    reflection.lessons_learned, reflection.next_actions
+                ))
+            
+                connection.commit()
+                cursor.close()
             
-            return True
+                return True
             
         except Error as e:
             self.logger.error(f"반성 데이터 저장 오류: {e}")
@@ -375,19 +375,20 @@ class TradingReflectionSystem:
     def _get_trades_in_period(self, start_date: datetime, end_date: datetime) -> List[Dict[str, Any]]:
         """기간 내 거래 데이터 조회"""
         try:
-            cursor = self.connection.cursor(dictionary=True)
+            with pooled_connection() as connection:
+                cursor = connection.cursor(dictionary=True)
             
-            select_query = """
-            SELECT * FROM trades 
-            WHERE timestamp BETWEEN %s AND %s
-            ORDER BY timestamp ASC
-            """
+                select_query = """
+                SELECT * FROM trades 
+                WHERE timestamp BETWEEN %s AND %s
+                ORDER BY timestamp ASC
+                """
             
-            cursor.execute(select_query, (start_date, end_date))
-            trades = cursor.fetchall()
+                cursor.execute(select_query, (start_date, end_date))
+                trades = cursor.fetchall()
             
-            cursor.close()
-            return trades
+                cursor.close()
+                return trades
             
         except Error as e:
             self.logger.error(f"거래 데이터 조회 오류: {e}")
@@ -485,31 +486,32 @@ class TradingReflectionSystem:
     def _save_performance_metrics(self, metrics: PerformanceMetrics) -> bool:
         """성과 지표 저장"""
         try:
-            cursor = self.connection.cursor()
-            
-            insert_query = """
-            INSERT INTO performance_metrics (
-                period_type, period_start, period_end, total_trades, winning_trades, losing_trades,
-                win_rate, total_profit_loss, total_profit_loss_percentage, max_drawdown, sharpe_ratio,
-                average_trade_duration, best_trade_profit, worst_trade_loss,
-                market_condition_performance, strategy_performance
-            ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-            """
-            
-            cursor.execute(insert_query, (
-                metrics.period_type, metrics.period_start, metrics.period_end,
-                metrics.total_trades, metrics.winning_trades, metrics.losing_trades,
-                metrics.win_rate, metrics.total_profit_loss, metrics.total_profit_loss_percentage,
-                metrics.max_drawdown, metrics.sharpe_ratio, metrics.average_trade_duration,
-                metrics.best_trade_profit, metrics.worst_trade_loss,
-                json.dumps(metrics.market_condition_performance, ensure_ascii=False),
-                json.dumps(metrics.strategy_performance, ensure_ascii=False)
-            ))
-            
-            self.connection.commit()
-            cursor.close()
+            with pooled_connection() as connection:
+                cursor = connection.cursor()
+            
+                insert_query = """
+                INSERT INTO performance_metrics (
+                    period_type, period_start, period_end, total_trades, winning_trades, losing_trades,
+                    win_rate, total_profit_loss, total_profit_loss_percentage, max_drawdown, sharpe_ratio,
+                    average_trade_duration, best_trade_profit, worst_trade_loss,
+                    market_condition_performance, strategy_performance
+                ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+                """
+            
+                cursor.execute(insert_query, (
+                    metrics.period_type, metrics.period_start, metrics.period_end,
+                    metrics.total_trades, metrics.winning_trades, metrics.losing_trades,
+                    metrics.win_rate, metrics.total_profit_loss, metrics.total_profit_loss_percentage,
+                    metrics.max_drawdown, metrics.sharpe_ratio, metrics.average_trade_duration,
+                    metrics.best_trade_profit, metrics.worst_trade_loss,
+                    json.dumps(metrics.market_condition_performance, ensure_ascii=False),
+                    json.dumps(metrics.strategy_performance, ensure_ascii=False)
+                ))
+            
+                connection.commit()
+                cursor.close()
             
-            return True
+                return True
             
         except Error as e:
             self.logger.error(f"성과 지표 저장 오류: {e}")
@@ -608,26 +610,27 @@ class TradingReflectionSystem:
     def _save_learning_insight(self, insight: Dict[str, Any]) -> bool:
         """학습 인사이트 저장"""
         try:
-            cursor = self.connection.cursor()
+            with pooled_connection() as connection:
+                cursor = connection.cursor()
+            
+                insert_query = """
+                INSERT INTO learning_insights (
+                    insight_type, insight_title, insight_description, confidence_level,
+                    supporting_data, applicable_conditions, action_items, priority_level
+                ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+                """
+            
+                cursor.execute(insert_query, (
+                    insight['insight_type'], insight['insight_title'], insight['insight_description'],
+                    insight['confidence_level'], json.dumps(insight['supporting_data'], ensure_ascii=False),
+                    json.dumps(insight['applicable_conditions'], ensure_ascii=False),
+                    insight['action_items'], insight['priority_level']
+                ))
+            
+                connection.commit()
+                cursor.close()
             
-            insert_query = """
-            INSERT INTO learning_insights (
-                insight_type, insight_title, insight_description, confidence_level,
-                supporting_data, applicable_conditions, action_items, priority_level
-            ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-            """
-            
-            cursor.execute(insert_query, (
-                insight['insight_type'], insight['insight_title'], insight['insight_description'],
-                insight['confidence_level'], json.dumps(insight['supporting_data'], ensure_ascii=False),
-                json.dumps(insight['applicable_conditions'], ensure_ascii=False),
-                insight['action_items'], insight['priority_level']
-            ))
-            
-            self.connection.commit()
-            cursor.close()
-            
-            return True
+                return True
             
         except Error as e:
             self.logger.error(f"학습 인사이트 저장 오류: {e}")
@@ -717,28 +720,29 @@ class TradingReflectionSystem:
     def _save_strategy_improvement(self, improvement: Dict[str, Any]) -> bool:
         """전략 개선 제안 저장"""
         try:
-            cursor = self.connection.cursor()
-            
-            insert_query = """
-            INSERT INTO strategy_improvements (
-                improvement_type, old_value, new_value, reason, expected_impact,
-                implementation_date, validation_period_days, performance_before,
-                performance_after, success_metric, status
-            ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-            """
-            
-            cursor.execute(insert_query, (
-                improvement['improvement_type'], improvement['old_value'], improvement['new_value'],
-                improvement['reason'], improvement['expected_impact'], improvement['implementation_date'],
-                improvement['validation_period_days'], json.dumps(improvement['performance_before'], ensure_ascii=False),
-                json.dumps(improvement['performance_after'], ensure_ascii=False),
-                improvement['success_metric'], improvement['status']
-            ))
-            
-            self.connection.commit()
-            cursor.close()
+            with pooled_connection() as connection:
+                cursor = connection.cursor()
+            
+                insert_query = """
+                INSERT INTO strategy_improvements (
+                    improvement_type, old_value, new_value, reason, expected_impact,
+                    implementation_date, validation_period_days, performance_before,
+                    performance_after, success_metric, status
+                ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+                """
+            
+                cursor.execute(insert_query, (
+                    improvement['improvement_type'], improvement['old_value'], improvement['new_value'],
+                    improvement['reason'], improvement['expected_impact'], improvement['implementation_date'],
+                    improvement['validation_period_days'], json.dumps(improvement['performance_before'], ensure_ascii=False),
+                    json.dumps(improvement['performance_after'], ensure_ascii=False),
+                    improvement['success_metric'], improvement['status']
+                ))
+            
+                connection.commit()
+                cursor.close()
             
-            return True
+                return True
             
         except Error as e:
             self.logger.error(f"전략 개선 제안 저장 오류: {e}")
@@ -0,0 +1,126 @@
+"""
+구조화 출력 모듈
+모델 응답을 TradingDecision JSON 스키마로 받아 pydantic으로 검증합니다.
+
+- Ollama format 파라미터에 스키마를 넘겨 디코딩 단계에서 형식을 제한
+- 검증 실패 시 먼저 로컬 정규화(한글 값/퍼센트 신뢰도 등)를 시도하고,
+  그래도 실패하면 오류 내용과 함께 짧은 수정 요청을 한 번만 보냄
+- 결과 종류(정상/정규화/수정/실패)를 집계하여 모델이 형식을 벗어나는 빈도를 확인
+"""
+
+import json
+import threading
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional, Tuple
+from pydantic import ValidationError
+from .models import TradingDecision
+from .ollama_client import JsonObjectScanner
+
+_DECISION_ALIASES = {'매수': 'buy', '매도': 'sell', '보유': 'hold', '관망': 'hold'}
+_RISK_ALIASES = {'낮음': 'low', '중간': 'medium', '보통': 'medium', '높음': 'high'}
+_CONFIDENCE_ALIASES = {'높음': 0.8, 'high': 0.8, '중간': 0.5, 'medium': 0.5, '낮음': 0.3, 'low': 0.3}
+
+REPAIR_PROMPT = """The JSON below does not match the required schema.
+Validation errors:
+{errors}
+
+JSON:
+{raw}
+
+Return only the corrected JSON object that matches the schema. Keep the original decision and reasoning."""
+
+_stats = {'requests': 0, 'valid': 0, 'normalized': 0, 'repaired': 0, 'failed': 0}
+_stats_lock = threading.Lock()
+
+def _count(name: str) -> None:
+    with _stats_lock:
+        _stats[name] += 1
+
+def get_structured_output_stats() -> Dict[str, Any]:
+    """구조화 출력 결과 집계 (수정 요청 비율 포함)"""
+    with _stats_lock:
+        stats = dict(_stats)
+    requests = stats['requests']
+    stats['repair_rate'] = (stats['repaired'] + stats['failed']) / requests if requests else 0.0
+    return stats
+
+@lru_cache(maxsize=None)
+def _schema_json() -> str:
+    return json.dumps(TradingDecision.model_json_schema(), ensure_ascii=False)
+
+def trading_decision_schema() -> Dict[str, Any]:
+    """Ollama format 파라미터용 TradingDecision JSON 스키마"""
+    return json.loads(_schema_json())
+
+def extract_json_object(text: str) -> Optional[Dict[str, Any]]:
+    """텍스트에서 첫 번째 완전한 JSON 객체"""
+    return JsonObjectScanner().feed(text or '')
+
+def normalize_decision(data: Dict[str, Any]) -> Dict[str, Any]:
+    """자주 벗어나는 값 정리 (한글 결정/위험도, 문자열·퍼센트 신뢰도, 대소문자)"""
+    data = dict(data)
+    for field, aliases in (('decision', _DECISION_ALIASES), ('risk_level', _RISK_ALIASES)):
+        value = data.get(field)
+        if isinstance(value, str):
+            value = value.strip()
+            data[field] = aliases.get(value, value.lower())
+    confidence = data.get('confidence')
+    if isinstance(confidence, str):
+        confidence = confidence.strip().rstrip('%').lower()
+        confidence = _CONFIDENCE_ALIASES.get(confidence, confidence)
+        try:
+            confidence = float(confidence)
+        except ValueError:
+            pass
+    if isinstance(confidence, (int, float)) and 1 < confidence <= 100:
+        confidence = confidence / 100
+    data['confidence'] = confidence
+    indicators = data.get('key_indicators')
+    if isinstance(indicators, dict):
+        data['key_indicators'] = {k: v.strip().lower() if isinstance(v, str) else v for k, v in indicators.items()}
+    return data
+
+def _validate(data: Optional[Dict[str, Any]]) -> Tuple[Optional[TradingDecision], str]:
+    if data is None:
+        return None, "no JSON object found"
+    try:
+        return TradingDecision.model_validate(data), ''
+    except ValidationError as e:
+        errors = '; '.join(f"{'.'.join(str(p) for p in error['loc'])}: {error['msg']}" for error in e.errors())
+        return None, errors
+
+def decode_decision(raw: str, repair: Optional[Callable[[str], str]] = None) -> Optional[TradingDecision]:
+    """
+    모델 응답을 TradingDecision으로 검증
+
+    Args:
+        raw: 모델 응답 텍스트
+        repair: 수정 프롬프트를 받아 모델 응답을 돌려주는 함수 (한 번만 호출, None이면 수정 생략)
+    """
+    _count('requests')
+    data = extract_json_object(raw)
+    decision, errors = _validate(data)
+    if decision is not None:
+        _count('valid')
+        return decision
+
+    if data is not None:
+        decision, errors = _validate(normalize_decision(data))
+        if decision is not None:
+            _count('normalized')
+            return decision
+
+    if repair is not None:
+        print(f"🔧 구조화 응답 수정 요청: {errors}")
+        repaired_text = repair(REPAIR_PROMPT.format(errors=errors, raw=(raw or '')[:2000]))
+        repaired = extract_json_object(repaired_text)
+        decision, errors = _validate(repaired)
+        if decision is None and repaired is not None:
+            decision, errors = _validate(normalize_decision(repaired))
+        if decision is not None:
+            _count('repaired')
+            return decision
+
+    _count('failed')
+    print(f"⚠️ 구조화 응답 검증 실패: {errors}")
+    return None
@@ -11,15 +11,13 @@ from ta.momentum import StochasticOscillator, WilliamsRIndicator, RSIIndicator
 from ta.volatility import BollingerBands, AverageTrueRange
 from ta.volume import OnBalanceVolumeIndicator
 from typing import Optional
+from config.settings import VECTORIZED_INDICATORS_ENABLED
+from .indicator_kernel import INDICATOR_COLUMNS, MIN_ROWS, compute_indicator_arrays
 
-def calculate_technical_indicators(df: pd.DataFrame) -> pd.DataFrame:
-    """기술적 지표 계산 함수"""
-    if df.empty:
-        return df
-    
+def normalize_ohlcv_columns(df: pd.DataFrame) -> Optional[pd.DataFrame]:
+    """OHLCV 컬럼명을 Open/High/Low/Close/Volume으로 통일 (필수 컬럼이 없으면 None)"""
     # 기본 OHLCV 컬럼명 확인 및 통일
     required_columns = ['open', 'high', 'low', 'close', 'volume']
-    df_columns = [col.lower() for col in df.columns]
     
     # 컬럼명 매핑
     column_mapping = {}
@@ -29,20 +27,67 @@ def calculate_technical_indicators(df: pd.DataFrame) -> pd.DataFrame:
                 column_mapping[req_col] = df_col
                 break
     
-    # 필수 컬럼이 없으면 원본 반환
+    # 필수 컬럼이 없으면 None 반환
     if len(column_mapping) < 5:
-        print("❌ 필수 OHLCV 컬럼을 찾을 수 없습니다.")
-        return df
+        return None
     
     # 컬럼명 통일
-    df_renamed = df.rename(columns={
+    return df.rename(columns={
         column_mapping['open']: 'Open',
         column_mapping['high']: 'High', 
         column_mapping['low']: 'Low',
         column_mapping['close']: 'Close',
         column_mapping['volume']: 'Volume'
     })
+
+def calculate_technical_indicators(df: pd.DataFrame) -> pd.DataFrame:
+    """기술적 지표 계산 함수"""
+    if df.empty:
+        return df
     
+    df_renamed = normalize_ohlcv_columns(df)
+    if df_renamed is None:
+        print("❌ 필수 OHLCV 컬럼을 찾을 수 없습니다.")
+        return df
+    
+    # NumPy 커널로 전체 지표를 한 번에 계산 (짧은 데이터나 오류 시 ta 계산)
+    if VECTORIZED_INDICATORS_ENABLED and len(df_renamed) >= MIN_ROWS:
+        try:
+            result = apply_indicator_kernel(df_renamed)
+            print(f"✅ 기술적 지표 계산 완료: {len(result.columns)}개 컬럼")
+            return result
+        except Exception as e:
+            print(f"⚠️ NumPy 지표 커널 오류, ta 계산으로 대체: {e}")
+    
+    return _calculate_with_ta(df, df_renamed)
+
+def calculate_technical_indicators_ta(df: pd.DataFrame) -> pd.DataFrame:
+    """ta 라이브러리 기반 기술적 지표 계산 (기준 구현)"""
+    if df.empty:
+        return df
+    
+    df_renamed = normalize_ohlcv_columns(df)
+    if df_renamed is None:
+        print("❌ 필수 OHLCV 컬럼을 찾을 수 없습니다.")
+        return df
+    
+    return _calculate_with_ta(df, df_renamed)
+
+def apply_indicator_kernel(df_renamed: pd.DataFrame) -> pd.DataFrame:
+    """NumPy 커널 결과를 지표 컬럼으로 추가 (컬럼명은 normalize_ohlcv_columns 기준)"""
+    out = compute_indicator_arrays(
+        df_renamed['Open'].to_numpy(dtype=np.float64),
+        df_renamed['High'].to_numpy(dtype=np.float64),
+        df_renamed['Low'].to_numpy(dtype=np.float64),
+        df_renamed['Close'].to_numpy(dtype=np.float64),
+        df_renamed['Volume'].to_numpy(dtype=np.float64),
+    )
+    indicators = pd.DataFrame(out.T, index=df_renamed.index, columns=INDICATOR_COLUMNS)
+    base = df_renamed.drop(columns=[name for name in INDICATOR_COLUMNS if name in df_renamed.columns])
+    return pd.concat([base, indicators], axis=1)
+
+def _calculate_with_ta(df: pd.DataFrame, df_renamed: pd.DataFrame) -> pd.DataFrame:
+    """지표별 ta 객체를 사용한 계산"""
     try:
         # 1. 이동평균선 (SMA, EMA)
         df_renamed['SMA_20'] = SMAIndicator(close=df_renamed['Close'], window=20).sma_indicator()
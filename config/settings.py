@@ -20,12 +20,43 @@ SERP_API_KEY = os.getenv("SERP_API_KEY")
 OLLAMA_BASE_URL = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
 OLLAMA_MODEL = os.getenv("OLLAMA_MODEL", "gpt-oss:20b")
 OLLAMA_VISION_MODEL = os.getenv("OLLAMA_VISION_MODEL", "llava:7b")
+OLLAMA_KEEP_ALIVE = os.getenv("OLLAMA_KEEP_ALIVE", "30m")  # 모델 메모리 유지 시간 (거래 사이클 간격보다 길게)
+OLLAMA_CONNECT_TIMEOUT = 5  # Ollama 연결 타임아웃 (초)
+OLLAMA_POOL_SIZE = 4  # Ollama HTTP 연결 풀 크기
+OLLAMA_WARMUP_ENABLED = True  # 시작 시 분석/Vision 모델 미리 로드
+# 작업별 후보 모델 (선호 순서, 뒤쪽은 느리거나 로딩 중일 때 쓰는 작은 양자화 모델)
+OLLAMA_TEXT_MODELS = [m.strip() for m in os.getenv("OLLAMA_TEXT_MODELS", f"{OLLAMA_MODEL},qwen2.5:7b-instruct-q4_K_M").split(",") if m.strip()]
+OLLAMA_VISION_MODELS = [m.strip() for m in os.getenv("OLLAMA_VISION_MODELS", f"{OLLAMA_VISION_MODEL},moondream:1.8b-v2-q4_K_M").split(",") if m.strip()]
+ROUTER_LATENCY_WINDOW = 20  # 모델별 지연 시간/오류율 계산에 쓰는 최근 호출 수
+ROUTER_MAX_ERROR_RATE = 0.5  # 최근 오류율이 이 값을 넘으면 후보 순서에서 뒤로 미룸
+ROUTER_COLD_LOAD_PENALTY = 60  # 메모리에 없는 모델의 예상 로딩 시간 (초, 관측값이 없을 때)
+ROUTER_LOADED_CHECK_INTERVAL = 30  # 로드된 모델 목록(/api/ps) 재조회 간격 (초)
+ROUTER_MIN_ATTEMPT_SECONDS = 5  # 대체 모델 몫을 남기고도 최소한 보장하는 시도 시간 (초)
 
 # 트레이딩 설정
 TRADING_SYMBOL = "KRW-BTC"
+# 매매 대상 마켓 (쉼표 구분, 첫 번째가 기본 심볼 - Vision 차트 분석은 기본 심볼만)
+TRADING_SYMBOLS = [s.strip() for s in os.getenv("TRADING_SYMBOLS", TRADING_SYMBOL).split(",") if s.strip()] or [TRADING_SYMBOL]
+PORTFOLIO_MAX_WORKERS = 8  # 심볼별 데이터 수집/지표/결정 동시 처리 스레드 수
+PORTFOLIO_SYMBOL_TIMEOUT = 90  # 심볼 하나의 분석 최대 대기 시간 (초, 초과 시 이번 사이클 제외)
+PORTFOLIO_DECISION_MARGIN = 5  # 심볼 분석 시간 중 모델 마감 후 결정 정리용으로 남겨 둘 시간 (초, 모델 마감 = 타임아웃 - 데이터 수집 - 여유)
 MIN_TRADE_AMOUNT = 5000  # 최소 거래 금액 (원)
 TRADE_RATIO = 0.95  # 거래 시 사용할 비율 (95%)
 FEE_RATE = 0.0005  # 수수료율 (0.05%)
+ORDER_POLL_INITIAL_DELAY = 0.1  # 주문 체결 조회 첫 대기 시간 (초, 시장가는 대부분 수백 ms 안에 체결)
+ORDER_POLL_MAX_DELAY = 1.0  # 주문 체결 조회 간격 상한 (초)
+ORDER_POLL_BACKOFF = 1.5  # 조회할 때마다 대기 시간에 곱하는 배수
+ORDER_FILL_TIMEOUT = 15  # 체결 완료를 기다리는 최대 시간 (초, 초과 시 마지막 조회 결과로 기록)
+# 주문 실행 알고리즘 (market: 호가 잔량 안에서 시장가, passive: 최우선 호가 지정가 후 시간 초과 시 시장가, twap: 나눠서 passive)
+EXECUTION_ALGORITHM = os.getenv("EXECUTION_ALGORITHM", "market")  # passive/twap은 지정가 대기만큼 체결이 늦어지므로 명시적으로 선택할 때만
+EXECUTION_PASSIVE_TIMEOUT = 10  # 최우선 호가 지정가 대기 시간 (초, 이후 취소하고 남은 수량 시장가)
+EXECUTION_CANCEL_TIMEOUT = 3  # 지정가 취소 후 최종 체결 수량 확인 대기 시간 (초)
+EXECUTION_CANCEL_RETRIES = 3  # 지정가 취소 요청 최대 시도 횟수 (그래도 대기 중이면 시장가 전환 없이 중단)
+EXECUTION_MAX_IMPACT_BPS = 10  # 시장가 한 조각이 최우선 호가 대비 밀어 올려도 되는 가격 범위 (bp)
+EXECUTION_REFILL_WAIT = 1.0  # 호가 잔량을 넘는 시장가 주문을 나눌 때 다음 조각까지 대기 (초)
+EXECUTION_MAX_CHILDREN = 10  # 시장가 조각 수 상한 (마지막 조각은 남은 수량 전부)
+EXECUTION_TWAP_SLICES = 4  # TWAP 조각 수
+EXECUTION_TWAP_INTERVAL = 15  # TWAP 조각 간격 (초)
 
 # 분석 설정
 DAILY_DATA_COUNT = 30  # 일봉 데이터 개수
@@ -37,6 +68,71 @@ TECHNICAL_INDICATORS = [
     'Stoch_K', 'Stoch_D', 'Williams_R', 'ATR',
     'ADX', 'OBV', 'ROC', 'CCI'
 ]
+INCREMENTAL_INDICATORS_ENABLED = True  # 분봉 지표를 새 캔들만 증분 계산
+VECTORIZED_INDICATORS_ENABLED = True  # 전체 지표 계산에 NumPy 커널 사용 (False면 ta 사용)
+
+# 로컬 캔들 저장소 설정 (마지막 저장 캔들 이후 구간만 조회)
+CANDLE_STORE_ENABLED = True
+CANDLE_STORE_DIR = os.getenv("CANDLE_STORE_DIR", "candles")  # 심볼/간격별 .npz 파일 저장 경로
+CANDLE_STORE_MAX_ROWS = 10080  # 심볼/간격별 최대 보관 캔들 수 (분봉 7일)
+
+# 업비트 REST 클라이언트 설정 (요청 그룹별 토큰 버킷, Remaining-Req 헤더로 보정)
+UPBIT_API_URL = os.getenv("UPBIT_API_URL", "https://api.upbit.com")
+UPBIT_RATE_LIMITS = {  # 요청 그룹별 초당 요청 수 (업비트 한도보다 약간 낮게)
+    'order': 7, 'default': 25,
+    'market': 9, 'candles': 9, 'ticker': 9, 'orderbook': 9, 'trades': 9,
+}
+UPBIT_ORDER_RESERVE = 2  # 주문 조회/취소 등 주문 레인을 위해 같은 그룹에서 남겨 두는 토큰 수
+UPBIT_MAX_RETRIES = 3  # 429/일시 오류 재시도 횟수
+UPBIT_RETRY_BASE_DELAY = 0.2  # 재시도 기본 대기 시간 (초, 지수 증가 + 지터)
+UPBIT_REQUEST_TIMEOUT = (3, 10)  # (연결, 읽기) 타임아웃 (초)
+UPBIT_LIMIT_WAIT_TIMEOUT = 10  # 토큰을 기다리는 최대 시간 (초)
+
+# 실시간 시세 피드 설정 (업비트 WebSocket)
+REALTIME_FEED_ENABLED = True
+REALTIME_FEED_URL = os.getenv("UPBIT_WEBSOCKET_URL", "wss://api.upbit.com/websocket/v1")
+REALTIME_FEED_MAX_AGE = 10  # 스냅샷 유효 시간 (초, 초과 시 REST 조회)
+REALTIME_FEED_RECONNECT_INITIAL = 1  # 재연결 초기 대기 (초)
+REALTIME_FEED_RECONNECT_MAX = 60  # 재연결 최대 대기 (초)
+REALTIME_FEED_TRADE_HISTORY = 500  # 심볼별 보관 체결 내역 수
+
+# 외부 API 응답 캐시 설정 (TTL / stale 허용 시간, 초)
+CACHE_DIR = os.getenv("CACHE_DIR", "cache")  # 디스크 계층 저장 경로 (빈 값이면 메모리만 사용)
+FEAR_GREED_CACHE_TTL = 3600  # 공포탐욕지수 (하루 1회 갱신)
+FEAR_GREED_CACHE_STALE = 86400
+NEWS_CACHE_TTL = 3600  # 뉴스
+NEWS_CACHE_STALE = 7200
+PRICE_CACHE_TTL = 2  # REST 현재가/오더북 (실시간 피드 미사용 시)
+
+# LLM 응답 캐시 설정 (양자화한 시장 상태가 같으면 모델 호출 생략)
+LLM_CACHE_ENABLED = True
+LLM_CACHE_TTL = 1800  # 응답 유지 시간 (초)
+LLM_CACHE_MAX_ENTRIES = 256  # 최대 항목 수 (초과 시 가장 오래 사용하지 않은 항목 삭제)
+LLM_CACHE_FILE = "llm_responses.json"  # CACHE_DIR 아래 저장 파일
+LLM_CACHE_BUCKETS = {  # 특징별 양자화 간격
+    'rsi': 5,
+    'stoch': 10,
+    'bb_position': 0.1,
+    'macd_hist_pct': 0.05,  # MACD 히스토그램 (가격 대비 %)
+    'fear_greed': 5,
+    'news_sentiment': 0.25,
+    'price_pct': 0.5,  # 가격 (로그 스케일 %)
+}
+
+# 데이터 병렬 수집 설정
+DATA_GATHER_MAX_WORKERS = 7  # 동시 수집 스레드 수
+DATA_GATHER_DEFAULT_TIMEOUT = 15  # 소스별 기본 타임아웃 (초)
+DATA_GATHER_TIMEOUTS = {  # 소스별 타임아웃 (초)
+    'daily_ohlcv': 10,
+    'minute_ohlcv': 20,
+    'current_price': 5,
+    'orderbook': 5,
+    'fear_greed': 10,
+    'news': 30,
+    'investment_status': 10,
+    'current_prices': 5,  # 여러 심볼 현재가 일괄 조회
+    'orderbooks': 5,  # 여러 심볼 오더북 일괄 조회
+}
 
 # 뉴스 분석 설정
 NEWS_COUNT = 20  # 수집할 뉴스 개수
@@ -49,14 +145,44 @@ SCREENSHOT_WINDOW_SIZE = (1920, 1080)
 VISION_API_TIMEOUT = 300  # Vision API 호출 타임아웃 (초)
 VISION_API_MAX_TOKENS = 50  # Vision API 최대 출력 토큰 수
 VISION_API_TEMPERATURE = 0.1  # Vision API temperature 설정
+STRUCTURED_OUTPUT_MAX_TOKENS = 400  # TradingDecision JSON 응답 최대 토큰 수 (스키마 필드를 모두 채울 수 있도록)
+INFERENCE_DEADLINE = 240  # Vision/텍스트 모델 병렬 추론 공통 마감 시간 (초, 초과한 쪽은 취소하고 완료된 결과만 사용)
+
+# 매매 결정 프롬프트 설정 (토큰 예산, 추정치 기준)
+PROMPT_TOKEN_BUDGET = 600  # 시장 데이터 요약 전체 예산
+PROMPT_SECTION_BUDGETS = {  # 섹션별 예산 (우선순위 순서, 전체 예산을 넘으면 뒤 섹션부터 축소)
+    'price': 60,
+    'daily': 110,
+    'minute': 70,
+    'sentiment': 40,
+    'orderbook': 50,
+    'candles': 130,
+    'news': 140,
+}
+PROMPT_CANDLE_ROWS = 10  # 요약에 포함할 최근 일봉 수
+PROMPT_NEWS_TITLE_CHARS = 80  # 뉴스 제목 최대 길이
 
 # 스크린샷 최적화/대기값 (증가)
 SCREENSHOT_WAIT_TIME = 60  # 페이지 로딩 대기 시간 (초)
-SCREENSHOT_ADDITIONAL_WAIT = 10  # 추가 대기 시간 (초)
-SCREENSHOT_MENU_WAIT = 8  # 메뉴 대기 시간 (초)
-SCREENSHOT_CHART_WAIT = 8  # 차트 업데이트 대기 시간 (초)
+SCREENSHOT_ADDITIONAL_WAIT = 10  # 차트 영역 표시 대기 상한 (초)
+SCREENSHOT_MENU_WAIT = 8  # 메뉴/버튼 표시 대기 상한 (초)
+SCREENSHOT_CHART_WAIT = 8  # 차트 재렌더링/지표 범례 대기 상한 (초)
+WAIT_POLL_INTERVAL = 0.1  # 대기 조건 확인 간격 (초)
+CHART_RENDER_SETTLE = 0.5  # 차트 캔버스가 이 시간 동안 바뀌지 않으면 렌더링 완료로 간주 (초)
 SCREENSHOT_MAX_SIZE_MB = 2.0  # 스크린샷 최대 크기 (MB)
 SCREENSHOT_QUALITY = 85  # 스크린샷 품질 (0-100)
+VISION_IMAGE_MAX_DIMENSION = 1920  # Vision 입력 이미지 긴 변 최대 길이 (px)
+VISION_IMAGE_MIN_QUALITY = 20  # 크기 상한을 맞출 때 허용하는 최저 JPEG 품질
+IMAGE_ARCHIVE_ENABLED = True  # 분석에 사용한 차트 이미지를 images/에 보관 (백그라운드 기록)
+IMAGE_ARCHIVE_DIR = "images"  # 보관 디렉토리
+IMAGE_ARCHIVE_MAX_FILES = 500  # 보관 최대 파일 수 (초과 시 오래된 파일 삭제)
+IMAGE_ARCHIVE_MAX_AGE_DAYS = 7  # 보관 기간 (일)
+
+# 차트 렌더링 설정 (Vision 모델 입력용)
+VISION_CHART_SOURCE = "render"  # "render": 로컬 OHLCV로 차트 직접 렌더링, "screenshot": 업비트 웹 차트 캡처
+CHART_RENDER_SIZE = (1024, 576)  # 렌더링 이미지 크기 (px)
+CHART_RENDER_CANDLES = 120  # 렌더링할 최근 캔들 수
+CHART_RENDER_FORMAT = "PNG"  # "PNG" 또는 "JPEG"
 
 # 실행 설정
 ANALYSIS_INTERVAL = 600  # 분석 간격 (초)
@@ -68,6 +194,22 @@ DB_PORT = int(os.getenv("DB_PORT", "3306"))
 DB_NAME = os.getenv("DB_NAME", "gptbitcoin")
 DB_USER = os.getenv("DB_USER", "root")
 DB_PASSWORD = os.getenv("DB_PASSWORD", "kimjink@@7")
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))  # 최대 동시 연결 수
+DB_POOL_MAX_IDLE = 300  # 유휴 연결 재생성 기준 (초)
+DB_POOL_PING_INTERVAL = 30  # 이 시간 이상 유휴였던 연결은 빌려주기 전 상태 확인 (초)
+DB_POOL_TIMEOUT = 10  # 연결 대기 최대 시간 (초)
+DB_PARTITION_MONTHS_AHEAD = 3  # market_data/system_logs 월 파티션을 미리 만들어 둘 개월 수
+
+# DB 쓰기 지연(write-behind) 설정
+WRITE_BEHIND_ENABLED = True  # 시장 데이터/시스템 로그/거래 INSERT를 백그라운드에서 일괄 저장
+TRADE_RECORD_SYNC = True  # 거래 기록은 즉시 동기 저장 (False면 큐 사용)
+WRITE_QUEUE_MAX_SIZE = 10000  # 큐 최대 행 수
+WRITE_QUEUE_BATCH_SIZE = 200  # executemany 최대 행 수
+WRITE_QUEUE_FLUSH_INTERVAL = 1.0  # 일괄 저장 주기 (초)
+WRITE_QUEUE_PUT_TIMEOUT = 0.5  # 큐가 가득 찼을 때 대기 시간 (초, 초과 시 저널 기록)
+WRITE_QUEUE_RETRY_INTERVAL = 30  # DB 장애 시 재시도 간격 (초)
+WRITE_QUEUE_JOURNAL = os.getenv("WRITE_QUEUE_JOURNAL", os.path.join("logs", "db_write_journal.jsonl"))
+WRITE_QUEUE_DEAD_LETTER = os.getenv("WRITE_QUEUE_DEAD_LETTER", os.path.join("logs", "db_write_dead_letter.jsonl"))  # 데이터 오류로 저장할 수 없는 행 격리 파일
 
 # 전략 개선 적용 설정
 STRATEGY_IMPROVEMENT_ENABLED = True  # 전략 개선 적용 비활성화 (성능 최적화)
@@ -81,6 +223,10 @@ BROWSER_DISABLE_IMAGES = False  # (필요 시 True로 최적화 가능)
 BROWSER_DISABLE_JS = False      # (필요 시 True로 최적화 가능)
 BROWSER_DISABLE_CSS = False     # (필요 시 True로 최적화 가능)
 BROWSER_PAGE_LOAD_STRATEGY = 'eager'  # 페이지 로드 전략
+BROWSER_SESSION_ENABLED = True  # 차트 페이지를 연 브라우저를 유지하여 매 사이클 재사용
+BROWSER_SESSION_MAX_AGE = 6 * 3600  # 브라우저 세션 최대 유지 시간 (초, 초과 시 재시작)
+UPBIT_CHART_URL_TEMPLATE = "https://upbit.com/exchange?code=CRIX.UPBIT.{symbol}"  # 심볼별 차트 페이지
+UPBIT_CHART_URL = UPBIT_CHART_URL_TEMPLATE.format(symbol=TRADING_SYMBOL)  # 스크린샷 대상 페이지 (기본 심볼)
 
 # 차트 설정 옵션
 ADD_BOLLINGER_BANDS = True  # 볼린저 밴드 추가 (정확한 XPath 사용)
@@ -106,6 +252,10 @@ CHART_XPATH = os.getenv(
     "CHART_XPATH",
     "/html/body/div[1]/div[2]/div[3]/div/section[1]/article[1]/div/span[2]/div/div/div[2]/div[1]",
 )
+STUDY_LEGEND_SELECTOR = os.getenv(
+    "STUDY_LEGEND_SELECTOR",
+    "cq-study-legend cq-item, .stx-panel-study",
+)  # 지표 추가 후 나타나는 범례 (볼린저 밴드 적용 확인용)
 STRICT_CHART_CAPTURE = True  # True면 지정 XPath 미발견 시 오류로 중단
 
 def validate_api_keys():
@@ -129,6 +279,7 @@ def get_trading_config():
     """트레이딩 설정 반환"""
     return {
         'symbol': TRADING_SYMBOL,
+        'symbols': TRADING_SYMBOLS,
         'min_amount': MIN_TRADE_AMOUNT,
         'trade_ratio': TRADE_RATIO,
         'fee_rate': FEE_RATE
@@ -0,0 +1,151 @@
+"""
+트레이딩 사이클 데이터 병렬 수집 모듈
+시장 데이터, 뉴스, 계좌 상태를 동시에 조회하여 사이클 지연을 가장 느린 소스 수준으로 줄입니다.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional, Tuple
+from config.settings import (
+    TRADING_SYMBOL, DAILY_DATA_COUNT, MINUTE_DATA_COUNT,
+    DATA_GATHER_MAX_WORKERS, DATA_GATHER_TIMEOUTS, DATA_GATHER_DEFAULT_TIMEOUT
+)
+from data.market_data import get_ohlcv_data, get_current_price, get_orderbook, get_fear_greed_index
+from data.news_data import get_bitcoin_news
+from trading.account import get_investment_status
+
+@dataclass
+class SourceResult:
+    """소스별 수집 결과"""
+    name: str
+    value: Any = None
+    status: str = 'pending'  # ok, empty, timeout, error
+    latency: float = 0.0  # 초
+    error: Optional[str] = None
+
+@dataclass
+class GatherResult:
+    """병렬 수집 전체 결과"""
+    sources: Dict[str, SourceResult] = field(default_factory=dict)
+    total_latency: float = 0.0
+
+    def get(self, name: str, default: Any = None) -> Any:
+        """소스 값 반환 (실패/타임아웃 시 기본값)"""
+        source = self.sources.get(name)
+        if source is None or source.value is None:
+            return default
+        return source.value
+
+    def latencies(self) -> Dict[str, float]:
+        """소스별 지연 시간 (초)"""
+        return {name: source.latency for name, source in self.sources.items()}
+
+    def slowest(self) -> Optional[SourceResult]:
+        """가장 오래 걸린 소스"""
+        if not self.sources:
+            return None
+        return max(self.sources.values(), key=lambda s: s.latency)
+
+    def failed(self) -> Dict[str, SourceResult]:
+        """실패하거나 타임아웃된 소스"""
+        return {name: s for name, s in self.sources.items() if s.status in ('timeout', 'error')}
+
+def _timed_call(func: Callable[..., Any], args: Tuple) -> Tuple[Any, float]:
+    """함수 실행 시간 측정 (워커 스레드 내부 실행 시간)"""
+    started = time.perf_counter()
+    value = func(*args)
+    return value, time.perf_counter() - started
+
+def build_cycle_sources(upbit: Any, symbol: str = TRADING_SYMBOL) -> Dict[str, Tuple[Callable[..., Any], Tuple]]:
+    """트레이딩 사이클에서 수집할 소스 정의"""
+    return {
+        'daily_ohlcv': (get_ohlcv_data, (symbol, "day", DAILY_DATA_COUNT)),
+        'minute_ohlcv': (get_ohlcv_data, (symbol, "minute1", MINUTE_DATA_COUNT)),
+        'current_price': (get_current_price, (symbol,)),
+        'orderbook': (get_orderbook, (symbol,)),
+        'fear_greed': (get_fear_greed_index, ()),
+        'news': (get_bitcoin_news, ()),
+        'investment_status': (get_investment_status, (upbit,)),
+    }
+
+def gather_sources(sources: Dict[str, Tuple[Callable[..., Any], Tuple]],
+                   timeouts: Optional[Dict[str, float]] = None,
+                   max_workers: int = DATA_GATHER_MAX_WORKERS) -> GatherResult:
+    """
+    여러 소스를 병렬로 조회
+
+    각 소스는 제출 시점부터 자신의 타임아웃까지만 기다리며,
+    타임아웃/예외가 발생한 소스는 값이 None인 부분 결과로 반환됩니다.
+    """
+    timeouts = {**DATA_GATHER_TIMEOUTS, **(timeouts or {})}
+    result = GatherResult()
+    started = time.perf_counter()
+
+    executor = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(sources))),
+                                  thread_name_prefix="gather")
+    try:
+        futures = {
+            name: executor.submit(_timed_call, func, args)
+            for name, (func, args) in sources.items()
+        }
+
+        # 마감 시각이 빠른 소스부터 대기
+        deadlines = {
+            name: started + timeouts.get(name, DATA_GATHER_DEFAULT_TIMEOUT)
+            for name in futures
+        }
+        for name in sorted(futures, key=deadlines.get):
+            source = SourceResult(name=name)
+            remaining = max(0.0, deadlines[name] - time.perf_counter())
+            try:
+                value, latency = futures[name].result(timeout=remaining)
+                source.value = value
+                source.latency = latency
+                source.status = 'ok' if value is not None else 'empty'
+            except FutureTimeoutError:
+                source.status = 'timeout'
+                source.latency = time.perf_counter() - started
+                source.error = f"{timeouts.get(name, DATA_GATHER_DEFAULT_TIMEOUT)}초 타임아웃"
+                futures[name].cancel()
+            except Exception as e:
+                source.status = 'error'
+                source.latency = time.perf_counter() - started
+                source.error = str(e)
+            result.sources[name] = source
+    finally:
+        # 타임아웃된 작업은 기다리지 않음 (백그라운드에서 종료)
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    # 원래 소스 순서 유지
+    result.sources = {name: result.sources[name] for name in sources}
+    result.total_latency = time.perf_counter() - started
+    return result
+
+def print_gather_report(result: GatherResult) -> None:
+    """소스별 지연 시간 출력"""
+    print(f"⏱️ 데이터 수집 완료: {result.total_latency:.2f}초")
+    for name, source in sorted(result.sources.items(), key=lambda item: item[1].latency, reverse=True):
+        status_icon = {'ok': '✅', 'empty': '⚠️', 'timeout': '⌛', 'error': '❌'}.get(source.status, '❓')
+        message = f"  {status_icon} {name}: {source.latency:.2f}초"
+        if source.error:
+            message += f" ({source.error})"
+        print(message)
+
+def gather_cycle_data(upbit: Any, logger: Any = None,
+                      timeouts: Optional[Dict[str, float]] = None) -> GatherResult:
+    """트레이딩 사이클용 데이터 병렬 수집"""
+    print("=== 시장 데이터 병렬 수집 중 ===")
+    result = gather_sources(build_cycle_sources(upbit), timeouts=timeouts)
+    print_gather_report(result)
+
+    if logger is not None:
+        slowest = result.slowest()
+        latency_text = ", ".join(f"{name}={latency:.2f}s" for name, latency in result.latencies().items())
+        logger.info(f"데이터 수집 지연: 총 {result.total_latency:.2f}s [{latency_text}]")
+        if slowest is not None:
+            logger.info(f"가장 느린 소스: {slowest.name} ({slowest.latency:.2f}s)")
+        for name, source in result.failed().items():
+            logger.warning(f"데이터 소스 수집 실패: {name} - {source.status} ({source.error})")
+
+    return result
@@ -0,0 +1,211 @@
+"""
+멀티 심볼 포트폴리오 트레이딩 사이클 모듈
+설정된 여러 KRW 마켓을 한 분석 주기 안에 처리합니다.
+
+- 공통 데이터(공포탐욕지수, 뉴스)는 한 번, 현재가/오더북은 티커/호가 API 일괄 조회 한 번
+- 심볼별 캔들 조회, 기술적 지표, 매매 결정은 스레드 풀에서 동시에 처리 (심볼별 타임아웃)
+- 매도를 먼저 실행한 뒤 남은 현금을 매수 신호 심볼에 신뢰도 비례로 배분
+- 설정에 없지만 보유 중인 코인도 분석하여 매도/손절매 검사 (매수는 설정된 심볼만)
+"""
+
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+from core.data_gather import gather_sources, print_gather_report
+from core.trading_cycle import get_vision_based_decision, check_and_execute_stop_loss
+from data.market_data import get_ohlcv_data, get_current_prices, get_orderbooks, get_fear_greed_index
+from data.news_data import get_bitcoin_news, analyze_news_sentiment
+from analysis.technical_indicators import calculate_technical_indicators
+from analysis.incremental_indicators import calculate_technical_indicators_incremental
+from analysis.ai_analysis import create_market_analysis_data, ai_trading_decision_with_indicators
+from trading.account_snapshot import get_account_service
+from trading.execution import execute_trading_decision
+from database.trade_recorder import save_market_data_record
+from config.settings import (
+    TRADING_SYMBOLS, DAILY_DATA_COUNT, MINUTE_DATA_COUNT, INCREMENTAL_INDICATORS_ENABLED,
+    PORTFOLIO_MAX_WORKERS, PORTFOLIO_SYMBOL_TIMEOUT, PORTFOLIO_DECISION_MARGIN, get_trading_config
+)
+
+@dataclass
+class SymbolAnalysis:
+    """심볼별 분석 결과"""
+    symbol: str
+    market_data: Optional[Dict[str, Any]] = None
+    decision: Optional[Dict[str, Any]] = None
+    minute_df: Any = None
+    latency: float = 0.0  # 초
+
+def allocate_buy_budgets(decisions: Dict[str, Optional[Dict[str, Any]]], krw_balance: float,
+                         trade_ratio: float, min_amount: float) -> Dict[str, float]:
+    """
+    매수 신호 심볼별 매수 금액 (보유 현금 × 거래 비율을 신뢰도 비례로 배분)
+
+    배분 금액이 최소 거래금액보다 작은 심볼이 있으면 그중 신뢰도가 가장 낮은 심볼을 빼고 다시 배분합니다.
+    모든 신뢰도가 0이면 균등 배분합니다.
+    """
+    weights = {
+        symbol: max(float(decision.get('confidence', 0) or 0), 0.0)
+        for symbol, decision in decisions.items()
+        if isinstance(decision, dict) and decision.get('decision') == 'buy'
+    }
+    if weights and not any(weights.values()):
+        weights = {symbol: 1.0 for symbol in weights}
+    available = krw_balance * trade_ratio
+
+    while weights:
+        total = sum(weights.values())
+        budgets = {symbol: available * weight / total for symbol, weight in weights.items()}
+        below = [symbol for symbol, budget in budgets.items() if budget < min_amount]
+        if not below:
+            return budgets
+        del weights[min(below, key=lambda symbol: (weights[symbol], symbol))]
+    return {}
+
+def analyze_symbol(symbol: str, current_price: Optional[float], orderbook: Optional[Dict[str, Any]],
+                   fear_greed_data: Any, analyzed_news: Any, use_vision: bool, logger: Any,
+                   timeout: float = PORTFOLIO_SYMBOL_TIMEOUT) -> SymbolAnalysis:
+    """
+    심볼 하나의 캔들 조회 → 지표 계산 → 매매 결정 (워커 스레드에서 실행)
+
+    모델 추론 마감 시간은 timeout에서 데이터 수집/지표 계산 시간과 여유 시간을 뺀 값이라서
+    모델 응답이 늦어도 심볼 타임아웃 전에 기본 분석 결정이 나옵니다.
+    """
+    started = time.perf_counter()
+    daily_df = get_ohlcv_data(symbol, "day", DAILY_DATA_COUNT)
+    minute_df = get_ohlcv_data(symbol, "minute1", MINUTE_DATA_COUNT)
+
+    if daily_df is not None:
+        daily_df = calculate_technical_indicators(daily_df)
+    if minute_df is not None:
+        if INCREMENTAL_INDICATORS_ENABLED:
+            # 증분 지표 엔진은 심볼별로 분리
+            minute_df = calculate_technical_indicators_incremental(minute_df, f"minute1:{symbol}")
+        else:
+            minute_df = calculate_technical_indicators(minute_df)
+
+    market_data = create_market_analysis_data(
+        daily_df, minute_df, current_price, orderbook,
+        fear_greed_data, analyzed_news, symbol=symbol
+    )
+    deadline = max(0.0, timeout - (time.perf_counter() - started) - PORTFOLIO_DECISION_MARGIN)
+    if use_vision:
+        decision = get_vision_based_decision(market_data, logger, minute_df, symbol, deadline)
+    else:
+        decision = ai_trading_decision_with_indicators(market_data, deadline)
+    return SymbolAnalysis(symbol, market_data, decision, minute_df, time.perf_counter() - started)
+
+def execute_portfolio_cycle(upbit: Any, logger: Any, symbols: Optional[List[str]] = None,
+                            use_vision: bool = True, max_workers: int = PORTFOLIO_MAX_WORKERS,
+                            symbol_timeout: float = PORTFOLIO_SYMBOL_TIMEOUT) -> Dict[str, Dict[str, Any]]:
+    """
+    여러 심볼 트레이딩 사이클 실행, 심볼별 매매 실행 결과 반환
+
+    Vision 차트 분석은 첫 번째(기본) 심볼만 사용하고 나머지는 지표 기반 결정을 사용합니다.
+    설정에 없는 보유 코인은 매도/보유 결정과 손절매 검사만 하고 매수 배분에서는 제외합니다.
+    """
+    symbols = list(symbols or TRADING_SYMBOLS)
+    primary = symbols[0]
+    results: Dict[str, Dict[str, Any]] = {}
+    try:
+        service = get_account_service(upbit)
+        service.begin_cycle()
+
+        # 잔고는 한 번 조회하여 이후 심볼별 스냅샷이 재사용
+        held = [symbol for symbol in service.held_symbols() if symbol not in symbols]
+        if held:
+            logger.info(f"설정 외 보유 코인 (매도/손절매 검사만): {', '.join(held)}")
+
+        # 공통 데이터 + 현재가/오더북 일괄 조회 병렬 수집
+        # (보유 코인은 KRW 마켓이 없을 수 있어 설정 심볼 일괄 조회와 분리)
+        print(f"=== 포트폴리오 공통 데이터 수집 중 ({len(symbols)}개 심볼, 보유 {len(held)}개) ===")
+        sources = {
+            'current_prices': (get_current_prices, (symbols,)),
+            'orderbooks': (get_orderbooks, (symbols,)),
+            'fear_greed': (get_fear_greed_index, ()),
+            'news': (get_bitcoin_news, ()),
+        }
+        if held:
+            sources['held_prices'] = (get_current_prices, (held,))
+        shared = gather_sources(sources)
+        print_gather_report(shared)
+        prices = {**(shared.get('held_prices') or {}), **(shared.get('current_prices') or {})}
+        orderbooks = shared.get('orderbooks') or {}
+        # 시세가 없는 심볼(일괄 조회 응답 누락, KRW 마켓 없음 등)은 주문 수량을 정할 수 없으므로 이번 사이클에서 제외
+        unpriced = [symbol for symbol in symbols if prices.get(symbol) is None]
+        if unpriced:
+            logger.warning(f"현재가 없음, 이번 사이클 제외: {', '.join(unpriced)}")
+        held = [symbol for symbol in held if prices.get(symbol) is not None]
+        universe = [symbol for symbol in symbols if symbol not in unpriced] + held
+        fear_greed_data = shared.get('fear_greed')
+        news_data = shared.get('news')
+        analyzed_news = analyze_news_sentiment(news_data) if news_data else None
+
+        # 심볼별 분석 동시 실행 (느린 심볼은 이번 사이클에서 제외)
+        analyses = gather_sources(
+            {symbol: (analyze_symbol, (symbol, prices.get(symbol), orderbooks.get(symbol), fear_greed_data,
+                                       analyzed_news, use_vision and symbol == primary, logger, symbol_timeout))
+             for symbol in universe},
+            timeouts={symbol: symbol_timeout for symbol in universe},
+            max_workers=max_workers
+        )
+        print_gather_report(analyses)
+        for name, source in analyses.failed().items():
+            logger.warning(f"심볼 분석 실패: {name} - {source.status} ({source.error})")
+        analyzed: Dict[str, SymbolAnalysis] = {}
+        for symbol in universe:
+            analysis = analyses.get(symbol)
+            if analysis is not None and analysis.decision:
+                analyzed[symbol] = analysis
+
+        primary_analysis = analyzed.get(primary)
+        if primary_analysis is not None:
+            # market_data 테이블은 심볼 컬럼이 없어 기본 심볼만 저장
+            try:
+                save_market_data_record(primary_analysis.market_data)
+            except Exception as e:
+                logger.error(f"시장 데이터 저장 실패: {e}")
+
+        def status_for(symbol: str) -> Optional[Dict[str, Any]]:
+            snapshot = service.snapshot(symbol, prices.get(symbol))
+            return snapshot.as_status() if snapshot is not None else None
+
+        # 매도/보유를 먼저 실행하여 매수에 쓸 현금 확보
+        for symbol, analysis in analyzed.items():
+            if analysis.decision.get('decision') != 'buy':
+                results[symbol] = execute_trading_decision(
+                    upbit, analysis.decision, status_for(symbol), analysis.market_data, symbol=symbol
+                )
+
+        # 매도 후 현금을 매수 신호 심볼에 배분 (신뢰도 높은 심볼부터 주문, 설정 외 보유 코인은 추가 매수 안 함)
+        for symbol in held:
+            if symbol in analyzed and analyzed[symbol].decision.get('decision') == 'buy':
+                logger.info(f"{symbol} 매수 신호 무시 (설정 외 보유 코인)")
+        buys = {symbol: analysis.decision for symbol, analysis in analyzed.items()
+                if symbol in symbols and analysis.decision.get('decision') == 'buy'}
+        if buys:
+            trading_config = get_trading_config()
+            cash_status = status_for(primary)
+            krw_balance = cash_status['krw_balance'] if cash_status else 0.0
+            budgets = allocate_buy_budgets(buys, krw_balance, trading_config['trade_ratio'],
+                                           trading_config['min_amount'])
+            logger.info(f"매수 배분 (현금 {krw_balance:,.0f}원): "
+                        + (", ".join(f"{symbol}={budget:,.0f}" for symbol, budget in budgets.items()) or "없음"))
+            for symbol in sorted(buys, key=lambda symbol: budgets.get(symbol, 0.0), reverse=True):
+                results[symbol] = execute_trading_decision(
+                    upbit, buys[symbol], status_for(symbol), analyzed[symbol].market_data,
+                    symbol=symbol, budget=budgets.get(symbol, 0.0)
+                )
+
+        # 심볼별 손절매 검사
+        for symbol, analysis in analyzed.items():
+            check_and_execute_stop_loss(
+                upbit, logger, analysis.minute_df, prices.get(symbol),
+                status_for(symbol), analysis.market_data, analysis.decision, symbol
+            )
+
+        succeeded = [symbol for symbol, result in results.items() if result and result.get('success')]
+        logger.info(f"포트폴리오 사이클 완료: 분석 {len(analyzed)}/{len(universe)}개, "
+                    f"실행 성공 {len(succeeded)}개, 잔고 조회 {service.fetches}회 누적")
+    except Exception as e:
+        logger.error(f"포트폴리오 사이클 오류: {e}")
+    return results
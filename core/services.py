@@ -5,8 +5,14 @@
 import os
 import sys
 import socket
+import threading
 import subprocess
 from typing import Any, List, Optional, Dict
+from config.settings import (
+    REALTIME_FEED_ENABLED, TRADING_SYMBOLS, BROWSER_SESSION_ENABLED,
+    OLLAMA_WARMUP_ENABLED, OLLAMA_MODEL, OLLAMA_VISION_MODEL
+)
+from data.realtime_feed import start_market_feed
 
 def start_detached_process(args: List[str], cwd: Optional[str] = None) -> None:
     """백그라운드 프로세스 실행"""
@@ -39,9 +45,33 @@ def is_port_open(port: int, host: str = "127.0.0.1", timeout: float = 0.5) -> bo
         return False
 
 def start_background_services(logger: Any) -> None:
-    """스케줄러와 대시보드 백그라운드 실행"""
+    """스케줄러, 대시보드, 실시간 시세 피드, 차트 브라우저, Ollama 모델 준비 백그라운드 실행"""
     project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
+    if REALTIME_FEED_ENABLED:
+        try:
+            # 현재가/오더북 스냅샷용 WebSocket 구독 (같은 프로세스 내 스레드)
+            feed = start_market_feed(TRADING_SYMBOLS)
+            if feed.wait_ready(timeout=5):
+                logger.info("실시간 시세 피드 연결 완료")
+            else:
+                logger.warning(f"실시간 시세 피드 초기 수신 지연 (REST 조회로 대체): {feed.last_error}")
+        except Exception as e:
+            logger.error(f"실시간 시세 피드 실행 실패: {e}")
+
+    if BROWSER_SESSION_ENABLED:
+        # 차트 페이지 로드/설정을 미리 해 두어 첫 사이클 캡처 지연 방지
+        from data.browser_session import get_chart_browser
+        threading.Thread(target=get_chart_browser().warmup, name="chart-browser-warmup", daemon=True).start()
+        logger.info("차트 브라우저 준비 시작")
+
+    if OLLAMA_WARMUP_ENABLED:
+        # 첫 사이클에서 모델 로딩 지연이 생기지 않도록 keep_alive와 함께 미리 로드
+        from analysis.ollama_client import get_ollama_client
+        threading.Thread(target=get_ollama_client().warmup, args=([OLLAMA_MODEL, OLLAMA_VISION_MODEL],),
+                         name="ollama-warmup", daemon=True).start()
+        logger.info("Ollama 모델 준비 시작")
+
     try:
         # 스케줄러 실행
         start_detached_process([sys.executable, "scheduler.py"], cwd=project_root)
@@ -5,37 +5,59 @@
 import time
 from typing import Dict, Any
 import pyupbit
-from data.market_data import get_market_data
-from data.news_data import get_bitcoin_news, analyze_news_sentiment, get_news_summary
+from core.data_gather import gather_cycle_data
+from data.news_data import analyze_news_sentiment, get_news_summary
 from data.screenshot import capture_upbit_screenshot, create_images_directory
+from data.chart_renderer import render_chart_base64
 from analysis.technical_indicators import calculate_technical_indicators
+from analysis.incremental_indicators import calculate_technical_indicators_incremental
 from analysis.ai_analysis import create_market_analysis_data, ai_trading_decision_with_indicators, ai_trading_decision_with_vision
-from trading.account import get_investment_status, get_total_profit_loss
+from trading.account import get_total_profit_loss
+from trading.account_snapshot import get_account_service
 from trading.execution import execute_trading_decision
 from database.trade_recorder import save_market_data_record
+from config.settings import (
+    INCREMENTAL_INDICATORS_ENABLED, VISION_CHART_SOURCE, TRADING_SYMBOL, TRADING_SYMBOLS, INFERENCE_DEADLINE
+)
 
 def execute_trading_cycle(upbit: pyupbit.Upbit, logger: Any, use_vision: bool = True) -> None:
-    """메인 트레이딩 사이클 실행"""
+    """메인 트레이딩 사이클 실행 (여러 심볼이 설정되면 포트폴리오 사이클로 처리)"""
+    if len(TRADING_SYMBOLS) > 1:
+        from core.portfolio_cycle import execute_portfolio_cycle
+        execute_portfolio_cycle(upbit, logger, TRADING_SYMBOLS, use_vision)
+        return
+    
     try:
-        # 시장 데이터 수집 및 기술적 지표 계산
-        daily_df, minute_df, current_price, orderbook, fear_greed_data = get_market_data()
+        # 계좌 스냅샷은 사이클 시작 시 한 번 조회하고 이후 주문 발생 시에만 갱신
+        get_account_service(upbit).begin_cycle()
         
+        # 시장 데이터, 뉴스, 투자 상태 병렬 수집 (소스별 타임아웃, 부분 결과 허용)
+        gathered = gather_cycle_data(upbit, logger)
+        daily_df = gathered.get('daily_ohlcv')
+        minute_df = gathered.get('minute_ohlcv')
+        current_price = gathered.get('current_price')
+        orderbook = gathered.get('orderbook')
+        fear_greed_data = gathered.get('fear_greed')
+        news_data = gathered.get('news')
+        investment_status = gathered.get('investment_status')
+
+        # 기술적 지표 계산
         if daily_df is not None:
             daily_df = calculate_technical_indicators(daily_df)
         if minute_df is not None:
-            minute_df = calculate_technical_indicators(minute_df)
-        
+            if INCREMENTAL_INDICATORS_ENABLED:
+                # 분봉은 새로 추가된 캔들만 반영
+                minute_df = calculate_technical_indicators_incremental(minute_df, 'minute1')
+            else:
+                minute_df = calculate_technical_indicators(minute_df)
+
         # 뉴스 데이터 분석
         analyzed_news = None
-        news_data = get_bitcoin_news()
         if news_data:
             analyzed_news = analyze_news_sentiment(news_data)
             if analyzed_news:
                 get_news_summary(analyzed_news)
-        
-        # 투자 상태 조회
-        investment_status = get_investment_status(upbit)
-        
+
         # 시장 분석 데이터 생성
         market_data = create_market_analysis_data(
             daily_df, minute_df, current_price, orderbook, 
@@ -50,7 +72,7 @@ def execute_trading_cycle(upbit: pyupbit.Upbit, logger: Any, use_vision: bool =
 
         # 매매 결정 (Vision API 또는 기본 분석)
         if use_vision:
-            decision = get_vision_based_decision(market_data, logger)
+            decision = get_vision_based_decision(market_data, logger, minute_df)
         else:
             decision = ai_trading_decision_with_indicators(market_data)
 
@@ -72,19 +94,31 @@ def execute_trading_cycle(upbit: pyupbit.Upbit, logger: Any, use_vision: bool =
     except Exception as e:
         logger.error(f"트레이딩 사이클 오류: {e}")
 
-def get_vision_based_decision(market_data: Dict, logger: Any) -> Dict:
-    """Vision API를 사용한 매매 결정"""
+def get_vision_based_decision(market_data: Dict, logger: Any, chart_df: Any = None,
+                              symbol: str = TRADING_SYMBOL, deadline: float = INFERENCE_DEADLINE) -> Dict:
+    """Vision API를 사용한 매매 결정 (차트는 로컬 렌더링 우선, 설정 시 웹 차트 캡처, 차트 준비 시간 포함 deadline초 안에 결정)"""
+    started = time.perf_counter()
     try:
-        create_images_directory()
-        screenshot_result = capture_upbit_screenshot()
+        chart_image_base64 = None
+        if VISION_CHART_SOURCE == "render":
+            started = time.perf_counter()
+            chart_image_base64 = render_chart_base64(chart_df, title=symbol)
+            if chart_image_base64:
+                logger.info(f"차트 렌더링 완료 ({time.perf_counter() - started:.3f}초)")
+        
+        if chart_image_base64 is None:
+            create_images_directory()
+            screenshot_result = capture_upbit_screenshot(symbol)
+            if screenshot_result:
+                filepath, chart_image_base64 = screenshot_result
         
-        if screenshot_result:
-            filepath, chart_image_base64 = screenshot_result
-            return ai_trading_decision_with_vision(market_data, chart_image_base64)
+        if chart_image_base64:
+            remaining = max(0.0, deadline - (time.perf_counter() - started))
+            return ai_trading_decision_with_vision(market_data, chart_image_base64, remaining)
     except Exception as e:
         logger.error(f"Vision API 분석 실패: {e}")
     
-    return ai_trading_decision_with_indicators(market_data)
+    return ai_trading_decision_with_indicators(market_data, max(0.0, deadline - (time.perf_counter() - started)))
 
 def check_and_execute_stop_loss(
     upbit: pyupbit.Upbit, 
@@ -93,7 +127,8 @@ def check_and_execute_stop_loss(
     current_price: float,
     investment_status: Dict,
     market_data: Dict,
-    current_decision: Dict
+    current_decision: Dict,
+    symbol: str = TRADING_SYMBOL
 ) -> None:
     """손절매 조건 검사 및 실행"""
     try:
@@ -102,7 +137,7 @@ def check_and_execute_stop_loss(
             logger.info("분봉 데이터 부족: 손절매 검사 건너뜀")
             return
 
-        total_profit_loss = get_total_profit_loss(upbit)
+        total_profit_loss = get_total_profit_loss(upbit, symbol)
         if not total_profit_loss:
             logger.info("손익 데이터 없음: 손절매 검사 건너뜀")
             return
@@ -118,11 +153,13 @@ def check_and_execute_stop_loss(
         if should_execute_stop_loss(
             recent_high_avg, current_price,
             total_profit_loss_value, sell_amount,
-            current_decision
+            current_decision, symbol
         ):
-            logger.info(f"손절매 실행 - 평균가: {recent_high_avg:,.0f}, 현재가: {current_price:,.0f}")
+            logger.info(f"{symbol} 손절매 실행 - 평균가: {recent_high_avg:,.0f}, 현재가: {current_price:,.0f}")
             decision = {'decision': 'sell'}
-            execute_trading_decision(upbit, decision, investment_status, market_data)
+            # 이번 사이클 매매 후 잔고 기준으로 매도 (주문이 없었으면 같은 스냅샷 재사용)
+            # 손절매는 지정가 대기 없이 바로 체결되도록 설정과 무관하게 시장가
+            execute_trading_decision(upbit, decision, total_profit_loss, market_data, symbol=symbol, algorithm='market')
 
     except Exception as e:
         logger.error(f"손절매 검사 오류: {e}")
@@ -132,13 +169,14 @@ def should_execute_stop_loss(
     current_price: float,
     total_profit_loss_value: float,
     sell_amount: float,
-    decision: Dict
+    decision: Dict,
+    symbol: str = TRADING_SYMBOL
 ) -> bool:
     """손절매 실행 여부 결정"""
     from database.stop_loss_query import get_yesterday_trade_info
     
     # 전날 0시 이후 또는 최근 구매 정보 조회
-    trade_info = get_yesterday_trade_info()
+    trade_info = get_yesterday_trade_info(symbol)
     if not trade_info:
         return False
     
@@ -64,10 +64,10 @@ def get_initial_investment_estimate():
         cursor.execute(query_btc_investment)
         btc_trade = cursor.fetchone()
         
-        # 방법 3: 모든 매수 거래의 총합으로 추정
+        # 방법 3: 모든 매수 거래의 총합으로 추정 (일별 집계 테이블)
         query_total_buy = """
         SELECT SUM(total_value) as total_buy_amount
-        FROM trades 
+        FROM trade_stats_daily 
         WHERE action = 'buy'
         """
         cursor.execute(query_total_buy)
@@ -105,14 +105,14 @@ def get_initial_investment_estimate():
 def get_upbit_deposit_history():
     """업비트 API를 통해 입금 내역을 조회하여 초기 투자금액을 추정하는 함수"""
     try:
-        import pyupbit
+        from data.upbit_client import get_upbit_client
         from config.settings import UPBIT_ACCESS_KEY, UPBIT_SECRET_KEY
         
         if not UPBIT_ACCESS_KEY or not UPBIT_SECRET_KEY:
             print("⚠️ 업비트 API 키가 설정되지 않았습니다.")
             return None
         
-        upbit = pyupbit.Upbit(UPBIT_ACCESS_KEY, UPBIT_SECRET_KEY)
+        upbit = get_upbit_client()
         
         # 방법 1: 업비트 API에서 실제 입금 내역 조회 (가장 정확)
         try:
@@ -207,7 +207,7 @@ def get_upbit_deposit_history():
             print(f"📊 BTC 평균 매수가: {btc_avg_price:,.0f}원")
             
             # 현재 비트코인 가격 조회
-            current_price = pyupbit.get_current_price("KRW-BTC")
+            current_price = get_upbit_client().get_current_price("KRW-BTC")
             if not current_price:
                 print("📊 현재 비트코인 가격을 가져올 수 없습니다.")
                 return None
@@ -314,14 +314,14 @@ def get_upbit_deposit_history():
 def get_upbit_account_info():
     """업비트 API를 통해 현재 계좌 정보를 조회하는 함수"""
     try:
-        import pyupbit
+        from data.upbit_client import get_upbit_client
         from config.settings import UPBIT_ACCESS_KEY, UPBIT_SECRET_KEY
         
         if not UPBIT_ACCESS_KEY or not UPBIT_SECRET_KEY:
             print("⚠️ 업비트 API 키가 설정되지 않았습니다.")
             return None
         
-        upbit = pyupbit.Upbit(UPBIT_ACCESS_KEY, UPBIT_SECRET_KEY)
+        upbit = get_upbit_client()
         
         # 현재 잔고 조회
         balances = upbit.get_balances()
@@ -344,7 +344,7 @@ def get_upbit_account_info():
                     account_info['btc_avg_price'] = float(balance.get('avg_buy_price', 0))
         
         # 현재 비트코인 가격 조회
-        current_price = pyupbit.get_current_price("KRW-BTC")
+        current_price = get_upbit_client().get_current_price("KRW-BTC")
         if current_price and account_info['btc_balance'] > 0:
             # 비트코인 보유량이 있다면 평균 매수가로 총 투자금액 계산
             total_btc_investment = account_info['btc_balance'] * account_info['btc_avg_price']
@@ -1047,8 +1047,8 @@ def main():
             
             # 현재 비트코인 가격
             try:
-                import pyupbit
-                current_price = pyupbit.get_current_price("KRW-BTC")
+                from data.upbit_client import get_upbit_client
+                current_price = get_upbit_client().get_current_price("KRW-BTC")
                 if current_price:
                     st.metric("현재 BTC 가격", f"{current_price:,.0f}원")
                     
@@ -0,0 +1,210 @@
+"""
+차트 브라우저 세션 모듈
+업비트 차트 페이지를 연 Chrome을 프로세스 동안 유지하여, 매 사이클 드라이버 설치/페이지 로드/
+1시간 주기·볼린저 밴드 설정 없이 차트 요소만 캡처합니다.
+
+- 첫 캡처(또는 warmup) 시 한 번만 페이지를 열고 차트를 설정
+- 페이지/브라우저가 죽으면 다음 캡처에서 재시작 후 1회 재시도
+- BROWSER_SESSION_MAX_AGE가 지나면 메모리 누적 방지를 위해 재시작
+"""
+
+import time
+import atexit
+import threading
+from typing import Any, Callable, Optional
+from selenium.webdriver.common.by import By
+from selenium.common.exceptions import NoSuchElementException, TimeoutException, WebDriverException
+from config.settings import (
+    SCREENSHOT_ADDITIONAL_WAIT, SCREENSHOT_MENU_WAIT, SCREENSHOT_CHART_WAIT,
+    ADD_BOLLINGER_BANDS, CHART_XPATH, STRICT_CHART_CAPTURE, STUDY_LEGEND_SELECTOR,
+    TIMEFRAME_MENU_BUTTON_XPATH, TIMEFRAME_1H_ITEM_XPATH,
+    CHART_SETTINGS_BUTTON_XPATH, BOLLINGER_OPTION_XPATH,
+    UPBIT_CHART_URL, BROWSER_SESSION_MAX_AGE
+)
+from data.page_waits import (
+    WaitTrace, wait_visible, wait_clickable, wait_css_present,
+    canvas_signature, wait_canvas_rerendered
+)
+
+def _click_when_ready(driver: Any, xpath: str, timeout: float) -> None:
+    """클릭 가능해지면 클릭 (상한 초과 시 오류)"""
+    element = wait_clickable(driver, xpath, timeout)
+    if element is None:
+        raise TimeoutException(f"{timeout}초 내 클릭 가능 상태가 되지 않음: {xpath}")
+    element.click()
+
+def configure_chart_page(driver: Any, trace: WaitTrace) -> None:
+    """차트 페이지 설정: 1시간 주기 선택, 볼린저 밴드 추가 (각 단계는 화면 준비 조건으로 대기)"""
+    if not ADD_BOLLINGER_BANDS:
+        return
+    chart = wait_visible(driver, CHART_XPATH, SCREENSHOT_ADDITIONAL_WAIT)
+    try:
+        print("⏱️ 시간 주기 메뉴를 엽니다...")
+        with trace.step('timeframe_menu'):
+            _click_when_ready(driver, TIMEFRAME_MENU_BUTTON_XPATH, SCREENSHOT_MENU_WAIT)
+
+        print("🕐 1시간 주기를 선택합니다...")
+        before = canvas_signature(driver, chart) if chart is not None else None
+        with trace.step('timeframe_1h'):
+            _click_when_ready(driver, TIMEFRAME_1H_ITEM_XPATH, SCREENSHOT_MENU_WAIT)
+        with trace.step('chart_rerender') as outcome:
+            outcome[0] = chart is not None and wait_canvas_rerendered(driver, chart, before, SCREENSHOT_CHART_WAIT)
+
+        print("⚙️ 차트 설정(지표) 버튼을 엽니다...")
+        with trace.step('study_menu'):
+            _click_when_ready(driver, CHART_SETTINGS_BUTTON_XPATH, SCREENSHOT_MENU_WAIT)
+
+        before = canvas_signature(driver, chart) if chart is not None else None
+        with trace.step('bollinger'):
+            _click_when_ready(driver, BOLLINGER_OPTION_XPATH, SCREENSHOT_MENU_WAIT)
+        with trace.step('study_legend') as outcome:
+            outcome[0] = wait_css_present(driver, STUDY_LEGEND_SELECTOR, SCREENSHOT_CHART_WAIT) is not None
+        with trace.step('chart_rerender') as outcome:
+            outcome[0] = chart is not None and wait_canvas_rerendered(driver, chart, before, SCREENSHOT_CHART_WAIT)
+        print("✅ 볼린저 밴드를 선택했습니다.")
+    except WebDriverException as e:
+        print(f"⚠️ 볼린저 밴드 설정 중 오류: {e}")
+
+def find_chart_element(driver: Any) -> Any:
+    """차트 영역 요소 (없으면 STRICT_CHART_CAPTURE에 따라 오류 또는 body)"""
+    try:
+        element = driver.find_element(By.XPATH, CHART_XPATH)
+        if element.is_displayed():
+            return element
+        print("⚠️ 차트 영역이 화면에 표시되지 않습니다.")
+    except NoSuchElementException as e:
+        print(f"⚠️ 차트 영역을 찾을 수 없습니다: {e}")
+
+    if STRICT_CHART_CAPTURE:
+        raise RuntimeError("차트 XPath를 찾지 못하여 캡처를 중단합니다. CHART_XPATH를 확인하세요.")
+    print("⚠️ 차트 영역을 찾을 수 없어 전체 페이지를 캡처합니다.")
+    return driver.find_element(By.TAG_NAME, "body")
+
+class ChartBrowser:
+    """설정된 차트 페이지를 유지하는 브라우저 세션"""
+
+    def __init__(self, url: str = UPBIT_CHART_URL,
+                 driver_factory: Optional[Callable[[], Any]] = None,
+                 configure: Callable[[Any, WaitTrace], None] = configure_chart_page,
+                 page_timeout: float = SCREENSHOT_ADDITIONAL_WAIT,
+                 max_age: float = BROWSER_SESSION_MAX_AGE):
+        self.url = url
+        self.driver_factory = driver_factory
+        self.configure = configure
+        self.page_timeout = page_timeout
+        self.max_age = max_age
+        self.stats = {'starts': 0, 'restarts': 0, 'captures': 0, 'failures': 0}
+        self.last_capture_seconds = 0.0
+        self.last_setup_trace: Optional[WaitTrace] = None  # 페이지 로드/차트 설정 단계별 소요 시간
+        self._driver: Optional[Any] = None
+        self._started_at = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def ready(self) -> bool:
+        """설정된 페이지가 열려 있는지 여부"""
+        return self._driver is not None
+
+    def warmup(self) -> bool:
+        """페이지를 미리 열고 설정 (첫 사이클 지연 방지)"""
+        with self._lock:
+            try:
+                self._ensure_page()
+                return True
+            except Exception as e:
+                print(f"⚠️ 차트 브라우저 준비 실패: {e}")
+                self._quit()
+                return False
+
+    def capture_png(self) -> Optional[bytes]:
+        """차트 영역 PNG (브라우저가 죽은 경우 재시작 후 1회 재시도)"""
+        with self._lock:
+            for attempt in range(2):
+                started = time.perf_counter()
+                try:
+                    driver = self._ensure_page()
+                    png = find_chart_element(driver).screenshot_as_png
+                    self.stats['captures'] += 1
+                    self.last_capture_seconds = time.perf_counter() - started
+                    return png
+                except WebDriverException as e:
+                    self.stats['failures'] += 1
+                    print(f"⚠️ 차트 브라우저 오류 ({'재시작 후 재시도' if attempt == 0 else '포기'}): {e}")
+                    self._quit()
+                    self.stats['restarts'] += 1
+            return None
+
+    def close(self) -> None:
+        """브라우저 종료"""
+        with self._lock:
+            self._quit()
+
+    def _ensure_page(self) -> Any:
+        """살아 있는 설정 완료 페이지 반환 (없거나 오래되었거나 응답이 없으면 새로 열기)"""
+        if self._driver is not None:
+            if time.monotonic() - self._started_at >= self.max_age:
+                print("♻️ 차트 브라우저 재시작 (최대 유지 시간 경과)")
+                self._quit()
+            elif not self._is_alive():
+                print("♻️ 차트 브라우저 재시작 (페이지 응답 없음)")
+                self._quit()
+                self.stats['restarts'] += 1
+
+        if self._driver is None:
+            factory = self.driver_factory
+            if factory is None:
+                from data.screenshot import setup_driver
+                factory = setup_driver
+            driver = factory()
+            trace = WaitTrace()
+            try:
+                print("⏳ 차트 페이지를 로딩 중입니다...")
+                with trace.step('page_load'):
+                    driver.get(self.url)
+                with trace.step('chart_visible') as outcome:
+                    outcome[0] = wait_visible(driver, CHART_XPATH, self.page_timeout) is not None
+                self.configure(driver, trace)
+            except Exception:
+                driver.quit()
+                raise
+            finally:
+                self.last_setup_trace = trace
+            print(f"⏱️ 차트 페이지 준비: {trace.summary()}")
+            self._driver = driver
+            self._started_at = time.monotonic()
+            self.stats['starts'] += 1
+        return self._driver
+
+    def _is_alive(self) -> bool:
+        try:
+            return self._driver.execute_script("return document.readyState") in ('interactive', 'complete')
+        except WebDriverException:
+            return False
+
+    def _quit(self) -> None:
+        driver, self._driver = self._driver, None
+        if driver is not None:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+
+_chart_browser: Optional[ChartBrowser] = None
+_chart_browser_lock = threading.Lock()
+
+def get_chart_browser() -> ChartBrowser:
+    """공용 차트 브라우저 세션 반환 (프로세스 종료 시 브라우저 정리)"""
+    global _chart_browser
+    with _chart_browser_lock:
+        if _chart_browser is None:
+            _chart_browser = ChartBrowser()
+            atexit.register(close_chart_browser)
+        return _chart_browser
+
+def close_chart_browser() -> None:
+    """공용 차트 브라우저 종료"""
+    global _chart_browser
+    with _chart_browser_lock:
+        if _chart_browser is not None:
+            _chart_browser.close()
+            _chart_browser = None
@@ -0,0 +1,171 @@
+"""
+로컬 OHLCV 캔들 저장소 모듈
+심볼/간격별 캔들을 로컬 파일에 보관하고, 마지막 저장 캔들 이후 구간만 업비트에서 조회합니다.
+
+매 사이클 분봉 1440개를 다시 받는 대신 빠진 꼬리 구간(보통 수십 개)만 받아 병합합니다.
+마지막 저장 캔들은 아직 진행 중일 수 있으므로 항상 다시 조회하여 덮어씁니다.
+"""
+
+import os
+import re
+import threading
+import numpy as np
+import pandas as pd
+from typing import Callable, Dict, Optional, Tuple
+from data.upbit_client import get_upbit_client
+from config.settings import CANDLE_STORE_DIR, CANDLE_STORE_MAX_ROWS
+
+# 고정 길이 간격 (월봉 등 가변 길이 간격은 저장소를 거치지 않고 직접 조회)
+_FIXED_PERIODS = {
+    'day': pd.Timedelta(days=1),
+    'days': pd.Timedelta(days=1),
+    'week': pd.Timedelta(weeks=1),
+    'weeks': pd.Timedelta(weeks=1),
+}
+_MINUTE_INTERVAL = re.compile(r'^minutes?(\d+)$')
+
+def interval_period(interval: str) -> Optional[pd.Timedelta]:
+    """pyupbit 간격 문자열의 캔들 길이 (지원하지 않으면 None)"""
+    if interval in _FIXED_PERIODS:
+        return _FIXED_PERIODS[interval]
+    match = _MINUTE_INTERVAL.match(interval)
+    if match:
+        return pd.Timedelta(minutes=int(match.group(1)))
+    return None
+
+def kst_now() -> pd.Timestamp:
+    """현재 한국 시간 (pyupbit 캔들 인덱스와 같은 timezone-naive KST)"""
+    return pd.Timestamp.now(tz='Asia/Seoul').tz_localize(None)
+
+class CandleStore:
+    """심볼/간격별 로컬 캔들 저장소 (컬럼별 배열을 .npz 파일로 보관)"""
+
+    def __init__(self, directory: str = CANDLE_STORE_DIR, max_rows: int = CANDLE_STORE_MAX_ROWS,
+                 fetcher: Optional[Callable[..., Optional[pd.DataFrame]]] = None,
+                 clock: Callable[[], pd.Timestamp] = kst_now):
+        self.directory = directory
+        self.max_rows = max_rows
+        self.fetcher = fetcher
+        self.clock = clock
+        self.stats = {'full_fetches': 0, 'tail_fetches': 0, 'rows_fetched': 0, 'fetch_failures': 0}
+        self.last_fetched_rows: Dict[Tuple[str, str], int] = {}  # 심볼/간격별 마지막 조회 캔들 수
+        self._frames: Dict[Tuple[str, str], pd.DataFrame] = {}
+        self._locks: Dict[Tuple[str, str], threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+
+    def path(self, symbol: str, interval: str) -> str:
+        """저장 파일 경로"""
+        return os.path.join(self.directory, f"{symbol}_{interval}.npz")
+
+    def load(self, symbol: str, interval: str) -> Optional[pd.DataFrame]:
+        """저장된 캔들 읽기 (없거나 손상된 경우 None)"""
+        key = (symbol, interval)
+        if key in self._frames:
+            return self._frames[key]
+
+        path = self.path(symbol, interval)
+        if not os.path.exists(path):
+            return None
+        try:
+            with np.load(path, allow_pickle=False) as stored:
+                columns = [str(column) for column in stored['columns']]
+                index = pd.DatetimeIndex(stored['timestamp'])
+                df = pd.DataFrame({column: stored[column] for column in columns}, index=index)
+        except Exception as e:
+            print(f"⚠️ 캔들 저장소 파일 읽기 실패 ({path}): {e}")
+            return None
+
+        self._frames[key] = df
+        return df
+
+    def save(self, symbol: str, interval: str, df: pd.DataFrame) -> None:
+        """캔들 저장 (임시 파일에 기록 후 교체)"""
+        os.makedirs(self.directory, exist_ok=True)
+        path = self.path(symbol, interval)
+        temp_path = f"{path}.tmp"
+        arrays = {column: df[column].to_numpy(dtype=np.float64) for column in df.columns}
+        with open(temp_path, 'wb') as f:
+            np.savez(f, columns=np.array(df.columns, dtype=str),
+                     timestamp=df.index.to_numpy(), **arrays)
+        os.replace(temp_path, path)
+        self._frames[(symbol, interval)] = df
+
+    def get_candles(self, symbol: str, interval: str, count: int) -> Optional[pd.DataFrame]:
+        """
+        최근 count개 캔들 반환
+
+        저장된 캔들이 충분하면 마지막 저장 캔들부터 현재까지만 조회하여 병합하고,
+        저장소가 비었거나 짧으면 count개를 전체 조회합니다.
+        조회에 실패하면 저장된 캔들을 그대로 반환합니다.
+        """
+        period = interval_period(interval)
+        if period is None:
+            return self._fetch(symbol, interval, count)
+
+        with self._lock(symbol, interval):
+            stored = self.load(symbol, interval)
+            fetch_count = count
+            if stored is not None and len(stored) >= count:
+                # 마지막 저장 캔들(진행 중일 수 있음) 포함
+                elapsed = self.clock() - stored.index[-1]
+                fetch_count = min(count, max(1, int(elapsed // period) + 1))
+
+            fetched = self._fetch(symbol, interval, fetch_count)
+            if fetched is not None and fetch_count < count and fetched.index[0] > stored.index[-1]:
+                # 조회 구간이 저장 이력과 겹치지 않음 (시계 오차 등) → 누락 방지를 위해 전체 조회
+                fetch_count = count
+                fetched = self._fetch(symbol, interval, count)
+
+            if fetched is None:
+                if stored is None or stored.empty:
+                    return None
+                self.stats['fetch_failures'] += 1
+                print(f"⚠️ {interval} 캔들 조회 실패: 저장된 캔들 {min(len(stored), count)}개 사용")
+                return stored.iloc[-count:].copy()
+
+            self.stats['full_fetches' if fetch_count == count else 'tail_fetches'] += 1
+            self.stats['rows_fetched'] += len(fetched)
+            self.last_fetched_rows[(symbol, interval)] = len(fetched)
+
+            merged = self._merge(stored, fetched, max(self.max_rows, count))
+            try:
+                self.save(symbol, interval, merged)
+            except Exception as e:
+                print(f"⚠️ 캔들 저장소 기록 실패: {e}")
+                self._frames[(symbol, interval)] = merged
+
+            return merged.iloc[-count:].copy()
+
+    def _fetch(self, symbol: str, interval: str, count: int) -> Optional[pd.DataFrame]:
+        """업비트 캔들 조회"""
+        fetcher = self.fetcher or get_upbit_client().get_ohlcv
+        df = fetcher(symbol, interval=interval, count=count)
+        if df is None or df.empty:
+            return None
+        return df
+
+    @staticmethod
+    def _merge(stored: Optional[pd.DataFrame], fetched: pd.DataFrame, max_rows: int) -> pd.DataFrame:
+        """저장 캔들과 신규 캔들 병합 (겹치는 캔들은 새로 조회한 값 사용)"""
+        if stored is None or stored.empty:
+            merged = fetched
+        else:
+            merged = pd.concat([stored, fetched[stored.columns.intersection(fetched.columns)]])
+            merged = merged[~merged.index.duplicated(keep='last')]
+        return merged.sort_index().iloc[-max_rows:]
+
+    def _lock(self, symbol: str, interval: str) -> threading.Lock:
+        """심볼/간격별 잠금 (병렬 수집 시 같은 파일 동시 갱신 방지)"""
+        with self._locks_guard:
+            return self._locks.setdefault((symbol, interval), threading.Lock())
+
+_candle_store: Optional[CandleStore] = None
+_candle_store_lock = threading.Lock()
+
+def get_candle_store() -> CandleStore:
+    """공용 캔들 저장소 반환"""
+    global _candle_store
+    with _candle_store_lock:
+        if _candle_store is None:
+            _candle_store = CandleStore()
+        return _candle_store
@@ -0,0 +1,184 @@
+"""
+차트 렌더링 모듈
+지표가 계산된 OHLCV DataFrame에서 캔들, 거래량, 볼린저 밴드/이동평균 차트를 직접 그려
+메모리 버퍼(PNG/JPEG)로 반환합니다.
+
+브라우저/네트워크 없이 Vision 모델 입력용 차트 이미지를 만듭니다 (Pillow만 사용).
+"""
+
+import io
+from typing import Dict, List, Optional, Sequence, Tuple
+import numpy as np
+import pandas as pd
+from PIL import Image, ImageDraw, ImageFont
+from data.image_pipeline import encode_for_vision, archive_image
+from config.settings import CHART_RENDER_SIZE, CHART_RENDER_CANDLES, CHART_RENDER_FORMAT, SCREENSHOT_QUALITY
+
+# 색상 (업비트 차트와 같은 상승 빨강/하락 파랑)
+BACKGROUND = (255, 255, 255)
+GRID = (235, 235, 235)
+TEXT = (60, 60, 60)
+UP = (200, 55, 55)
+DOWN = (40, 90, 200)
+OVERLAYS: Dict[str, Tuple[int, int, int]] = {
+    'BB_Upper': (150, 100, 200),
+    'BB_Middle': (190, 160, 220),
+    'BB_Lower': (150, 100, 200),
+    'SMA_20': (230, 150, 30),
+    'SMA_50': (40, 160, 90),
+}
+BB_FILL = (150, 100, 200, 28)
+
+PADDING = 8
+AXIS_WIDTH = 90  # 오른쪽 가격 축
+TITLE_HEIGHT = 22
+VOLUME_RATIO = 0.22  # 거래량 영역 높이 비율
+
+def _ohlcv(df: pd.DataFrame) -> Dict[str, np.ndarray]:
+    """Open/High/Low/Close/Volume 배열 (소문자 컬럼도 허용)"""
+    arrays = {}
+    for name in ('Open', 'High', 'Low', 'Close', 'Volume'):
+        column = name if name in df.columns else name.lower()
+        arrays[name] = df[column].to_numpy(dtype=np.float64)
+    return arrays
+
+def _font(size: int) -> ImageFont.ImageFont:
+    try:
+        return ImageFont.load_default(size=size)
+    except TypeError:
+        return ImageFont.load_default()
+
+def _polyline(draw: ImageDraw.ImageDraw, xs: np.ndarray, ys: np.ndarray,
+              color: Tuple[int, int, int], width: int = 1) -> None:
+    """NaN 구간을 끊어서 선 그리기"""
+    segment: List[Tuple[float, float]] = []
+    for x, y in zip(xs, ys):
+        if np.isfinite(y):
+            segment.append((float(x), float(y)))
+            continue
+        if len(segment) > 1:
+            draw.line(segment, fill=color, width=width)
+        segment = []
+    if len(segment) > 1:
+        draw.line(segment, fill=color, width=width)
+
+def _price_ticks(low: float, high: float, count: int = 5) -> Sequence[float]:
+    """가격 축 눈금 (1/2/5 × 10^n 간격)"""
+    span = max(high - low, 1e-9)
+    raw_step = span / count
+    magnitude = 10 ** np.floor(np.log10(raw_step))
+    step = next(m * magnitude for m in (1, 2, 5, 10) if m * magnitude >= raw_step)
+    start = np.ceil(low / step) * step
+    return np.arange(start, high + step * 0.001, step)
+
+def render_chart_image(df: pd.DataFrame, size: Tuple[int, int] = CHART_RENDER_SIZE,
+                       candles: int = CHART_RENDER_CANDLES, title: str = '') -> Image.Image:
+    """최근 candles개 캔들 차트 이미지"""
+    data = df.iloc[-candles:]
+    if data.empty:
+        raise ValueError("렌더링할 캔들이 없습니다")
+    arrays = _ohlcv(data)
+    overlays = {name: data[name].to_numpy(dtype=np.float64) for name in OVERLAYS if name in data.columns}
+
+    width, height = size
+    image = Image.new('RGB', size, BACKGROUND)
+    draw = ImageDraw.Draw(image, 'RGBA')
+    font = _font(12)
+
+    plot_left, plot_right = PADDING, width - AXIS_WIDTH
+    price_top = PADDING + TITLE_HEIGHT
+    volume_height = int((height - price_top - PADDING) * VOLUME_RATIO)
+    volume_bottom = height - PADDING
+    volume_top = volume_bottom - volume_height
+    price_bottom = volume_top - PADDING
+
+    # 가격 범위 (캔들 + 오버레이)
+    low_candidates = [np.nanmin(arrays['Low'])] + [np.nanmin(v) for v in overlays.values() if np.isfinite(v).any()]
+    high_candidates = [np.nanmax(arrays['High'])] + [np.nanmax(v) for v in overlays.values() if np.isfinite(v).any()]
+    price_low, price_high = min(low_candidates), max(high_candidates)
+    margin = (price_high - price_low) * 0.03 or max(abs(price_high) * 0.001, 1.0)
+    price_low, price_high = price_low - margin, price_high + margin
+
+    def y_price(values: np.ndarray) -> np.ndarray:
+        return price_bottom - (values - price_low) / (price_high - price_low) * (price_bottom - price_top)
+
+    count = len(data)
+    slot = (plot_right - plot_left) / count
+    xs = plot_left + slot * (np.arange(count) + 0.5)
+    body_half = max(1.0, slot * 0.35)
+
+    # 눈금/격자
+    for tick in _price_ticks(price_low, price_high):
+        y = float(y_price(np.array([tick]))[0])
+        draw.line([(plot_left, y), (plot_right, y)], fill=GRID)
+        draw.text((plot_right + 4, y - 6), f"{tick:,.0f}", fill=TEXT, font=font)
+    draw.line([(plot_left, volume_top - PADDING // 2), (plot_right, volume_top - PADDING // 2)], fill=GRID)
+
+    # 볼린저 밴드 영역
+    if 'BB_Upper' in overlays and 'BB_Lower' in overlays:
+        upper, lower = y_price(overlays['BB_Upper']), y_price(overlays['BB_Lower'])
+        valid = np.isfinite(upper) & np.isfinite(lower)
+        if valid.sum() > 1:
+            polygon = list(zip(xs[valid], upper[valid])) + list(zip(xs[valid][::-1], lower[valid][::-1]))
+            draw.polygon([(float(x), float(y)) for x, y in polygon], fill=BB_FILL)
+
+    # 거래량
+    volume = np.nan_to_num(arrays['Volume'])
+    volume_max = volume.max() or 1.0
+    rising = arrays['Close'] >= arrays['Open']
+    for x, v, up in zip(xs, volume, rising):
+        top = volume_bottom - v / volume_max * volume_height
+        draw.rectangle([x - body_half, top, x + body_half, volume_bottom], fill=UP if up else DOWN)
+
+    # 캔들
+    opens, closes = y_price(arrays['Open']), y_price(arrays['Close'])
+    highs, lows = y_price(arrays['High']), y_price(arrays['Low'])
+    for x, o, c, h, l, up in zip(xs, opens, closes, highs, lows, rising):
+        color = UP if up else DOWN
+        draw.line([(x, h), (x, l)], fill=color)
+        top, bottom = min(o, c), max(o, c)
+        draw.rectangle([x - body_half, top, x + body_half, max(bottom, top + 1)], fill=color)
+
+    # 오버레이 선
+    for name, values in overlays.items():
+        _polyline(draw, xs, y_price(values), OVERLAYS[name], width=1 if name == 'BB_Middle' else 2)
+
+    # 제목/범례 (기본 폰트에 한글이 없어 영문 표기)
+    last_close = arrays['Close'][-1]
+    period = ''
+    if isinstance(data.index, pd.DatetimeIndex):
+        period = f"{data.index[0]:%m-%d %H:%M} ~ {data.index[-1]:%m-%d %H:%M}"
+    header = f"{title}  {period}  Close {last_close:,.0f}".strip()
+    draw.text((plot_left, PADDING), header, fill=TEXT, font=font)
+    legend_x = plot_right - 10
+    for name in reversed([n for n in ('SMA_20', 'SMA_50', 'BB_Upper') if n in overlays]):
+        label = 'BB(20,2)' if name == 'BB_Upper' else name
+        legend_x -= font.getlength(label) + 22
+        draw.line([(legend_x, PADDING + 7), (legend_x + 14, PADDING + 7)], fill=OVERLAYS[name], width=2)
+        draw.text((legend_x + 18, PADDING), label, fill=TEXT, font=font)
+
+    return image
+
+def render_chart(df: pd.DataFrame, size: Tuple[int, int] = CHART_RENDER_SIZE,
+                 candles: int = CHART_RENDER_CANDLES, image_format: str = CHART_RENDER_FORMAT,
+                 quality: int = SCREENSHOT_QUALITY, title: str = '') -> bytes:
+    """차트를 PNG/JPEG 바이트로 렌더링"""
+    image = render_chart_image(df, size=size, candles=candles, title=title)
+    buffer = io.BytesIO()
+    if image_format.upper() in ('JPEG', 'JPG'):
+        image.save(buffer, format='JPEG', quality=quality, optimize=True)
+    else:
+        image.save(buffer, format='PNG', optimize=False)
+    return buffer.getvalue()
+
+def render_chart_base64(df: Optional[pd.DataFrame], title: str = '', **kwargs) -> Optional[str]:
+    """Vision 입력용 차트 base64 문자열 (렌더링 이미지를 바로 JPEG 인코딩, 데이터가 없거나 실패하면 None)"""
+    if df is None or df.empty:
+        return None
+    try:
+        encoded = encode_for_vision(render_chart_image(df, title=title, **kwargs))
+        archive_image(encoded)
+        return encoded.base64
+    except Exception as e:
+        print(f"⚠️ 차트 렌더링 실패: {e}")
+        return None
@@ -0,0 +1,183 @@
+"""
+이미지 처리 모듈
+캡처/렌더링한 차트 이미지를 디스크를 거치지 않고 메모리에서 한 번만 리사이즈·인코딩하고,
+base64 변환도 한 번만 수행합니다.
+
+- JPEG 품질은 이진 탐색으로 크기 상한 안에서 가장 높은 값을 선택
+- images/ 보관은 선택 사항이며 백그라운드 스레드에서 기록 (개수/기간 제한)
+"""
+
+import io
+import os
+import time
+import queue
+import atexit
+import base64
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Optional, Union
+from PIL import Image
+from config.settings import (
+    SCREENSHOT_MAX_SIZE_MB, SCREENSHOT_QUALITY, VISION_IMAGE_MAX_DIMENSION, VISION_IMAGE_MIN_QUALITY,
+    IMAGE_ARCHIVE_ENABLED, IMAGE_ARCHIVE_DIR, IMAGE_ARCHIVE_MAX_FILES, IMAGE_ARCHIVE_MAX_AGE_DAYS
+)
+
+@dataclass
+class EncodedImage:
+    """인코딩된 이미지 (base64는 처음 요청 시 한 번만 계산)"""
+    data: bytes
+    format: str
+    width: int
+    height: int
+    quality: Optional[int] = None
+    encode_attempts: int = 1
+    _base64: Optional[str] = field(default=None, repr=False)
+
+    @property
+    def size_mb(self) -> float:
+        return len(self.data) / (1024 * 1024)
+
+    @property
+    def base64(self) -> str:
+        if self._base64 is None:
+            self._base64 = base64.b64encode(self.data).decode('ascii')
+        return self._base64
+
+def _encode_jpeg(image: Image.Image, quality: int) -> bytes:
+    buffer = io.BytesIO()
+    image.save(buffer, format='JPEG', quality=quality, optimize=True)
+    return buffer.getvalue()
+
+def encode_for_vision(source: Union[bytes, Image.Image],
+                      max_size_mb: float = SCREENSHOT_MAX_SIZE_MB,
+                      max_dimension: int = VISION_IMAGE_MAX_DIMENSION,
+                      max_quality: int = SCREENSHOT_QUALITY,
+                      min_quality: int = VISION_IMAGE_MIN_QUALITY) -> EncodedImage:
+    """
+    이미지를 Vision 모델 입력용 JPEG로 인코딩
+
+    긴 변이 max_dimension을 넘으면 한 번 축소하고, [min_quality, max_quality]에서
+    크기 상한을 만족하는 가장 높은 품질을 이진 탐색합니다 (최소 품질로도 넘으면 최소 품질 사용).
+    """
+    image = Image.open(io.BytesIO(source)) if isinstance(source, (bytes, bytearray)) else source
+    if image.mode != 'RGB':
+        image = image.convert('RGB')
+    if max(image.size) > max_dimension:
+        ratio = max_dimension / max(image.size)
+        image = image.resize((int(image.width * ratio), int(image.height * ratio)), Image.Resampling.LANCZOS)
+
+    limit = int(max_size_mb * 1024 * 1024)
+    attempts = 1
+    best_quality, best = max_quality, _encode_jpeg(image, max_quality)
+    if len(best) > limit:
+        low, high = min_quality, max_quality - 1
+        fallback = None
+        best = None
+        while low <= high:
+            quality = (low + high) // 2
+            data = _encode_jpeg(image, quality)
+            attempts += 1
+            if len(data) <= limit:
+                best_quality, best = quality, data
+                low = quality + 1
+            else:
+                if quality == min_quality:
+                    fallback = data
+                high = quality - 1
+        if best is None:
+            best_quality, best = min_quality, fallback or _encode_jpeg(image, min_quality)
+
+    return EncodedImage(best, 'JPEG', image.width, image.height, best_quality, attempts)
+
+class ImageArchiver:
+    """이미지를 백그라운드에서 디렉토리에 보관 (최대 개수/기간 초과분 삭제)"""
+
+    def __init__(self, directory: str = IMAGE_ARCHIVE_DIR, max_files: int = IMAGE_ARCHIVE_MAX_FILES,
+                 max_age_days: float = IMAGE_ARCHIVE_MAX_AGE_DAYS, prefix: str = 'upbit_screenshot'):
+        self.directory = directory
+        self.max_files = max_files
+        self.max_age_days = max_age_days
+        self.prefix = prefix
+        self.stats = {'archived': 0, 'pruned': 0, 'dropped': 0, 'errors': 0}
+        self._queue: queue.Queue = queue.Queue(maxsize=32)
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def archive(self, data: bytes, extension: str) -> str:
+        """보관 요청 (즉시 반환, 기록될 경로 반환)"""
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        path = os.path.join(self.directory, f"{self.prefix}_{timestamp}.{extension}")
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="image-archiver", daemon=True)
+                self._thread.start()
+        try:
+            self._queue.put_nowait((path, data))
+        except queue.Full:
+            self.stats['dropped'] += 1
+        return path
+
+    def flush(self, timeout: float = 10.0) -> bool:
+        """대기 중인 기록이 끝날 때까지 대기"""
+        deadline = time.monotonic() + timeout
+        while self._queue.unfinished_tasks:
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.01)
+        return True
+
+    def _run(self) -> None:
+        while True:
+            path, data = self._queue.get()
+            try:
+                os.makedirs(self.directory, exist_ok=True)
+                temp_path = f"{path}.tmp"
+                with open(temp_path, 'wb') as f:
+                    f.write(data)
+                os.replace(temp_path, path)
+                self.stats['archived'] += 1
+                self.prune()
+            except Exception as e:
+                self.stats['errors'] += 1
+                print(f"⚠️ 이미지 보관 실패 ({path}): {e}")
+            finally:
+                self._queue.task_done()
+
+    def prune(self) -> int:
+        """보관 한도를 넘는 오래된 파일 삭제"""
+        try:
+            entries = [entry for entry in os.scandir(self.directory)
+                       if entry.is_file() and entry.name.startswith(self.prefix) and not entry.name.endswith('.tmp')]
+        except FileNotFoundError:
+            return 0
+        entries.sort(key=lambda entry: entry.stat().st_mtime, reverse=True)
+        cutoff = time.time() - self.max_age_days * 86400
+        removed = 0
+        for position, entry in enumerate(entries):
+            if position >= self.max_files or entry.stat().st_mtime < cutoff:
+                try:
+                    os.remove(entry.path)
+                    removed += 1
+                except OSError:
+                    pass
+        self.stats['pruned'] += removed
+        return removed
+
+_archiver: Optional[ImageArchiver] = None
+_archiver_lock = threading.Lock()
+
+def get_image_archiver() -> ImageArchiver:
+    """공용 이미지 보관기 반환 (종료 시 남은 기록 처리)"""
+    global _archiver
+    with _archiver_lock:
+        if _archiver is None:
+            _archiver = ImageArchiver()
+            atexit.register(_archiver.flush)
+        return _archiver
+
+def archive_image(image: EncodedImage) -> Optional[str]:
+    """설정에 따라 이미지 보관 (비활성화 시 None)"""
+    if not IMAGE_ARCHIVE_ENABLED:
+        return None
+    return get_image_archiver().archive(image.data, 'jpg' if image.format == 'JPEG' else image.format.lower())
@@ -3,16 +3,22 @@
 업비트 API를 통해 비트코인 시장 데이터를 수집합니다.
 """
 
-import pyupbit
 import pandas as pd
 import requests
-from typing import Optional, Dict, Any, Tuple
-from config.settings import TRADING_SYMBOL, DAILY_DATA_COUNT, MINUTE_DATA_COUNT
+from typing import Optional, Dict, Any, List, Tuple
+from config.settings import (
+    TRADING_SYMBOL, DAILY_DATA_COUNT, MINUTE_DATA_COUNT, CANDLE_STORE_ENABLED,
+    FEAR_GREED_CACHE_TTL, FEAR_GREED_CACHE_STALE
+)
+from data.candle_store import get_candle_store
+from data.upbit_client import get_upbit_client
+from data.realtime_feed import get_latest_price, get_latest_orderbook, get_latest_prices, get_latest_orderbooks
+from utils.cache import cached_call
 
 def get_current_price(symbol: str = TRADING_SYMBOL) -> Optional[float]:
-    """현재 가격 조회"""
+    """현재 가격 조회 (실시간 피드 스냅샷 우선)"""
     try:
-        price = pyupbit.get_current_price(symbol)
+        price = get_latest_price(symbol)
         if price:
             print(f"📊 현재 {symbol} 가격: {price:,}원")
         return price
@@ -20,12 +26,40 @@ def get_current_price(symbol: str = TRADING_SYMBOL) -> Optional[float]:
         print(f"❌ 현재 가격 조회 실패: {e}")
         return None
 
-def get_ohlcv_data(symbol: str = TRADING_SYMBOL, interval: str = "day", count: int = 30) -> Optional[pd.DataFrame]:
-    """OHLCV 데이터 조회"""
+def get_current_prices(symbols: List[str]) -> Dict[str, float]:
+    """여러 심볼 현재가 (피드 스냅샷 우선, 나머지는 티커 API 일괄 조회)"""
     try:
-        df = pyupbit.get_ohlcv(symbol, interval=interval, count=count)
+        prices = get_latest_prices(symbols)
+        print(f"📊 현재가 조회: {len(prices)}/{len(symbols)}개 심볼")
+        return prices
+    except Exception as e:
+        print(f"❌ 현재가 일괄 조회 실패: {e}")
+        return {}
+
+def get_orderbooks(symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+    """여러 심볼 오더북 (피드 스냅샷 우선, 나머지는 호가 API 일괄 조회)"""
+    try:
+        orderbooks = get_latest_orderbooks(symbols)
+        print(f"📈 오더북 조회: {len(orderbooks)}/{len(symbols)}개 심볼")
+        return orderbooks
+    except Exception as e:
+        print(f"❌ 오더북 일괄 조회 실패: {e}")
+        return {}
+
+def get_ohlcv_data(symbol: str = TRADING_SYMBOL, interval: str = "day", count: int = 30,
+                   use_store: bool = CANDLE_STORE_ENABLED) -> Optional[pd.DataFrame]:
+    """OHLCV 데이터 조회 (use_store=True면 로컬 캔들 저장소에서 빠진 구간만 조회)"""
+    try:
+        if use_store:
+            store = get_candle_store()
+            df = store.get_candles(symbol, interval, count)
+        else:
+            df = get_upbit_client().get_ohlcv(symbol, interval=interval, count=count)
         if df is not None and not df.empty:
-            print(f"✅ {interval} 데이터 수집 완료: {len(df)}개")
+            if use_store:
+                print(f"✅ {interval} 데이터 수집 완료: {len(df)}개 (신규 조회 {store.last_fetched_rows.get((symbol, interval), 0)}개)")
+            else:
+                print(f"✅ {interval} 데이터 수집 완료: {len(df)}개")
             return df
         else:
             print(f"❌ {interval} 데이터 수집 실패")
@@ -35,9 +69,9 @@ def get_ohlcv_data(symbol: str = TRADING_SYMBOL, interval: str = "day", count: i
         return None
 
 def get_orderbook(symbol: str = TRADING_SYMBOL) -> Optional[Dict[str, Any]]:
-    """오더북 정보 조회"""
+    """오더북 정보 조회 (실시간 피드 스냅샷 우선)"""
     try:
-        orderbook = pyupbit.get_orderbook(symbol)
+        orderbook = get_latest_orderbook(symbol)
         if orderbook and isinstance(orderbook, dict):
             if 'orderbook_units' in orderbook and len(orderbook['orderbook_units']) > 0:
                 ask_price = orderbook['orderbook_units'][0]['ask_price']
@@ -57,7 +91,12 @@ def get_orderbook(symbol: str = TRADING_SYMBOL) -> Optional[Dict[str, Any]]:
         return None
 
 def get_fear_greed_index() -> Optional[Dict[str, Any]]:
-    """공포탐욕지수 데이터 수집"""
+    """공포탐욕지수 조회 (하루 1회 갱신되므로 캐시 사용, 만료 후에는 이전 값 반환 후 백그라운드 갱신)"""
+    return cached_call('fear_greed', fetch_fear_greed_index, FEAR_GREED_CACHE_TTL,
+                       stale_ttl=FEAR_GREED_CACHE_STALE, persist=True)
+
+def fetch_fear_greed_index() -> Optional[Dict[str, Any]]:
+    """공포탐욕지수 데이터 수집 (API 직접 조회)"""
     try:
         url = "https://api.alternative.me/fng/?limit=2"
         response = requests.get(url, timeout=10)
@@ -5,40 +5,38 @@ Google News API를 통해 비트코인 관련 뉴스를 수집하고 감정 분
 
 import requests
 from typing import Optional, List, Dict, Any
-from config.settings import SERP_API_KEY, NEWS_COUNT, NEWS_LANGUAGE, NEWS_REGION
+from config.settings import SERP_API_KEY, NEWS_COUNT, NEWS_LANGUAGE, NEWS_REGION, NEWS_CACHE_TTL, NEWS_CACHE_STALE
 import datetime
-from database.connection import get_db_connection
+from database.connection import pooled_connection
+from utils.cache import cached_call
 import json
 
 def save_news_to_db(news_data):
-    conn = get_db_connection()
-    cursor = conn.cursor()
     now = datetime.datetime.now()
     
     # 리스트를 JSON 문자열로 변환
     news_json = json.dumps(news_data)
     
-    cursor.execute(
-        "INSERT INTO news (data, fetched_at) VALUES (%s, %s)",
-        (news_json, now)
-    )
-    conn.commit()
-    cursor.close()
-    conn.close()
+    with pooled_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute(
+            "INSERT INTO news (data, fetched_at) VALUES (%s, %s)",
+            (news_json, now)
+        )
+        conn.commit()
+        cursor.close()
 
 def get_cached_news_from_db():
-    conn = get_db_connection()
-    cursor = conn.cursor(dictionary=True)
     one_hour_ago = datetime.datetime.now() - datetime.timedelta(hours=1)
     
-    cursor.execute(
-        "SELECT * FROM news WHERE fetched_at >= %s ORDER BY fetched_at DESC LIMIT 1",
-        (one_hour_ago,)
-    )
-    
-    result = cursor.fetchone()
-    cursor.close()
-    conn.close()
+    with pooled_connection() as conn:
+        cursor = conn.cursor(dictionary=True)
+        cursor.execute(
+            "SELECT * FROM news WHERE fetched_at >= %s ORDER BY fetched_at DESC LIMIT 1",
+            (one_hour_ago,)
+        )
+        result = cursor.fetchone()
+        cursor.close()
     
     if result:
         print('✅ 캐시된 뉴스 데이터 사용')
@@ -47,13 +45,18 @@ def get_cached_news_from_db():
     return None
 
 def get_bitcoin_news() -> Optional[List[Dict[str, Any]]]:
-    """Google News API를 사용하여 비트코인 관련 뉴스 수집"""
+    """Google News API를 사용하여 비트코인 관련 뉴스 수집 (프로세스/디스크 캐시 우선)"""
     print("=== 비트코인 뉴스 수집 중 ===")
     
     if not SERP_API_KEY:
         print("⚠️ SERP_API_KEY가 설정되지 않아 뉴스 분석을 건너뜁니다.")
         return None
     
+    return cached_call('news', fetch_bitcoin_news, NEWS_CACHE_TTL,
+                       stale_ttl=NEWS_CACHE_STALE, persist=True)
+
+def fetch_bitcoin_news() -> Optional[List[Dict[str, Any]]]:
+    """DB 캐시 확인 후 Google News API 조회"""
     news = get_cached_news_from_db()
     if news:
         return news['data']
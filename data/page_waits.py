@@ -0,0 +1,119 @@
+"""
+브라우저 대기 모듈
+고정 sleep 대신 WebDriverWait 조건으로 화면 준비 상태(메뉴 표시, 차트 캔버스 재렌더링,
+지표 범례 표시)를 감지하고, 단계별 소요 시간을 기록합니다.
+
+각 대기는 상한(timeout)이 있어 최악의 경우에도 지연이 제한되며,
+조건이 먼저 충족되면 바로 다음 단계로 넘어갑니다.
+"""
+
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterator, List, Optional
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from config.settings import WAIT_POLL_INTERVAL, CHART_RENDER_SETTLE
+
+# 차트 영역 캔버스 서명 (그려진 내용이 바뀌면 값이 달라짐)
+_CANVAS_SIGNATURE_JS = """
+const root = arguments[0];
+let signature = '';
+for (const canvas of root.querySelectorAll('canvas')) {
+    try {
+        const data = canvas.toDataURL();
+        signature += canvas.width + 'x' + canvas.height + ':' + data.length + ':' + data.slice(-64) + ';';
+    } catch (e) {
+        signature += canvas.width + 'x' + canvas.height + ':tainted;';
+    }
+}
+return signature;
+"""
+
+@dataclass
+class WaitStep:
+    """대기 단계 기록"""
+    name: str
+    seconds: float
+    ok: bool
+
+@dataclass
+class WaitTrace:
+    """단계별 소요 시간 기록"""
+    steps: List[WaitStep] = field(default_factory=list)
+
+    @contextmanager
+    def step(self, name: str) -> Iterator[List[bool]]:
+        """단계 시간 측정 (yield된 리스트에 False를 넣으면 실패로 기록)"""
+        outcome = [True]
+        started = time.perf_counter()
+        try:
+            yield outcome
+        except Exception:
+            outcome[0] = False
+            raise
+        finally:
+            self.steps.append(WaitStep(name, time.perf_counter() - started, outcome[0]))
+
+    @property
+    def total_seconds(self) -> float:
+        return sum(step.seconds for step in self.steps)
+
+    def summary(self) -> str:
+        """한 줄 요약 (단계=초, 실패는 ✗ 표시)"""
+        parts = [f"{step.name}={step.seconds:.2f}s{'' if step.ok else '✗'}" for step in self.steps]
+        return f"{' → '.join(parts)} (합계 {self.total_seconds:.2f}s)"
+
+def wait_until(driver: Any, condition: Callable[[Any], Any], timeout: float,
+               poll: float = WAIT_POLL_INTERVAL) -> Any:
+    """조건 충족 시 결과 반환, 상한 초과 시 None (예외 없음)"""
+    try:
+        return WebDriverWait(driver, timeout, poll_frequency=poll).until(condition)
+    except TimeoutException:
+        return None
+
+def wait_visible(driver: Any, xpath: str, timeout: float) -> Any:
+    """XPath 요소가 보일 때까지 대기"""
+    return wait_until(driver, EC.visibility_of_element_located((By.XPATH, xpath)), timeout)
+
+def wait_clickable(driver: Any, xpath: str, timeout: float) -> Any:
+    """XPath 요소가 클릭 가능할 때까지 대기"""
+    return wait_until(driver, EC.element_to_be_clickable((By.XPATH, xpath)), timeout)
+
+def wait_css_present(driver: Any, selector: str, timeout: float) -> Any:
+    """CSS 선택자 요소가 나타날 때까지 대기 (지표 범례 등)"""
+    return wait_until(driver, EC.presence_of_element_located((By.CSS_SELECTOR, selector)), timeout)
+
+def canvas_signature(driver: Any, element: Any) -> Optional[str]:
+    """요소 안 캔버스들의 현재 렌더링 서명"""
+    try:
+        return driver.execute_script(_CANVAS_SIGNATURE_JS, element)
+    except WebDriverException:
+        return None
+
+def wait_canvas_rerendered(driver: Any, element: Any, before: Optional[str], timeout: float,
+                           settle: float = CHART_RENDER_SETTLE) -> bool:
+    """
+    캔버스 서명이 before와 달라진 뒤 settle초 동안 더 바뀌지 않을 때까지 대기
+
+    before가 None이면(이전 서명을 못 구한 경우) 안정화만 기다립니다.
+    """
+    deadline = time.monotonic() + timeout
+    state = {'last': before, 'changed_at': None}
+
+    def rerendered(_driver: Any) -> bool:
+        current = canvas_signature(_driver, element)
+        now = time.monotonic()
+        if current is None:
+            return False
+        if current != state['last']:
+            state['last'] = current
+            state['changed_at'] = now
+            return False
+        return state['changed_at'] is not None and now - state['changed_at'] >= settle
+
+    if before is None:
+        state['changed_at'] = time.monotonic()
+    return bool(wait_until(driver, rerendered, max(0.0, deadline - time.monotonic())))
@@ -0,0 +1,285 @@
+"""
+실시간 시세 피드 모듈
+업비트 WebSocket(ticker, orderbook, trade)을 백그라운드 스레드에서 구독하여
+최신 시세 스냅샷을 메모리에 유지합니다.
+
+현재가/오더북 조회는 REST 대신 이 스냅샷을 읽으며, 피드가 실행 중이 아니거나
+스냅샷이 오래된 경우에만 REST로 조회합니다.
+"""
+
+import json
+import time
+import uuid
+import random
+import asyncio
+import threading
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+import websockets
+from config.settings import (
+    TRADING_SYMBOL, REALTIME_FEED_URL, REALTIME_FEED_MAX_AGE,
+    REALTIME_FEED_RECONNECT_INITIAL, REALTIME_FEED_RECONNECT_MAX, REALTIME_FEED_TRADE_HISTORY,
+    PRICE_CACHE_TTL
+)
+from utils.cache import cached_call
+from data.upbit_client import get_upbit_client
+
+class MarketFeed:
+    """업비트 WebSocket 시세 피드 (연결 끊김 시 지수 백오프로 재연결)"""
+
+    def __init__(self, symbols: List[str], url: str = REALTIME_FEED_URL,
+                 max_age: float = REALTIME_FEED_MAX_AGE,
+                 reconnect_initial: float = REALTIME_FEED_RECONNECT_INITIAL,
+                 reconnect_max: float = REALTIME_FEED_RECONNECT_MAX,
+                 trade_history: int = REALTIME_FEED_TRADE_HISTORY):
+        self.symbols = list(symbols)
+        self.url = url
+        self.max_age = max_age
+        self.reconnect_initial = reconnect_initial
+        self.reconnect_max = reconnect_max
+        self.trade_history = trade_history
+        self.connected = False
+        self.last_error: Optional[str] = None
+        self.stats = {'connects': 0, 'reconnects': 0, 'messages': 0, 'errors': 0}
+
+        self._lock = threading.Lock()
+        self._tickers: Dict[str, Dict[str, Any]] = {}
+        self._orderbooks: Dict[str, Dict[str, Any]] = {}
+        self._trades: Dict[str, Deque[Dict[str, Any]]] = {
+            symbol: deque(maxlen=self.trade_history) for symbol in self.symbols
+        }
+        self._received_at: Dict[tuple, float] = {}  # (type, code) -> 수신 시각
+        self._ready = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._task: Optional[asyncio.Task] = None
+
+    # ---- 실행 제어 ----
+
+    @property
+    def running(self) -> bool:
+        """백그라운드 스레드 실행 여부"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> 'MarketFeed':
+        """백그라운드 스레드에서 구독 시작"""
+        if not self.running:
+            self._thread = threading.Thread(target=self._thread_main, name="market-feed", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """구독 종료"""
+        loop, task = self._loop, self._task
+        if loop is not None and task is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(task.cancel)
+        if self._thread is not None:
+            self._thread.join(timeout)
+        self._thread = None
+
+    def wait_ready(self, timeout: float = 5.0) -> bool:
+        """모든 심볼의 첫 시세 수신 대기"""
+        return self._ready.wait(timeout)
+
+    def _thread_main(self) -> None:
+        loop = asyncio.new_event_loop()
+        self._loop = loop
+        try:
+            self._task = loop.create_task(self._run())
+            loop.run_until_complete(self._task)
+        except asyncio.CancelledError:
+            pass
+        finally:
+            self.connected = False
+            loop.close()
+
+    async def _run(self) -> None:
+        """연결 → 구독 → 수신 루프 (끊기면 백오프 후 재연결)"""
+        delay = self.reconnect_initial
+        while True:
+            try:
+                async with websockets.connect(self.url, open_timeout=10, ping_interval=30,
+                                              max_size=None) as ws:
+                    await ws.send(json.dumps(self._subscription()))
+                    self.connected = True
+                    self.stats['connects'] += 1
+                    delay = self.reconnect_initial
+                    async for raw in ws:
+                        self._handle_message(raw)
+                self.last_error = "연결 종료"
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.stats['errors'] += 1
+                self.last_error = str(e)
+            finally:
+                self.connected = False
+
+            self.stats['reconnects'] += 1
+            await asyncio.sleep(delay * (1 + random.random() * 0.1))
+            delay = min(delay * 2, self.reconnect_max)
+
+    def _subscription(self) -> List[Dict[str, Any]]:
+        """업비트 구독 요청 메시지"""
+        return [
+            {'ticket': f"aibitcoin-{uuid.uuid4()}"},
+            {'type': 'ticker', 'codes': self.symbols},
+            {'type': 'orderbook', 'codes': self.symbols},
+            {'type': 'trade', 'codes': self.symbols},
+            {'format': 'DEFAULT'},
+        ]
+
+    def _handle_message(self, raw: Any) -> None:
+        """수신 메시지를 스냅샷에 반영"""
+        try:
+            if isinstance(raw, bytes):
+                raw = raw.decode('utf-8')
+            message = json.loads(raw)
+        except (UnicodeDecodeError, ValueError):
+            self.stats['errors'] += 1
+            return
+
+        message_type = message.get('type')
+        code = message.get('code')
+        if code is None or message_type not in ('ticker', 'orderbook', 'trade'):
+            return
+
+        with self._lock:
+            if message_type == 'ticker':
+                self._tickers[code] = message
+            elif message_type == 'orderbook':
+                self._orderbooks[code] = message
+            else:
+                self._trades.setdefault(code, deque(maxlen=self.trade_history)).append(message)
+            self._received_at[(message_type, code)] = time.monotonic()
+            self.stats['messages'] += 1
+            if all(symbol in self._tickers for symbol in self.symbols):
+                self._ready.set()
+
+    # ---- 스냅샷 조회 ----
+
+    def _is_fresh(self, message_type: str, code: str, max_age: Optional[float]) -> bool:
+        received_at = self._received_at.get((message_type, code))
+        if received_at is None:
+            return False
+        max_age = self.max_age if max_age is None else max_age
+        return time.monotonic() - received_at <= max_age
+
+    def get_price(self, code: str, max_age: Optional[float] = None) -> Optional[float]:
+        """최신 체결가 (수신 기록이 없거나 오래되면 None)"""
+        with self._lock:
+            ticker = self._tickers.get(code)
+            if ticker is None or not self._is_fresh('ticker', code, max_age):
+                return None
+            return float(ticker['trade_price'])
+
+    def get_ticker(self, code: str, max_age: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """최신 ticker 메시지"""
+        with self._lock:
+            ticker = self._tickers.get(code)
+            if ticker is None or not self._is_fresh('ticker', code, max_age):
+                return None
+            return dict(ticker)
+
+    def get_orderbook(self, code: str, max_age: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """최신 오더북 (pyupbit.get_orderbook 단일 종목 응답과 같은 형식)"""
+        with self._lock:
+            orderbook = self._orderbooks.get(code)
+            if orderbook is None or not self._is_fresh('orderbook', code, max_age):
+                return None
+            return {
+                'market': code,
+                'timestamp': orderbook.get('timestamp'),
+                'total_ask_size': orderbook.get('total_ask_size'),
+                'total_bid_size': orderbook.get('total_bid_size'),
+                'orderbook_units': [dict(unit) for unit in orderbook.get('orderbook_units', [])],
+            }
+
+    def get_trades(self, code: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """최근 체결 내역 (오래된 순)"""
+        with self._lock:
+            trades = list(self._trades.get(code, ()))
+        return trades[-limit:] if limit else trades
+
+_market_feed: Optional[MarketFeed] = None
+_market_feed_lock = threading.Lock()
+
+def start_market_feed(symbols: Optional[List[str]] = None) -> MarketFeed:
+    """공용 시세 피드 시작 (이미 실행 중이면 그대로 반환)"""
+    global _market_feed
+    with _market_feed_lock:
+        if _market_feed is None:
+            _market_feed = MarketFeed(symbols or [TRADING_SYMBOL])
+        return _market_feed.start()
+
+def stop_market_feed() -> None:
+    """공용 시세 피드 종료"""
+    global _market_feed
+    with _market_feed_lock:
+        if _market_feed is not None:
+            _market_feed.stop()
+            _market_feed = None
+
+def get_market_feed() -> Optional[MarketFeed]:
+    """실행 중인 공용 시세 피드 (없으면 None)"""
+    feed = _market_feed
+    return feed if feed is not None and feed.running else None
+
+def get_latest_price(symbol: str = TRADING_SYMBOL) -> Optional[float]:
+    """현재가 (피드 스냅샷 우선, 없거나 오래되면 REST 조회 - 짧은 TTL로 중복 호출 방지)"""
+    feed = get_market_feed()
+    if feed is not None:
+        price = feed.get_price(symbol)
+        if price is not None:
+            return price
+    return cached_call(f"price:{symbol}", lambda: get_upbit_client().get_current_price(symbol), PRICE_CACHE_TTL)
+
+def get_latest_orderbook(symbol: str = TRADING_SYMBOL) -> Optional[Dict[str, Any]]:
+    """오더북 (피드 스냅샷 우선, 없거나 오래되면 REST 조회 - 짧은 TTL로 중복 호출 방지)"""
+    feed = get_market_feed()
+    if feed is not None:
+        orderbook = feed.get_orderbook(symbol)
+        if orderbook is not None:
+            return orderbook
+    return cached_call(f"orderbook:{symbol}", lambda: get_upbit_client().get_orderbook(symbol), PRICE_CACHE_TTL)
+
+def get_latest_prices(symbols: List[str]) -> Dict[str, float]:
+    """
+    여러 심볼 현재가 (피드 스냅샷 우선, 빠진 심볼만 REST 티커 API 한 번으로 일괄 조회)
+
+    일괄 조회 결과는 심볼별 캐시에도 넣어 같은 사이클의 get_latest_price 호출이 재조회하지 않게 합니다.
+    """
+    prices: Dict[str, float] = {}
+    feed = get_market_feed()
+    if feed is not None:
+        for symbol in symbols:
+            price = feed.get_price(symbol)
+            if price is not None:
+                prices[symbol] = price
+    missing = [symbol for symbol in symbols if symbol not in prices]
+    if missing:
+        fetched = get_upbit_client().get_current_price(missing) or {}
+        for symbol, price in fetched.items():
+            prices[symbol] = price
+            cached_call(f"price:{symbol}", lambda price=price: price, PRICE_CACHE_TTL)
+    return prices
+
+def get_latest_orderbooks(symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+    """여러 심볼 오더북 (피드 스냅샷 우선, 빠진 심볼만 REST 호가 API 한 번으로 일괄 조회)"""
+    orderbooks: Dict[str, Dict[str, Any]] = {}
+    feed = get_market_feed()
+    if feed is not None:
+        for symbol in symbols:
+            orderbook = feed.get_orderbook(symbol)
+            if orderbook is not None:
+                orderbooks[symbol] = orderbook
+    missing = [symbol for symbol in symbols if symbol not in orderbooks]
+    if missing:
+        fetched = get_upbit_client().get_orderbook(missing) or []
+        if isinstance(fetched, dict):
+            fetched = [fetched]
+        for orderbook in fetched:
+            if isinstance(orderbook, dict) and orderbook.get('market'):
+                orderbooks[orderbook['market']] = orderbook
+                cached_call(f"orderbook:{orderbook['market']}", lambda orderbook=orderbook: orderbook, PRICE_CACHE_TTL)
+    return orderbooks
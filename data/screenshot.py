@@ -4,87 +4,39 @@
 """
 
 import os
-import time
-import base64
-from datetime import datetime
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from webdriver_manager.chrome import ChromeDriverManager
-from PIL import Image
-import io
+from functools import lru_cache
 from typing import Optional, Tuple
+from data.image_pipeline import encode_for_vision, archive_image
 from config.settings import (
-    SCREENSHOT_WINDOW_SIZE, SCREENSHOT_MAX_SIZE_MB, SCREENSHOT_QUALITY,
-    SCREENSHOT_WAIT_TIME, SCREENSHOT_ADDITIONAL_WAIT, SCREENSHOT_MENU_WAIT, SCREENSHOT_CHART_WAIT,
+    SCREENSHOT_WINDOW_SIZE, SCREENSHOT_MAX_SIZE_MB, SCREENSHOT_QUALITY, SCREENSHOT_WAIT_TIME,
     BROWSER_HEADLESS, BROWSER_DISABLE_IMAGES, BROWSER_DISABLE_JS, BROWSER_DISABLE_CSS,
-    BROWSER_PAGE_LOAD_STRATEGY, ADD_BOLLINGER_BANDS, CHART_XPATH, STRICT_CHART_CAPTURE,
-    TIMEFRAME_MENU_BUTTON_XPATH, TIMEFRAME_1H_ITEM_XPATH,
-    CHART_SETTINGS_BUTTON_XPATH, BOLLINGER_OPTION_XPATH
+    BROWSER_PAGE_LOAD_STRATEGY, BROWSER_SESSION_ENABLED, TRADING_SYMBOL,
+    UPBIT_CHART_URL, UPBIT_CHART_URL_TEMPLATE
 )
 
 def optimize_image(image_path: str, max_size_mb: float = SCREENSHOT_MAX_SIZE_MB, quality: int = SCREENSHOT_QUALITY) -> Tuple[bytes, dict]:
-    """이미지를 최적화하여 파일 크기를 줄이고 품질을 유지"""
+    """이미지 파일을 최적화하여 파일 크기를 줄이고 품질을 유지 (메모리 파이프라인 사용)"""
     try:
-        with Image.open(image_path) as img:
-            original_size = os.path.getsize(image_path) / (1024 * 1024)  # MB
-            original_width, original_height = img.size
-            
-            print(f"📏 원본 이미지 크기: {original_size:.2f} MB ({original_width}x{original_height})")
-            
-            # RGB 모드로 변환 (JPEG 최적화를 위해)
-            if img.mode != 'RGB':
-                img = img.convert('RGB')
-            
-            # 이미지 크기 조정 (너무 큰 경우에만)
-            max_dimension = 1920
-            if original_width > max_dimension or original_height > max_dimension:
-                ratio = min(max_dimension / original_width, max_dimension / original_height)
-                new_width = int(original_width * ratio)
-                new_height = int(original_height * ratio)
-                img = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
-                print(f"📐 이미지 크기 조정: {new_width}x{new_height}")
-            
-            # 최적화된 이미지를 메모리에 저장
-            output_buffer = io.BytesIO()
-            
-            # 파일 크기가 목표 크기보다 클 때까지 품질을 낮춤 (더 보수적으로)
-            current_quality = quality
-            while True:
-                output_buffer.seek(0)
-                output_buffer.truncate()
-                
-                img.save(output_buffer, format='JPEG', quality=current_quality, optimize=True)
-                
-                optimized_size = len(output_buffer.getvalue()) / (1024 * 1024)  # MB
-                
-                if optimized_size <= max_size_mb or current_quality <= 20:  # 최소 품질을 20으로 설정
-                    break
-                
-                current_quality -= 2  # 더 작은 단위로 품질 감소
-            
-            optimized_bytes = output_buffer.getvalue()
-            optimized_size = len(optimized_bytes) / (1024 * 1024)  # MB
-            
-            optimization_info = {
-                'original_size_mb': original_size,
-                'optimized_size_mb': optimized_size,
-                'compression_ratio': (1 - optimized_size / original_size) * 100,
-                'final_quality': current_quality,
-                'width': img.size[0],
-                'height': img.size[1]
-            }
-            
-            print(f"✅ 이미지 최적화 완료:")
-            print(f"   📏 원본 크기: {original_size:.2f} MB")
-            print(f"   📏 최적화 크기: {optimized_size:.2f} MB")
-            print(f"   📊 압축률: {optimization_info['compression_ratio']:.1f}%")
-            print(f"   🎨 최종 품질: {current_quality}")
-            
-            return optimized_bytes, optimization_info
+        with open(image_path, "rb") as f:
+            original = f.read()
+        encoded = encode_for_vision(original, max_size_mb=max_size_mb, max_quality=quality)
+        original_size = len(original) / (1024 * 1024)  # MB
+        optimization_info = {
+            'original_size_mb': original_size,
+            'optimized_size_mb': encoded.size_mb,
+            'compression_ratio': (1 - encoded.size_mb / original_size) * 100 if original_size else 0,
+            'final_quality': encoded.quality,
+            'width': encoded.width,
+            'height': encoded.height
+        }
+        print(f"✅ 이미지 최적화 완료: {original_size:.2f} MB → {encoded.size_mb:.2f} MB (품질 {encoded.quality})")
+        return encoded.data, optimization_info
             
     except Exception as e:
         print(f"⚠️ 이미지 최적화 중 오류: {e}")
@@ -92,6 +44,11 @@ def optimize_image(image_path: str, max_size_mb: float = SCREENSHOT_MAX_SIZE_MB,
         with open(image_path, "rb") as f:
             return f.read(), {'error': str(e)}
 
+@lru_cache(maxsize=1)
+def get_chromedriver_path() -> str:
+    """ChromeDriver 경로 (설치/버전 확인은 프로세스당 한 번)"""
+    return ChromeDriverManager().install()
+
 def setup_driver() -> webdriver.Chrome:
     """Chrome 드라이버 설정 (최적화된 버전)"""
     chrome_options = Options()
@@ -148,12 +105,12 @@ def setup_driver() -> webdriver.Chrome:
     chrome_options.page_load_strategy = BROWSER_PAGE_LOAD_STRATEGY  # DOM이 준비되면 즉시 로드 완료로 간주
     
     try:
-        service = Service(ChromeDriverManager().install())
+        service = Service(get_chromedriver_path())
         driver = webdriver.Chrome(service=service, options=chrome_options)
         
         # 페이지 로드 타임아웃 설정
         driver.set_page_load_timeout(SCREENSHOT_WAIT_TIME)
-        driver.implicitly_wait(10)  # 암시적 대기 시간 증가
+        driver.implicitly_wait(0)  # 대기는 data.page_waits의 명시적 조건으로만 처리
         
         return driver
         
@@ -168,93 +125,35 @@ def create_images_directory():
         os.makedirs("images")
         print("📁 images 디렉토리를 생성했습니다.")
 
-def capture_upbit_screenshot() -> Optional[Tuple[str, str]]:
-    """업비트 페이지 스크린샷 캡쳐 (차트 영역만)"""
-    url = "https://upbit.com/exchange?code=CRIX.UPBIT.KRW-BTC"
+def capture_upbit_screenshot(symbol: str = TRADING_SYMBOL) -> Optional[Tuple[Optional[str], str]]:
+    """업비트 페이지 스크린샷 캡쳐 (차트 영역만, (보관 경로 또는 None, base64) 반환)"""
+    from data.browser_session import ChartBrowser, get_chart_browser
+    
+    print(f"🚀 업비트 {symbol} 페이지 스크린샷 캡쳐를 시작합니다...")
     
-    print("🚀 업비트 페이지 스크린샷 캡쳐를 시작합니다...")
+    # 기본 심볼 차트 페이지가 열린 브라우저 재사용 (비활성화 시나 다른 심볼은 1회용 세션)
+    url = UPBIT_CHART_URL_TEMPLATE.format(symbol=symbol)
+    shared = BROWSER_SESSION_ENABLED and url == UPBIT_CHART_URL
+    browser = get_chart_browser() if shared else ChartBrowser(url)
     
-    driver = None
     try:
-        # 드라이버 설정
-        driver = setup_driver()
-        
-        # 페이지 로드 (타임아웃 증가)
-        print("⏳ 페이지를 로딩 중입니다...")
-        driver.get(url)
-        
-        # 충분한 대기 시간 (원복)
-        time.sleep(SCREENSHOT_ADDITIONAL_WAIT)
-        
-        # 차트 영역 찾기 (원래 XPath 방식)
-        print("🔍 차트 영역을 찾는 중입니다...")
-        chart_xpath = CHART_XPATH
-        chart_element = None
-        try:
-            chart_element = driver.find_element(By.XPATH, chart_xpath)
-            if chart_element.is_displayed():
-                print(f"✅ 차트 영역 발견 (XPath): {chart_xpath}")
-            else:
-                print("⚠️ 차트 영역이 화면에 표시되지 않습니다.")
-                chart_element = None
-        except Exception as e:
-            print(f"⚠️ 차트 영역을 찾을 수 없습니다: {e}")
-            chart_element = None
-        
-        # 1) 시간주기 메뉴 → 1시간 선택 → 2) 차트 설정 버튼 → 볼린저 선택 → 3) 차트 캡쳐
-        if ADD_BOLLINGER_BANDS:
-            try:
-                print("⏱️ 시간 주기 메뉴를 엽니다...")
-                tf_menu_btn = driver.find_element(By.XPATH, TIMEFRAME_MENU_BUTTON_XPATH)
-                tf_menu_btn.click()
-                time.sleep(SCREENSHOT_MENU_WAIT)
-
-                print("🕐 1시간 주기를 선택합니다...")
-                tf_1h = driver.find_element(By.XPATH, TIMEFRAME_1H_ITEM_XPATH)
-                tf_1h.click()
-                time.sleep(SCREENSHOT_CHART_WAIT)
-
-                print("⚙️ 차트 설정(지표) 버튼을 엽니다...")
-                indicator_button = driver.find_element(By.XPATH, CHART_SETTINGS_BUTTON_XPATH)
-                indicator_button.click()
-
-                time.sleep(SCREENSHOT_MENU_WAIT)
-
-                bollinger_option = driver.find_element(By.XPATH, BOLLINGER_OPTION_XPATH)
-                bollinger_option.click()
-                print("✅ 볼린저 밴드를 선택했습니다.")
-
-                time.sleep(SCREENSHOT_CHART_WAIT)
-
-            except Exception as e:
-                print(f"⚠️ 볼린저 밴드 설정 중 오류: {e}")
-        
-        if not chart_element:
-            if STRICT_CHART_CAPTURE:
-                raise Exception("차트 XPath를 찾지 못하여 캡처를 중단합니다. CHART_XPATH를 확인하세요.")
-            print("⚠️ 차트 영역을 찾을 수 없어 전체 페이지를 캡처합니다.")
-            chart_element = driver.find_element(By.TAG_NAME, "body")
-        
-        # 현재 시간으로 파일명 생성
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"upbit_screenshot_{timestamp}.png"
-        filepath = os.path.join("images", filename)
-        
-        # 차트 영역만 스크린샷 캡쳐
         print("📸 차트 영역만 스크린샷을 캡쳐 중입니다...")
-        chart_element.screenshot(filepath)
+        png = browser.capture_png()
+        if png is None:
+            return None
         
-        # Base64 인코딩
-        with open(filepath, "rb") as f:
-            image_base64 = base64.b64encode(f.read()).decode('utf-8')
+        # 메모리에서 한 번만 인코딩/base64 변환, 보관은 백그라운드 기록
+        encoded = encode_for_vision(png)
+        filepath = archive_image(encoded)
         
-        print(f"✅ 차트 스크린샷 완료: {filepath}")
-        return filepath, image_base64
+        print(f"✅ 차트 스크린샷 완료: {encoded.width}x{encoded.height}, {encoded.size_mb:.2f} MB, "
+              f"품질 {encoded.quality} ({browser.last_capture_seconds:.2f}초)")
+        return filepath, encoded.base64
         
     except Exception as e:
         print(f"❌ 스크린샷 캡쳐 중 오류: {e}")
         return None
         
     finally:
-        if driver:
-            driver.quit()
+        if not shared:
+            browser.close()
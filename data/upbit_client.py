@@ -0,0 +1,348 @@
+"""
+업비트 REST 클라이언트 모듈
+모든 업비트 REST 호출을 하나의 세션과 요청 그룹별 토큰 버킷으로 통과시킵니다.
+
+- 요청 그룹(order/default/market/candles/ticker/orderbook/trades)마다 초당 한도를 토큰 버킷으로 관리
+- 응답의 Remaining-Req 헤더(group=...; min=...; sec=...)로 남은 토큰을 보정 (대시보드 등 다른 프로세스 사용분 반영)
+- 우선순위 레인: 주문 > 계좌 조회 > 시세 조회 순으로 토큰을 배정하고, 하위 레인은 예비 토큰을 남겨 둠
+- 429는 서버가 처리하지 않은 요청이므로 주문도 지터를 섞은 지수 백오프로 재시도,
+  네트워크 오류/5xx는 중복 실행 위험이 없는 조회(GET)만 재시도
+- pyupbit.Upbit와 같은 메서드 이름을 제공하여 기존 호출부를 그대로 사용
+"""
+
+import re
+import math
+import time
+import heapq
+import random
+import itertools
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+import pyupbit
+import requests
+from requests.adapters import HTTPAdapter
+from config.settings import (
+    UPBIT_ACCESS_KEY, UPBIT_SECRET_KEY, UPBIT_API_URL, UPBIT_RATE_LIMITS, UPBIT_ORDER_RESERVE,
+    UPBIT_MAX_RETRIES, UPBIT_RETRY_BASE_DELAY, UPBIT_REQUEST_TIMEOUT, UPBIT_LIMIT_WAIT_TIMEOUT
+)
+
+# 우선순위 레인 (숫자가 작을수록 먼저)
+PRIORITY_ORDER = 0
+PRIORITY_ACCOUNT = 1
+PRIORITY_MARKET = 2
+
+_REMAINING_REQ = re.compile(r"group=([a-z\-]+); min=([0-9]+); sec=([0-9]+)")
+_UUID = re.compile(r"^\w+-\w+-\w+-\w+-\w+$")
+
+def parse_remaining_req(header: Optional[str]) -> Optional[Tuple[str, int, int]]:
+    """Remaining-Req 헤더 파싱 → (그룹, 분당 남은 수, 초당 남은 수), 형식이 다르면 None"""
+    matched = _REMAINING_REQ.search(header or '')
+    if matched is None:
+        return None
+    return matched.group(1), int(matched.group(2)), int(matched.group(3))
+
+class UpbitApiError(Exception):
+    """업비트 API 오류 응답"""
+
+    def __init__(self, status: int, name: str, message: str = ''):
+        super().__init__(f"{status} {name}: {message}")
+        self.status = status
+        self.name = name
+        self.message = message
+
+class TokenBucket:
+    """우선순위 레인이 있는 토큰 버킷 (대기 중인 요청 중 우선순위가 가장 높은 요청부터 토큰 배정)"""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None, reserve: int = 0,
+                 clock: Callable[[], float] = time.monotonic):
+        self.rate = rate
+        self.capacity = capacity or rate
+        self.reserve = reserve  # 주문 레인이 아닌 요청은 이만큼 토큰을 남겨 둠
+        self.clock = clock
+        self.tokens = float(self.capacity)
+        self.acquired = 0
+        self.waited = 0.0  # 토큰 대기 시간 합계 (초)
+        self.remaining: Optional[Tuple[int, int]] = None  # 마지막 Remaining-Req (분, 초)
+        self._updated = clock()
+        self._paused_until = 0.0
+        self._waiters: List[Tuple[int, int]] = []
+        self._sequence = itertools.count()
+        self._cond = threading.Condition()
+
+    def _refill(self, now: float) -> None:
+        elapsed = max(0.0, now - max(self._updated, self._paused_until))
+        self._updated = now
+        if now >= self._paused_until:
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+
+    def acquire(self, priority: int = PRIORITY_MARKET, timeout: Optional[float] = None) -> bool:
+        """토큰 하나 획득 (timeout 안에 못 받으면 False)"""
+        entry = (priority, next(self._sequence))
+        needed = 1 + (self.reserve if priority > PRIORITY_ORDER else 0)
+        started = self.clock()
+        with self._cond:
+            heapq.heappush(self._waiters, entry)
+            try:
+                while True:
+                    now = self.clock()
+                    self._refill(now)
+                    if self._waiters[0] == entry and now >= self._paused_until and self.tokens >= needed:
+                        self.tokens -= 1
+                        self.acquired += 1
+                        self.waited += now - started
+                        return True
+                    if now < self._paused_until:
+                        delay = self._paused_until - now
+                    else:
+                        delay = max(needed - self.tokens, 0.0) / self.rate
+                    if timeout is not None:
+                        remaining = started + timeout - now
+                        if remaining <= 0:
+                            return False
+                        delay = min(delay, remaining)
+                    self._cond.wait(max(delay, 0.001))
+            finally:
+                self._waiters.remove(entry)
+                heapq.heapify(self._waiters)
+                self._cond.notify_all()
+
+    def observe(self, per_minute: int, per_second: int) -> None:
+        """서버가 알려준 남은 요청 수로 보정 (다른 프로세스 사용분 반영)"""
+        with self._cond:
+            now = self.clock()
+            self._refill(now)
+            self.remaining = (per_minute, per_second)
+            self.tokens = min(self.tokens, float(per_second))
+            if per_minute <= 0:
+                # 분당 한도 소진: 다음 분이 시작될 때까지 대기
+                self._paused_until = max(self._paused_until, now + 60 - time.time() % 60)
+            self._cond.notify_all()
+
+    def penalize(self, seconds: float) -> None:
+        """429 응답 후 seconds 동안 토큰 배정 중지"""
+        with self._cond:
+            now = self.clock()
+            self._refill(now)
+            self.tokens = 0.0
+            self._paused_until = max(self._paused_until, now + seconds)
+            self._cond.notify_all()
+
+class UpbitClient:
+    """요청 한도를 지키는 업비트 REST 클라이언트 (pyupbit.Upbit 호환 메서드)"""
+
+    def __init__(self, access_key: Optional[str] = UPBIT_ACCESS_KEY, secret_key: Optional[str] = UPBIT_SECRET_KEY,
+                 base_url: str = UPBIT_API_URL, limits: Optional[Dict[str, float]] = None,
+                 order_reserve: int = UPBIT_ORDER_RESERVE, max_retries: int = UPBIT_MAX_RETRIES,
+                 retry_base_delay: float = UPBIT_RETRY_BASE_DELAY,
+                 timeout: Tuple[float, float] = UPBIT_REQUEST_TIMEOUT,
+                 limit_wait_timeout: float = UPBIT_LIMIT_WAIT_TIMEOUT,
+                 sleep: Callable[[float], None] = time.sleep):
+        self.base_url = base_url.rstrip('/')
+        self.limits = {**UPBIT_RATE_LIMITS, **(limits or {})}
+        self.order_reserve = order_reserve
+        self.max_retries = max_retries
+        self.retry_base_delay = retry_base_delay
+        self.timeout = timeout
+        self.limit_wait_timeout = limit_wait_timeout
+        self.sleep = sleep
+        # 인증 헤더(JWT) 생성은 pyupbit 구현을 그대로 사용
+        self._upbit = pyupbit.Upbit(access_key, secret_key) if access_key and secret_key else None
+        self.session = requests.Session()
+        self.session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=8))
+        self.session.mount('http://', HTTPAdapter(pool_connections=4, pool_maxsize=8))
+        self.buckets: Dict[str, TokenBucket] = {}
+        self.stats = {'requests': 0, 'retries': 0, 'rate_limited': 0, 'errors': 0}
+        self._lock = threading.Lock()
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self.stats[name] += 1
+
+    def bucket(self, group: str) -> TokenBucket:
+        """요청 그룹의 토큰 버킷 (처음 보는 그룹은 시세 그룹 한도 사용)"""
+        with self._lock:
+            bucket = self.buckets.get(group)
+            if bucket is None:
+                rate = self.limits.get(group, self.limits.get('market', 9))
+                reserve = self.order_reserve if group == 'default' else 0
+                bucket = self.buckets[group] = TokenBucket(rate, reserve=reserve)
+            return bucket
+
+    def _acquire(self, group: str, priority: int) -> None:
+        if not self.bucket(group).acquire(priority, timeout=self.limit_wait_timeout):
+            raise UpbitApiError(0, 'rate_limit_wait', f"{group} 그룹 토큰 대기 시간 초과")
+
+    def _retry_delay(self, attempt: int) -> float:
+        """지수 백오프 + 지터 (기본 대기 시간의 50~100%)"""
+        return random.uniform(0.5, 1.0) * self.retry_base_delay * (2 ** attempt)
+
+    def request(self, method: str, path: str, params: Optional[Dict[str, Any]] = None, group: str = 'default',
+                priority: int = PRIORITY_ACCOUNT, auth: bool = False) -> Any:
+        """한도/재시도를 적용한 요청 (실패 시 UpbitApiError)"""
+        url = f"{self.base_url}{path}"
+        idempotent = method == 'GET'
+        for attempt in range(self.max_retries + 1):
+            last_attempt = attempt == self.max_retries
+            self._acquire(group, priority)
+            headers = {'Accept': 'application/json'}
+            if auth:
+                if self._upbit is None:
+                    raise UpbitApiError(401, 'no_credentials', "업비트 API 키가 설정되지 않았습니다")
+                headers.update(self._upbit._request_headers(params or None))
+            self._count('requests')
+            try:
+                if method == 'GET':
+                    response = self.session.get(url, params=params, headers=headers, timeout=self.timeout)
+                elif method == 'DELETE':
+                    response = self.session.delete(url, params=params, headers=headers, timeout=self.timeout)
+                else:
+                    response = self.session.request(method, url, json=params, headers=headers, timeout=self.timeout)
+            except requests.RequestException as e:
+                # 주문 요청은 서버 처리 여부를 알 수 없으므로 재시도하지 않음
+                if not idempotent or last_attempt:
+                    self._count('errors')
+                    raise UpbitApiError(0, 'network_error', str(e))
+                self._count('retries')
+                self.sleep(self._retry_delay(attempt))
+                continue
+
+            remaining = parse_remaining_req(response.headers.get('Remaining-Req'))
+            if remaining is not None:
+                self.bucket(remaining[0]).observe(remaining[1], remaining[2])
+
+            if response.status_code == 429:
+                self._count('rate_limited')
+                print(f"⚠️ 업비트 요청 한도 초과 ({path}, {group}), 재시도 {attempt + 1}/{self.max_retries}")
+                if last_attempt:
+                    self._count('errors')
+                    raise UpbitApiError(429, 'too_many_requests', response.text)
+                self._count('retries')
+                self.bucket(remaining[0] if remaining else group).penalize(self._retry_delay(attempt))
+                continue
+            if response.status_code >= 500 and idempotent and not last_attempt:
+                self._count('retries')
+                self.sleep(self._retry_delay(attempt))
+                continue
+            if not response.ok:
+                self._count('errors')
+                try:
+                    error = response.json().get('error', {})
+                except ValueError:
+                    error = {}
+                raise UpbitApiError(response.status_code, error.get('name', 'http_error'),
+                                    error.get('message', response.text))
+            return response.json()
+
+    def _call(self, method: str, path: str, params: Optional[Dict[str, Any]], group: str, priority: int,
+              auth: bool = True) -> Any:
+        """pyupbit와 같이 실패 시 None 반환"""
+        try:
+            return self.request(method, path, params, group=group, priority=priority, auth=auth)
+        except UpbitApiError as e:
+            print(f"❌ 업비트 API 오류 ({method} {path}): {e}")
+            return None
+
+    # 계좌/주문 (exchange API)
+    def get_balances(self) -> Optional[List[Dict[str, Any]]]:
+        """전체 계좌 조회"""
+        return self._call('GET', '/v1/accounts', None, 'default', PRIORITY_ACCOUNT)
+
+    def get_individual_order(self, uuid: str) -> Optional[Dict[str, Any]]:
+        """개별 주문 조회 (체결 추적용, 주문 레인)"""
+        return self._call('GET', '/v1/order', {'uuid': uuid}, 'default', PRIORITY_ORDER)
+
+    def get_order(self, ticker_or_uuid: str, state: str = 'wait', page: int = 1, limit: int = 100) -> Any:
+        """UUID면 개별 주문, 마켓이면 주문 목록 조회"""
+        if _UUID.match(ticker_or_uuid or ''):
+            return self.get_individual_order(ticker_or_uuid)
+        params = {'market': ticker_or_uuid, 'state': state, 'page': page, 'limit': limit, 'order_by': 'desc'}
+        return self._call('GET', '/v1/orders', params, 'default', PRIORITY_ACCOUNT)
+
+    def _order(self, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        return self._call('POST', '/v1/orders', params, 'order', PRIORITY_ORDER)
+
+    def buy_market_order(self, ticker: str, price: float) -> Optional[Dict[str, Any]]:
+        """시장가 매수 (price: 원화 금액)"""
+        return self._order({'market': ticker, 'side': 'bid', 'price': str(price), 'ord_type': 'price'})
+
+    def sell_market_order(self, ticker: str, volume: float) -> Optional[Dict[str, Any]]:
+        """시장가 매도"""
+        return self._order({'market': ticker, 'side': 'ask', 'volume': str(volume), 'ord_type': 'market'})
+
+    def buy_limit_order(self, ticker: str, price: float, volume: float) -> Optional[Dict[str, Any]]:
+        """지정가 매수"""
+        return self._order({'market': ticker, 'side': 'bid', 'volume': str(volume), 'price': str(price), 'ord_type': 'limit'})
+
+    def sell_limit_order(self, ticker: str, price: float, volume: float) -> Optional[Dict[str, Any]]:
+        """지정가 매도"""
+        return self._order({'market': ticker, 'side': 'ask', 'volume': str(volume), 'price': str(price), 'ord_type': 'limit'})
+
+    def cancel_order(self, uuid: str) -> Optional[Dict[str, Any]]:
+        """주문 취소 (주문 레인)"""
+        return self._call('DELETE', '/v1/order', {'uuid': uuid}, 'default', PRIORITY_ORDER)
+
+    # 시세 (quotation API)
+    def get_current_price(self, ticker: Union[str, List[str]] = "KRW-BTC") -> Union[float, Dict[str, float], None]:
+        """현재가 (단일 티커는 숫자, 리스트는 {마켓: 가격})"""
+        markets = ticker if isinstance(ticker, str) else ','.join(ticker)
+        tickers = self._call('GET', '/v1/ticker', {'markets': markets}, 'ticker', PRIORITY_MARKET, auth=False)
+        if not tickers:
+            return None
+        if isinstance(ticker, str):
+            return tickers[0]['trade_price']
+        return {item['market']: item['trade_price'] for item in tickers}
+
+    def get_orderbook(self, ticker: Union[str, List[str]] = "KRW-BTC") -> Any:
+        """호가 (단일 티커는 딕셔너리, 리스트는 목록 - pyupbit.get_orderbook 형식)"""
+        markets = ticker if isinstance(ticker, str) else ','.join(ticker)
+        orderbooks = self._call('GET', '/v1/orderbook', {'markets': markets}, 'orderbook', PRIORITY_MARKET, auth=False)
+        if not orderbooks:
+            return None
+        return orderbooks[0] if isinstance(ticker, str) or len(ticker) == 1 else orderbooks
+
+    def get_ohlcv(self, ticker: str = "KRW-BTC", interval: str = "day", count: int = 200, to: Any = None):
+        """캔들 DataFrame (pyupbit.get_ohlcv, 200개 단위 요청 수만큼 토큰 확보)"""
+        try:
+            for _ in range(max(1, math.ceil(count / 200))):
+                self._acquire('candles', PRIORITY_MARKET)
+        except UpbitApiError as e:
+            print(f"❌ 업비트 캔들 조회 대기 실패: {e}")
+            return None
+        return pyupbit.get_ohlcv(ticker, interval=interval, count=count, to=to)
+
+    def __getattr__(self, name: str) -> Any:
+        """그 밖의 pyupbit.Upbit 메서드 (입출금 내역 등)는 계좌 레인 토큰을 받은 뒤 위임"""
+        upbit = self.__dict__.get('_upbit')
+        method = getattr(upbit, name, None) if upbit is not None and not name.startswith('_') else None
+        if not callable(method):
+            raise AttributeError(name)
+
+        def limited(*args, **kwargs):
+            self._acquire('default', PRIORITY_ACCOUNT)
+            return method(*args, **kwargs)
+        return limited
+
+    def metrics(self) -> Dict[str, Any]:
+        """요청 통계와 그룹별 토큰/대기 시간"""
+        with self._lock:
+            buckets = dict(self.buckets)
+            stats = dict(self.stats)
+        return {
+            **stats,
+            'groups': {
+                group: {'tokens': round(bucket.tokens, 2), 'acquired': bucket.acquired,
+                        'waited': bucket.waited, 'remaining': bucket.remaining}
+                for group, bucket in buckets.items()
+            },
+        }
+
+_client: Optional[UpbitClient] = None
+_client_lock = threading.Lock()
+
+def get_upbit_client() -> UpbitClient:
+    """공용 업비트 클라이언트 반환 (프로세스 안의 모든 REST 호출이 같은 한도를 공유)"""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = UpbitClient()
+        return _client
@@ -1,10 +1,16 @@
 """
 MySQL 데이터베이스 연결 모듈
+연결 풀에서 연결을 빌려 쓰고 반환합니다 (pooled_connection 컨텍스트 매니저).
 """
 
+import time
+import threading
+from collections import deque
+from contextlib import contextmanager
 import mysql.connector
 from mysql.connector import Error
-from typing import Optional
+from mysql.connector.errors import PoolError
+from typing import Any, Callable, Deque, Dict, Iterator, Optional, Tuple
 import logging
 
 class DatabaseConnection:
@@ -224,78 +230,182 @@ class DatabaseConnection:
             self.connect()
         return self.connection
 
-# 전역 데이터베이스 연결 객체
-db_connection = DatabaseConnection()
+class PooledConnection:
+    """풀에서 빌린 연결 (close() 호출 시 실제로 닫지 않고 풀에 반환)"""
 
-def get_db_connection():
-    """데이터베이스 연결 객체 반환"""
-    return db_connection.get_connection()
+    def __init__(self, pool: 'ConnectionPool', connection: Any):
+        self._pool = pool
+        self._connection = connection
 
-def init_database():
-    """데이터베이스 초기화 및 테이블 생성"""
-    try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        # trades 테이블 재생성
-        cursor.execute("DROP TABLE IF EXISTS trades")
-        cursor.execute("""
-            CREATE TABLE trades (
-                id INT AUTO_INCREMENT PRIMARY KEY,
-                timestamp DATETIME NOT NULL,
-                decision VARCHAR(10) NOT NULL,
-                action VARCHAR(10) NOT NULL,
-                price DECIMAL(20, 8) NOT NULL,
-                amount DECIMAL(20, 8) NOT NULL,
-                total_value DECIMAL(20, 2) NOT NULL,
-                fee DECIMAL(20, 2) DEFAULT 0,
-                balance_krw DECIMAL(20, 2) NOT NULL,
-                balance_btc DECIMAL(20, 8) NOT NULL,
-                order_id VARCHAR(100),
-                status VARCHAR(20) DEFAULT 'executed',
-                confidence DECIMAL(5, 4),
-                reasoning TEXT,
-                market_data JSON,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
-            ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
-        """)
-        
-        # 기존 news 테이블이 있다면 삭제
-        cursor.execute("DROP TABLE IF EXISTS news")
-        
-        # news 테이블 새로 생성
-        cursor.execute("""
-            CREATE TABLE news (
-                id BIGINT AUTO_INCREMENT PRIMARY KEY,
-                data JSON NOT NULL,
-                fetched_at DATETIME NOT NULL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                INDEX idx_fetched_at (fetched_at)
-            ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
-        """)
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._connection, name)
+
+    def close(self) -> None:
+        """풀에 반환"""
+        if self._connection is not None:
+            connection, self._connection = self._connection, None
+            self._pool.release(connection)
+
+class ConnectionPool:
+    """
+    MySQL 연결 풀
+
+    - 유휴 시간이 max_idle을 넘은 연결은 폐기 후 새로 생성 (서버 wait_timeout 대비)
+    - ping_interval 이상 유휴였던 연결은 빌려주기 전에 상태 확인
+    - 모든 연결이 사용 중이면 checkout_timeout까지 대기 후 PoolError
+    """
+
+    def __init__(self, size: int = None, max_idle: float = None, checkout_timeout: float = None,
+                 ping_interval: float = None, factory: Optional[Callable[[], Any]] = None):
+        from config.settings import DB_POOL_SIZE, DB_POOL_MAX_IDLE, DB_POOL_TIMEOUT, DB_POOL_PING_INTERVAL
 
-        # 기존 테이블 마이그레이션: fetched_at 컬럼/인덱스 보정
+        self.size = size or DB_POOL_SIZE
+        self.max_idle = max_idle if max_idle is not None else DB_POOL_MAX_IDLE
+        self.checkout_timeout = checkout_timeout if checkout_timeout is not None else DB_POOL_TIMEOUT
+        self.ping_interval = ping_interval if ping_interval is not None else DB_POOL_PING_INTERVAL
+        self.factory = factory or self._connect
+        self.logger = logging.getLogger(__name__)
+        self.stats = {'created': 0, 'checkouts': 0, 'waits': 0, 'timeouts': 0,
+                      'recycled': 0, 'health_failures': 0}
+
+        self._idle: Deque[Tuple[Any, float]] = deque()  # (연결, 반환 시각)
+        self._open = 0  # 생성되어 열려 있는 연결 수 (유휴 + 사용 중)
+        self._condition = threading.Condition()
+
+    @staticmethod
+    def _connect() -> Any:
+        from config.settings import DB_HOST, DB_PORT, DB_NAME, DB_USER, DB_PASSWORD
+        return mysql.connector.connect(
+            host=DB_HOST,
+            port=DB_PORT,
+            database=DB_NAME,
+            user=DB_USER,
+            password=DB_PASSWORD,
+            charset='utf8mb4',
+            autocommit=True
+        )
+
+    def acquire(self, timeout: float = None) -> Any:
+        """연결 빌리기"""
+        timeout = self.checkout_timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        with self._condition:
+            while True:
+                while self._idle:
+                    # 최근에 반환된 연결부터 사용 (오래된 연결은 자연스럽게 만료)
+                    connection, released_at = self._idle.pop()
+                    idle_time = time.monotonic() - released_at
+                    if idle_time > self.max_idle:
+                        self.stats['recycled'] += 1
+                        self._discard(connection)
+                        continue
+                    if idle_time > self.ping_interval and not self._is_healthy(connection):
+                        self.stats['health_failures'] += 1
+                        self._discard(connection)
+                        continue
+                    self.stats['checkouts'] += 1
+                    return connection
+
+                if self._open < self.size:
+                    self._open += 1
+                    break
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self.stats['timeouts'] += 1
+                    raise PoolError(f"DB 연결 풀 대기 시간 초과 ({timeout}초, 크기 {self.size})")
+                self.stats['waits'] += 1
+                self._condition.wait(remaining)
+
+        # 새 연결 생성은 잠금 밖에서 (느린 연결이 다른 반환을 막지 않도록)
+        try:
+            connection = self.factory()
+        except Exception:
+            with self._condition:
+                self._open -= 1
+                self._condition.notify()
+            raise
+        with self._condition:
+            self.stats['created'] += 1
+            self.stats['checkouts'] += 1
+        return connection
+
+    def release(self, connection: Any) -> None:
+        """연결 반환 (끊어졌거나 트랜잭션이 남은 연결 정리)"""
+        healthy = True
+        try:
+            if getattr(connection, 'in_transaction', False):
+                connection.rollback()
+            healthy = connection.is_connected()
+        except Exception:
+            healthy = False
+
+        with self._condition:
+            if healthy:
+                self._idle.append((connection, time.monotonic()))
+            else:
+                self.stats['health_failures'] += 1
+                self._discard(connection)
+            self._condition.notify()
+
+    @contextmanager
+    def connection(self, timeout: float = None) -> Iterator[Any]:
+        """연결 빌리기/반환 컨텍스트 매니저"""
+        connection = self.acquire(timeout)
         try:
-            cursor.execute("SHOW COLUMNS FROM news LIKE 'fetched_at'")
-            column_exists = cursor.fetchone()
-            if not column_exists:
-                cursor.execute(
-                    "ALTER TABLE news ADD COLUMN fetched_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP"
-                )
+            yield connection
+        finally:
+            self.release(connection)
 
-            # 인덱스 확인 및 생성
-            cursor.execute("SHOW INDEX FROM news WHERE Key_name = %s", ("idx_fetched_at",))
-            index_exists = cursor.fetchone()
-            if not index_exists:
-                cursor.execute("CREATE INDEX idx_fetched_at ON news (fetched_at)")
-        except Exception as _e:
-            # 마이그레이션 시도 실패는 치명적이지 않으므로 로깅만 하고 계속 진행
+    def metrics(self) -> Dict[str, int]:
+        """풀 크기 지표"""
+        with self._condition:
+            idle = len(self._idle)
+            return {'size': self.size, 'open': self._open, 'idle': idle,
+                    'in_use': self._open - idle, **self.stats}
+
+    def close_all(self) -> None:
+        """유휴 연결 모두 닫기"""
+        with self._condition:
+            while self._idle:
+                connection, _ = self._idle.pop()
+                self._discard(connection)
+
+    def _is_healthy(self, connection: Any) -> bool:
+        try:
+            return connection.is_connected()
+        except Exception:
+            return False
+
+    def _discard(self, connection: Any) -> None:
+        """연결 닫고 열린 연결 수에서 제외 (잠금 보유 상태에서 호출)"""
+        self._open -= 1
+        try:
+            connection.close()
+        except Exception:
             pass
-        
-        conn.commit()
-        cursor.close()
-        conn.close()
+
+# 전역 데이터베이스 연결 풀
+db_pool = ConnectionPool()
+
+@contextmanager
+def pooled_connection(timeout: float = None) -> Iterator[Any]:
+    """풀에서 연결을 빌려 사용 후 반환"""
+    with db_pool.connection(timeout) as connection:
+        yield connection
+
+def get_db_connection():
+    """풀에서 연결 객체 반환 (사용 후 close() 호출 시 풀에 반환)"""
+    return PooledConnection(db_pool, db_pool.acquire())
+
+def init_database():
+    """데이터베이스 초기화 (스키마 마이그레이션 적용, 기존 데이터 유지)"""
+    from .migrations import apply_migrations
+    try:
+        with pooled_connection() as conn:
+            applied = apply_migrations(conn)
+        if applied:
+            print(f"✅ 데이터베이스 스키마 마이그레이션 적용: {applied}")
         print("✅ 데이터베이스 테이블 초기화 완료")
         return True
         
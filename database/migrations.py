@@ -0,0 +1,355 @@
+"""
+데이터베이스 스키마 마이그레이션 모듈
+버전별 마이그레이션을 schema_migrations 테이블에 기록하며 한 번씩만 적용합니다.
+
+각 마이그레이션은 존재 여부를 확인한 뒤 실행하므로 중간에 실패해도 다시 실행할 수 있습니다.
+(MySQL DDL은 자동 커밋되어 트랜잭션으로 묶을 수 없음)
+"""
+
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, Callable, List, Optional, Tuple
+import logging
+from .rollup import install_rollups
+from config.settings import DB_PARTITION_MONTHS_AHEAD, TRADING_SYMBOL
+
+logger = logging.getLogger(__name__)
+
+# 월 단위 RANGE 파티션 테이블 (추가만 되는 로그성 테이블)
+PARTITIONED_TABLES = ('market_data', 'system_logs')
+FUTURE_PARTITION = 'p_future'
+ARCHIVE_PARTITION = 'p_archive'
+
+@dataclass
+class Migration:
+    """스키마 마이그레이션"""
+    version: int
+    name: str
+    apply: Callable[[Any], None]  # cursor를 받아 실행
+
+# ---- 조회 헬퍼 ----
+
+def _table_exists(cursor, table: str) -> bool:
+    cursor.execute(
+        "SELECT COUNT(*) FROM information_schema.TABLES WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s",
+        (table,)
+    )
+    return cursor.fetchone()[0] > 0
+
+def _column_exists(cursor, table: str, column: str) -> bool:
+    cursor.execute(
+        "SELECT COUNT(*) FROM information_schema.COLUMNS "
+        "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND COLUMN_NAME = %s",
+        (table, column)
+    )
+    return cursor.fetchone()[0] > 0
+
+def _index_exists(cursor, table: str, index: str) -> bool:
+    cursor.execute(
+        "SELECT COUNT(*) FROM information_schema.STATISTICS "
+        "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND INDEX_NAME = %s",
+        (table, index)
+    )
+    return cursor.fetchone()[0] > 0
+
+def _partition_names(cursor, table: str) -> List[str]:
+    cursor.execute(
+        "SELECT PARTITION_NAME FROM information_schema.PARTITIONS "
+        "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND PARTITION_NAME IS NOT NULL "
+        "ORDER BY PARTITION_ORDINAL_POSITION",
+        (table,)
+    )
+    return [row[0] for row in cursor.fetchall()]
+
+def _add_index(cursor, table: str, index: str, columns: str) -> None:
+    if not _index_exists(cursor, table, index):
+        cursor.execute(f"CREATE INDEX {index} ON {table} ({columns})")
+        logger.info(f"인덱스 생성: {table}.{index} ({columns})")
+
+# ---- 월 파티션 ----
+
+def _month_start(day: date) -> date:
+    return day.replace(day=1)
+
+def _next_month(day: date) -> date:
+    return date(day.year + (day.month == 12), day.month % 12 + 1, 1)
+
+def monthly_partition_bounds(start: date, months: int) -> List[Tuple[str, str]]:
+    """start가 속한 달부터 months개월의 (파티션 이름, 상한 날짜) 목록"""
+    bounds = []
+    month = _month_start(start)
+    for _ in range(months):
+        upper = _next_month(month)
+        bounds.append((f"p{month:%Y%m}", upper.isoformat()))
+        month = upper
+    return bounds
+
+def _partition_clause(bounds: List[Tuple[str, str]]) -> str:
+    parts = [f"PARTITION {name} VALUES LESS THAN ('{upper}')" for name, upper in bounds]
+    parts.append(f"PARTITION {FUTURE_PARTITION} VALUES LESS THAN (MAXVALUE)")
+    return ",\n    ".join(parts)
+
+def ensure_monthly_partitions(cursor, today: Optional[date] = None,
+                              months_ahead: int = DB_PARTITION_MONTHS_AHEAD) -> None:
+    """파티션 테이블에 이번 달부터 months_ahead개월 뒤까지의 파티션 추가 (p_future 분할)"""
+    today = today or datetime.now().date()
+    wanted = monthly_partition_bounds(today, months_ahead + 1)
+    for table in PARTITIONED_TABLES:
+        existing = _partition_names(cursor, table)
+        if FUTURE_PARTITION not in existing:
+            continue
+        monthly = sorted(name for name in existing if name not in (FUTURE_PARTITION, ARCHIVE_PARTITION))
+        latest = monthly[-1] if monthly else ''
+        missing = [(name, upper) for name, upper in wanted if name > latest]
+        if missing:
+            cursor.execute(
+                f"ALTER TABLE {table} REORGANIZE PARTITION {FUTURE_PARTITION} INTO (\n    "
+                f"{_partition_clause(missing)}\n)"
+            )
+            logger.info(f"파티션 추가: {table} {[name for name, _ in missing]}")
+
+def _partition_by_month(cursor, table: str, months_ahead: int = DB_PARTITION_MONTHS_AHEAD) -> None:
+    """기존 테이블을 timestamp 기준 월 RANGE 파티션으로 전환 (이번 달 이전 데이터는 p_archive)"""
+    if _partition_names(cursor, table):
+        return
+    # 파티션 키는 모든 유니크 키(기본 키 포함)에 포함되어야 함
+    cursor.execute(f"ALTER TABLE {table} DROP PRIMARY KEY, ADD PRIMARY KEY (id, timestamp)")
+    this_month = _month_start(datetime.now().date())
+    bounds = [(ARCHIVE_PARTITION, this_month.isoformat())] + monthly_partition_bounds(this_month, months_ahead + 1)
+    cursor.execute(
+        f"ALTER TABLE {table} PARTITION BY RANGE COLUMNS(timestamp) (\n    {_partition_clause(bounds)}\n)"
+    )
+    logger.info(f"월 파티션 적용: {table}")
+
+# ---- 마이그레이션 ----
+
+def _baseline_tables(cursor) -> None:
+    """기본 테이블 생성 (이미 있으면 유지)"""
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS trades (
+            id INT AUTO_INCREMENT PRIMARY KEY,
+            timestamp DATETIME NOT NULL,
+            decision VARCHAR(10) NOT NULL,
+            action VARCHAR(10) NOT NULL,
+            price DECIMAL(20, 8) NOT NULL,
+            amount DECIMAL(20, 8) NOT NULL,
+            total_value DECIMAL(20, 2) NOT NULL,
+            fee DECIMAL(20, 2) DEFAULT 0,
+            balance_krw DECIMAL(20, 2) NOT NULL,
+            balance_btc DECIMAL(20, 8) NOT NULL,
+            order_id VARCHAR(100),
+            status VARCHAR(20) DEFAULT 'executed',
+            confidence DECIMAL(5, 4),
+            reasoning TEXT,
+            market_data JSON,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+    """)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS news (
+            id BIGINT AUTO_INCREMENT PRIMARY KEY,
+            data JSON NOT NULL,
+            fetched_at DATETIME NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            INDEX idx_fetched_at (fetched_at)
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+    """)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS market_data (
+            id INT AUTO_INCREMENT PRIMARY KEY,
+            timestamp DATETIME NOT NULL,
+            current_price DECIMAL(20, 2) NOT NULL,
+            volume_24h DECIMAL(20, 2),
+            change_24h DECIMAL(10, 4),
+            rsi DECIMAL(10, 4),
+            macd DECIMAL(10, 4),
+            macd_signal DECIMAL(10, 4),
+            bollinger_upper DECIMAL(20, 2),
+            bollinger_lower DECIMAL(20, 2),
+            fear_greed_index INT,
+            fear_greed_value DECIMAL(10, 4),
+            news_sentiment DECIMAL(5, 4),
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+    """)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS system_logs (
+            id INT AUTO_INCREMENT PRIMARY KEY,
+            timestamp DATETIME NOT NULL,
+            level VARCHAR(10) NOT NULL,
+            message TEXT NOT NULL,
+            module VARCHAR(50),
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+    """)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS trading_reflections (
+            id INT AUTO_INCREMENT PRIMARY KEY,
+            trade_id INT NOT NULL,
+            reflection_type ENUM('immediate', 'daily', 'weekly', 'monthly') NOT NULL,
+            performance_score DECIMAL(5, 4),
+            profit_loss DECIMAL(20, 2),
+            profit_loss_percentage DECIMAL(10, 4),
+            market_conditions JSON,
+            decision_quality_score DECIMAL(5, 4),
+            timing_score DECIMAL(5, 4),
+            risk_management_score DECIMAL(5, 4),
+            ai_analysis TEXT,
+            improvement_suggestions TEXT,
+            lessons_learned TEXT,
+            next_actions TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (trade_id) REFERENCES trades(id) ON DELETE CASCADE
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+    """)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS performance_metrics (
+            id INT AUTO_INCREMENT PRIMARY KEY,
+            period_type ENUM('daily', 'weekly', 'monthly') NOT NULL,
+            period_start DATETIME NOT NULL,
+            period_end DATETIME NOT NULL,
+            total_trades INT NOT NULL,
+            winning_trades INT NOT NULL,
+            losing_trades INT NOT NULL,
+            win_rate DECIMAL(5, 4),
+            total_profit_loss DECIMAL(20, 2),
+            total_profit_loss_percentage DECIMAL(10, 4),
+            max_drawdown DECIMAL(10, 4),
+            sharpe_ratio DECIMAL(10, 4),
+            average_trade_duration INT,
+            best_trade_profit DECIMAL(20, 2),
+            worst_trade_loss DECIMAL(20, 2),
+            market_condition_performance JSON,
+            strategy_performance JSON,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+    """)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS learning_insights (
+            id INT AUTO_INCREMENT PRIMARY KEY,
+            insight_type ENUM('pattern', 'strategy', 'risk', 'timing', 'market') NOT NULL,
+            insight_title VARCHAR(200) NOT NULL,
+            insight_description TEXT NOT NULL,
+            confidence_level DECIMAL(5, 4),
+            supporting_data JSON,
+            applicable_conditions JSON,
+            action_items TEXT,
+            priority_level ENUM('low', 'medium', 'high', 'critical') DEFAULT 'medium',
+            status ENUM('discovered', 'implemented', 'validated', 'archived') DEFAULT 'discovered',
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+    """)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS strategy_improvements (
+            id INT AUTO_INCREMENT PRIMARY KEY,
+            improvement_type ENUM('parameter', 'condition', 'timing', 'risk') NOT NULL,
+            old_value TEXT,
+            new_value TEXT,
+            reason TEXT,
+            expected_impact TEXT,
+            implementation_date DATETIME,
+            validation_period_days INT DEFAULT 30,
+            performance_before JSON,
+            performance_after JSON,
+            success_metric DECIMAL(5, 4),
+            status ENUM('proposed', 'implemented', 'validated', 'reverted') DEFAULT 'proposed',
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+    """)
+
+def _news_fetched_at(cursor) -> None:
+    """이전 버전 news 테이블의 fetched_at 컬럼/인덱스 보정"""
+    if not _column_exists(cursor, 'news', 'fetched_at'):
+        cursor.execute("ALTER TABLE news ADD COLUMN fetched_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP")
+    _add_index(cursor, 'news', 'idx_fetched_at', 'fetched_at')
+
+def _query_indexes(cursor) -> None:
+    """조회/정렬 컬럼 인덱스"""
+    # 최근/기간 조회 (ORDER BY timestamp, WHERE timestamp BETWEEN)
+    _add_index(cursor, 'trades', 'idx_trades_timestamp', 'timestamp')
+    # 손절매/통계 조회 (WHERE action = ... AND timestamp ...) - 조회 컬럼까지 포함한 커버링 인덱스
+    _add_index(cursor, 'trades', 'idx_trades_action_timestamp', 'action, timestamp, price, amount, total_value')
+    _add_index(cursor, 'market_data', 'idx_market_data_timestamp', 'timestamp')
+    _add_index(cursor, 'system_logs', 'idx_system_logs_timestamp', 'timestamp')
+    _add_index(cursor, 'system_logs', 'idx_system_logs_level_timestamp', 'level, timestamp')
+    _add_index(cursor, 'trading_reflections', 'idx_reflections_created_at', 'created_at')
+    _add_index(cursor, 'performance_metrics', 'idx_metrics_period', 'period_type, period_start')
+
+def _monthly_partitions(cursor) -> None:
+    """추가 전용 테이블 월 파티션 (trades는 trading_reflections 외래 키 때문에 인덱스만 적용)"""
+    for table in PARTITIONED_TABLES:
+        _partition_by_month(cursor, table)
+
+def _trades_symbol(cursor) -> None:
+    """여러 마켓 매매 기록 구분용 trades.symbol 컬럼 (기존 기록은 기본 심볼)"""
+    if not _column_exists(cursor, 'trades', 'symbol'):
+        cursor.execute(f"ALTER TABLE trades ADD COLUMN symbol VARCHAR(20) NOT NULL DEFAULT '{TRADING_SYMBOL}' AFTER timestamp")
+    # 심볼별 손절매 조회 (WHERE symbol = ... AND action = 'buy' ORDER BY timestamp)
+    _add_index(cursor, 'trades', 'idx_trades_symbol_action_timestamp', 'symbol, action, timestamp')
+
+MIGRATIONS: List[Migration] = [
+    Migration(1, 'baseline_tables', _baseline_tables),
+    Migration(2, 'news_fetched_at', _news_fetched_at),
+    Migration(3, 'query_indexes', _query_indexes),
+    Migration(4, 'monthly_partitions', _monthly_partitions),
+    Migration(5, 'stats_rollups', install_rollups),
+    Migration(6, 'trades_symbol', _trades_symbol),
+]
+
+def apply_migrations(connection, migrations: List[Migration] = None) -> List[int]:
+    """
+    적용되지 않은 마이그레이션을 순서대로 실행하고 파티션을 최신 상태로 유지
+
+    Returns:
+        이번에 적용한 버전 목록
+    """
+    migrations = MIGRATIONS if migrations is None else migrations
+    cursor = connection.cursor()
+    try:
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS schema_migrations (
+                version INT PRIMARY KEY,
+                name VARCHAR(100) NOT NULL,
+                applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+        """)
+        cursor.execute("SELECT version FROM schema_migrations")
+        applied_versions = {row[0] for row in cursor.fetchall()}
+
+        applied = []
+        for migration in sorted(migrations, key=lambda m: m.version):
+            if migration.version in applied_versions:
+                continue
+            logger.info(f"스키마 마이그레이션 적용: {migration.version} {migration.name}")
+            migration.apply(cursor)
+            cursor.execute(
+                "INSERT INTO schema_migrations (version, name) VALUES (%s, %s)",
+                (migration.version, migration.name)
+            )
+            connection.commit()
+            applied.append(migration.version)
+
+        ensure_monthly_partitions(cursor)
+        connection.commit()
+        return applied
+    finally:
+        cursor.close()
+
+def ensure_partitions() -> bool:
+    """파티션 유지 작업 (스케줄러에서 주기 실행)"""
+    from database.connection import pooled_connection
+    try:
+        with pooled_connection() as connection:
+            cursor = connection.cursor()
+            try:
+                ensure_monthly_partitions(cursor)
+                connection.commit()
+            finally:
+                cursor.close()
+        return True
+    except Exception as e:
+        logger.error(f"파티션 유지 작업 오류: {e}")
+        return False
@@ -0,0 +1,243 @@
+"""
+통계 집계(rollup) 테이블 모듈
+거래/반성 INSERT 시 트리거로 시간별·일별 집계 행을 갱신하고,
+통계 API는 원본 행 대신 집계 행(기간 수만큼)을 읽습니다.
+
+- trade_stats_hourly / trade_stats_daily: (구간, decision, action)별 건수, 거래 금액, 수수료
+- reflection_stats_hourly / reflection_stats_daily: (구간, reflection_type)별 건수, 성과 점수 합계, 손익 합계
+
+트리거로 갱신하므로 동기 저장과 쓰기 지연 큐(executemany) 모두 반영됩니다.
+원본 행을 수정/삭제한 경우 rebuild_rollups()로 다시 계산합니다.
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional, Tuple
+
+# (집계 테이블, 구간 표현식)
+_TRADE_ROLLUPS = (
+    ('trade_stats_hourly', "DATE_FORMAT({column}, '%Y-%m-%d %H:00:00')"),
+    ('trade_stats_daily', "DATE({column})"),
+)
+_REFLECTION_ROLLUPS = (
+    ('reflection_stats_hourly', "DATE_FORMAT({column}, '%Y-%m-%d %H:00:00')"),
+    ('reflection_stats_daily', "DATE({column})"),
+)
+
+# ---- 스키마 (마이그레이션에서 사용) ----
+
+def create_rollup_tables(cursor) -> None:
+    """집계 테이블 생성"""
+    for table, _ in _TRADE_ROLLUPS:
+        cursor.execute(f"""
+            CREATE TABLE IF NOT EXISTS {table} (
+                bucket DATETIME NOT NULL,
+                decision VARCHAR(10) NOT NULL,
+                action VARCHAR(10) NOT NULL,
+                trade_count INT NOT NULL DEFAULT 0,
+                total_value DECIMAL(24, 2) NOT NULL DEFAULT 0,
+                total_fee DECIMAL(24, 2) NOT NULL DEFAULT 0,
+                PRIMARY KEY (bucket, decision, action)
+            ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+        """)
+    for table, _ in _REFLECTION_ROLLUPS:
+        cursor.execute(f"""
+            CREATE TABLE IF NOT EXISTS {table} (
+                bucket DATETIME NOT NULL,
+                reflection_type VARCHAR(10) NOT NULL,
+                reflection_count INT NOT NULL DEFAULT 0,
+                score_sum DECIMAL(20, 4) NOT NULL DEFAULT 0,
+                score_count INT NOT NULL DEFAULT 0,
+                profit_loss_sum DECIMAL(24, 2) NOT NULL DEFAULT 0,
+                PRIMARY KEY (bucket, reflection_type)
+            ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+        """)
+
+def _trade_upsert(table: str, bucket: str) -> str:
+    return f"""
+        INSERT INTO {table} (bucket, decision, action, trade_count, total_value, total_fee)
+        VALUES ({bucket.format(column='NEW.timestamp')}, NEW.decision, NEW.action, 1,
+                IFNULL(NEW.total_value, 0), IFNULL(NEW.fee, 0))
+        ON DUPLICATE KEY UPDATE
+            trade_count = trade_count + 1,
+            total_value = total_value + VALUES(total_value),
+            total_fee = total_fee + VALUES(total_fee);
+    """
+
+def _reflection_upsert(table: str, bucket: str) -> str:
+    return f"""
+        INSERT INTO {table} (bucket, reflection_type, reflection_count, score_sum, score_count, profit_loss_sum)
+        VALUES ({bucket.format(column='NEW.created_at')}, NEW.reflection_type, 1,
+                IFNULL(NEW.performance_score, 0), NEW.performance_score IS NOT NULL,
+                IFNULL(NEW.profit_loss, 0))
+        ON DUPLICATE KEY UPDATE
+            reflection_count = reflection_count + 1,
+            score_sum = score_sum + VALUES(score_sum),
+            score_count = score_count + VALUES(score_count),
+            profit_loss_sum = profit_loss_sum + VALUES(profit_loss_sum);
+    """
+
+def rebuild_rollups(cursor) -> None:
+    """원본 테이블에서 집계 행 재계산"""
+    for table, bucket in _TRADE_ROLLUPS:
+        cursor.execute(f"DELETE FROM {table}")
+        bucket_expr = bucket.format(column='timestamp')
+        cursor.execute(f"""
+            INSERT INTO {table} (bucket, decision, action, trade_count, total_value, total_fee)
+            SELECT {bucket_expr}, decision, action, COUNT(*),
+                   IFNULL(SUM(total_value), 0), IFNULL(SUM(fee), 0)
+            FROM trades
+            GROUP BY {bucket_expr}, decision, action
+        """)
+    for table, bucket in _REFLECTION_ROLLUPS:
+        cursor.execute(f"DELETE FROM {table}")
+        bucket_expr = bucket.format(column='created_at')
+        cursor.execute(f"""
+            INSERT INTO {table} (bucket, reflection_type, reflection_count, score_sum, score_count, profit_loss_sum)
+            SELECT {bucket_expr}, reflection_type, COUNT(*), IFNULL(SUM(performance_score), 0),
+                   COUNT(performance_score), IFNULL(SUM(profit_loss), 0)
+            FROM trading_reflections
+            GROUP BY {bucket_expr}, reflection_type
+        """)
+
+def install_rollups(cursor) -> None:
+    """집계 테이블/트리거 설치 후 기존 행 집계 (재실행 가능)"""
+    create_rollup_tables(cursor)
+    cursor.execute("DROP TRIGGER IF EXISTS trg_trades_rollup")
+    cursor.execute("DROP TRIGGER IF EXISTS trg_reflections_rollup")
+    rebuild_rollups(cursor)
+    trade_body = "".join(_trade_upsert(table, bucket) for table, bucket in _TRADE_ROLLUPS)
+    cursor.execute(f"CREATE TRIGGER trg_trades_rollup AFTER INSERT ON trades FOR EACH ROW BEGIN {trade_body} END")
+    reflection_body = "".join(_reflection_upsert(table, bucket) for table, bucket in _REFLECTION_ROLLUPS)
+    cursor.execute(
+        f"CREATE TRIGGER trg_reflections_rollup AFTER INSERT ON trading_reflections FOR EACH ROW BEGIN {reflection_body} END"
+    )
+
+# ---- 조회 ----
+
+def split_range(start: datetime) -> Tuple[datetime, datetime]:
+    """
+    start 이후 구간을 (원본 조회 끝, 시간별 조회 끝)으로 분할
+
+    [start, hour_start)는 원본 행 (1시간 미만), [hour_start, day_start)는 시간별 집계,
+    day_start 이후는 일별 집계에서 읽습니다.
+    """
+    hour_start = start.replace(minute=0, second=0, microsecond=0)
+    if hour_start < start:
+        hour_start += timedelta(hours=1)
+    day_start = hour_start.replace(hour=0)
+    if day_start < hour_start:
+        day_start += timedelta(days=1)
+    return hour_start, day_start
+
+@dataclass
+class TradeTotals:
+    """거래 집계 합계"""
+    total_trades: int = 0
+    decision_counts: Dict[str, int] = field(default_factory=dict)
+    buy_total: float = 0.0
+    sell_total: float = 0.0
+    total_fee: float = 0.0
+
+    def add(self, decision: str, action: str, count: int, value: Any, fee: Any) -> None:
+        self.total_trades += int(count)
+        self.decision_counts[decision] = self.decision_counts.get(decision, 0) + int(count)
+        if action == 'buy':
+            self.buy_total += float(value or 0)
+        elif action == 'sell':
+            self.sell_total += float(value or 0)
+        self.total_fee += float(fee or 0)
+
+    def to_dict(self) -> Dict[str, Any]:
+        profit = self.sell_total - self.buy_total - self.total_fee
+        return {
+            'total_trades': self.total_trades,
+            'decision_counts': self.decision_counts,
+            'total_value': self.buy_total + self.sell_total,
+            'total_fee': self.total_fee,
+            'buy_total': self.buy_total,
+            'sell_total': self.sell_total,
+            'profit': profit,
+            'profit_rate': (profit / self.buy_total * 100) if self.buy_total > 0 else 0,
+        }
+
+@dataclass
+class ReflectionTotals:
+    """반성 집계 합계"""
+    total_reflections: int = 0
+    reflection_types: Dict[str, int] = field(default_factory=dict)
+    score_sum: float = 0.0
+    score_count: int = 0
+    profit_loss_sum: float = 0.0
+
+    def add(self, reflection_type: str, count: int, score_sum: Any, score_count: int, profit_loss: Any) -> None:
+        self.total_reflections += int(count)
+        self.reflection_types[reflection_type] = self.reflection_types.get(reflection_type, 0) + int(count)
+        self.score_sum += float(score_sum or 0)
+        self.score_count += int(score_count or 0)
+        self.profit_loss_sum += float(profit_loss or 0)
+
+    @property
+    def avg_performance_score(self) -> float:
+        return self.score_sum / self.score_count if self.score_count else 0
+
+def get_trade_totals(cursor, start: Optional[datetime] = None) -> TradeTotals:
+    """start 이후(None이면 전체) 거래 합계"""
+    totals = TradeTotals()
+    if start is None:
+        cursor.execute("""
+            SELECT decision, action, SUM(trade_count), SUM(total_value), SUM(total_fee)
+            FROM trade_stats_daily
+            GROUP BY decision, action
+        """)
+        for row in cursor.fetchall():
+            totals.add(*row)
+        return totals
+
+    hour_start, day_start = split_range(start)
+    cursor.execute("""
+        SELECT decision, action, COUNT(*), SUM(total_value), SUM(fee)
+        FROM trades
+        WHERE timestamp >= %s AND timestamp < %s
+        GROUP BY decision, action
+    """, (start, hour_start))
+    for row in cursor.fetchall():
+        totals.add(*row)
+    for query, params in (
+        ("FROM trade_stats_hourly WHERE bucket >= %s AND bucket < %s", (hour_start, day_start)),
+        ("FROM trade_stats_daily WHERE bucket >= %s", (day_start,)),
+    ):
+        cursor.execute(f"""
+            SELECT decision, action, SUM(trade_count), SUM(total_value), SUM(total_fee)
+            {query}
+            GROUP BY decision, action
+        """, params)
+        for row in cursor.fetchall():
+            totals.add(*row)
+    return totals
+
+def get_reflection_totals(cursor, start: datetime) -> ReflectionTotals:
+    """start 이후 반성 합계"""
+    totals = ReflectionTotals()
+    hour_start, day_start = split_range(start)
+    cursor.execute("""
+        SELECT reflection_type, COUNT(*), IFNULL(SUM(performance_score), 0),
+               COUNT(performance_score), SUM(profit_loss)
+        FROM trading_reflections
+        WHERE created_at >= %s AND created_at < %s
+        GROUP BY reflection_type
+    """, (start, hour_start))
+    for row in cursor.fetchall():
+        totals.add(*row)
+    for query, params in (
+        ("FROM reflection_stats_hourly WHERE bucket >= %s AND bucket < %s", (hour_start, day_start)),
+        ("FROM reflection_stats_daily WHERE bucket >= %s", (day_start,)),
+    ):
+        cursor.execute(f"""
+            SELECT reflection_type, SUM(reflection_count), SUM(score_sum), SUM(score_count), SUM(profit_loss_sum)
+            {query}
+            GROUP BY reflection_type
+        """, params)
+        for row in cursor.fetchall():
+            totals.add(*row)
+    return totals
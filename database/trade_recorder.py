@@ -8,7 +8,10 @@ import math
 from typing import Dict, Any, Optional
 from mysql.connector import Error
 import logging
-from .connection import get_db_connection
+from .connection import pooled_connection
+from .write_queue import get_write_queue
+from .rollup import get_trade_totals
+from config.settings import WRITE_BEHIND_ENABLED, TRADE_RECORD_SYNC, TRADING_SYMBOL
 from utils.json_cleaner import clean_json_data
 
 class TradeRecorder:
@@ -17,19 +20,26 @@ class TradeRecorder:
     def __init__(self):
         self.logger = logging.getLogger(__name__)
     
+    def _insert(self, query: str, row: tuple, sync: bool = False) -> None:
+        """INSERT 실행 (쓰기 지연 사용 시 큐에 넣고 즉시 반환, 저장은 백그라운드 일괄 처리)"""
+        if WRITE_BEHIND_ENABLED and not sync:
+            get_write_queue().enqueue(query, row)
+            return
+        
+        with pooled_connection() as connection:
+            cursor = connection.cursor()
+            cursor.execute(query, row)
+            connection.commit()
+            cursor.close()
+    
     def save_trade(self, decision: Dict[str, Any], execution_result: Dict[str, Any], 
-                   investment_status: Dict[str, Any], market_data: Dict[str, Any] = None) -> bool:
-        """거래 기록을 데이터베이스에 저장"""
+                   investment_status: Dict[str, Any], market_data: Dict[str, Any] = None,
+                   sync: bool = TRADE_RECORD_SYNC) -> bool:
+        """거래 기록을 데이터베이스에 저장 (sync=True면 커밋까지 기다림)"""
         try:
-            connection = get_db_connection()
-            if not connection:
-                self.logger.error("데이터베이스 연결 실패")
-                return False
-            
-            cursor = connection.cursor()
-            
             # 거래 정보 추출
             timestamp = datetime.now()
+            symbol = execution_result.get('symbol', TRADING_SYMBOL)
             decision_type = decision.get('decision', 'unknown')
             action = execution_result.get('action', 'none')
             price = execution_result.get('price', 0)
@@ -57,20 +67,17 @@ class TradeRecorder:
             # 거래 기록 저장
             insert_query = """
             INSERT INTO trades (
-                timestamp, decision, action, price, amount, total_value, fee,
+                timestamp, symbol, decision, action, price, amount, total_value, fee,
                 balance_krw, balance_btc, order_id, status, confidence, reasoning, market_data
-            ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+            ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
             """
             
-            cursor.execute(insert_query, (
-                timestamp, decision_type, action, price, amount, total_value, fee,
+            self._insert(insert_query, (
+                timestamp, symbol, decision_type, action, price, amount, total_value, fee,
                 balance_krw, balance_btc, order_id, status, confidence, reasoning, market_data_json
-            ))
+            ), sync=sync)
             
-            connection.commit()
-            cursor.close()
-            
-            self.logger.info(f"거래 기록 저장 완료: {decision_type} - {action}")
+            self.logger.info(f"거래 기록 저장 완료: {symbol} {decision_type} - {action}")
             return True
             
         except Error as e:
@@ -80,13 +87,6 @@ class TradeRecorder:
     def save_market_data(self, market_data: Dict[str, Any]) -> bool:
         """시장 데이터를 데이터베이스에 저장"""
         try:
-            connection = get_db_connection()
-            if not connection:
-                self.logger.error("데이터베이스 연결 실패")
-                return False
-            
-            cursor = connection.cursor()
-            
             timestamp = datetime.now()
             
             def to_number_or_none(value, *, ndigits: int | None = None, as_int: bool = False):
@@ -164,7 +164,7 @@ class TradeRecorder:
             ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
             """
             
-            cursor.execute(insert_query, (
+            self._insert(insert_query, (
                 timestamp,
                 current_price,
                 volume_24h,
@@ -179,9 +179,6 @@ class TradeRecorder:
                 news_sentiment,
             ))
             
-            connection.commit()
-            cursor.close()
-            
             self.logger.info("시장 데이터 저장 완료")
             return True
             
@@ -192,13 +189,6 @@ class TradeRecorder:
     def save_system_log(self, level: str, message: str, module: str = None) -> bool:
         """시스템 로그를 데이터베이스에 저장"""
         try:
-            connection = get_db_connection()
-            if not connection:
-                self.logger.error("데이터베이스 연결 실패")
-                return False
-            
-            cursor = connection.cursor()
-            
             timestamp = datetime.now()
             
             insert_query = """
@@ -206,10 +196,7 @@ class TradeRecorder:
             VALUES (%s, %s, %s, %s)
             """
             
-            cursor.execute(insert_query, (timestamp, level, message, module))
-            
-            connection.commit()
-            cursor.close()
+            self._insert(insert_query, (timestamp, level, message, module))
             
             return True
             
@@ -220,65 +207,39 @@ class TradeRecorder:
     def get_recent_trades(self, limit: int = 10) -> list:
         """최근 거래 기록 조회"""
         try:
-            connection = get_db_connection()
-            if not connection:
-                return []
-            
-            cursor = connection.cursor(dictionary=True)
+            with pooled_connection() as connection:
+                cursor = connection.cursor(dictionary=True)
             
-            select_query = """
-            SELECT * FROM trades 
-            ORDER BY timestamp DESC 
-            LIMIT %s
-            """
+                select_query = """
+                SELECT * FROM trades 
+                ORDER BY timestamp DESC 
+                LIMIT %s
+                """
             
-            cursor.execute(select_query, (limit,))
-            trades = cursor.fetchall()
+                cursor.execute(select_query, (limit,))
+                trades = cursor.fetchall()
             
-            cursor.close()
-            return trades
+                cursor.close()
+                return trades
             
         except Error as e:
             self.logger.error(f"거래 기록 조회 오류: {e}")
             return []
     
     def get_trade_statistics(self) -> Dict[str, Any]:
-        """거래 통계 조회"""
+        """거래 통계 조회 (일별 집계 테이블 사용)"""
         try:
-            connection = get_db_connection()
-            if not connection:
-                return {}
-            
-            cursor = connection.cursor(dictionary=True)
-            
-            # 전체 거래 수
-            cursor.execute("SELECT COUNT(*) as total_trades FROM trades")
-            total_trades = cursor.fetchone()['total_trades']
-            
-            # 매수/매도/보유 거래 수
-            cursor.execute("""
-                SELECT decision, COUNT(*) as count 
-                FROM trades 
-                GROUP BY decision
-            """)
-            decision_counts = {row['decision']: row['count'] for row in cursor.fetchall()}
-            
-            # 총 거래 금액
-            cursor.execute("SELECT SUM(total_value) as total_value FROM trades")
-            total_value = cursor.fetchone()['total_value'] or 0
-            
-            # 총 수수료
-            cursor.execute("SELECT SUM(fee) as total_fee FROM trades")
-            total_fee = cursor.fetchone()['total_fee'] or 0
-            
-            cursor.close()
-            
-            return {
-                'total_trades': total_trades,
-                'decision_counts': decision_counts,
-                'total_value': total_value,
-                'total_fee': total_fee
-            }
+            with pooled_connection() as connection:
+                cursor = connection.cursor()
+                totals = get_trade_totals(cursor).to_dict()
+                cursor.close()
+            
+                return {
+                    'total_trades': totals['total_trades'],
+                    'decision_counts': totals['decision_counts'],
+                    'total_value': totals['total_value'],
+                    'total_fee': totals['total_fee']
+                }
             
         except Error as e:
             self.logger.error(f"거래 통계 조회 오류: {e}")
@@ -288,9 +249,10 @@ class TradeRecorder:
 trade_recorder = TradeRecorder()
 
 def save_trade_record(decision: Dict[str, Any], execution_result: Dict[str, Any], 
-                     investment_status: Dict[str, Any], market_data: Dict[str, Any] = None) -> bool:
+                     investment_status: Dict[str, Any], market_data: Dict[str, Any] = None,
+                     sync: bool = TRADE_RECORD_SYNC) -> bool:
     """거래 기록 저장 (편의 함수)"""
-    return trade_recorder.save_trade(decision, execution_result, investment_status, market_data)
+    return trade_recorder.save_trade(decision, execution_result, investment_status, market_data, sync)
 
 def save_market_data_record(market_data: Dict[str, Any]) -> bool:
     """시장 데이터 저장 (편의 함수)"""
@@ -0,0 +1,359 @@
+"""
+DB 쓰기 지연(write-behind) 큐 모듈
+거래/시장 데이터/시스템 로그 INSERT를 백그라운드 스레드에서 모아 executemany로 일괄 저장합니다.
+
+- 큐가 가득 차면 put_timeout까지 대기 후 디스크 저널에 기록 (행 유실 없음)
+- DB에 연결할 수 없으면 저널(JSON Lines)에 기록하고, 연결이 복구되면 재전송
+- 데이터 오류(값 범위 초과, 컬럼 불일치 등)는 장애가 아니므로 행 단위로 재시도하고 실패한 행만 dead-letter 파일로 격리
+- 종료 시(close/atexit) 큐에 남은 행을 모두 저장하거나 저널에 기록
+"""
+
+import os
+import json
+import time
+import queue
+import atexit
+import logging
+import threading
+from datetime import datetime, date
+from decimal import Decimal
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from mysql.connector.errors import InterfaceError, OperationalError, PoolError
+from config.settings import (
+    WRITE_QUEUE_MAX_SIZE, WRITE_QUEUE_BATCH_SIZE, WRITE_QUEUE_FLUSH_INTERVAL,
+    WRITE_QUEUE_PUT_TIMEOUT, WRITE_QUEUE_JOURNAL, WRITE_QUEUE_DEAD_LETTER, WRITE_QUEUE_RETRY_INTERVAL
+)
+
+Row = Tuple[Any, ...]
+_STOP = object()
+# DB에 닿지 못한 오류 (저널에 기록 후 재시도), 그 밖의 오류는 행 데이터 문제로 처리
+CONNECTIVITY_ERRORS = (OperationalError, InterfaceError, PoolError, ConnectionError, TimeoutError)
+
+def _encode_value(value: Any) -> Any:
+    """저널 기록용 값 변환 (MySQL이 받는 문자열/숫자)"""
+    if isinstance(value, datetime):
+        return value.strftime('%Y-%m-%d %H:%M:%S.%f')
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    return value
+
+def default_executor(sql: str, rows: List[Row]) -> None:
+    """풀 연결로 여러 행 INSERT"""
+    from .connection import pooled_connection
+    with pooled_connection() as connection:
+        cursor = connection.cursor()
+        try:
+            cursor.executemany(sql, rows)
+            connection.commit()
+        finally:
+            cursor.close()
+
+class WriteBehindQueue:
+    """INSERT 일괄 처리 큐"""
+
+    def __init__(self, max_size: int = WRITE_QUEUE_MAX_SIZE, batch_size: int = WRITE_QUEUE_BATCH_SIZE,
+                 flush_interval: float = WRITE_QUEUE_FLUSH_INTERVAL,
+                 put_timeout: float = WRITE_QUEUE_PUT_TIMEOUT,
+                 journal_path: Optional[str] = WRITE_QUEUE_JOURNAL,
+                 dead_letter_path: Optional[str] = WRITE_QUEUE_DEAD_LETTER,
+                 retry_interval: float = WRITE_QUEUE_RETRY_INTERVAL,
+                 executor: Callable[[str, List[Row]], None] = default_executor):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.put_timeout = put_timeout
+        self.journal_path = journal_path
+        self.dead_letter_path = dead_letter_path
+        self.retry_interval = retry_interval
+        self.executor = executor
+        self.logger = logging.getLogger(__name__)
+        self.stats = {'enqueued': 0, 'written': 0, 'batches': 0, 'spilled': 0,
+                      'replayed': 0, 'blocked_puts': 0, 'write_errors': 0, 'dead_lettered': 0, 'max_depth': 0}
+        self.last_batch_latency = 0.0
+
+        self._queue: queue.Queue = queue.Queue(maxsize=max_size)
+        self._pending = 0  # 큐 + 처리 중인 행 수
+        self._pending_condition = threading.Condition()
+        self._journal_lock = threading.Lock()
+        self._dead_letter_lock = threading.Lock()  # 저널 재전송 중(_journal_lock 보유)에도 격리 가능하도록 분리
+        self._db_available = True
+        self._last_retry = 0.0
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+
+    # ---- 실행 제어 ----
+
+    def start(self) -> 'WriteBehindQueue':
+        """백그라운드 저장 스레드 시작"""
+        if self._thread is None or not self._thread.is_alive():
+            self._closed = False
+            self._thread = threading.Thread(target=self._run, name="db-write-behind", daemon=True)
+            self._thread.start()
+        return self
+
+    def close(self, timeout: float = 30.0) -> None:
+        """남은 행을 모두 저장(또는 저널 기록)한 뒤 종료"""
+        if self._closed:
+            return
+        self._closed = True
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join(timeout)
+        # 스레드가 없거나 시간 내 끝나지 않은 경우 남은 행은 저널로
+        leftovers = self._drain_nowait()
+        if leftovers:
+            self._spill(leftovers)
+
+    def flush(self, timeout: float = 30.0) -> bool:
+        """현재까지 넣은 행이 모두 처리될 때까지 대기"""
+        deadline = time.monotonic() + timeout
+        with self._pending_condition:
+            while self._pending > 0:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._pending_condition.wait(remaining)
+        return True
+
+    # ---- 입력 ----
+
+    def enqueue(self, sql: str, row: Row) -> bool:
+        """
+        행 추가 (즉시 반환)
+
+        큐가 가득 차면 put_timeout까지 기다리고, 그래도 자리가 없으면 저널에 기록합니다.
+        """
+        if self._closed:
+            # 종료 이후 들어온 행은 저널에 기록 (다음 실행 시 재전송)
+            self._spill([(sql, row)])
+            return False
+        if self._thread is None or not self._thread.is_alive():
+            self.start()
+        with self._pending_condition:
+            self._pending += 1
+        self.stats['enqueued'] += 1
+        try:
+            self._queue.put_nowait((sql, row))
+        except queue.Full:
+            self.stats['blocked_puts'] += 1
+            try:
+                self._queue.put((sql, row), timeout=self.put_timeout)
+            except queue.Full:
+                self._spill([(sql, row)])
+                self._done(1)
+                return False
+        self.stats['max_depth'] = max(self.stats['max_depth'], self._queue.qsize())
+        return True
+
+    def metrics(self) -> Dict[str, Any]:
+        """큐 상태 및 역압 지표"""
+        return {
+            'depth': self._queue.qsize(),
+            'capacity': self._queue.maxsize,
+            'pending': self._pending,
+            'db_available': self._db_available,
+            'journal_rows': self._journal_rows(),
+            'last_batch_latency': self.last_batch_latency,
+            **self.stats,
+        }
+
+    # ---- 백그라운드 저장 ----
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            batch, stopping = self._collect_batch()
+            if batch:
+                self._write_batch(batch)
+            elif self._db_available or time.monotonic() - self._last_retry >= self.retry_interval:
+                self._replay_journal()
+
+        # 종료: 재시도 대기 없이 큐에 남은 행 저장 후 저널 재전송 1회 시도
+        self._last_retry = float('-inf')
+        leftovers = self._drain_nowait()
+        while leftovers:
+            chunk, leftovers = leftovers[:self.batch_size], leftovers[self.batch_size:]
+            self._write_batch(chunk)
+        self._replay_journal()
+
+    def _collect_batch(self) -> Tuple[List[Tuple[str, Row]], bool]:
+        """flush_interval 동안 최대 batch_size개 수집"""
+        batch: List[Tuple[str, Row]] = []
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                item = self._queue.get(timeout=max(remaining, 0.0)) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is _STOP:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    def _execute(self, sql: str, rows: List[Row]) -> Tuple[List[Row], Optional[Exception]]:
+        """
+        executemany 실행, (연결 오류로 저장하지 못한 행, 연결 오류) 반환
+
+        연결 오류가 아닌 실패는 행 데이터 문제로 보고 한 행씩 다시 저장하며,
+        그래도 실패한 행은 dead-letter 파일로 격리합니다 (DB 장애로 취급하지 않음).
+        """
+        try:
+            self.executor(sql, rows)
+            self.stats['written'] += len(rows)
+            self.stats['batches'] += 1
+            return [], None
+        except CONNECTIVITY_ERRORS as e:
+            return rows, e
+        except Exception as e:
+            self.stats['write_errors'] += 1
+            self.logger.warning(f"데이터 오류로 일괄 저장 실패 ({len(rows)}행, 행 단위 재시도): {e}")
+
+        poisoned: List[Tuple[Row, str]] = []
+        for index, row in enumerate(rows):
+            try:
+                self.executor(sql, [row])
+                self.stats['written'] += 1
+            except CONNECTIVITY_ERRORS as e:
+                self._dead_letter(sql, poisoned)
+                return rows[index:], e
+            except Exception as e:
+                poisoned.append((row, str(e)))
+        self._dead_letter(sql, poisoned)
+        return [], None
+
+    def _write_batch(self, batch: List[Tuple[str, Row]]) -> None:
+        """SQL별로 묶어 executemany, 연결 오류 시 저널 기록"""
+        grouped: Dict[str, List[Row]] = {}
+        for sql, row in batch:
+            grouped.setdefault(sql, []).append(row)
+
+        started = time.perf_counter()
+        for sql, rows in grouped.items():
+            if not self._db_available and time.monotonic() - self._last_retry < self.retry_interval:
+                self._spill([(sql, row) for row in rows])
+                continue
+            unwritten, error = self._execute(sql, rows)
+            if error is not None:
+                self.stats['write_errors'] += 1
+                self._db_available = False
+                self._last_retry = time.monotonic()
+                self.logger.error(f"DB 일괄 저장 실패 ({len(unwritten)}행, 저널 기록): {error}")
+                self._spill([(sql, row) for row in unwritten])
+            elif not self._db_available:
+                self._db_available = True
+                self.logger.info("DB 연결 복구: 저널 재전송 시작")
+                self._replay_journal()
+        self.last_batch_latency = time.perf_counter() - started
+        self._done(len(batch))
+
+    def _drain_nowait(self) -> List[Tuple[str, Row]]:
+        items = []
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                return items
+            if item is not _STOP:
+                items.append(item)
+
+    def _done(self, count: int) -> None:
+        with self._pending_condition:
+            self._pending -= count
+            self._pending_condition.notify_all()
+
+    # ---- 디스크 저널 ----
+
+    def _spill(self, items: List[Tuple[str, Row]]) -> None:
+        """저널 파일에 행 추가 (저널 경로가 없으면 버림)"""
+        if not self.journal_path:
+            self.logger.error(f"저널 경로 미설정: {len(items)}행 유실")
+            return
+        with self._journal_lock:
+            directory = os.path.dirname(self.journal_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(self.journal_path, 'a', encoding='utf-8') as f:
+                for sql, row in items:
+                    f.write(json.dumps({'sql': sql, 'row': [_encode_value(value) for value in row]},
+                                       ensure_ascii=False) + '\n')
+                f.flush()
+                os.fsync(f.fileno())
+        self.stats['spilled'] += len(items)
+
+    def _dead_letter(self, sql: str, rows: List[Tuple[Row, str]]) -> None:
+        """데이터 오류로 저장할 수 없는 행을 오류 메시지와 함께 격리 (재전송하지 않음)"""
+        if not rows:
+            return
+        self.stats['dead_lettered'] += len(rows)
+        self.logger.error(f"저장 불가 행 {len(rows)}개 격리: {rows[0][1]}")
+        if not self.dead_letter_path:
+            return
+        with self._dead_letter_lock:
+            directory = os.path.dirname(self.dead_letter_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(self.dead_letter_path, 'a', encoding='utf-8') as f:
+                for row, error in rows:
+                    f.write(json.dumps({'sql': sql, 'row': [_encode_value(value) for value in row], 'error': error},
+                                       ensure_ascii=False) + '\n')
+
+    def _journal_rows(self) -> int:
+        if not self.journal_path or not os.path.exists(self.journal_path):
+            return 0
+        with self._journal_lock, open(self.journal_path, 'r', encoding='utf-8') as f:
+            return sum(1 for line in f if line.strip())
+
+    def _replay_journal(self) -> None:
+        """저널 행 재전송 (저장/격리된 행은 제거, 연결 오류가 나면 남은 행을 그대로 유지)"""
+        self._last_retry = time.monotonic()
+        if not self.journal_path or not os.path.exists(self.journal_path):
+            return
+        with self._journal_lock:
+            with open(self.journal_path, 'r', encoding='utf-8') as f:
+                entries = [json.loads(line) for line in f if line.strip()]
+            if not entries:
+                os.remove(self.journal_path)
+                return
+
+            grouped: Dict[str, List[Row]] = {}
+            for entry in entries:
+                grouped.setdefault(entry['sql'], []).append(tuple(entry['row']))
+
+            remaining = []
+            error = None
+            for sql, rows in grouped.items():
+                for start in range(0, len(rows), self.batch_size):
+                    chunk = rows[start:start + self.batch_size]
+                    if error is None:
+                        unwritten, error = self._execute(sql, chunk)
+                        self.stats['replayed'] += len(chunk) - len(unwritten)
+                    else:
+                        unwritten = chunk  # DB 연결이 끊겼으면 나머지는 다음 재시도로
+                    remaining.extend({'sql': sql, 'row': list(row)} for row in unwritten)
+            if error is not None:
+                self._db_available = False
+                self.logger.warning(f"저널 재전송 실패: {error}")
+
+            if remaining:
+                temp_path = f"{self.journal_path}.tmp"
+                with open(temp_path, 'w', encoding='utf-8') as f:
+                    for entry in remaining:
+                        f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+                os.replace(temp_path, self.journal_path)
+            else:
+                self._db_available = True
+                os.remove(self.journal_path)
+
+_write_queue: Optional[WriteBehindQueue] = None
+_write_queue_lock = threading.Lock()
+
+def get_write_queue() -> WriteBehindQueue:
+    """공용 쓰기 큐 반환 (최초 호출 시 시작, 종료 시 자동 flush)"""
+    global _write_queue
+    with _write_queue_lock:
+        if _write_queue is None:
+            _write_queue = WriteBehindQueue().start()
+            atexit.register(_write_queue.close)
+        return _write_queue
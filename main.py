@@ -4,13 +4,11 @@
 
 import time
 import argparse
-import pyupbit
 from config.settings import (
     validate_api_keys, 
-    UPBIT_ACCESS_KEY, 
-    UPBIT_SECRET_KEY, 
     ANALYSIS_INTERVAL
 )
+from data.upbit_client import get_upbit_client
 from database.connection import init_database
 from utils.logger import get_logger
 from core.services import start_background_services
@@ -58,8 +56,8 @@ def main():
         print("💡 MySQL 서버가 실행 중인지 확인해주세요.")
         return
     
-    # 업비트 연결
-    upbit = pyupbit.Upbit(UPBIT_ACCESS_KEY, UPBIT_SECRET_KEY)
+    # 업비트 연결 (요청 한도를 공유하는 공용 REST 클라이언트)
+    upbit = get_upbit_client()
     
    
     print("🔄 자동매매를 시작합니다...")
@@ -14,6 +14,7 @@ from analysis.reflection_system import (
     generate_strategy_improvements
 )
 from database.connection import init_database
+from database.migrations import ensure_partitions
 from utils.logger import get_logger
 
 class ReflectionScheduler:
@@ -41,6 +42,9 @@ class ReflectionScheduler:
             # 전략 개선 제안 (매주 토요일 오전 9시)
             schedule.every().saturday.at("09:00").do(self.strategy_improvement_analysis)
             
+            # 월 파티션 유지 (매일 오전 1시)
+            schedule.every().day.at("01:00").do(self.partition_maintenance)
+            
             self.logger.info("반성 스케줄러 설정 완료")
             
         except Exception as e:
@@ -161,6 +165,13 @@ class ReflectionScheduler:
         except Exception as e:
             self.logger.error(f"전략 개선 제안 분석 오류: {e}")
     
+    def partition_maintenance(self):
+        """다가오는 달의 파티션 미리 생성"""
+        if ensure_partitions():
+            self.logger.info("파티션 유지 작업 완료")
+        else:
+            self.logger.error("파티션 유지 작업 실패")
+    
     def run(self):
         """스케줄러 실행"""
         self.logger.info("반성 스케줄러 시작")
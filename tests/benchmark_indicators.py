@@ -0,0 +1,47 @@
+"""
+기술적 지표 계산 벤치마크
+NumPy 커널과 기존 ta 계산의 소요 시간을 캔들 수별로 비교합니다.
+
+사용법: python tests/benchmark_indicators.py [캔들 수 ...] [--skip-ta-above N]
+"""
+
+import sys
+import os
+import time
+import argparse
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가 (tests/의 부모 경로)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from analysis.technical_indicators import calculate_technical_indicators, calculate_technical_indicators_ta
+from tests.test_incremental_indicators import make_ohlcv
+
+def time_call(func, df, repeat: int) -> float:
+	"""최소 소요 시간 (초)"""
+	best = float('inf')
+	for _ in range(repeat):
+		started = time.perf_counter()
+		func(df)
+		best = min(best, time.perf_counter() - started)
+	return best
+
+def main():
+	parser = argparse.ArgumentParser(description="기술적 지표 계산 벤치마크")
+	parser.add_argument('sizes', nargs='*', type=int, default=[1_000, 100_000, 1_000_000])
+	parser.add_argument('--skip-ta-above', type=int, default=None, help="이 캔들 수를 넘으면 ta 측정 생략")
+	args = parser.parse_args()
+
+	print(f"{'캔들 수':>12} | {'NumPy 커널':>12} | {'ta':>12} | {'배속':>8}")
+	print("-" * 54)
+	for size in args.sizes:
+		df = make_ohlcv(size)
+		repeat = 5 if size <= 100_000 else 1
+		kernel_time = time_call(calculate_technical_indicators, df, repeat)
+		if args.skip_ta_above and size > args.skip_ta_above:
+			print(f"{size:>12,} | {kernel_time * 1000:>10.1f}ms | {'-':>12} | {'-':>8}")
+			continue
+		ta_time = time_call(calculate_technical_indicators_ta, df, repeat)
+		print(f"{size:>12,} | {kernel_time * 1000:>10.1f}ms | {ta_time * 1000:>10.1f}ms | {ta_time / kernel_time:>7.1f}x")
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,95 @@
+"""
+계좌 스냅샷 테스트
+한 사이클 안에서 잔고 조회가 한 번만 일어나는지, 우리 주문 후에만 다시 조회하는지,
+평가금액/비중/미실현 손익 계산 속성을 검증합니다.
+"""
+
+import sys
+import os
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가 (tests/의 부모 경로)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import trading.execution as execution
+from trading.account import get_investment_status, get_total_profit_loss
+from trading.account_snapshot import AccountSnapshot, get_account_service, parse_balances
+
+PRICE = 150_000_000
+
+class FakeUpbit:
+	"""get_balances 호출 횟수를 세는 가짜 업비트 클라이언트"""
+
+	def __init__(self):
+		self.balance_calls = 0
+		self.krw = 1_000_000.0
+		self.btc = 0.01
+
+	def get_balances(self):
+		self.balance_calls += 1
+		return [
+			{'currency': 'KRW', 'balance': str(self.krw), 'avg_buy_price': '0'},
+			{'currency': 'BTC', 'balance': str(self.btc), 'avg_buy_price': '120000000'},
+		]
+
+	def sell_market_order(self, ticker, volume):
+		self.btc -= volume
+		self.krw += volume * PRICE
+		return {'uuid': 'sell-1', 'side': 'ask'}
+
+	def get_order(self, uuid):
+		return {'uuid': uuid, 'side': 'ask', 'state': 'done', 'executed_volume': '0.0095', 'paid_fee': '712.5',
+				'trades': [{'price': str(PRICE), 'volume': '0.0095', 'funds': '1425000'}]}
+
+def make_service(upbit):
+	service = get_account_service(upbit)
+	service.price_source = lambda symbol: PRICE
+	return service
+
+def test_derived_values():
+	"""파생 값은 스냅샷 필드로 계산"""
+	snapshot = AccountSnapshot(krw_balance=1_500_000, btc_balance=0.01, btc_avg_price=120_000_000, current_price=PRICE)
+	assert snapshot.btc_value == 1_500_000
+	assert snapshot.btc_ratio == 50.0
+	assert snapshot.unrealized_pnl == 300_000
+	assert abs(snapshot.unrealized_pnl_percent - 25.0) < 1e-9
+	assert snapshot.performance_grade == "A+ (우수)"
+	assert parse_balances({'KRW': {'balance': '10'}, 'BTC': {'balance': '0.5', 'avg_buy_price': '2'}}) == (10.0, 0.5, 2.0)
+
+def test_single_fetch_per_cycle():
+	"""사이클 안의 투자 상태/손익 조회는 같은 스냅샷 재사용, 새 사이클에서만 다시 조회"""
+	upbit = FakeUpbit()
+	service = make_service(upbit)
+	status = get_investment_status(upbit)
+	profit = get_total_profit_loss(upbit)
+	assert status == profit and status['btc_balance'] == 0.01 and status['current_price'] == PRICE
+	assert upbit.balance_calls == 1
+
+	upbit.krw = 2_000_000.0  # 외부 입금은 다음 사이클에 반영
+	assert get_investment_status(upbit)['krw_balance'] == 1_000_000.0
+	service.begin_cycle()
+	assert get_investment_status(upbit)['krw_balance'] == 2_000_000.0
+	assert upbit.balance_calls == 2
+
+def test_order_invalidates_snapshot():
+	"""매도 주문 후에는 새 잔고로 조회, 주문이 없으면 재조회 없음"""
+	upbit = FakeUpbit()
+	service = make_service(upbit)
+	original_save = execution.save_trade_record
+	execution.save_trade_record = lambda *args: None
+	try:
+		status = get_investment_status(upbit)
+		before = service.version
+		result = execution.execute_trading_decision(upbit, {'decision': 'sell'}, status)
+	finally:
+		execution.save_trade_record = original_save
+	assert result['success'] and result['price'] == PRICE
+	assert service.version == before + 1
+	after = get_total_profit_loss(upbit)
+	assert abs(after['btc_balance'] - 0.0005) < 1e-12
+	assert upbit.balance_calls == 2
+
+if __name__ == "__main__":
+	test_derived_values()
+	test_single_fetch_per_cycle()
+	test_order_invalidates_snapshot()
+	print("🎉 계좌 스냅샷 테스트 완료!")
@@ -0,0 +1,113 @@
+"""
+차트 브라우저 세션 테스트
+가짜 WebDriver로 세션 재사용, 페이지 충돌 시 재시작, 최대 유지 시간 경과 시 재시작을 검증합니다.
+"""
+
+import sys
+import os
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가 (tests/의 부모 경로)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from selenium.common.exceptions import WebDriverException
+from data.browser_session import ChartBrowser
+
+class FakeElement:
+	def __init__(self, driver):
+		self.driver = driver
+
+	def is_displayed(self):
+		return True
+
+	@property
+	def screenshot_as_png(self):
+		if self.driver.crashed:
+			raise WebDriverException("tab crashed")
+		self.driver.captures += 1
+		return b"\x89PNG" + bytes([self.driver.id])
+
+class FakeDriver:
+	"""selenium WebDriver 대체"""
+	created = []
+
+	def __init__(self):
+		FakeDriver.created.append(self)
+		self.id = len(FakeDriver.created)
+		self.pages = []
+		self.crashed = False
+		self.quit_called = False
+		self.configured = False
+		self.captures = 0
+
+	def get(self, url):
+		self.pages.append(url)
+
+	def find_element(self, by, value):
+		return FakeElement(self)
+
+	def execute_script(self, script):
+		if self.crashed:
+			raise WebDriverException("tab crashed")
+		return 'complete'
+
+	def quit(self):
+		self.quit_called = True
+
+def make_browser(max_age=3600):
+	FakeDriver.created = []
+	def configure(driver, trace):
+		driver.configured = True
+	return ChartBrowser(url="https://example.test/chart", driver_factory=FakeDriver,
+						configure=configure, page_timeout=1, max_age=max_age)
+
+def test_session_reused():
+	"""페이지 로드/설정은 한 번, 이후 캡처는 요소만"""
+	browser = make_browser()
+	assert browser.warmup()
+	for _ in range(5):
+		assert browser.capture_png() == b"\x89PNG\x01"
+	assert len(FakeDriver.created) == 1
+	driver = FakeDriver.created[0]
+	assert driver.pages == ["https://example.test/chart"] and driver.configured
+	assert driver.captures == 5 and browser.stats['starts'] == 1
+	assert [step.name for step in browser.last_setup_trace.steps] == ['page_load', 'chart_visible']
+	browser.close()
+	assert driver.quit_called and not browser.ready
+
+def test_recovers_from_crash():
+	"""응답 없는 페이지는 다음 캡처에서 새 브라우저로 교체"""
+	browser = make_browser()
+	browser.capture_png()
+	FakeDriver.created[0].crashed = True
+	assert browser.capture_png() == b"\x89PNG\x02"
+	assert FakeDriver.created[0].quit_called
+	assert FakeDriver.created[1].configured
+	assert browser.stats['restarts'] == 1
+
+def test_crash_during_capture_retries_once():
+	"""캡처 중 오류 시 재시작 후 1회 재시도, 계속 실패하면 None"""
+	browser = make_browser()
+	browser.capture_png()
+	original = FakeDriver.find_element
+	FakeDriver.find_element = lambda self, by, value: (_ for _ in ()).throw(WebDriverException("gone"))
+	try:
+		assert browser.capture_png() is None
+	finally:
+		FakeDriver.find_element = original
+	assert browser.stats['failures'] == 2 and len(FakeDriver.created) == 2
+	assert browser.capture_png() is not None
+
+def test_recycled_after_max_age():
+	"""최대 유지 시간이 지나면 새 세션"""
+	browser = make_browser(max_age=0)
+	browser.capture_png()
+	browser.capture_png()
+	assert len(FakeDriver.created) == 2
+	assert FakeDriver.created[0].quit_called
+
+if __name__ == "__main__":
+	test_session_reused()
+	test_recovers_from_crash()
+	test_crash_during_capture_retries_once()
+	test_recycled_after_max_age()
+	print("🎉 차트 브라우저 세션 테스트 완료!")
@@ -0,0 +1,116 @@
+"""
+공용 TTL 캐시 테스트
+TTL 만료, stale-while-revalidate, single-flight, 디스크 계층을 확인합니다.
+"""
+
+import sys
+import os
+import time
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가 (tests/의 부모 경로)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.cache import TTLCache
+
+class FakeClock:
+	def __init__(self):
+		self.now = 1_760_000_000.0
+
+	def __call__(self):
+		return self.now
+
+def test_ttl_and_stale_while_revalidate():
+	"""TTL 이내는 캐시, stale 구간은 이전 값 반환 후 백그라운드 갱신"""
+	clock = FakeClock()
+	cache = TTLCache(directory=None, clock=clock)
+	calls = []
+	refreshed = threading.Event()
+
+	def loader():
+		calls.append(clock.now)
+		if len(calls) > 1:
+			refreshed.set()
+		return len(calls)
+
+	assert cache.get_or_load('fng', loader, ttl=60, stale_ttl=300) == 1
+	clock.now += 30
+	assert cache.get_or_load('fng', loader, ttl=60, stale_ttl=300) == 1
+	assert cache.stats['hits'] == 1
+
+	clock.now += 100  # stale 구간
+	assert cache.get_or_load('fng', loader, ttl=60, stale_ttl=300) == 1
+	assert refreshed.wait(2)
+	for _ in range(100):
+		if cache.peek('fng').value == 2:
+			break
+		time.sleep(0.01)
+	assert cache.get_or_load('fng', loader, ttl=60, stale_ttl=300) == 2
+	assert cache.stats['stale_hits'] == 1
+
+	clock.now += 1000  # stale 허용 구간도 지남 → 동기 조회
+	assert cache.get_or_load('fng', loader, ttl=60, stale_ttl=300) == 3
+	assert cache.stats['misses'] == 2
+
+def test_single_flight():
+	"""동시 미스는 한 번만 조회하고, None 결과는 캐시하지 않음"""
+	cache = TTLCache(directory=None)
+	calls = []
+	release = threading.Event()
+
+	def slow_loader():
+		calls.append(1)
+		release.wait(2)
+		return {'price': 158350000.0}
+
+	with ThreadPoolExecutor(max_workers=8) as executor:
+		futures = [executor.submit(cache.get_or_load, 'price:KRW-BTC', slow_loader, 5) for _ in range(8)]
+		time.sleep(0.1)
+		release.set()
+		results = [future.result() for future in futures]
+
+	assert len(calls) == 1
+	assert all(result == {'price': 158350000.0} for result in results)
+	assert cache.stats['coalesced'] == 7
+
+	assert cache.get_or_load('empty', lambda: None, ttl=60) is None
+	assert cache.get_or_load('empty', lambda: 'ok', ttl=60) == 'ok'
+
+def test_loader_error_propagates():
+	cache = TTLCache(directory=None)
+
+	def failing_loader():
+		raise RuntimeError("API 오류")
+
+	try:
+		cache.get_or_load('news', failing_loader, ttl=60)
+		assert False, "예외가 전달되어야 함"
+	except RuntimeError:
+		pass
+	assert cache.stats['load_errors'] == 1
+	assert cache.get_or_load('news', lambda: ['기사'], ttl=60) == ['기사']
+
+def test_disk_tier_survives_restart():
+	clock = FakeClock()
+	with tempfile.TemporaryDirectory() as directory:
+		first = TTLCache(directory=directory, clock=clock)
+		first.get_or_load('news', lambda: [{'title': '비트코인 상승'}], ttl=3600, persist=True)
+
+		clock.now += 600
+		restarted = TTLCache(directory=directory, clock=clock)
+		value = restarted.get_or_load('news', lambda: [{'title': '새 기사'}], ttl=3600, persist=True)
+		assert value == [{'title': '비트코인 상승'}]
+		assert restarted.stats['disk_hits'] == 1
+
+		clock.now += 3600  # 디스크 값도 만료
+		again = TTLCache(directory=directory, clock=clock)
+		assert again.get_or_load('news', lambda: [{'title': '새 기사'}], ttl=3600, persist=True) == [{'title': '새 기사'}]
+
+if __name__ == "__main__":
+	test_ttl_and_stale_while_revalidate()
+	test_single_flight()
+	test_loader_error_propagates()
+	test_disk_tier_survives_restart()
+	print("🎉 공용 TTL 캐시 테스트 완료!")
@@ -0,0 +1,90 @@
+"""
+로컬 캔들 저장소 테스트
+가짜 업비트 조회 함수로 꼬리 구간 조회, 진행 중 캔들 덮어쓰기, 파일 재사용을 확인합니다.
+"""
+
+import sys
+import os
+import tempfile
+import numpy as np
+import pandas as pd
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가 (tests/의 부모 경로)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data.candle_store import CandleStore, interval_period
+
+class FakeExchange:
+	"""pyupbit.get_ohlcv 대체 (현재 시각까지의 분봉 반환, 마지막 캔들은 진행 중)"""
+
+	def __init__(self, start: str = '2025-08-01 09:00'):
+		self.start = pd.Timestamp(start)
+		self.now = self.start + pd.Timedelta(minutes=2000)
+		self.requests = []
+
+	def candles(self) -> pd.DataFrame:
+		index = pd.date_range(self.start, self.now.floor('min'), freq='min')
+		close = 1.4e8 + np.arange(len(index), dtype=float) * 1000
+		# 진행 중 캔들 종가는 조회 시각(초)에 따라 변함
+		close[-1] += self.now.second
+		return pd.DataFrame({
+			'open': close, 'high': close + 500, 'low': close - 500,
+			'close': close, 'volume': np.ones(len(index)), 'value': close,
+		}, index=index)
+
+	def get_ohlcv(self, symbol, interval='minute1', count=200):
+		self.requests.append(count)
+		return self.candles().iloc[-count:]
+
+def test_interval_period():
+	assert interval_period('minute1') == pd.Timedelta(minutes=1)
+	assert interval_period('minutes60') == pd.Timedelta(hours=1)
+	assert interval_period('day') == pd.Timedelta(days=1)
+	assert interval_period('month') is None
+
+def test_tail_fetch_and_forming_candle():
+	"""두 번째 조회부터 빠진 구간만 조회하고 결과는 전체 조회와 동일"""
+	exchange = FakeExchange()
+	with tempfile.TemporaryDirectory() as directory:
+		store = CandleStore(directory, fetcher=exchange.get_ohlcv, clock=lambda: exchange.now)
+		first = store.get_candles('KRW-BTC', 'minute1', 1440)
+		assert exchange.requests == [1440]
+		pd.testing.assert_frame_equal(first, exchange.candles().iloc[-1440:])
+
+		# 7분 30초 경과: 마지막 저장 캔들(진행 중이던 캔들) + 신규 7개
+		exchange.now += pd.Timedelta(minutes=7, seconds=30)
+		second = store.get_candles('KRW-BTC', 'minute1', 1440)
+		assert exchange.requests[-1] == 8
+		assert store.stats['tail_fetches'] == 1
+		assert not second.index.has_duplicates
+		pd.testing.assert_frame_equal(second, exchange.candles().iloc[-1440:], check_freq=False)
+
+		# 재시작 후에도 파일에서 이어서 조회
+		exchange.now += pd.Timedelta(minutes=2)
+		restarted = CandleStore(directory, fetcher=exchange.get_ohlcv, clock=lambda: exchange.now)
+		third = restarted.get_candles('KRW-BTC', 'minute1', 1440)
+		assert exchange.requests[-1] == 3
+		pd.testing.assert_frame_equal(third, exchange.candles().iloc[-1440:], check_freq=False)
+
+def test_gap_and_fetch_failure():
+	"""오래 비어 있으면 전체 조회, 조회 실패 시 저장된 캔들 반환"""
+	exchange = FakeExchange()
+	with tempfile.TemporaryDirectory() as directory:
+		store = CandleStore(directory, fetcher=exchange.get_ohlcv, clock=lambda: exchange.now)
+		store.get_candles('KRW-BTC', 'minute1', 200)
+
+		exchange.now += pd.Timedelta(minutes=500)
+		result = store.get_candles('KRW-BTC', 'minute1', 200)
+		assert exchange.requests[-1] == 200
+		pd.testing.assert_frame_equal(result, exchange.candles().iloc[-200:], check_freq=False)
+
+		store.fetcher = lambda *args, **kwargs: None
+		stale = store.get_candles('KRW-BTC', 'minute1', 200)
+		assert store.stats['fetch_failures'] == 1
+		pd.testing.assert_frame_equal(stale, result, check_freq=False)
+
+if __name__ == "__main__":
+	test_interval_period()
+	test_tail_fetch_and_forming_candle()
+	test_gap_and_fetch_failure()
+	print("🎉 로컬 캔들 저장소 테스트 완료!")
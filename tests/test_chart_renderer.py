@@ -0,0 +1,63 @@
+"""
+차트 렌더링 테스트
+지표 DataFrame에서 고정 크기 PNG/JPEG를 메모리로 만들고, 결측값/컬럼 형식/빈 데이터 처리를 검증합니다.
+"""
+
+import sys
+import os
+import io
+import time
+import base64
+from PIL import Image
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가 (tests/의 부모 경로)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from analysis.technical_indicators import calculate_technical_indicators
+from data.chart_renderer import render_chart, render_chart_base64, render_chart_image
+from tests.test_incremental_indicators import make_ohlcv
+import data.image_pipeline
+
+data.image_pipeline.IMAGE_ARCHIVE_ENABLED = False  # 테스트 중 images/ 보관 안 함
+
+def test_render_png_fixed_size():
+	"""고정 크기 PNG, 캔들/지표 색이 그려짐, 1초 이내"""
+	df = calculate_technical_indicators(make_ohlcv(1440))
+	started = time.perf_counter()
+	png = render_chart(df, size=(800, 450), candles=120, image_format='PNG', title='KRW-BTC')
+	elapsed = time.perf_counter() - started
+	assert png[:8] == b"\x89PNG\r\n\x1a\n"
+	image = Image.open(io.BytesIO(png))
+	assert image.size == (800, 450)
+	colors = {color for _, color in image.getcolors(maxcolors=1 << 16)}
+	assert (200, 55, 55) in colors and (40, 90, 200) in colors  # 상승/하락 캔들
+	assert (230, 150, 30) in colors  # SMA_20
+	assert elapsed < 1.0
+	assert render_chart(df, size=(800, 450), candles=120, title='KRW-BTC') == render_chart(df, size=(800, 450), candles=120, title='KRW-BTC')
+
+def test_render_jpeg_and_base64():
+	"""JPEG 출력과 base64 문자열"""
+	df = calculate_technical_indicators(make_ohlcv(200))
+	jpeg = render_chart(df, image_format='JPEG', quality=80)
+	assert jpeg[:2] == b"\xff\xd8"
+	encoded = render_chart_base64(df, size=(640, 360))
+	assert base64.b64decode(encoded)[:2] == b"\xff\xd8"
+	assert Image.open(io.BytesIO(base64.b64decode(encoded))).size == (640, 360)
+
+def test_nan_overlays_and_lowercase_columns():
+	"""지표 초기 NaN 구간과 pyupbit 원본(소문자, 지표 없음) 모두 렌더링"""
+	raw = make_ohlcv(40).rename(columns=str.lower)
+	assert render_chart_image(raw, candles=40).size
+	df = calculate_technical_indicators(make_ohlcv(40))
+	assert render_chart_image(df, candles=40).size
+
+def test_empty_returns_none():
+	assert render_chart_base64(None) is None
+	assert render_chart_base64(make_ohlcv(40).iloc[:0]) is None
+
+if __name__ == "__main__":
+	test_render_png_fixed_size()
+	test_render_jpeg_and_base64()
+	test_nan_overlays_and_lowercase_columns()
+	test_empty_returns_none()
+	print("🎉 차트 렌더링 테스트 완료!")
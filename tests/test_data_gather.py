@@ -0,0 +1,57 @@
+"""
+데이터 병렬 수집 테스트
+"""
+
+import sys
+import os
+import time
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가 (tests/의 부모 경로)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.data_gather import gather_sources
+
+def _slow(value, delay):
+	time.sleep(delay)
+	return value
+
+def _fail():
+	raise RuntimeError("소스 오류")
+
+def test_gather_runs_sources_concurrently():
+	"""병렬 수집 지연이 합이 아닌 최댓값 수준인지 확인"""
+	sources = {
+		'a': (_slow, (1, 0.3)),
+		'b': (_slow, (2, 0.3)),
+		'c': (_slow, (3, 0.3)),
+	}
+	result = gather_sources(sources, timeouts={'a': 5, 'b': 5, 'c': 5})
+
+	print(f"⏱️ 총 지연: {result.total_latency:.2f}초, 소스별: {result.latencies()}")
+	assert result.get('a') == 1 and result.get('b') == 2 and result.get('c') == 3
+	assert result.total_latency < 0.8
+	assert all(source.status == 'ok' for source in result.sources.values())
+
+def test_gather_partial_results_on_timeout_and_error():
+	"""타임아웃/오류 소스는 None으로 처리되고 나머지는 정상 반환"""
+	sources = {
+		'fast': (_slow, ('ok', 0.01)),
+		'slow': (_slow, ('late', 2.0)),
+		'broken': (_fail, ()),
+	}
+	started = time.perf_counter()
+	result = gather_sources(sources, timeouts={'fast': 1, 'slow': 0.2, 'broken': 1})
+	elapsed = time.perf_counter() - started
+
+	assert elapsed < 1.0
+	assert result.get('fast') == 'ok'
+	assert result.get('slow') is None
+	assert result.sources['slow'].status == 'timeout'
+	assert result.sources['broken'].status == 'error'
+	assert set(result.failed()) == {'slow', 'broken'}
+	assert list(result.sources) == ['fast', 'slow', 'broken']
+
+if __name__ == "__main__":
+	test_gather_runs_sources_concurrently()
+	test_gather_partial_results_on_timeout_and_error()
+	print("🎉 데이터 병렬 수집 테스트 완료!")
@@ -0,0 +1,102 @@
+"""
+MySQL 연결 풀 테스트
+가짜 연결 객체로 빌리기/반환, 대기/타임아웃, 유휴 연결 재생성, 상태 확인을 검증합니다.
+"""
+
+import sys
+import os
+import time
+import threading
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가 (tests/의 부모 경로)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mysql.connector import Error
+from database.connection import ConnectionPool, PooledConnection
+
+class FakeConnection:
+	"""mysql.connector 연결 대체"""
+	count = 0
+
+	def __init__(self):
+		FakeConnection.count += 1
+		self.id = FakeConnection.count
+		self.connected = True
+		self.in_transaction = False
+		self.rollbacks = 0
+
+	def is_connected(self):
+		return self.connected
+
+	def rollback(self):
+		self.rollbacks += 1
+		self.in_transaction = False
+
+	def close(self):
+		self.connected = False
+
+def test_reuse_and_metrics():
+	"""반환된 연결을 재사용하고 크기 지표가 맞는지 확인"""
+	pool = ConnectionPool(size=2, factory=FakeConnection)
+	with pool.connection() as first:
+		assert pool.metrics()['in_use'] == 1
+	with pool.connection() as second:
+		assert second is first
+	assert pool.stats['created'] == 1
+	metrics = pool.metrics()
+	assert metrics['open'] == 1 and metrics['idle'] == 1 and metrics['in_use'] == 0
+
+def test_wait_and_timeout():
+	"""풀이 가득 차면 반환될 때까지 대기하고, 시간 초과 시 PoolError"""
+	pool = ConnectionPool(size=1, checkout_timeout=0.1, factory=FakeConnection)
+	held = pool.acquire()
+	try:
+		pool.acquire()
+		assert False, "PoolError가 발생해야 함"
+	except Error:
+		pass
+	assert pool.stats['timeouts'] == 1
+
+	threading.Timer(0.05, pool.release, args=(held,)).start()
+	with pool.connection(timeout=2) as connection:
+		assert connection is held
+	assert pool.stats['waits'] >= 1
+
+def test_recycle_and_health_check():
+	"""오래 유휴였던 연결은 재생성하고, 끊긴 연결은 폐기"""
+	pool = ConnectionPool(size=2, max_idle=0.05, ping_interval=0, factory=FakeConnection)
+	with pool.connection() as old:
+		pass
+	time.sleep(0.1)
+	with pool.connection() as fresh:
+		assert fresh is not old
+	assert not old.connected
+	assert pool.stats['recycled'] == 1
+
+	pool.max_idle = 60
+	fresh.connected = False  # 서버 측 연결 종료
+	with pool.connection() as replacement:
+		assert replacement is not fresh
+	assert pool.stats['health_failures'] >= 1
+	assert pool.metrics()['open'] == 1
+
+def test_rollback_and_legacy_close():
+	"""반환 시 열린 트랜잭션 롤백, 기존 get_db_connection().close()는 풀 반환"""
+	pool = ConnectionPool(size=1, factory=FakeConnection)
+	with pool.connection() as connection:
+		connection.in_transaction = True
+	assert connection.rollbacks == 1
+
+	wrapped = PooledConnection(pool, pool.acquire())
+	assert wrapped.is_connected()
+	wrapped.close()
+	wrapped.close()  # 중복 close는 무시
+	assert connection.connected
+	assert pool.metrics()['idle'] == 1
+
+if __name__ == "__main__":
+	test_reuse_and_metrics()
+	test_wait_and_timeout()
+	test_recycle_and_health_check()
+	test_rollback_and_legacy_close()
+	print("🎉 DB 연결 풀 테스트 완료!")
@@ -0,0 +1,145 @@
+"""
+LLM 응답 캐시 테스트
+양자화 특징 키, 차트 지각 해시, TTL/LRU, 파일 저장, 적중률을 검증합니다.
+"""
+
+import sys
+import os
+import copy
+import tempfile
+from PIL import Image, ImageDraw
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가 (tests/의 부모 경로)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import json
+import analysis.ai_analysis as ai_analysis
+import analysis.decision_cache as decision_cache
+from analysis.decision_cache import DecisionCache, market_fingerprint, image_dhash
+from analysis.ollama_client import GenerateResult
+import analysis.model_router as model_router
+from analysis.model_router import ModelRouter
+
+class FakeClock:
+	def __init__(self):
+		self.now = 1_760_000_000.0
+
+	def __call__(self):
+		return self.now
+
+MARKET_DATA = {
+	'current_price': 140_000_000,
+	'technical_indicators': {
+		'daily_indicators': {'rsi': 61.2, 'stoch_k': 72.0, 'bb_position': 0.64, 'macd': 1_200_000, 'macd_signal': 1_100_000},
+		'minute_indicators': {'rsi': 48.0, 'bb_position': 0.41},
+	},
+	'fear_greed_index': {'current_value': 71},
+	'news_analysis': {'average_sentiment': 0.3},
+}
+
+def test_fingerprint_quantization():
+	"""구간 안의 작은 변화는 같은 특징, 구간 경계를 넘으면 다른 특징"""
+	base = market_fingerprint(MARKET_DATA)
+	nudged = copy.deepcopy(MARKET_DATA)
+	nudged['current_price'] = 140_100_000
+	nudged['technical_indicators']['daily_indicators']['rsi'] = 63.9
+	assert market_fingerprint(nudged) == base
+
+	moved = copy.deepcopy(MARKET_DATA)
+	moved['technical_indicators']['daily_indicators']['rsi'] = 66.0
+	assert market_fingerprint(moved) != base
+	assert market_fingerprint({'current_price': 1}) == {'rsi_d': None, 'rsi_m': None, 'stoch_d': None,
+														'bb_d': None, 'bb_m': None, 'price': 0.0}
+
+def make_chart(label: str, trend: int) -> Image.Image:
+	image = Image.new('RGB', (320, 180), (255, 255, 255))
+	draw = ImageDraw.Draw(image)
+	points = [(x, 150 - x * trend // 4 % 120) for x in range(0, 320, 8)]
+	draw.line(points, fill=(200, 55, 55), width=6)
+	draw.rectangle([0, 150, 320, 180], fill=(40, 90, 200))
+	draw.text((5, 5), label, fill=(60, 60, 60))
+	return image
+
+def test_image_dhash():
+	"""라벨만 다른 차트는 같은 해시, 모양이 다르면 다른 해시"""
+	first = image_dhash(make_chart('10:00', 1))
+	assert first == image_dhash(make_chart('10:10', 1))
+	assert first != image_dhash(make_chart('10:00', 3))
+	assert len(first) == 16
+	assert image_dhash("not-an-image") is None
+
+def test_ttl_lru_and_hit_rate():
+	"""TTL 만료, LRU 제거, 적중 시 모델 호출 생략"""
+	clock = FakeClock()
+	cache = DecisionCache(path=None, ttl=600, max_entries=2, clock=clock)
+	calls = []
+
+	def compute():
+		calls.append(1)
+		return f"응답 {len(calls)}"
+
+	fingerprint = market_fingerprint(MARKET_DATA)
+	assert cache.get_or_compute('indicators', 'm', fingerprint, compute) == "응답 1"
+	assert cache.get_or_compute('indicators', 'm', fingerprint, compute) == "응답 1"
+	assert len(calls) == 1 and cache.hit_rate == 0.5
+
+	clock.now += 601
+	assert cache.get_or_compute('indicators', 'm', fingerprint, compute) == "응답 2"
+	assert cache.stats['expired'] == 1
+
+	cache.get_or_compute('vision', 'm', {'chart': 'a'}, compute)
+	cache.get_or_compute('vision', 'm', {'chart': 'b'}, compute)
+	assert cache.stats['evictions'] == 1
+	assert cache.get_or_compute('indicators', 'm', fingerprint, compute) == "응답 5"
+
+	assert cache.get_or_compute('sentiment', 'm', {}, lambda: "") == ""
+	assert cache.metrics()['size'] == 2
+
+def test_persisted_between_instances():
+	"""파일에 저장된 응답은 새 인스턴스에서도 사용 (만료분 제외)"""
+	clock = FakeClock()
+	with tempfile.TemporaryDirectory() as directory:
+		path = os.path.join(directory, 'llm.json')
+		first = DecisionCache(path=path, ttl=600, clock=clock)
+		first.get_or_compute('indicators', 'm', {'k': 1}, lambda: "저장된 응답")
+		clock.now += 300
+		second = DecisionCache(path=path, ttl=600, clock=clock)
+		assert second.get_or_compute('indicators', 'm', {'k': 1}, lambda: "새 응답") == "저장된 응답"
+		clock.now += 301
+		assert DecisionCache(path=path, ttl=600, clock=clock).metrics()['size'] == 0
+
+def test_fallback_answer_not_cached(monkeypatch):
+	"""라우터가 대체 모델로 응답한 결정은 저장하지 않고, 라우터 1순위 후보(OLLAMA_MODEL과 달라도) 응답만 재사용"""
+	primary, fallback = 'custom-text:3b', 'qwen2.5:7b-instruct-q4_K_M'
+	answers = [fallback, primary, fallback]
+	calls = []
+
+	def fake_call(prompt, on_result=None, **kwargs):
+		model = answers[len(calls)]
+		calls.append(model)
+		text = json.dumps({
+			"decision": "buy", "reason": model, "confidence": 0.7, "risk_level": "medium",
+			"expected_price_range": {"min": 139_000_000, "max": 141_000_000},
+			"key_indicators": {"rsi_signal": "neutral", "macd_signal": "bullish", "bb_signal": "middle",
+							   "trend_strength": "moderate", "market_sentiment": "greed", "news_sentiment": "neutral"},
+		})
+		on_result(GenerateResult(text=text, model=model))
+		return text
+
+	monkeypatch.setattr(ai_analysis, 'call_ollama_api', fake_call)
+	monkeypatch.setattr(model_router, '_router', ModelRouter({'text': [primary, fallback], 'vision': []}))
+	monkeypatch.setattr(decision_cache, 'LLM_CACHE_ENABLED', True)
+	monkeypatch.setattr(decision_cache, '_cache', DecisionCache(path=None, clock=FakeClock()))
+
+	assert ai_analysis.request_text_decision(MARKET_DATA)['reason'] == answers[0]
+	assert decision_cache.get_decision_cache().metrics()['size'] == 0
+	assert ai_analysis.request_text_decision(MARKET_DATA)['reason'] == primary
+	assert ai_analysis.request_text_decision(MARKET_DATA)['reason'] == primary
+	assert len(calls) == 2
+
+if __name__ == "__main__":
+	test_fingerprint_quantization()
+	test_image_dhash()
+	test_ttl_lru_and_hit_rate()
+	test_persisted_between_instances()
+	print("🎉 LLM 응답 캐시 테스트 완료!")
@@ -0,0 +1,264 @@
+"""
+주문 실행 알고리즘 테스트
+로컬 모의 거래소(호가 소진/재충전, 지정가 대기 체결, 취소)와 가짜 시계로
+호가 잔량 내 시장가 분할, 지정가 대기 후 시장가 전환, TWAP 조각 간격, 도착가 대비 슬리피지를 검증합니다.
+"""
+
+import sys
+import os
+import logging
+import uuid as uuid_lib
+from itertools import zip_longest
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가 (tests/의 부모 경로)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+import core.trading_cycle as trading_cycle
+import trading.execution as execution
+from trading.execution_algos import ExecutionAlgorithm, depth_within, slippage_bps, BID, ASK
+
+SYMBOL = "KRW-BTC"
+ASKS = [(100_000_000, 0.001), (100_100_000, 1.0), (100_200_000, 1.0)]
+BIDS = [(99_900_000, 1.0), (99_800_000, 1.0)]
+FEE_RATE = 0.0005
+
+class SimulatedExchange:
+	"""
+	단일 마켓 모의 거래소
+
+	시장가 주문은 호가를 소진하며 체결되고, 시간이 지나면(advance) 호가가 원래대로 채워집니다.
+	지정가 주문은 초당 passive_fill_rate 비율만큼 주문 가격으로 체결됩니다.
+	"""
+
+	def __init__(self, passive_fill_rate=0.0):
+		self.passive_fill_rate = passive_fill_rate
+		self.now = 0.0
+		self.orders = {}
+		self.log = []  # (시각, 주문 유형, 방향)
+		self.refill()
+
+	def refill(self):
+		self.asks = [list(level) for level in ASKS]
+		self.bids = [list(level) for level in BIDS]
+
+	def advance(self, seconds):
+		self.now += seconds
+		self.refill()
+		for order in self.orders.values():
+			if order['state'] == 'wait':
+				remaining = order['volume'] - order['executed']
+				volume = min(remaining, order['volume'] * self.passive_fill_rate * seconds)
+				if volume > 0:
+					self._trade(order, order['price'], volume)
+				if order['volume'] - order['executed'] <= 1e-12:
+					order['state'] = 'done'
+
+	def _new_order(self, side, ord_type, price=0.0, volume=0.0):
+		order = {'uuid': str(uuid_lib.uuid4()), 'side': side, 'ord_type': ord_type, 'price': price,
+				 'volume': volume, 'executed': 0.0, 'fee': 0.0, 'trades': [], 'state': 'wait'}
+		self.orders[order['uuid']] = order
+		self.log.append((self.now, ord_type, side))
+		return order
+
+	def _trade(self, order, price, volume):
+		order['executed'] += volume
+		order['fee'] += price * volume * FEE_RATE
+		order['trades'].append({'price': str(price), 'volume': str(volume), 'funds': str(price * volume)})
+
+	def _sweep(self, order, levels, funds=None, volume=None):
+		"""호가를 앞에서부터 소진 (매수는 금액, 매도는 수량 기준)"""
+		for level in levels:
+			price, size = level
+			if size <= 0:
+				continue
+			take = min(size, funds / price) if funds is not None else min(size, volume)
+			self._trade(order, price, take)
+			level[1] -= take
+			if funds is not None:
+				funds -= take * price
+				if funds <= 1e-6:
+					break
+			else:
+				volume -= take
+				if volume <= 1e-12:
+					break
+		order['state'] = 'done'
+
+	def get_orderbook(self, ticker):
+		"""업비트 호가 형식 (잔량이 남은 레벨만)"""
+		asks = [level for level in self.asks if level[1] > 0]
+		bids = [level for level in self.bids if level[1] > 0]
+		units = [{'ask_price': ask[0], 'ask_size': ask[1], 'bid_price': bid[0], 'bid_size': bid[1]}
+				 for ask, bid in zip_longest(asks, bids, fillvalue=(0, 0))]
+		return {'market': ticker, 'orderbook_units': units}
+
+	def buy_market_order(self, ticker, price):
+		order = self._new_order(BID, 'price')
+		self._sweep(order, self.asks, funds=float(price))
+		return {'uuid': order['uuid']}
+
+	def sell_market_order(self, ticker, volume):
+		order = self._new_order(ASK, 'market')
+		self._sweep(order, self.bids, volume=float(volume))
+		return {'uuid': order['uuid']}
+
+	def buy_limit_order(self, ticker, price, volume):
+		return {'uuid': self._new_order(BID, 'limit', float(price), float(volume))['uuid']}
+
+	def sell_limit_order(self, ticker, price, volume):
+		return {'uuid': self._new_order(ASK, 'limit', float(price), float(volume))['uuid']}
+
+	def cancel_order(self, uuid):
+		order = self.orders[uuid]
+		if order['state'] == 'wait':
+			order['state'] = 'cancel'
+		return {'uuid': uuid}
+
+	def get_order(self, uuid):
+		order = self.orders[uuid]
+		return {'uuid': uuid, 'side': order['side'], 'state': order['state'], 'price': str(order['price']),
+				'executed_volume': str(order['executed']), 'paid_fee': str(order['fee']), 'trades': list(order['trades'])}
+
+	def sleep(self, seconds):
+		self.advance(seconds)
+
+	def clock(self):
+		return self.now
+
+class FailingCancelExchange(SimulatedExchange):
+	"""취소 API가 실패(None)하여 지정가 주문이 계속 대기하는 거래소"""
+
+	def __init__(self, passive_fill_rate=0.0):
+		super().__init__(passive_fill_rate)
+		self.cancel_requests = []
+
+	def cancel_order(self, uuid):
+		self.cancel_requests.append(uuid)
+		return None
+
+class LateCancelExchange(SimulatedExchange):
+	"""취소 요청이 delay초 뒤에 반영되는 거래소 (그 사이에도 지정가 체결 진행)"""
+
+	def __init__(self, passive_fill_rate=0.0, delay=0.0):
+		super().__init__(passive_fill_rate)
+		self.delay = delay
+		self.cancel_at = {}
+
+	def cancel_order(self, uuid):
+		self.cancel_at.setdefault(uuid, self.now + self.delay)
+		return {'uuid': uuid}
+
+	def advance(self, seconds):
+		super().advance(seconds)
+		for uuid, at in self.cancel_at.items():
+			if self.now >= at and self.orders[uuid]['state'] == 'wait':
+				self.orders[uuid]['state'] = 'cancel'
+
+def make_algorithm(exchange, **kwargs):
+	return ExecutionAlgorithm(exchange, SYMBOL, min_order=5000, sleep=exchange.sleep, clock=exchange.clock, **kwargs)
+
+def test_depth_and_slippage():
+	"""최우선 호가 대비 범위 안의 잔량과 슬리피지 부호"""
+	orderbook = SimulatedExchange().get_orderbook(SYMBOL)
+	assert depth_within(orderbook, BID, 5) == (0.001, 100_000.0)
+	volume, _ = depth_within(orderbook, BID, 10)
+	assert abs(volume - 1.001) < 1e-12
+	assert depth_within(orderbook, ASK, 10)[0] == 1.0 and depth_within(orderbook, ASK, 20)[0] == 2.0
+	assert slippage_bps(BID, 100.0, 101.0) == 100.0
+	assert slippage_bps(ASK, 100.0, 101.0) == -100.0
+
+def test_market_does_not_walk_book():
+	"""호가 잔량 안에서만 나눠 주문하면 한 번에 호가를 훑는 주문보다 평균 체결가가 유리"""
+	exchange = SimulatedExchange()
+	report = make_algorithm(exchange, max_impact_bps=5, refill_wait=1.0).execute(BID, 300_000, 'market')
+	assert len(report.fills) == 3
+	assert report.avg_price == 100_000_000 and abs(report.funds - 300_000) < 1e-6
+	assert abs(report.slippage_bps - slippage_bps(BID, 99_950_000, 100_000_000)) < 1e-9  # 반 스프레드만 부담
+
+	one_shot = make_algorithm(SimulatedExchange(), max_children=1).execute(BID, 300_000, 'market')
+	assert len(one_shot.fills) == 1 and one_shot.avg_price > report.avg_price
+	assert one_shot.slippage_bps > report.slippage_bps
+
+def test_passive_timeout_then_cross():
+	"""최우선 매도호가 지정가로 일부 체결 후 시간 초과 시 취소하고 남은 수량은 시장가"""
+	exchange = SimulatedExchange(passive_fill_rate=0.05)
+	report = make_algorithm(exchange, passive_timeout=4, max_impact_bps=5).execute(ASK, 0.01, 'passive')
+	passive, *crossed = report.fills
+	assert passive.avg_price == 100_000_000 and 0 < passive.executed_volume < 0.01
+	assert exchange.orders[passive.uuid]['state'] == 'cancel'
+	assert crossed and all(fill.avg_price == 99_900_000 for fill in crossed)
+	assert abs(report.executed_volume - 0.01) < 1e-8
+	# 지정가 체결분만큼 전량 시장가(반 스프레드 +5bp)보다 슬리피지가 작음
+	assert report.slippage_bps < slippage_bps(ASK, 99_950_000, 99_900_000)
+	assert [entry[1] for entry in exchange.log] == ['limit'] + ['market'] * len(crossed)
+
+def test_failed_cancel_does_not_cross():
+	"""취소가 끝내 확인되지 않으면 재시도 후 시장가 없이 중단하고 대기 중인 주문을 보고 (과다 체결 없음)"""
+	exchange = FailingCancelExchange(passive_fill_rate=0.05)
+	report = make_algorithm(exchange, passive_timeout=4, cancel_timeout=1, cancel_retries=3).execute(ASK, 0.01, 'passive')
+	uuid = report.fills[0].uuid
+	assert len(exchange.cancel_requests) == 3 and report.live_order_ids == [uuid]
+	assert [entry[1] for entry in exchange.log] == ['limit']
+	assert report.executed_volume < 0.01
+	assert report.as_fill().state == 'wait' and report.as_fill().timed_out
+	result = execution.apply_execution_report({'status': 'executed', 'success': True}, report)
+	assert result['status'] == 'pending' and result['live_order_ids'] == [uuid]
+
+	twap_exchange = FailingCancelExchange(passive_fill_rate=0.01)
+	twap = make_algorithm(twap_exchange, cancel_timeout=1, cancel_retries=2).execute(BID, 400_000, 'twap', slices=4, interval=10)
+	assert [entry[1] for entry in twap_exchange.log] == ['limit'] and len(twap.live_order_ids) == 1
+
+def test_late_cancel_waits_before_cross():
+	"""취소 반영이 늦어도 종료 상태를 확인한 뒤 남은 수량만 시장가 (총 체결량 = 목표 수량)"""
+	exchange = LateCancelExchange(passive_fill_rate=0.05, delay=2.5)
+	report = make_algorithm(exchange, passive_timeout=4, cancel_timeout=1, max_impact_bps=5).execute(ASK, 0.01, 'passive')
+	passive, *crossed = report.fills
+	assert exchange.orders[passive.uuid]['state'] == 'cancel' and not report.live_order_ids
+	assert crossed and abs(report.executed_volume - 0.01) < 1e-8
+
+def test_twap_slices_on_schedule():
+	"""TWAP은 조각 간격마다 최우선 매수호가 지정가 주문, 모두 체결되면 시장가 없음"""
+	exchange = SimulatedExchange(passive_fill_rate=100)
+	report = make_algorithm(exchange).execute(BID, 400_000, 'twap', slices=4, interval=10)
+	assert [entry[1] for entry in exchange.log] == ['limit'] * 4
+	times = [entry[0] for entry in exchange.log]
+	assert all(abs((later - earlier) - 10) < 1e-9 for earlier, later in zip(times, times[1:]))
+	assert report.avg_price == 99_900_000 and report.slippage_bps < 0
+	assert abs(report.funds - 400_000) < 1000  # 수량은 1e-8 단위 내림
+
+def test_execution_records_slippage(monkeypatch):
+	"""매도 실행 결과에 실행 알고리즘, 주문 목록, 도착가 대비 슬리피지 기록"""
+	exchange = SimulatedExchange(passive_fill_rate=0.05)
+
+	def run(upbit, symbol, side, amount, arrival_price=None, algorithm='market'):
+		return make_algorithm(upbit, passive_timeout=4).execute(side, amount, algorithm, arrival_price=arrival_price)
+
+	monkeypatch.setattr(execution, 'execute_order', run)
+	monkeypatch.setattr(execution, 'save_trade_record', lambda *args: True)
+	status = {'krw_balance': 0.0, 'btc_balance': 0.01, 'current_price': 99_950_000}
+	result = execution.execute_trading_decision(exchange, {'decision': 'sell'}, status, algorithm='passive')
+	assert result['success'] and result['algorithm'] == 'passive'
+	assert len(result['order_ids']) >= 2 and result['order_id'] == result['order_ids'][0]
+	assert abs(result['amount'] - 0.0095) < 1e-8
+	assert result['arrival_price'] == 99_950_000 and result['slippage_bps'] < 5
+
+def test_stop_loss_uses_market(monkeypatch):
+	"""손절매 매도는 실행 알고리즘 설정(passive/twap)과 무관하게 바로 체결되는 market"""
+	calls = []
+	monkeypatch.setattr(trading_cycle, 'get_total_profit_loss', lambda upbit, symbol: {
+		'current_price': 90_000_000, 'btc_balance': 0.01, 'btc_avg_price': 100_000_000, 'krw_balance': 0.0})
+	monkeypatch.setattr(trading_cycle, 'should_execute_stop_loss', lambda *args: True)
+	monkeypatch.setattr(trading_cycle, 'execute_trading_decision', lambda *args, **kwargs: calls.append(kwargs))
+	minute_df = pd.DataFrame({'High': [100_000_000.0] * 10})
+	trading_cycle.check_and_execute_stop_loss(None, logging.getLogger("test"), minute_df, 90_000_000, {}, {}, {'decision': 'hold'})
+	assert calls and calls[0]['algorithm'] == 'market'
+
+if __name__ == "__main__":
+	test_depth_and_slippage()
+	test_market_does_not_walk_book()
+	test_passive_timeout_then_cross()
+	test_failed_cancel_does_not_cross()
+	test_late_cancel_waits_before_cross()
+	test_twap_slices_on_schedule()
+	print("🎉 주문 실행 알고리즘 테스트 완료!")
@@ -0,0 +1,76 @@
+"""
+이미지 처리 테스트
+메모리 인코딩(리사이즈 1회, JPEG 품질 이진 탐색, base64 1회)과 백그라운드 보관/보관 한도를 검증합니다.
+"""
+
+import sys
+import os
+import io
+import time
+import base64
+import tempfile
+import numpy as np
+from PIL import Image
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가 (tests/의 부모 경로)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data.image_pipeline import encode_for_vision, ImageArchiver
+
+def make_png(width=2400, height=1350, seed=0):
+	"""압축이 잘 안 되는 노이즈 PNG"""
+	pixels = np.random.default_rng(seed).integers(0, 256, size=(height, width, 3), dtype=np.uint8)
+	buffer = io.BytesIO()
+	Image.fromarray(pixels).save(buffer, format='PNG')
+	return buffer.getvalue()
+
+def test_resize_and_quality_search():
+	"""긴 변 축소 후 크기 상한 안에서 가장 높은 품질 선택"""
+	png = make_png()
+	encoded = encode_for_vision(png, max_size_mb=0.5, max_dimension=1200, max_quality=90, min_quality=20)
+	assert (encoded.width, encoded.height) == (1200, 675)
+	assert encoded.size_mb <= 0.5
+	assert encoded.data[:2] == b"\xff\xd8"
+	# 한 단계 높은 품질은 상한 초과 (가능한 최고 품질 선택)
+	resized = Image.open(io.BytesIO(png)).convert('RGB').resize((1200, 675), Image.Resampling.LANCZOS)
+	buffer = io.BytesIO()
+	resized.save(buffer, format='JPEG', quality=encoded.quality + 1, optimize=True)
+	assert len(buffer.getvalue()) > 0.5 * 1024 * 1024
+	assert encoded.encode_attempts <= 8  # 이진 탐색 (선형 탐색은 최대 35회)
+
+def test_small_image_single_encode():
+	"""상한 안이면 최고 품질로 한 번만 인코딩, base64는 캐시"""
+	encoded = encode_for_vision(Image.new('RGB', (640, 360), (255, 255, 255)), max_quality=85)
+	assert encoded.quality == 85 and encoded.encode_attempts == 1
+	assert encoded.base64 is encoded.base64
+	assert base64.b64decode(encoded.base64) == encoded.data
+
+def test_min_quality_when_unreachable():
+	"""최저 품질로도 상한을 넘으면 최저 품질 결과 사용"""
+	encoded = encode_for_vision(make_png(800, 600), max_size_mb=0.001, min_quality=20)
+	assert encoded.quality == 20
+
+def test_archiver_retention():
+	"""백그라운드 기록 후 최대 개수 초과분 삭제"""
+	with tempfile.TemporaryDirectory() as directory:
+		archiver = ImageArchiver(directory=directory, max_files=3, max_age_days=7, prefix='chart')
+		paths = []
+		for i in range(5):
+			paths.append(archiver.archive(bytes([i]) * 10, 'jpg'))
+			time.sleep(0.01)
+		assert archiver.flush(5)
+		remaining = sorted(os.listdir(directory))
+		assert len(remaining) == 3
+		assert os.path.basename(paths[-1]) in remaining
+		assert archiver.stats['archived'] == 5 and archiver.stats['pruned'] == 2
+
+		old = os.path.join(directory, remaining[0])
+		os.utime(old, (time.time() - 8 * 86400, time.time() - 8 * 86400))
+		assert archiver.prune() == 1
+
+if __name__ == "__main__":
+	test_resize_and_quality_search()
+	test_small_image_single_encode()
+	test_min_quality_when_unreachable()
+	test_archiver_retention()
+	print("🎉 이미지 처리 테스트 완료!")
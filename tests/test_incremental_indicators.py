@@ -0,0 +1,85 @@
+"""
+증분 기술적 지표 엔진 테스트
+ta 전체 계산(calculate_technical_indicators_ta)과 결과를 비교합니다.
+"""
+
+import sys
+import os
+import numpy as np
+import pandas as pd
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가 (tests/의 부모 경로)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from analysis.technical_indicators import calculate_technical_indicators_ta as calculate_technical_indicators
+from analysis.incremental_indicators import IncrementalIndicatorEngine, INDICATOR_COLUMNS
+
+def make_ohlcv(rows: int, seed: int = 0) -> pd.DataFrame:
+	"""pyupbit 형식의 테스트용 분봉 데이터 생성"""
+	rng = np.random.default_rng(seed)
+	close = 1.4e8 + np.cumsum(rng.normal(0, 2e5, rows))
+	volume = rng.random(rows) * 10
+	return pd.DataFrame({
+		'open': close + rng.normal(0, 1e5, rows),
+		'high': close + rng.random(rows) * 3e5,
+		'low': close - rng.random(rows) * 3e5,
+		'close': close,
+		'volume': volume,
+		'value': volume * close,
+	}, index=pd.date_range('2025-08-01', periods=rows, freq='min'))
+
+def assert_same_indicators(result: pd.DataFrame, expected: pd.DataFrame, tail: int = None):
+	"""지표 컬럼 비교 (rolling 합산 순서 차이만 허용)"""
+	assert list(result.columns) == list(expected.columns)
+	for column in INDICATOR_COLUMNS:
+		actual = result[column].to_numpy()
+		wanted = expected[column].to_numpy()
+		if tail:
+			actual, wanted = actual[-tail:], wanted[-tail:]
+		assert np.allclose(actual, wanted, rtol=1e-9, atol=1e-9, equal_nan=True), column
+
+def test_seed_matches_ta():
+	"""초기 계산이 ta 결과와 동일한지 확인"""
+	df = make_ohlcv(1440)
+	engine = IncrementalIndicatorEngine()
+	assert_same_indicators(engine.update(df), calculate_technical_indicators(df))
+
+def test_new_and_forming_candles():
+	"""새 캔들 추가 및 진행 중 캔들 갱신이 전체 재계산과 동일한지 확인"""
+	df = make_ohlcv(1450)
+	engine = IncrementalIndicatorEngine()
+	engine.update(df.iloc[:1440])
+
+	grown = df.iloc[:1443]
+	assert_same_indicators(engine.update(grown), calculate_technical_indicators(grown))
+	assert engine.last_new_rows == 4  # 되감은 진행 중 캔들 + 신규 3개
+
+	forming = grown.copy()
+	forming.iloc[-1, forming.columns.get_loc('close')] += 12345
+	forming.iloc[-1, forming.columns.get_loc('high')] += 20000
+	assert_same_indicators(engine.update(forming), calculate_technical_indicators(forming))
+	assert engine.last_new_rows == 1
+	assert engine.stats['seeds'] == 1
+
+def test_sliding_window_and_reseed():
+	"""조회 구간이 밀려나도 최근 구간은 ta와 동일하고, 이력이 어긋나면 재초기화"""
+	df = make_ohlcv(1500)
+	engine = IncrementalIndicatorEngine()
+	engine.update(df.iloc[:1440])
+
+	sliding = df.iloc[10:1450]
+	result = engine.update(sliding)
+	assert len(result) == len(sliding)
+	assert_same_indicators(result, calculate_technical_indicators(sliding), tail=200)
+	assert engine.stats['seeds'] == 1
+
+	# 과거 구간의 데이터가 바뀐 경우 (연속되지 않은 이력)
+	revised = make_ohlcv(1440, seed=1)
+	assert_same_indicators(engine.update(revised), calculate_technical_indicators(revised))
+	assert engine.stats['seeds'] == 2
+
+if __name__ == "__main__":
+	test_seed_matches_ta()
+	test_new_and_forming_candles()
+	test_sliding_window_and_reseed()
+	print("🎉 증분 기술적 지표 테스트 완료!")
@@ -0,0 +1,57 @@
+"""
+NumPy 지표 커널 테스트
+ta 기반 계산(calculate_technical_indicators_ta)과 결과를 비교합니다.
+"""
+
+import sys
+import os
+import numpy as np
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가 (tests/의 부모 경로)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from analysis.technical_indicators import calculate_technical_indicators, calculate_technical_indicators_ta
+from analysis.indicator_kernel import INDICATOR_COLUMNS, MIN_ROWS, compute_indicator_arrays, linear_recurrence
+from tests.test_incremental_indicators import make_ohlcv
+
+def test_linear_recurrence_matches_loop():
+	"""블록 벡터화 점화식이 단순 루프와 동일한지 확인"""
+	x = np.random.default_rng(0).normal(size=1000)
+	expected = np.empty(len(x))
+	previous = 3.0
+	for t, value in enumerate(x):
+		previous = 0.9 * previous + value
+		expected[t] = previous
+	assert np.allclose(linear_recurrence(x, 0.9, 3.0), expected, rtol=1e-12, atol=1e-12)
+
+def test_kernel_matches_ta():
+	"""일봉(30개)과 분봉(1440개) 길이에서 ta 결과와 동일한지 확인"""
+	for rows in (MIN_ROWS, 30, 1440):
+		df = make_ohlcv(rows, seed=rows)
+		result = calculate_technical_indicators(df)
+		expected = calculate_technical_indicators_ta(df)
+		assert list(result.columns) == list(expected.columns)
+		assert result.index.equals(expected.index)
+		for column in INDICATOR_COLUMNS:
+			assert np.allclose(result[column], expected[column], rtol=1e-8, atol=1e-8, equal_nan=True), (rows, column)
+
+def test_preallocated_output():
+	"""미리 할당한 출력 배열에 기록하고 짧은 입력은 거부하는지 확인"""
+	df = make_ohlcv(200)
+	arrays = [df[name].to_numpy(dtype=np.float64) for name in ('open', 'high', 'low', 'close', 'volume')]
+	out = np.empty((len(INDICATOR_COLUMNS), len(df)))
+	assert compute_indicator_arrays(*arrays, out=out) is out
+	assert np.allclose(out, compute_indicator_arrays(*arrays), equal_nan=True)
+
+	short = [array[:MIN_ROWS - 1] for array in arrays]
+	try:
+		compute_indicator_arrays(*short)
+		assert False, "짧은 입력은 ValueError가 발생해야 함"
+	except ValueError:
+		pass
+
+if __name__ == "__main__":
+	test_linear_recurrence_matches_loop()
+	test_kernel_matches_ta()
+	test_preallocated_output()
+	print("🎉 NumPy 지표 커널 테스트 완료!")
@@ -0,0 +1,117 @@
+"""
+병렬 추론 테스트
+Vision/텍스트 모델 동시 실행 시 총 소요 시간이 max(지연)인지, 마감 시간 초과 작업 취소,
+두 모델 신호 통합을 검증합니다 (모델 호출은 지연 함수로 대체).
+"""
+
+import sys
+import os
+import json
+import time
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가 (tests/의 부모 경로)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import analysis.ai_analysis as ai_analysis
+import analysis.decision_cache as decision_cache
+from analysis.inference import run_with_deadline
+
+decision_cache.LLM_CACHE_ENABLED = False
+ORIGINAL_CALLS = (ai_analysis.call_ollama_vision_api, ai_analysis.call_ollama_api)
+
+MARKET_DATA = {
+	'current_price': 140_000_000,
+	'technical_indicators': {'daily_indicators': {'rsi': 25.0, 'macd': 1.0, 'bb_position': 0.1}},
+	'fear_greed_index': {'value': 40},
+}
+
+def slow(seconds, value, cancelled=None):
+	"""cancel 이벤트를 확인하며 seconds초 뒤 value 반환 (스트리밍 모델 호출 흉내)"""
+	def task(cancel):
+		deadline = time.monotonic() + seconds
+		while time.monotonic() < deadline:
+			if cancel.wait(0.01):
+				if cancelled is not None:
+					cancelled.append(True)
+				return ""
+		return value
+	return task
+
+def test_runs_concurrently_until_deadline():
+	"""총 시간은 가장 느린 작업 기준, 마감 초과 작업은 취소"""
+	cancelled = []
+	started = time.perf_counter()
+	outcomes = run_with_deadline({
+		'a': slow(0.3, "A"),
+		'b': slow(0.3, "B"),
+		'slow': slow(5, "S", cancelled),
+		'broken': lambda cancel: 1 / 0,
+	}, deadline=0.6)
+	elapsed = time.perf_counter() - started
+	assert 0.55 <= elapsed < 1.0
+	assert outcomes['a'].ok and outcomes['a'].value == "A" and outcomes['b'].ok
+	assert outcomes['slow'].timed_out and not outcomes['slow'].ok
+	assert outcomes['broken'].error and not outcomes['broken'].ok
+	time.sleep(0.05)
+	assert cancelled == [True]
+
+def decision_json(decision, confidence, reason):
+	return json.dumps({
+		"decision": decision, "reason": reason, "confidence": confidence, "risk_level": "medium",
+		"expected_price_range": {"min": 139_000_000, "max": 141_000_000},
+		"key_indicators": {"rsi_signal": "oversold", "macd_signal": "bullish", "bb_signal": "lower_band",
+						   "trend_strength": "weak", "market_sentiment": "fear", "news_sentiment": "neutral"},
+	})
+
+def patch_models(vision_seconds, vision_text, text_seconds, text_analysis):
+	def fake_vision(prompt, image_base64, cancel=None, **kwargs):
+		return slow(vision_seconds, vision_text)(cancel)
+	def fake_text(prompt, cancel=None, **kwargs):
+		return slow(text_seconds, text_analysis)(cancel)
+	ai_analysis.call_ollama_vision_api = fake_vision
+	ai_analysis.call_ollama_api = fake_text
+
+def restore_models():
+	ai_analysis.call_ollama_vision_api, ai_analysis.call_ollama_api = ORIGINAL_CALLS
+
+def test_vision_and_text_merged_in_parallel():
+	"""두 모델이 같은 방향이면 신뢰도 상승, 총 시간은 max(지연)"""
+	patch_models(0.4, decision_json("buy", 0.5, "반등"), 0.4, decision_json("buy", 0.6, "Oversold bounce"))
+	try:
+		started = time.perf_counter()
+		decision = ai_analysis.ai_trading_decision_with_vision(MARKET_DATA, "aW1hZ2U=", deadline=5)
+		assert time.perf_counter() - started < 0.75
+	finally:
+		restore_models()
+	assert decision['decision'] == 'buy'
+	assert decision['confidence'] == 1.0  # 높음(0.8) + 과매도 가산
+	assert decision['text_analysis'] == "Oversold bounce"
+
+def test_vision_timeout_uses_text_result():
+	"""Vision이 마감 시간을 넘으면 텍스트 모델 결과만으로 결정"""
+	patch_models(5, decision_json("buy", 0.9, "반등"), 0.1, decision_json("sell", 0.5, "Bearish breakdown"))
+	try:
+		started = time.perf_counter()
+		decision = ai_analysis.ai_trading_decision_with_vision(MARKET_DATA, "aW1hZ2U=", deadline=0.5)
+		assert time.perf_counter() - started < 1.0
+	finally:
+		restore_models()
+	assert decision['decision'] == 'sell'
+
+def test_merge_model_signals():
+	"""반대 신호는 보유(낮음), Vision 보유 + 텍스트 방향은 한 단계 낮은 신뢰도"""
+	vision = {"trading_signal": "매수", "confidence": "높음"}
+	sell = {"trading_signal": "매도", "confidence": "중간"}
+	buy = {"trading_signal": "매수", "confidence": "중간"}
+	assert ai_analysis.merge_model_signals(vision, sell)['trading_signal'] == "보유"
+	assert ai_analysis.merge_model_signals(vision, sell)['confidence'] == "낮음"
+	held = ai_analysis.merge_model_signals({"trading_signal": "보유", "confidence": "중간"}, buy)
+	assert held['trading_signal'] == "매수" and held['confidence'] == "낮음"
+	assert ai_analysis.merge_model_signals(None, None)['trading_signal'] == "보유"
+
+if __name__ == "__main__":
+	test_runs_concurrently_until_deadline()
+	test_vision_and_text_merged_in_parallel()
+	test_vision_timeout_uses_text_result()
+	test_merge_model_signals()
+	print("🎉 병렬 추론 테스트 완료!")
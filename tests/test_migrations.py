@@ -0,0 +1,123 @@
+"""
+스키마 마이그레이션 테스트
+information_schema 조회를 흉내 내는 가짜 커서로 버전 기록, 재실행 시 멱등성, 월 파티션 추가를 검증합니다.
+"""
+
+import sys
+import os
+import re
+from datetime import date
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가 (tests/의 부모 경로)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database.migrations import apply_migrations, ensure_monthly_partitions, monthly_partition_bounds
+
+class FakeSchema:
+	"""테이블/인덱스/파티션 상태"""
+
+	def __init__(self):
+		self.tables = {}  # 이름 -> 인덱스 이름 집합
+		self.partitions = {}  # 테이블 -> 파티션 이름 목록
+		self.versions = []
+		self.statements = []
+
+class FakeCursor:
+	"""마이그레이션에서 쓰는 SQL만 해석하는 커서"""
+
+	def __init__(self, schema):
+		self.schema = schema
+		self.result = []
+
+	def execute(self, sql, params=()):
+		schema = self.schema
+		sql = " ".join(sql.split())
+		schema.statements.append(sql)
+		self.result = []
+		created = re.match(r"CREATE TABLE IF NOT EXISTS (\w+)", sql)
+		if created:
+			schema.tables.setdefault(created.group(1), set())
+		elif sql.startswith("SELECT version FROM schema_migrations"):
+			self.result = [(version,) for version in schema.versions]
+		elif sql.startswith("INSERT INTO schema_migrations"):
+			schema.versions.append(params[0])
+		elif "information_schema.TABLES" in sql:
+			self.result = [(int(params[0] in schema.tables),)]
+		elif "information_schema.COLUMNS" in sql:
+			self.result = [(1,)]
+		elif "information_schema.STATISTICS" in sql:
+			self.result = [(int(params[1] in schema.tables.get(params[0], ())),)]
+		elif "information_schema.PARTITIONS" in sql:
+			self.result = [(name,) for name in schema.partitions.get(params[0], [])]
+		elif sql.startswith("CREATE INDEX"):
+			index, table = re.match(r"CREATE INDEX (\w+) ON (\w+)", sql).groups()
+			schema.tables[table].add(index)
+		elif "PARTITION BY RANGE" in sql or "REORGANIZE PARTITION" in sql:
+			table = re.match(r"ALTER TABLE (\w+)", sql).group(1)
+			names = re.findall(r"PARTITION (\w+) VALUES", sql)
+			current = [name for name in schema.partitions.get(table, []) if name != 'p_future']
+			schema.partitions[table] = current + names
+
+	def fetchone(self):
+		return self.result[0] if self.result else None
+
+	def fetchall(self):
+		return self.result
+
+	def close(self):
+		pass
+
+class FakeConnection:
+	def __init__(self, schema):
+		self.schema = schema
+		self.commits = 0
+
+	def cursor(self):
+		return FakeCursor(self.schema)
+
+	def commit(self):
+		self.commits += 1
+
+def test_monthly_partition_bounds():
+	"""월 경계와 연말 넘김"""
+	bounds = monthly_partition_bounds(date(2025, 11, 17), 3)
+	assert bounds == [('p202511', '2025-12-01'), ('p202512', '2026-01-01'), ('p202601', '2026-02-01')]
+
+def test_apply_migrations_idempotent():
+	"""첫 실행은 모든 버전 적용, 재실행은 아무것도 하지 않고 DROP TABLE 없음"""
+	schema = FakeSchema()
+	connection = FakeConnection(schema)
+	applied = apply_migrations(connection)
+	assert applied == [1, 2, 3, 4, 5, 6]
+	assert 'idx_trades_symbol_action_timestamp' in schema.tables['trades']
+	assert 'idx_trades_action_timestamp' in schema.tables['trades']
+	assert 'idx_system_logs_level_timestamp' in schema.tables['system_logs']
+	assert schema.partitions['market_data'][0] == 'p_archive'
+	assert schema.partitions['market_data'][-1] == 'p_future'
+	assert 'trades' not in schema.partitions  # 외래 키 참조 테이블은 파티션하지 않음
+	assert 'trade_stats_daily' in schema.tables
+	assert any(sql.startswith("CREATE TRIGGER trg_trades_rollup") for sql in schema.statements)
+
+	statements = len(schema.statements)
+	assert apply_migrations(connection) == []
+	reruns = schema.statements[statements:]
+	assert not any(sql.startswith(("ALTER", "CREATE INDEX", "DROP")) for sql in reruns)
+	assert not any("DROP TABLE" in sql for sql in schema.statements)
+
+def test_ensure_monthly_partitions():
+	"""p_future를 나눠 빠진 달만 추가"""
+	schema = FakeSchema()
+	schema.partitions = {
+		'market_data': ['p_archive', 'p202601', 'p_future'],
+		'system_logs': ['p_archive', 'p202601', 'p202602', 'p202603', 'p_future'],
+	}
+	ensure_monthly_partitions(FakeCursor(schema), today=date(2026, 1, 20), months_ahead=2)
+	assert schema.partitions['market_data'] == ['p_archive', 'p202601', 'p202602', 'p202603', 'p_future']
+	assert schema.partitions['system_logs'] == ['p_archive', 'p202601', 'p202602', 'p202603', 'p_future']
+	assert sum("REORGANIZE" in sql for sql in schema.statements) == 1
+
+if __name__ == "__main__":
+	test_monthly_partition_bounds()
+	test_apply_migrations_idempotent()
+	test_ensure_monthly_partitions()
+	print("🎉 스키마 마이그레이션 테스트 완료!")
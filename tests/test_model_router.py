@@ -0,0 +1,151 @@
+"""
+모델 라우터 테스트
+로컬 가짜 Ollama 서버(모델별 지연/오류, /api/ps)로 느린 모델 대체, 로드되지 않은 모델 건너뛰기와
+백그라운드 로드, 오류율에 따른 순서 조정, p50/p95 집계를 검증합니다.
+"""
+
+import sys
+import os
+import json
+import time
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가 (tests/의 부모 경로)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from analysis.ollama_client import OllamaClient, GenerateResult
+from analysis.model_router import ModelRouter
+
+BIG, SMALL = "big:20b", "small:7b-q4"
+
+class FakeOllamaHandler(BaseHTTPRequestHandler):
+	"""모델별 첫 토큰 지연(server.delays)/HTTP 오류(server.failing), /api/ps는 server.loaded"""
+	protocol_version = "HTTP/1.1"
+
+	def log_message(self, format, *args):
+		pass
+
+	def send_json(self, status, body):
+		data = json.dumps(body).encode()
+		self.send_response(status)
+		self.send_header('Content-Type', 'application/json')
+		self.send_header('Content-Length', str(len(data)))
+		self.end_headers()
+		self.wfile.write(data)
+
+	def do_GET(self):
+		self.send_json(200, {"models": [{"name": name, "model": name} for name in self.server.loaded]})
+
+	def do_POST(self):
+		payload = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))))
+		model = payload['model']
+		self.server.requests.append((model, payload.get('stream', True)))
+		if model in self.server.failing:
+			self.send_json(500, {"error": f"{model} failed"})
+			return
+		if not payload.get('stream', True):
+			self.server.loaded.append(model)
+			self.send_json(200, {"model": model, "response": "", "done": True})
+			return
+		time.sleep(self.server.delays.get(model, 0.0))
+		messages = [{"model": model, "response": f"answer from {model}", "done": False},
+					{"model": model, "response": "", "done": True, "eval_count": 1}]
+		try:
+			body = b"".join((json.dumps(message) + "\n").encode() for message in messages)
+			self.send_response(200)
+			self.send_header('Content-Type', 'application/x-ndjson')
+			self.send_header('Content-Length', str(len(body)))
+			self.end_headers()
+			self.wfile.write(body)
+		except (BrokenPipeError, ConnectionResetError):
+			self.close_connection = True
+
+def start_fake_ollama(loaded, delays=None, failing=()):
+	server = ThreadingHTTPServer(('127.0.0.1', 0), FakeOllamaHandler)
+	server.daemon_threads = True
+	server.handle_error = lambda request, client_address: None  # 예산 초과로 끊긴 연결 무시
+	server.loaded = list(loaded)
+	server.delays = delays or {}
+	server.failing = set(failing)
+	server.requests = []
+	threading.Thread(target=server.serve_forever, daemon=True).start()
+	return server
+
+def make_router(server, **kwargs):
+	client = OllamaClient(base_url=f"http://127.0.0.1:{server.server_address[1]}", connect_timeout=2,
+						  read_timeout=5, pool_size=2)
+	options = dict(loaded_check_interval=0, min_attempt_seconds=0.2, cold_load_penalty=60)
+	options.update(kwargs)
+	return ModelRouter({'text': [BIG, SMALL]}, client=client, **options)
+
+def generated_models(server):
+	return [model for model, stream in server.requests if stream]
+
+def test_percentiles_and_error_rate():
+	"""최근 창 기준 p50/p95와 오류율, 외부 취소는 기록하지 않음"""
+	router = ModelRouter({'text': [BIG]}, client=OllamaClient(), window=4)
+	for latency in (9.0, 1.0, 2.0, 3.0, 4.0):
+		router.record(GenerateResult(text="ok", model=BIG, latency=latency))
+	router.record(GenerateResult(text="", model=BIG, latency=0.1, error="cancelled"))
+	router.record(GenerateResult(text="", model=BIG, latency=0.1, error="HTTP 500"))
+	metrics = router.metrics()[BIG]
+	assert metrics['p50'] == 2.0 and metrics['p95'] == 4.0  # 9.0은 창에서 밀려남
+	assert metrics['samples'] == 4 and metrics['error_rate'] == 0.25
+
+def test_fails_over_when_big_model_is_slow():
+	"""큰 모델이 예산을 넘기면 작은 모델로 전환하고, 다음 호출부터는 바로 작은 모델 선택"""
+	server = start_fake_ollama([BIG, SMALL], delays={BIG: 3.0})
+	try:
+		router = make_router(server)
+		started = time.perf_counter()
+		result = router.generate('text', "프롬프트", deadline=1.5)
+		assert time.perf_counter() - started < 1.5
+		assert result.error is None and result.model == SMALL
+		assert result.text == f"answer from {SMALL}"
+		assert router.metrics()[BIG]['p95'] >= 1.2
+
+		assert router.plan('text', deadline=1.0) == [SMALL, BIG]
+		assert router.generate('text', "프롬프트", deadline=1.0).model == SMALL
+		assert generated_models(server) == [BIG, SMALL, SMALL]
+		assert router.plan('text', deadline=30) == [BIG, SMALL]  # 여유가 있으면 선호 모델
+	finally:
+		server.shutdown()
+
+def test_skips_cold_model_and_warms_it():
+	"""메모리에 없는 선호 모델은 건너뛰고 백그라운드에서 로드, 로드 후에는 다시 선호 모델 사용"""
+	server = start_fake_ollama([SMALL])
+	try:
+		router = make_router(server)
+		assert router.generate('text', "프롬프트", deadline=10).model == SMALL
+		deadline = time.time() + 2
+		while BIG not in server.loaded and time.time() < deadline:
+			time.sleep(0.02)
+		assert (BIG, False) in server.requests
+		time.sleep(0.05)
+		assert router.generate('text', "프롬프트", deadline=10).model == BIG
+	finally:
+		server.shutdown()
+
+def test_error_rate_moves_model_back():
+	"""오류가 나면 같은 호출에서 대체 모델로, 오류율이 높아지면 후순위로"""
+	server = start_fake_ollama([BIG, SMALL], failing=[BIG])
+	try:
+		router = make_router(server)
+		result = router.generate('text', "프롬프트", deadline=5)
+		assert result.model == SMALL and result.error is None
+		assert router.metrics()[BIG]['error_rate'] == 1.0
+		assert router.plan('text', deadline=5) == [SMALL, BIG]
+
+		server.failing = {BIG, SMALL}
+		result = router.generate('text', "프롬프트", deadline=5)
+		assert result.error and result.text == ""
+	finally:
+		server.shutdown()
+
+if __name__ == "__main__":
+	test_percentiles_and_error_rate()
+	test_fails_over_when_big_model_is_slow()
+	test_skips_cold_model_and_warms_it()
+	test_error_rate_moves_model_back()
+	print("🎉 모델 라우터 테스트 완료!")
@@ -0,0 +1,138 @@
+"""
+Ollama 클라이언트 테스트
+로컬 가짜 Ollama 서버(NDJSON 스트리밍)로 연결 재사용, keep_alive 전달,
+JSON 완성 시 조기 종료, 처리량 지표, warmup을 검증합니다.
+"""
+
+import sys
+import os
+import json
+import time
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가 (tests/의 부모 경로)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from analysis.ollama_client import OllamaClient, JsonObjectScanner
+
+class FakeOllamaHandler(BaseHTTPRequestHandler):
+	"""/api/generate 스트리밍 응답 (server.tokens를 chunk_delay 간격으로 전송)"""
+	protocol_version = "HTTP/1.1"
+
+	def log_message(self, format, *args):
+		pass
+
+	def do_POST(self):
+		length = int(self.headers.get('Content-Length', 0))
+		payload = json.loads(self.rfile.read(length))
+		self.server.requests.append(payload)
+		self.server.client_ports.append(self.client_address[1])
+
+		if not payload.get('stream', True):
+			body = json.dumps({"model": payload['model'], "response": "", "done": True}).encode()
+			self.send_response(200)
+			self.send_header('Content-Type', 'application/json')
+			self.send_header('Content-Length', str(len(body)))
+			self.end_headers()
+			self.wfile.write(body)
+			return
+
+		self.send_response(200)
+		self.send_header('Content-Type', 'application/x-ndjson')
+		self.send_header('Transfer-Encoding', 'chunked')
+		self.end_headers()
+		messages = [{"model": payload['model'], "response": token, "done": False} for token in self.server.tokens]
+		messages.append({"model": payload['model'], "response": "", "done": True,
+						 "eval_count": len(self.server.tokens), "eval_duration": 500_000_000,
+						 "load_duration": 10_000_000})
+		sent = 0
+		try:
+			for message in messages:
+				line = (json.dumps(message) + "\n").encode()
+				self.wfile.write(f"{len(line):x}\r\n".encode() + line + b"\r\n")
+				self.wfile.flush()
+				sent += 1
+				time.sleep(self.server.chunk_delay)
+			self.wfile.write(b"0\r\n\r\n")
+			self.wfile.flush()
+		except (BrokenPipeError, ConnectionResetError):
+			self.close_connection = True
+		self.server.sent_counts.append(sent)
+
+def start_fake_ollama(tokens, chunk_delay=0.0):
+	server = ThreadingHTTPServer(('127.0.0.1', 0), FakeOllamaHandler)
+	server.daemon_threads = True
+	server.handle_error = lambda request, client_address: None  # 조기 종료로 끊긴 연결 무시
+	server.tokens = tokens
+	server.chunk_delay = chunk_delay
+	server.requests = []
+	server.client_ports = []
+	server.sent_counts = []
+	threading.Thread(target=server.serve_forever, daemon=True).start()
+	return server
+
+def make_client(server):
+	return OllamaClient(base_url=f"http://127.0.0.1:{server.server_address[1]}", keep_alive="45m",
+						connect_timeout=2, read_timeout=5, pool_size=2)
+
+def test_scanner_handles_braces_in_strings():
+	"""문자열 안의 중괄호/이스케이프는 무시하고 첫 완전한 객체 반환"""
+	scanner = JsonObjectScanner()
+	assert scanner.feed('분석 결과: {"reason": "지지선 {하단') is None
+	assert scanner.feed('} \\"돌파\\"", "decision": "buy"') is None
+	assert scanner.feed('} 이후 텍스트') == {"reason": '지지선 {하단} "돌파"', "decision": "buy"}
+
+def test_streams_and_reuses_connection():
+	"""토큰 누적, keep_alive/옵션 전달, 두 번째 호출에서 같은 연결 재사용"""
+	server = start_fake_ollama(["비트", "코인 ", "관망"])
+	try:
+		client = make_client(server)
+		first = client.generate("프롬프트", model="m1", temperature=0.2, max_tokens=50)
+		second = client.generate("프롬프트", model="m1")
+		assert first.text == "비트코인 관망" and first.error is None
+		assert first.eval_count == 3
+		assert abs(first.tokens_per_second - 6.0) < 1e-9  # 3 tokens / 0.5s
+		payload = server.requests[0]
+		assert payload['keep_alive'] == "45m" and payload['stream'] is True
+		assert payload['options'] == {"temperature": 0.2, "num_predict": 50}
+		assert server.client_ports[0] == server.client_ports[1]
+		assert second.text == first.text
+		assert client.metrics()['m1']['calls'] == 2
+	finally:
+		server.shutdown()
+
+def test_stops_when_json_complete():
+	"""JSON 객체가 완성되면 나머지 토큰을 기다리지 않고 종료"""
+	tokens = ['{"decision": ', '"buy", ', '"confidence": 0.8}'] + ["추가 설명 "] * 20
+	server = start_fake_ollama(tokens, chunk_delay=0.05)
+	try:
+		client = make_client(server)
+		result = client.generate("JSON으로 답하세요", model="m2", stop_on_json=True)
+		assert result.parsed == {"decision": "buy", "confidence": 0.8}
+		assert result.stopped_early
+		assert result.latency < 0.5  # 전체 스트림은 1초 이상
+		assert client.metrics()['m2']['early_stops'] == 1
+	finally:
+		server.shutdown()
+
+def test_warmup_and_error():
+	"""warmup은 빈 프롬프트와 keep_alive로 모델별 한 번씩, 연결 실패는 오류 결과"""
+	server = start_fake_ollama([])
+	try:
+		client = make_client(server)
+		assert client.warmup(["m1", "m2", "m1"]) == {"m1": True, "m2": True}
+		assert [(p['model'], p['prompt'], p['keep_alive']) for p in server.requests] == [("m1", "", "45m"), ("m2", "", "45m")]
+	finally:
+		server.shutdown()
+		server.server_close()
+
+	result = make_client(server).generate("프롬프트", model="m3")
+	assert result.text == "" and result.error
+
+if __name__ == "__main__":
+	test_scanner_handles_braces_in_strings()
+	test_streams_and_reuses_connection()
+	test_stops_when_json_complete()
+	test_warmup_and_error()
+	print("🎉 Ollama 클라이언트 테스트 완료!")
@@ -0,0 +1,112 @@
+"""
+주문 체결 추적 테스트
+가짜 업비트 클라이언트로 점증 간격 조회, 실제 평균 체결가/수수료 계산,
+시간 초과 처리, 매매 실행 결과 반영(고정 3초 대기 제거)을 검증합니다.
+"""
+
+import sys
+import os
+import time
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가 (tests/의 부모 경로)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import trading.execution as execution
+from trading.order_tracker import OrderTracker, summarize_order
+
+DONE_ORDER = {
+	'uuid': 'order-1', 'side': 'bid', 'state': 'cancel', 'price': '100000', 'paid_fee': '49.97',
+	'executed_volume': '0.0007', 'trades_count': 2,
+	'trades': [
+		{'price': '142000000', 'volume': '0.0004', 'funds': '56800'},
+		{'price': '143000000', 'volume': '0.0003', 'funds': '42900'},
+	],
+}
+
+class FakeUpbit:
+	"""get_order가 pending_polls번 'wait'를 돌려준 뒤 최종 주문 반환"""
+
+	def __init__(self, final_order, pending_polls=2):
+		self.final_order = final_order
+		self.pending_polls = pending_polls
+		self.calls = 0
+		self.orders = []
+
+	def get_order(self, uuid):
+		self.calls += 1
+		if self.calls == 1:
+			raise ConnectionError("일시적 오류")
+		if self.calls <= self.pending_polls:
+			return {'uuid': uuid, 'state': 'wait', 'executed_volume': '0', 'trades': []}
+		return self.final_order
+
+	def buy_market_order(self, ticker, price):
+		self.orders.append(('buy', ticker, price))
+		return {'uuid': 'order-1', 'side': 'bid', 'state': 'wait'}
+
+	def get_balances(self):
+		raise AssertionError("체결 후 잔고를 다시 조회하면 안 됨")
+
+class FakeClock:
+	def __init__(self):
+		self.now = 0.0
+		self.sleeps = []
+
+	def sleep(self, seconds):
+		self.sleeps.append(round(seconds, 4))
+		self.now += seconds
+
+	def __call__(self):
+		return self.now
+
+def test_summarize_uses_trades():
+	"""평균 체결가는 체결 목록 금액/수량 기준"""
+	fill = summarize_order(DONE_ORDER)
+	assert fill.is_final and fill.filled
+	assert abs(fill.avg_price - 99700 / 0.0007) < 1e-3
+	assert fill.funds == 99700 and fill.paid_fee == 49.97 and fill.trades_count == 2
+
+def test_polls_with_backoff_until_final():
+	"""조회 실패/대기 상태를 거쳐 종료 상태가 될 때까지 간격을 늘리며 조회"""
+	clock = FakeClock()
+	upbit = FakeUpbit(DONE_ORDER, pending_polls=3)
+	fill = OrderTracker(upbit, initial_delay=0.1, max_delay=0.3, backoff=2, timeout=5,
+						sleep=clock.sleep, clock=clock).wait_for_fill('order-1')
+	assert clock.sleeps == [0.1, 0.2, 0.3, 0.3]
+	assert fill.polls == 4 and not fill.timed_out
+	assert fill.executed_volume == 0.0007
+	assert abs(fill.elapsed - 0.9) < 1e-9
+
+def test_times_out_with_last_state():
+	"""timeout까지 종료되지 않으면 마지막 조회 결과와 timed_out 반환"""
+	clock = FakeClock()
+	upbit = FakeUpbit(DONE_ORDER, pending_polls=100)
+	fill = OrderTracker(upbit, initial_delay=0.5, max_delay=1.0, backoff=2, timeout=2,
+						sleep=clock.sleep, clock=clock).wait_for_fill('order-1')
+	assert fill.timed_out and fill.state == 'wait' and not fill.filled
+	assert abs(clock.now - 2.0) < 1e-9
+
+def test_execution_records_actual_fill():
+	"""매수 실행 결과에 실제 체결가/수량/수수료 기록, 고정 대기 없이 종료"""
+	saved = []
+	original_save = execution.save_trade_record
+	execution.save_trade_record = lambda decision, result, status, market_data: saved.append(dict(result))
+	try:
+		upbit = FakeUpbit(DONE_ORDER, pending_polls=2)
+		status = {'krw_balance': 105_000, 'btc_balance': 0.0, 'current_price': 140_000_000}
+		started = time.perf_counter()
+		result = execution.execute_trading_decision(upbit, {'decision': 'buy'}, status)
+		assert time.perf_counter() - started < 1.0
+	finally:
+		execution.save_trade_record = original_save
+	assert result['status'] == 'executed' and result['success']
+	assert result['amount'] == 0.0007 and result['fee'] == 49.97
+	assert abs(result['price'] - 99700 / 0.0007) < 1e-3
+	assert saved[0]['order_id'] == 'order-1' and saved[0]['price'] == result['price']
+
+if __name__ == "__main__":
+	test_summarize_uses_trades()
+	test_polls_with_backoff_until_final()
+	test_times_out_with_last_state()
+	test_execution_records_actual_fill()
+	print("🎉 주문 체결 추적 테스트 완료!")
@@ -0,0 +1,96 @@
+"""
+브라우저 대기 테스트
+조건 충족 시 즉시 진행, 상한 초과 시 제한된 시간 후 진행, 캔버스 재렌더링 감지, 단계별 시간 기록을 검증합니다.
+"""
+
+import sys
+import os
+import time
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가 (tests/의 부모 경로)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from selenium.common.exceptions import NoSuchElementException
+from data.page_waits import WaitTrace, wait_until, wait_visible, wait_canvas_rerendered
+from data.browser_session import configure_chart_page
+
+class FakeElement:
+	def __init__(self, driver, value):
+		self.driver = driver
+		self.value = value
+
+	def is_displayed(self):
+		return True
+
+	def is_enabled(self):
+		return True
+
+	def click(self):
+		self.driver.clicks.append(self.value)
+		self.driver.render_at = time.monotonic() + 0.2  # 클릭 0.2초 후 차트 다시 그림
+
+class FakeDriver:
+	"""지정 시각 이후에 요소가 나타나고, 클릭 후 캔버스가 바뀌는 드라이버"""
+
+	def __init__(self, appear_after=0.0):
+		self.appear_at = time.monotonic() + appear_after
+		self.clicks = []
+		self.render_at = None
+		self.frames = 0
+
+	def find_element(self, by, value):
+		if time.monotonic() < self.appear_at:
+			raise NoSuchElementException(value)
+		return FakeElement(self, value)
+
+	def execute_script(self, script, *args):
+		if self.render_at is not None and time.monotonic() >= self.render_at:
+			self.frames += 1
+			self.render_at = None
+		return f"frame-{self.frames}"
+
+def test_wait_returns_when_ready():
+	"""요소가 나타나면 상한보다 훨씬 빨리 반환"""
+	driver = FakeDriver(appear_after=0.2)
+	started = time.monotonic()
+	assert wait_visible(driver, "//chart", timeout=5) is not None
+	assert time.monotonic() - started < 1.0
+
+def test_wait_bounded_by_timeout():
+	"""조건이 충족되지 않으면 상한 후 None (예외 없음)"""
+	started = time.monotonic()
+	assert wait_until(FakeDriver(), lambda driver: False, timeout=0.3) is None
+	assert 0.3 <= time.monotonic() - started < 1.0
+
+def test_canvas_rerender():
+	"""서명이 바뀌고 안정화되면 완료, 바뀌지 않으면 상한 후 False"""
+	driver = FakeDriver()
+	element = driver.find_element("xpath", "//chart")
+	before = driver.execute_script("")
+	element.click()
+	started = time.monotonic()
+	assert wait_canvas_rerendered(driver, element, before, timeout=3, settle=0.2)
+	assert time.monotonic() - started < 1.5
+
+	assert not wait_canvas_rerendered(driver, element, driver.execute_script(""), timeout=0.4, settle=0.2)
+
+def test_configure_trace():
+	"""차트 설정 단계가 모두 기록되고 고정 대기 없이 끝남"""
+	driver = FakeDriver()
+	trace = WaitTrace()
+	started = time.monotonic()
+	configure_chart_page(driver, trace)
+	names = [step.name for step in trace.steps]
+	assert names == ['timeframe_menu', 'timeframe_1h', 'chart_rerender',
+					 'study_menu', 'bollinger', 'study_legend', 'chart_rerender']
+	assert all(step.ok for step in trace.steps)
+	assert len(driver.clicks) == 4
+	assert time.monotonic() - started < 5
+	assert "합계" in trace.summary()
+
+if __name__ == "__main__":
+	test_wait_returns_when_ready()
+	test_wait_bounded_by_timeout()
+	test_canvas_rerender()
+	test_configure_trace()
+	print("🎉 브라우저 대기 테스트 완료!")
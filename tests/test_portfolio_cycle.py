@@ -0,0 +1,233 @@
+"""
+멀티 심볼 포트폴리오 사이클 테스트
+가짜 업비트 계좌와 가짜 데이터 소스로 신뢰도 비례 현금 배분, 심볼별 결정의 동시 처리,
+매도 선실행 후 매수 배분, 현재가 일괄 조회(티커 API 한 번)를 검증합니다.
+"""
+
+import sys
+import os
+import time
+import logging
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가 (tests/의 부모 경로)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import json
+import threading
+import core.portfolio_cycle as portfolio_cycle
+import core.trading_cycle as trading_cycle
+import analysis.ai_analysis as ai_analysis
+import analysis.decision_cache as decision_cache
+import data.realtime_feed as realtime_feed
+import trading.execution as execution
+from core.portfolio_cycle import allocate_buy_budgets, execute_portfolio_cycle
+from data.upbit_client import UpbitClient
+from utils.cache import get_cache
+
+PRICES = {'KRW-BTC': 150_000_000.0, 'KRW-ETH': 5_000_000.0, 'KRW-XRP': 800.0, 'KRW-SOL': 250_000.0}
+DECISIONS = {
+	'KRW-BTC': {'decision': 'buy', 'confidence': 0.75},
+	'KRW-ETH': {'decision': 'sell', 'confidence': 0.8},
+	'KRW-XRP': {'decision': 'buy', 'confidence': 0.25},
+	'KRW-SOL': {'decision': 'hold', 'confidence': 0.5},
+}
+
+class FakeUpbit:
+	"""잔고/주문을 메모리에서 처리하는 가짜 업비트 계좌 (시장가 주문은 즉시 체결)"""
+
+	def __init__(self):
+		self.balances = {'KRW': 100_000.0, 'ETH': 0.01}
+		self.orders = []
+		self.balance_calls = 0
+
+	def get_balances(self):
+		self.balance_calls += 1
+		return [{'currency': currency, 'balance': str(balance), 'avg_buy_price': '0'}
+				for currency, balance in self.balances.items()]
+
+	def buy_market_order(self, ticker, price):
+		currency = ticker.split('-')[1]
+		self.balances['KRW'] -= price
+		self.balances[currency] = self.balances.get(currency, 0.0) + price / PRICES[ticker]
+		self.orders.append(('buy', ticker, price))
+		return {'uuid': f"buy-{ticker}"}
+
+	def sell_market_order(self, ticker, volume):
+		currency = ticker.split('-')[1]
+		self.balances[currency] -= volume
+		self.balances['KRW'] += volume * PRICES[ticker]
+		self.orders.append(('sell', ticker, volume))
+		return {'uuid': f"sell-{ticker}"}
+
+	def get_order(self, uuid):
+		return {'uuid': uuid, 'state': 'done', 'executed_volume': '0', 'paid_fee': '0', 'trades': []}
+
+def test_allocate_buy_budgets():
+	"""신뢰도 비례 배분, 최소 거래금액 미만 심볼은 제외 후 재배분, 신뢰도가 모두 0이면 균등"""
+	decisions = {
+		'KRW-BTC': {'decision': 'buy', 'confidence': 0.6},
+		'KRW-ETH': {'decision': 'buy', 'confidence': 0.3},
+		'KRW-XRP': {'decision': 'buy', 'confidence': 0.1},
+		'KRW-SOL': {'decision': 'hold', 'confidence': 0.9},
+	}
+	budgets = allocate_buy_budgets(decisions, 100_000, 1.0, 5000)
+	expected = {'KRW-BTC': 60_000, 'KRW-ETH': 30_000, 'KRW-XRP': 10_000}
+	assert set(budgets) == set(expected)
+	assert all(abs(budgets[symbol] - amount) < 1e-6 for symbol, amount in expected.items())
+
+	budgets = allocate_buy_budgets(decisions, 40_000, 1.0, 5000)
+	assert set(budgets) == {'KRW-BTC', 'KRW-ETH'} and abs(sum(budgets.values()) - 40_000) < 1e-6
+
+	zero = {symbol: {'decision': 'buy', 'confidence': 0} for symbol in ('KRW-BTC', 'KRW-ETH')}
+	assert allocate_buy_budgets(zero, 20_000, 0.5, 5000) == {'KRW-BTC': 5000, 'KRW-ETH': 5000}
+	assert len(allocate_buy_budgets(zero, 5000, 1.0, 5000)) == 1
+	assert allocate_buy_budgets(zero, 4000, 1.0, 5000) == {}
+
+def test_portfolio_cycle(monkeypatch):
+	"""심볼별 결정은 동시에, 매도 후 늘어난 현금을 매수 신호에 신뢰도 비례로 배분"""
+	def decide(market_data, deadline=None):
+		time.sleep(0.2)
+		return dict(DECISIONS[market_data['symbol']])
+
+	monkeypatch.setattr(portfolio_cycle, 'get_current_prices', lambda symbols: {s: PRICES[s] for s in symbols})
+	monkeypatch.setattr(portfolio_cycle, 'get_orderbooks', lambda symbols: {})
+	monkeypatch.setattr(portfolio_cycle, 'get_fear_greed_index', lambda: None)
+	monkeypatch.setattr(portfolio_cycle, 'get_bitcoin_news', lambda: None)
+	monkeypatch.setattr(portfolio_cycle, 'get_ohlcv_data', lambda *args: None)
+	monkeypatch.setattr(portfolio_cycle, 'ai_trading_decision_with_indicators', decide)
+	monkeypatch.setattr(portfolio_cycle, 'save_market_data_record', lambda market_data: True)
+	monkeypatch.setattr(execution, 'save_trade_record', lambda *args: True)
+
+	upbit = FakeUpbit()
+	started = time.perf_counter()
+	results = execute_portfolio_cycle(upbit, logging.getLogger("test"), list(PRICES), use_vision=False)
+	assert time.perf_counter() - started < 0.6  # 4개 심볼 × 0.2초를 동시에
+
+	assert [order[:2] for order in upbit.orders] == [('sell', 'KRW-ETH'), ('buy', 'KRW-BTC'), ('buy', 'KRW-XRP')]
+	assert results['KRW-SOL']['action'] == 'hold' and results['KRW-ETH']['symbol'] == 'KRW-ETH'
+	# 매도 후 현금 100,000 + 0.0095 ETH × 5,000,000 = 147,500원의 95%를 0.75:0.25로 배분
+	available = (100_000 + 0.0095 * PRICES['KRW-ETH']) * 0.95
+	buys = {order[1]: order[2] for order in upbit.orders if order[0] == 'buy'}
+	assert abs(buys['KRW-BTC'] - available * 0.75) < 1  # 주문 금액은 원 단위 내림
+	assert abs(buys['KRW-XRP'] - available * 0.25) < 1
+	assert upbit.balance_calls == 4  # 사이클 시작 1회 + 주문 3건 후 각 1회
+
+def test_held_symbols_outside_universe(monkeypatch):
+	"""설정에 없는 보유 코인도 분석하여 매도/손절매 검사, 매수 신호는 무시, 시세 없는 코인은 제외"""
+	decisions = {'KRW-BTC': {'decision': 'hold', 'confidence': 0.5}, 'KRW-ETH': {'decision': 'sell', 'confidence': 0.8},
+				 'KRW-XRP': {'decision': 'buy', 'confidence': 0.9}}
+	price_requests = []
+	stop_loss_checks = []
+
+	def prices(symbols):
+		price_requests.append(list(symbols))
+		return {symbol: PRICES[symbol] for symbol in symbols if symbol in PRICES}
+
+	monkeypatch.setattr(portfolio_cycle, 'get_current_prices', prices)
+	monkeypatch.setattr(portfolio_cycle, 'get_orderbooks', lambda symbols: {})
+	monkeypatch.setattr(portfolio_cycle, 'get_fear_greed_index', lambda: None)
+	monkeypatch.setattr(portfolio_cycle, 'get_bitcoin_news', lambda: None)
+	monkeypatch.setattr(portfolio_cycle, 'get_ohlcv_data', lambda *args: None)
+	monkeypatch.setattr(portfolio_cycle, 'ai_trading_decision_with_indicators',
+						lambda market_data, deadline=None: dict(decisions[market_data['symbol']]))
+	monkeypatch.setattr(portfolio_cycle, 'save_market_data_record', lambda market_data: True)
+	monkeypatch.setattr(portfolio_cycle, 'check_and_execute_stop_loss',
+						lambda upbit, logger, minute_df, price, status, market_data, decision, symbol: stop_loss_checks.append(symbol))
+	monkeypatch.setattr(execution, 'save_trade_record', lambda *args: True)
+
+	upbit = FakeUpbit()
+	upbit.balances.update({'XRP': 100.0, 'NOMARKET': 5.0})
+	results = execute_portfolio_cycle(upbit, logging.getLogger("test"), ['KRW-BTC'], use_vision=False)
+	assert sorted(price_requests) == [['KRW-BTC'], ['KRW-ETH', 'KRW-XRP', 'KRW-NOMARKET']]
+	assert [order[:2] for order in upbit.orders] == [('sell', 'KRW-ETH')]
+	assert set(results) == {'KRW-BTC', 'KRW-ETH'}
+	assert sorted(stop_loss_checks) == ['KRW-BTC', 'KRW-ETH', 'KRW-XRP']
+
+def test_unpriced_symbol_not_traded(monkeypatch):
+	"""일괄 현재가 응답에 빠진 심볼은 분석/주문하지 않고, 가격 0인 매수 결정은 주문 전에 건너뜀"""
+	analyzed = []
+
+	def decide(market_data, deadline=None):
+		analyzed.append(market_data['symbol'])
+		return dict(DECISIONS[market_data['symbol']])
+
+	monkeypatch.setattr(portfolio_cycle, 'get_current_prices', lambda symbols: {s: PRICES[s] for s in symbols if s != 'KRW-XRP'})
+	monkeypatch.setattr(portfolio_cycle, 'get_orderbooks', lambda symbols: {})
+	monkeypatch.setattr(portfolio_cycle, 'get_fear_greed_index', lambda: None)
+	monkeypatch.setattr(portfolio_cycle, 'get_bitcoin_news', lambda: None)
+	monkeypatch.setattr(portfolio_cycle, 'get_ohlcv_data', lambda *args: None)
+	monkeypatch.setattr(portfolio_cycle, 'ai_trading_decision_with_indicators', decide)
+	monkeypatch.setattr(portfolio_cycle, 'save_market_data_record', lambda market_data: True)
+	monkeypatch.setattr(execution, 'save_trade_record', lambda *args: True)
+
+	upbit = FakeUpbit()
+	results = execute_portfolio_cycle(upbit, logging.getLogger("test"), ['KRW-BTC', 'KRW-XRP'], use_vision=False)
+	assert sorted(analyzed) == ['KRW-BTC', 'KRW-ETH'] and 'KRW-XRP' not in results  # ETH는 보유 코인
+	assert [order[:2] for order in upbit.orders] == [('sell', 'KRW-ETH'), ('buy', 'KRW-BTC')]
+
+	status = {'krw_balance': 100_000.0, 'btc_balance': 0.0, 'current_price': 0.0}
+	result = execution.execute_trading_decision(upbit, {'decision': 'buy'}, status, symbol='KRW-XRP')
+	assert result['status'] == 'no_price' and not result['success'] and len(upbit.orders) == 2
+
+def test_vision_slower_than_symbol_timeout(monkeypatch):
+	"""Vision 모델이 심볼 타임아웃보다 느려도 모델 마감이 먼저 와서 텍스트 결정으로 매매와 손절매 검사 진행"""
+	text_decision = json.dumps({
+		"decision": "sell", "reason": "과열", "confidence": 0.8, "risk_level": "medium",
+		"expected_price_range": {"min": 4_900_000, "max": 5_100_000},
+		"key_indicators": {"rsi_signal": "overbought", "macd_signal": "bearish", "bb_signal": "upper_band",
+						   "trend_strength": "weak", "market_sentiment": "greed", "news_sentiment": "neutral"},
+	})
+	deadlines = []
+
+	def slow_vision(prompt, image_base64, cancel=None, deadline=None, **kwargs):
+		deadlines.append(deadline)
+		(cancel or threading.Event()).wait(5)  # 마감 시 취소될 때까지 응답 없음
+		return ""
+
+	def fast_text(prompt, cancel=None, deadline=None, **kwargs):
+		return text_decision
+
+	stop_loss_checks = []
+	monkeypatch.setattr(portfolio_cycle, 'get_current_prices', lambda symbols: {s: PRICES[s] for s in symbols})
+	monkeypatch.setattr(portfolio_cycle, 'get_orderbooks', lambda symbols: {})
+	monkeypatch.setattr(portfolio_cycle, 'get_fear_greed_index', lambda: None)
+	monkeypatch.setattr(portfolio_cycle, 'get_bitcoin_news', lambda: None)
+	monkeypatch.setattr(portfolio_cycle, 'get_ohlcv_data', lambda *args: None)
+	monkeypatch.setattr(portfolio_cycle, 'save_market_data_record', lambda market_data: True)
+	monkeypatch.setattr(portfolio_cycle, 'PORTFOLIO_DECISION_MARGIN', 0.2)
+	monkeypatch.setattr(portfolio_cycle, 'check_and_execute_stop_loss',
+						lambda upbit, logger, minute_df, price, status, market_data, decision, symbol: stop_loss_checks.append(symbol))
+	monkeypatch.setattr(trading_cycle, 'render_chart_base64', lambda chart_df, title=None: "Y2hhcnQ=")
+	monkeypatch.setattr(ai_analysis, 'call_ollama_vision_api', slow_vision)
+	monkeypatch.setattr(ai_analysis, 'call_ollama_api', fast_text)
+	monkeypatch.setattr(ai_analysis, 'STRATEGY_IMPROVEMENT_ENABLED', False)
+	monkeypatch.setattr(decision_cache, 'LLM_CACHE_ENABLED', False)
+	monkeypatch.setattr(execution, 'save_trade_record', lambda *args: True)
+
+	upbit = FakeUpbit()
+	started = time.perf_counter()
+	results = execute_portfolio_cycle(upbit, logging.getLogger("test"), ['KRW-ETH'], use_vision=True, symbol_timeout=1.0)
+	assert time.perf_counter() - started < 1.5
+	assert deadlines and deadlines[0] <= 0.8
+	assert results['KRW-ETH']['symbol'] == 'KRW-ETH' and [order[:2] for order in upbit.orders] == [('sell', 'KRW-ETH')]
+	assert stop_loss_checks == ['KRW-ETH']
+
+def test_batched_prices(monkeypatch):
+	"""피드가 없으면 여러 심볼 현재가를 티커 API 한 번으로 조회하고 심볼별 캐시에 넣음"""
+	calls = []
+
+	def batched(self, ticker):
+		calls.append(ticker)
+		return {symbol: PRICES[symbol] for symbol in ticker} if isinstance(ticker, list) else PRICES[ticker]
+
+	monkeypatch.setattr(UpbitClient, 'get_current_price', batched)
+	monkeypatch.setattr(realtime_feed, '_market_feed', None)
+	for symbol in PRICES:
+		get_cache().invalidate(f"price:{symbol}")
+	assert realtime_feed.get_latest_prices(list(PRICES)) == PRICES
+	assert realtime_feed.get_latest_price('KRW-SOL') == PRICES['KRW-SOL']
+	assert calls == [list(PRICES)]
+
+if __name__ == "__main__":
+	test_allocate_buy_budgets()
+	print("🎉 포트폴리오 사이클 테스트 완료!")
@@ -0,0 +1,86 @@
+"""
+프롬프트 생성 테스트
+create_market_analysis_data 결과를 요약했을 때 예산 준수, 원본 JSON 대비 토큰 감소,
+섹션 우선순위에 따른 축소를 검증합니다.
+"""
+
+import sys
+import os
+import json
+import numpy as np
+import pandas as pd
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가 (tests/의 부모 경로)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from analysis.technical_indicators import calculate_technical_indicators
+from analysis.ai_analysis import create_market_analysis_data
+from analysis.prompt_builder import PromptBuilder, build_decision_prompt, estimate_tokens
+
+def make_ohlcv(rows: int, freq: str, seed: int = 0) -> pd.DataFrame:
+	rng = np.random.default_rng(seed)
+	close = 1.4e8 + np.cumsum(rng.normal(0, 2e5, rows))
+	volume = rng.random(rows) * 10 + 1
+	return pd.DataFrame({
+		'open': close + rng.normal(0, 1e5, rows),
+		'high': close + rng.random(rows) * 3e5,
+		'low': close - rng.random(rows) * 3e5,
+		'close': close,
+		'volume': volume,
+		'value': volume * close,
+	}, index=pd.date_range('2025-08-01', periods=rows, freq=freq))
+
+def make_market_data():
+	daily_df = calculate_technical_indicators(make_ohlcv(30, 'D', seed=1))
+	minute_df = calculate_technical_indicators(make_ohlcv(200, 'min', seed=2))
+	orderbook = {'orderbook_units': [
+		{'ask_price': 140_010_000 + i * 1000, 'bid_price': 140_000_000 - i * 1000, 'ask_size': 0.5, 'bid_size': 1.5}
+		for i in range(15)
+	]}
+	fear_greed = {'current_value': 72, 'current_classification': 'Greed', 'value_change': 4}
+	news = [{'title': f'비트코인 ETF 자금 유입 지속 {i} ' + 'x' * 120, 'sentiment': '긍정', 'sentiment_score': 0.5}
+			for i in range(5)]
+	return create_market_analysis_data(daily_df, minute_df, 140_005_000, orderbook, fear_greed, news)
+
+def test_estimate_tokens():
+	"""영문 단어/숫자/한글 토큰 추정"""
+	assert estimate_tokens("") == 0
+	assert estimate_tokens("RSI 62") == 2
+	assert estimate_tokens("140005000") == 3
+	assert estimate_tokens("비트코인") == 4
+
+def test_compact_prompt_within_budget():
+	"""요약 프롬프트는 예산 이하이며 원본 JSON보다 훨씬 작음"""
+	market_data = make_market_data()
+	built = build_decision_prompt("Decide buy/sell/hold.", market_data)
+	raw_tokens = estimate_tokens(json.dumps(market_data, default=str))
+
+	assert built.tokens < raw_tokens * 0.1
+	assert sum(built.section_tokens.values()) <= 600
+	for name in ('price', 'daily', 'minute', 'sentiment', 'orderbook', 'candles', 'news'):
+		assert f"[{name}]" in built.text, name
+	assert "fear&greed 72 Greed" in built.text
+	assert "nan" not in built.text.lower()
+
+def test_section_budgets_truncate_in_priority_order():
+	"""섹션 예산을 넘는 줄은 버리고, 전체 예산이 모자라면 뒤 섹션부터 빠짐"""
+	market_data = make_market_data()
+	tight = PromptBuilder(budgets={'price': 60, 'candles': 30}, total_budget=1000).summarize(market_data)
+	assert tight.section_tokens['candles'] <= 30
+	assert 'candles' in tight.truncated
+
+	limited = PromptBuilder(budgets={'price': 60, 'daily': 200, 'news': 200}, total_budget=70).summarize(market_data)
+	assert limited.tokens <= 75
+	assert '[news]' not in limited.text and '[price]' in limited.text
+
+def test_missing_sections_are_skipped():
+	"""데이터가 없는 섹션은 생략"""
+	built = PromptBuilder().summarize({'current_price': 100_000_000})
+	assert built.text == "[price]\nprice 100,000,000 KRW"
+
+if __name__ == "__main__":
+	test_estimate_tokens()
+	test_compact_prompt_within_budget()
+	test_section_budgets_truncate_in_priority_order()
+	test_missing_sections_are_skipped()
+	print("🎉 프롬프트 생성 테스트 완료!")
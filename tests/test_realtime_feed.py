@@ -0,0 +1,133 @@
+"""
+실시간 시세 피드 테스트
+기록된 업비트 WebSocket 메시지를 재생하는 로컬 서버로 구독, 스냅샷, 재연결을 확인합니다.
+"""
+
+import sys
+import os
+import json
+import time
+import asyncio
+import threading
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가 (tests/의 부모 경로)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from websockets.asyncio.server import serve
+import data.realtime_feed as realtime_feed
+from data.realtime_feed import MarketFeed
+from data.upbit_client import UpbitClient
+
+# 업비트 DEFAULT 포맷 기록 메시지 (필드 일부)
+RECORDED_MESSAGES = [
+	{'type': 'ticker', 'code': 'KRW-BTC', 'trade_price': 158350000.0, 'change': 'RISE',
+	 'acc_trade_volume_24h': 2845.12, 'timestamp': 1760659200123, 'stream_type': 'REALTIME'},
+	{'type': 'orderbook', 'code': 'KRW-BTC', 'timestamp': 1760659200150,
+	 'total_ask_size': 4.21, 'total_bid_size': 6.87,
+	 'orderbook_units': [
+		 {'ask_price': 158351000.0, 'bid_price': 158350000.0, 'ask_size': 0.12, 'bid_size': 0.45},
+		 {'ask_price': 158360000.0, 'bid_price': 158340000.0, 'ask_size': 0.30, 'bid_size': 0.08},
+	 ], 'stream_type': 'REALTIME'},
+	{'type': 'trade', 'code': 'KRW-BTC', 'trade_price': 158350000.0, 'trade_volume': 0.0021,
+	 'ask_bid': 'BID', 'sequential_id': 17606592001230000, 'timestamp': 1760659200180},
+	{'type': 'trade', 'code': 'KRW-BTC', 'trade_price': 158351000.0, 'trade_volume': 0.015,
+	 'ask_bid': 'BID', 'sequential_id': 17606592001990000, 'timestamp': 1760659200199},
+]
+RECONNECT_TICKER = dict(RECORDED_MESSAGES[0], trade_price=158400000.0, timestamp=1760659201000)
+
+class ReplayServer:
+	"""기록 메시지를 재생하는 로컬 WebSocket 서버 (첫 연결은 재생 후 끊음)"""
+
+	def __init__(self):
+		self.subscriptions = []
+		self.port = None
+		self._ready = threading.Event()
+		self._stop = None
+		self._thread = threading.Thread(target=lambda: asyncio.run(self._main()), daemon=True)
+
+	async def _handler(self, websocket):
+		self.subscriptions.append(json.loads(await websocket.recv()))
+		if len(self.subscriptions) == 1:
+			for message in RECORDED_MESSAGES:
+				await websocket.send(json.dumps(message).encode('utf-8'))
+			return  # 연결 종료 → 클라이언트 재연결 유도
+		await websocket.send(json.dumps(RECONNECT_TICKER).encode('utf-8'))
+		await websocket.wait_closed()
+
+	async def _main(self):
+		self._stop = asyncio.get_running_loop().create_future()
+		async with serve(self._handler, '127.0.0.1', 0) as server:
+			self.port = server.sockets[0].getsockname()[1]
+			self._ready.set()
+			await self._stop
+
+	def __enter__(self):
+		self._thread.start()
+		self._ready.wait(5)
+		return self
+
+	def __exit__(self, *exc):
+		loop = self._stop.get_loop()
+		loop.call_soon_threadsafe(self._stop.set_result, None)
+		self._thread.join(5)
+
+def wait_for(condition, timeout: float = 5.0) -> bool:
+	deadline = time.monotonic() + timeout
+	while time.monotonic() < deadline:
+		if condition():
+			return True
+		time.sleep(0.01)
+	return False
+
+def test_snapshot_and_reconnect():
+	"""기록 메시지로 스냅샷을 만들고, 연결이 끊기면 백오프 후 재연결"""
+	with ReplayServer() as server:
+		feed = MarketFeed(['KRW-BTC'], url=f"ws://127.0.0.1:{server.port}",
+		                  reconnect_initial=0.05, reconnect_max=0.2).start()
+		try:
+			assert feed.wait_ready(5)
+			assert wait_for(lambda: len(feed.get_trades('KRW-BTC')) == 2)
+
+			subscription = server.subscriptions[0]
+			assert [item.get('type') for item in subscription[1:4]] == ['ticker', 'orderbook', 'trade']
+			assert subscription[1]['codes'] == ['KRW-BTC']
+
+			orderbook = feed.get_orderbook('KRW-BTC')
+			assert orderbook['market'] == 'KRW-BTC'
+			assert orderbook['orderbook_units'][0]['ask_price'] == 158351000.0
+			assert [trade['trade_volume'] for trade in feed.get_trades('KRW-BTC')] == [0.0021, 0.015]
+
+			# 재연결 후 갱신된 ticker 반영
+			assert wait_for(lambda: feed.get_price('KRW-BTC') == 158400000.0)
+			assert len(server.subscriptions) == 2
+			assert feed.stats['connects'] == 2 and feed.stats['reconnects'] >= 1
+			assert feed.get_price('KRW-BTC', max_age=0) is None  # 오래된 스냅샷은 무시
+		finally:
+			feed.stop()
+	assert not feed.running
+
+def test_readers_use_snapshot(monkeypatch):
+	"""피드 실행 중에는 현재가/오더북 조회가 REST를 호출하지 않음"""
+	def rest_called(*args, **kwargs):
+		raise AssertionError("REST 호출 발생")
+
+	monkeypatch.setattr(UpbitClient, 'get_current_price', rest_called)
+	monkeypatch.setattr(UpbitClient, 'get_orderbook', rest_called)
+
+	with ReplayServer() as server:
+		feed = MarketFeed(['KRW-BTC'], url=f"ws://127.0.0.1:{server.port}", reconnect_initial=0.05)
+		monkeypatch.setattr(realtime_feed, '_market_feed', feed)
+		feed.start()
+		try:
+			assert feed.wait_ready(5)
+			assert wait_for(lambda: feed.get_orderbook('KRW-BTC') is not None)
+
+			from data.market_data import get_current_price, get_orderbook
+			assert get_current_price('KRW-BTC') in (158350000.0, 158400000.0)
+			assert get_orderbook('KRW-BTC')['total_bid_size'] == 6.87
+		finally:
+			feed.stop()
+
+if __name__ == "__main__":
+	test_snapshot_and_reconnect()
+	print("🎉 실시간 시세 피드 테스트 완료!")
@@ -0,0 +1,112 @@
+"""
+통계 집계(rollup) 테스트
+구간 분할과, 원본/시간별/일별 집계를 합친 통계가 원본 전체 집계와 같은지 검증합니다.
+"""
+
+import sys
+import os
+from datetime import datetime, timedelta
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가 (tests/의 부모 경로)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database.rollup import split_range, get_trade_totals, get_reflection_totals
+
+def make_trades(now):
+	"""50시간 동안 30분마다 거래 (decision, action, timestamp, total_value, fee)"""
+	trades = []
+	for i in range(100):
+		timestamp = now - timedelta(minutes=30 * i + 7)
+		action = ('buy', 'sell', 'hold')[i % 3]
+		trades.append((action, action, timestamp, 0 if action == 'hold' else 10000 + i, 5 if action != 'hold' else 0))
+	return trades
+
+class RollupCursor:
+	"""원본 행으로 집계 테이블 쿼리에 응답하는 가짜 커서"""
+
+	def __init__(self, trades, reflections=()):
+		self.trades = trades
+		self.reflections = reflections
+		self.result = []
+		self.queries = []
+
+	@staticmethod
+	def _bucket(timestamp, table):
+		if table.endswith('hourly'):
+			return timestamp.replace(minute=0, second=0, microsecond=0)
+		return timestamp.replace(hour=0, minute=0, second=0, microsecond=0)
+
+	def execute(self, sql, params=()):
+		self.queries.append(sql)
+		table = next(name for name in ('trade_stats_hourly', 'trade_stats_daily', 'reflection_stats_hourly',
+									   'reflection_stats_daily', 'trading_reflections', 'trades') if name in sql)
+		source = self.reflections if 'reflection' in table else self.trades
+		if table in ('trades', 'trading_reflections'):
+			start, end = params
+			rows = [row for row in source if start <= row[2] < end]
+		else:
+			start = params[0] if params else datetime.min
+			end = params[1] if len(params) > 1 else datetime.max
+			rows = [row for row in source if start <= self._bucket(row[2], table) < end]
+
+		grouped = {}
+		for row in rows:
+			if 'reflection' in table:
+				key = (row[0],)
+				count, score_sum, score_count, profit = grouped.get(key, (0, 0, 0, 0))
+				grouped[key] = (count + 1, score_sum + (row[1] or 0), score_count + (row[1] is not None), profit + row[3])
+			else:
+				key = (row[0], row[1])
+				count, value, fee = grouped.get(key, (0, 0, 0))
+				grouped[key] = (count + 1, value + row[3], fee + row[4])
+		self.result = [key + values for key, values in grouped.items()]
+
+	def fetchall(self):
+		return self.result
+
+def test_split_range():
+	"""시간/일 경계로 분할"""
+	assert split_range(datetime(2026, 3, 1, 13, 20)) == (datetime(2026, 3, 1, 14), datetime(2026, 3, 2))
+	assert split_range(datetime(2026, 3, 1, 14)) == (datetime(2026, 3, 1, 14), datetime(2026, 3, 2))
+	assert split_range(datetime(2026, 3, 2)) == (datetime(2026, 3, 2), datetime(2026, 3, 2))
+	assert split_range(datetime(2026, 12, 31, 23, 1)) == (datetime(2027, 1, 1), datetime(2027, 1, 1))
+
+def test_trade_totals_match_raw():
+	"""집계 조합 결과가 원본 직접 집계와 같음"""
+	now = datetime(2026, 3, 5, 10, 42)
+	trades = make_trades(now)
+	start = now - timedelta(hours=30)
+	cursor = RollupCursor(trades)
+	stats = get_trade_totals(cursor, start).to_dict()
+
+	window = [row for row in trades if row[2] >= start]
+	buy = sum(row[3] for row in window if row[1] == 'buy')
+	sell = sum(row[3] for row in window if row[1] == 'sell')
+	fee = sum(row[4] for row in window)
+	assert stats['total_trades'] == len(window)
+	assert stats['decision_counts'] == {d: sum(row[0] == d for row in window) for d in ('buy', 'sell', 'hold')}
+	assert stats['buy_total'] == buy and stats['sell_total'] == sell and stats['total_fee'] == fee
+	assert stats['profit'] == sell - buy - fee
+	assert len(cursor.queries) == 3
+
+	all_time = get_trade_totals(RollupCursor(trades)).to_dict()
+	assert all_time['total_trades'] == len(trades)
+
+def test_reflection_totals():
+	"""점수가 없는 반성은 평균에서 제외"""
+	now = datetime(2026, 3, 5, 10, 42)
+	reflections = [('immediate', 0.8, now - timedelta(hours=2), 1000),
+				   ('immediate', None, now - timedelta(hours=3), -500),
+				   ('daily', 0.4, now - timedelta(days=2), 0),
+				   ('daily', 0.1, now - timedelta(days=9), 0)]
+	totals = get_reflection_totals(RollupCursor([], reflections), now - timedelta(days=7))
+	assert totals.total_reflections == 3
+	assert totals.reflection_types == {'immediate': 2, 'daily': 1}
+	assert abs(totals.avg_performance_score - 0.6) < 1e-9
+	assert totals.profit_loss_sum == 500
+
+if __name__ == "__main__":
+	test_split_range()
+	test_trade_totals_match_raw()
+	test_reflection_totals()
+	print("🎉 통계 집계 테스트 완료!")
@@ -0,0 +1,86 @@
+"""
+구조화 출력 테스트
+TradingDecision 스키마 검증, 로컬 정규화, 한 번의 수정 요청, 결과 집계를 확인합니다.
+"""
+
+import sys
+import os
+import json
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가 (tests/의 부모 경로)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import analysis.ai_analysis as ai_analysis
+from analysis.structured_output import decode_decision, get_structured_output_stats, trading_decision_schema
+
+VALID = {
+	"decision": "buy", "reason": "과매도 반등", "confidence": 0.7, "risk_level": "medium",
+	"expected_price_range": {"min": 139_000_000, "max": 141_000_000},
+	"key_indicators": {"rsi_signal": "oversold", "macd_signal": "bullish", "bb_signal": "lower_band",
+					   "trend_strength": "weak", "market_sentiment": "fear", "news_sentiment": "neutral"},
+}
+
+def stats_delta(before):
+	after = get_structured_output_stats()
+	return {key: after[key] - before[key] for key in ('requests', 'valid', 'normalized', 'repaired', 'failed')}
+
+def test_valid_response_with_preamble():
+	"""앞뒤 설명이 붙어도 첫 JSON 객체를 검증"""
+	before = get_structured_output_stats()
+	decision = decode_decision("분석 결과입니다:\n" + json.dumps(VALID, ensure_ascii=False) + "\n이상입니다.")
+	assert decision.decision == "buy" and decision.confidence == 0.7
+	assert stats_delta(before) == {'requests': 1, 'valid': 1, 'normalized': 0, 'repaired': 0, 'failed': 0}
+
+def test_normalized_without_model_call():
+	"""한글 결정/퍼센트 신뢰도는 수정 요청 없이 로컬에서 정리"""
+	raw = dict(VALID, decision="매도", confidence="80%", risk_level="높음")
+	calls = []
+	decision = decode_decision(json.dumps(raw, ensure_ascii=False), repair=lambda prompt: calls.append(prompt))
+	assert decision.decision == "sell" and decision.confidence == 0.8 and decision.risk_level == "high"
+	assert calls == []
+
+def test_single_repair_pass():
+	"""필드 누락은 오류 내용과 함께 한 번만 수정 요청"""
+	before = get_structured_output_stats()
+	broken = {key: value for key, value in VALID.items() if key != 'expected_price_range'}
+	prompts = []
+
+	def repair(prompt):
+		prompts.append(prompt)
+		return json.dumps(VALID)
+
+	decision = decode_decision(json.dumps(broken), repair=repair)
+	assert decision.expected_price_range.max == 141_000_000
+	assert len(prompts) == 1 and "expected_price_range" in prompts[0]
+
+	prompts.clear()
+	assert decode_decision("비트코인은 상승할 것 같습니다", repair=lambda prompt: prompts.append(prompt) or "여전히 설명") is None
+	assert len(prompts) == 1
+	assert stats_delta(before) == {'requests': 2, 'valid': 0, 'normalized': 0, 'repaired': 1, 'failed': 1}
+	assert get_structured_output_stats()['repair_rate'] > 0
+
+def test_schema_sent_as_format():
+	"""모델 호출에 TradingDecision 스키마를 format으로 전달"""
+	calls = []
+	original = ai_analysis.call_ollama_api
+
+	def fake_call(prompt, **kwargs):
+		calls.append(kwargs)
+		return json.dumps(VALID)
+
+	ai_analysis.call_ollama_api = fake_call
+	try:
+		decision, _ = ai_analysis.request_structured_decision("prompt")
+	finally:
+		ai_analysis.call_ollama_api = original
+	assert decision['decision'] == "buy"
+	assert calls[0]['json_format'] == trading_decision_schema()
+	assert calls[0]['json_format']['properties']['decision']['enum'] == ["buy", "sell", "hold"]
+	assert calls[0]['stop_on_json'] is True
+
+if __name__ == "__main__":
+	test_valid_response_with_preamble()
+	test_normalized_without_model_call()
+	test_single_repair_pass()
+	test_schema_sent_as_format()
+	print("🎉 구조화 출력 테스트 완료!")
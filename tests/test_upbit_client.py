@@ -0,0 +1,146 @@
+"""
+업비트 REST 클라이언트 테스트
+로컬 가짜 업비트 서버로 Remaining-Req 헤더 반영, 429 재시도, 주문 요청의 네트워크 오류 비재시도,
+우선순위 레인(주문 먼저)과 토큰 버킷 속도 제한을 검증합니다.
+"""
+
+import sys
+import os
+import json
+import time
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가 (tests/의 부모 경로)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data.upbit_client import (
+	UpbitClient, TokenBucket, parse_remaining_req, PRIORITY_ORDER, PRIORITY_MARKET
+)
+
+SECRET = "test-secret-key-for-jwt-signing-0001"
+
+class FakeUpbitHandler(BaseHTTPRequestHandler):
+	"""server.responses[경로]에 쌓인 (상태, 본문, 초당 남은 수)를 순서대로 응답 (마지막 응답은 반복)"""
+	protocol_version = "HTTP/1.1"
+
+	def log_message(self, format, *args):
+		pass
+
+	def respond(self):
+		path = self.path.split('?')[0]
+		length = int(self.headers.get('Content-Length', 0))
+		body = json.loads(self.rfile.read(length)) if length else None
+		self.server.requests.append((self.command, path, body, self.headers.get('Authorization')))
+		queue = self.server.responses[path]
+		status, payload, remaining_sec = queue.pop(0) if len(queue) > 1 else queue[0]
+		data = (payload if isinstance(payload, str) else json.dumps(payload)).encode()
+		group = 'order' if path == '/v1/orders' and self.command == 'POST' else self.server.groups.get(path, 'default')
+		self.send_response(status)
+		self.send_header('Content-Type', 'application/json')
+		self.send_header('Content-Length', str(len(data)))
+		self.send_header('Remaining-Req', f"group={group}; min=1800; sec={remaining_sec}")
+		self.end_headers()
+		self.wfile.write(data)
+
+	do_GET = respond
+	do_POST = respond
+	do_DELETE = respond
+
+def start_fake_upbit(responses):
+	server = ThreadingHTTPServer(('127.0.0.1', 0), FakeUpbitHandler)
+	server.daemon_threads = True
+	server.responses = responses
+	server.groups = {'/v1/ticker': 'ticker', '/v1/orderbook': 'orderbook'}
+	server.requests = []
+	threading.Thread(target=server.serve_forever, daemon=True).start()
+	return server
+
+def make_client(server, **kwargs):
+	return UpbitClient("access", SECRET, base_url=f"http://127.0.0.1:{server.server_address[1]}",
+					   retry_base_delay=0.01, **kwargs)
+
+def test_parse_remaining_req():
+	"""Remaining-Req 헤더 파싱"""
+	assert parse_remaining_req("group=market; min=573; sec=9") == ('market', 573, 9)
+	assert parse_remaining_req("group=order; min=199; sec=7") == ('order', 199, 7)
+	assert parse_remaining_req("") is None
+
+def test_header_and_public_calls():
+	"""공개 시세는 인증 없이, 계좌 조회는 JWT로, 남은 요청 수는 그룹 버킷에 반영"""
+	server = start_fake_upbit({
+		'/v1/ticker': [(200, [{'market': 'KRW-BTC', 'trade_price': 150000000.0}], 3)],
+		'/v1/accounts': [(200, [{'currency': 'KRW', 'balance': '1000'}], 29)],
+	})
+	try:
+		client = make_client(server)
+		assert client.get_current_price("KRW-BTC") == 150000000.0
+		assert client.get_balances() == [{'currency': 'KRW', 'balance': '1000'}]
+		ticker_request, account_request = server.requests
+		assert ticker_request[3] is None and account_request[3].startswith("Bearer ")
+		assert client.bucket('ticker').remaining == (1800, 3)
+		assert client.bucket('ticker').tokens <= 3
+	finally:
+		server.shutdown()
+
+def test_order_retried_after_429():
+	"""429는 처리되지 않은 요청이므로 주문도 재시도, 결과는 한 번만 체결"""
+	server = start_fake_upbit({
+		'/v1/orders': [(429, "Too many API requests.", 0), (200, {'uuid': 'order-1', 'side': 'bid'}, 6)],
+	})
+	try:
+		client = make_client(server)
+		result = client.buy_market_order("KRW-BTC", 10000)
+		assert result == {'uuid': 'order-1', 'side': 'bid'}
+		posts = [request for request in server.requests if request[0] == 'POST']
+		assert len(posts) == 2
+		assert posts[0][2] == {'market': 'KRW-BTC', 'side': 'bid', 'price': '10000', 'ord_type': 'price'}
+		assert client.stats['rate_limited'] == 1 and client.stats['retries'] == 1
+	finally:
+		server.shutdown()
+
+def test_network_error_not_retried_for_orders():
+	"""주문 요청의 연결 오류는 중복 주문 위험이 있어 재시도하지 않음, 조회는 재시도"""
+	server = start_fake_upbit({})
+	port = server.server_address[1]
+	server.shutdown()
+	server.server_close()
+	client = UpbitClient("access", SECRET, base_url=f"http://127.0.0.1:{port}", retry_base_delay=0.01)
+	assert client.sell_market_order("KRW-BTC", 0.001) is None
+	assert client.stats['requests'] == 1 and client.stats['retries'] == 0
+	assert client.get_balances() is None
+	assert client.stats['requests'] == 1 + 1 + client.max_retries
+
+def test_priority_lane_and_rate():
+	"""토큰이 없을 때 나중에 온 주문 요청이 먼저 대기 중인 시세 요청보다 먼저 토큰을 받음"""
+	bucket = TokenBucket(rate=10, capacity=1)
+	assert bucket.acquire(PRIORITY_MARKET)
+	order = []
+
+	def take(priority, name):
+		bucket.acquire(priority, timeout=2)
+		order.append(name)
+
+	market = threading.Thread(target=take, args=(PRIORITY_MARKET, 'market'))
+	market.start()
+	time.sleep(0.02)
+	orders = threading.Thread(target=take, args=(PRIORITY_ORDER, 'order'))
+	orders.start()
+	market.join()
+	orders.join()
+	assert order == ['order', 'market']
+
+	started = time.perf_counter()
+	for _ in range(5):
+		assert bucket.acquire(PRIORITY_MARKET)
+	assert time.perf_counter() - started >= 0.35  # 초당 10개
+	bucket.penalize(0.2)
+	assert not bucket.acquire(PRIORITY_ORDER, timeout=0.1)
+
+if __name__ == "__main__":
+	test_parse_remaining_req()
+	test_header_and_public_calls()
+	test_order_retried_after_429()
+	test_network_error_not_retried_for_orders()
+	test_priority_lane_and_rate()
+	print("🎉 업비트 REST 클라이언트 테스트 완료!")
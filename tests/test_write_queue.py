@@ -0,0 +1,138 @@
+"""
+DB 쓰기 지연 큐 테스트
+가짜 executor로 일괄 저장, 종료 시 flush, DB 장애 시 저널 기록 및 재전송을 확인합니다.
+"""
+
+import sys
+import os
+import json
+import tempfile
+import threading
+from datetime import datetime
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가 (tests/의 부모 경로)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mysql.connector.errors import DataError
+from database.write_queue import WriteBehindQueue
+
+LOG_SQL = "INSERT INTO system_logs (timestamp, level, message, module) VALUES (%s, %s, %s, %s)"
+MARKET_SQL = "INSERT INTO market_data (timestamp, current_price) VALUES (%s, %s)"
+
+class FakeDatabase:
+	"""executemany 호출 기록 (available=False면 연결 오류)"""
+
+	def __init__(self):
+		self.available = True
+		self.calls = []
+		self.lock = threading.Lock()
+
+	def __call__(self, sql, rows):
+		if not self.available:
+			raise ConnectionError("MySQL 연결 불가")
+		if sql == MARKET_SQL and any(float(row[1]) >= 1e15 for row in rows):
+			raise DataError("1264 (22003): Out of range value for column 'current_price'")
+		with self.lock:
+			self.calls.append((sql, list(rows)))
+
+	def rows(self, sql):
+		return [row for called_sql, rows in self.calls if called_sql == sql for row in rows]
+
+def test_batches_and_flush_on_close():
+	"""SQL별로 묶어 executemany하고, close 시 남은 행을 모두 저장"""
+	database = FakeDatabase()
+	with tempfile.TemporaryDirectory() as directory:
+		write_queue = WriteBehindQueue(batch_size=50, flush_interval=0.2,
+		                               journal_path=os.path.join(directory, 'journal.jsonl'),
+		                               executor=database).start()
+		for i in range(120):
+			write_queue.enqueue(LOG_SQL, (datetime.now(), 'INFO', f"로그 {i}", 'test'))
+			if i % 2 == 0:
+				write_queue.enqueue(MARKET_SQL, (datetime.now(), 1.5e8 + i))
+		write_queue.close()
+
+		assert [row[2] for row in database.rows(LOG_SQL)] == [f"로그 {i}" for i in range(120)]
+		assert len(database.rows(MARKET_SQL)) == 60
+		assert len(database.calls) < 180 / 10  # 행 단위가 아닌 일괄 저장
+		assert write_queue.metrics()['pending'] == 0
+		assert not os.path.exists(os.path.join(directory, 'journal.jsonl'))
+
+def test_journal_when_database_down():
+	"""DB 장애 시 저널에 기록하고, 복구 후 재전송"""
+	database = FakeDatabase()
+	database.available = False
+	with tempfile.TemporaryDirectory() as directory:
+		journal = os.path.join(directory, 'journal.jsonl')
+		write_queue = WriteBehindQueue(flush_interval=0.05, retry_interval=0.1,
+		                               journal_path=journal, executor=database).start()
+		for i in range(5):
+			write_queue.enqueue(MARKET_SQL, (datetime(2025, 8, 1, 9, i), 1.5e8 + i))
+		assert write_queue.flush(timeout=5)
+		assert write_queue.metrics()['journal_rows'] == 5
+		with open(journal, encoding='utf-8') as f:
+			assert json.loads(f.readline())['row'][0] == '2025-08-01 09:00:00.000000'
+
+		database.available = True
+		write_queue.enqueue(MARKET_SQL, (datetime(2025, 8, 1, 9, 5), 1.5e8 + 5))
+		write_queue.close()
+
+		prices = sorted(row[1] for row in database.rows(MARKET_SQL))
+		assert prices == [1.5e8 + i for i in range(6)]
+		assert write_queue.stats['replayed'] >= 5
+		assert not os.path.exists(journal)
+
+def test_poison_row_dead_lettered():
+	"""값 범위 초과 행 하나 때문에 묶음 전체를 저널로 보내지 않고, 행 단위 재시도 후 실패 행만 격리"""
+	database = FakeDatabase()
+	with tempfile.TemporaryDirectory() as directory:
+		journal = os.path.join(directory, 'journal.jsonl')
+		dead_letter = os.path.join(directory, 'dead_letter.jsonl')
+		# 이전 실행에서 저널에 남은 행에도 잘못된 행이 섞여 있음
+		with open(journal, 'w', encoding='utf-8') as f:
+			for price in (1.4e8, 1e16):
+				f.write(json.dumps({'sql': MARKET_SQL, 'row': ['2025-08-01 08:00:00.000000', price]}) + '\n')
+		write_queue = WriteBehindQueue(flush_interval=0.05, retry_interval=0.1, journal_path=journal,
+		                               dead_letter_path=dead_letter, executor=database).start()
+		for i in range(5):
+			write_queue.enqueue(MARKET_SQL, (datetime(2025, 8, 1, 9, i), 1e16 if i == 2 else 1.5e8 + i))
+			write_queue.enqueue(LOG_SQL, (datetime.now(), 'INFO', f"로그 {i}", 'test'))
+		write_queue.close()
+
+		prices = sorted(row[1] for row in database.rows(MARKET_SQL))
+		assert prices == [1.4e8] + [1.5e8 + i for i in range(5) if i != 2]
+		assert len(database.rows(LOG_SQL)) == 5
+		assert write_queue.stats['dead_lettered'] == 2 and write_queue.stats['spilled'] == 0
+		assert write_queue.metrics()['db_available'] and not os.path.exists(journal)
+		with open(dead_letter, encoding='utf-8') as f:
+			quarantined = [json.loads(line) for line in f]
+		assert [entry['row'][1] for entry in quarantined] == [1e16, 1e16]
+		assert 'Out of range' in quarantined[0]['error']
+
+def test_backpressure_spills_to_journal():
+	"""큐가 가득 차면 잠시 대기 후 저널에 기록"""
+	release = threading.Event()
+	database = FakeDatabase()
+
+	def slow_executor(sql, rows):
+		release.wait(5)
+		database(sql, rows)
+
+	with tempfile.TemporaryDirectory() as directory:
+		write_queue = WriteBehindQueue(max_size=2, batch_size=1, flush_interval=0.01, put_timeout=0.01,
+		                               journal_path=os.path.join(directory, 'journal.jsonl'),
+		                               executor=slow_executor).start()
+		results = [write_queue.enqueue(LOG_SQL, (datetime.now(), 'INFO', f"로그 {i}", 'test')) for i in range(6)]
+		assert not all(results)
+		assert write_queue.stats['blocked_puts'] >= 1
+		assert write_queue.stats['spilled'] >= 1
+		release.set()
+		write_queue.close()
+		# 큐를 거친 행 + 저널에서 재전송된 행 = 전체
+		assert len(database.rows(LOG_SQL)) + write_queue.metrics()['journal_rows'] == 6
+
+if __name__ == "__main__":
+	test_batches_and_flush_on_close()
+	test_journal_when_database_down()
+	test_poison_row_dead_lettered()
+	test_backpressure_spills_to_journal()
+	print("🎉 DB 쓰기 지연 큐 테스트 완료!")
@@ -0,0 +1,207 @@
+"""
+계좌 스냅샷 모듈
+잔고/현재가 조회 결과를 버전이 붙은 스냅샷으로 캐시하여 한 사이클 안의 중복 조회를 없앱니다.
+
+- 사이클 시작 시 한 번 조회하고, 이후에는 우리 주문(매수/매도)이 발생했을 때만 무효화
+- 평가금액/비중/미실현 손익 등 파생 값은 스냅샷의 계산 속성으로 제공
+- 인증 API 호출은 사이클당 1회(거래가 있으면 2회), 여러 심볼도 같은 잔고 목록에서 스냅샷 생성
+"""
+
+import time
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from config.settings import TRADING_SYMBOL
+from data.realtime_feed import get_latest_price
+
+def parse_balances(balances: Any, currency: str = 'BTC') -> Tuple[float, float, float]:
+    """get_balances 응답(리스트/딕셔너리)에서 (KRW 잔고, 코인 잔고, 평균 매수가)"""
+    if isinstance(balances, dict):
+        balances = [{'currency': name, **data} for name, data in balances.items() if isinstance(data, dict)]
+    krw_balance = coin_balance = avg_buy_price = 0.0
+    for balance in balances or []:
+        if not isinstance(balance, dict):
+            continue
+        if balance.get('currency') == 'KRW':
+            krw_balance = float(balance.get('balance', 0))
+        elif balance.get('currency') == currency:
+            coin_balance = float(balance.get('balance', 0))
+            avg_buy_price = float(balance.get('avg_buy_price', 0))
+    return krw_balance, coin_balance, avg_buy_price
+
+@dataclass(frozen=True)
+class AccountSnapshot:
+    """특정 시점의 계좌 상태 (파생 값은 계산 속성)"""
+    krw_balance: float
+    btc_balance: float
+    btc_avg_price: float
+    current_price: float
+    version: int = 0
+    taken_at: float = 0.0
+    symbol: str = TRADING_SYMBOL
+
+    @property
+    def currency(self) -> str:
+        return self.symbol.split('-')[-1]
+
+    @property
+    def btc_value(self) -> float:
+        """비트코인 평가금액"""
+        return self.btc_balance * self.current_price
+
+    @property
+    def total_assets(self) -> float:
+        return self.krw_balance + self.btc_value
+
+    @property
+    def btc_ratio(self) -> float:
+        """총 자산 중 비트코인 비중 (%)"""
+        return self.btc_value / self.total_assets * 100 if self.total_assets else 0.0
+
+    @property
+    def total_investment(self) -> float:
+        """평균 매수가 기준 투자금액"""
+        return self.btc_avg_price * self.btc_balance
+
+    @property
+    def unrealized_pnl(self) -> float:
+        """미실현 손익 (원)"""
+        return self.btc_value - self.total_investment if self.current_price else 0.0
+
+    @property
+    def unrealized_pnl_percent(self) -> float:
+        return self.unrealized_pnl / self.total_investment * 100 if self.total_investment else 0.0
+
+    @property
+    def performance_grade(self) -> str:
+        """투자 성과 등급"""
+        percent = self.unrealized_pnl_percent
+        if percent >= 20:
+            return "A+ (우수)"
+        if percent >= 10:
+            return "A (양호)"
+        if percent >= 0:
+            return "B (보통)"
+        if percent >= -10:
+            return "C (주의)"
+        return "D (위험)"
+
+    def as_status(self) -> Dict[str, Any]:
+        """기존 투자 상태 딕셔너리 형식"""
+        return {
+            'krw_balance': self.krw_balance,
+            'btc_balance': self.btc_balance,
+            'btc_avg_price': self.btc_avg_price,
+            'current_price': self.current_price,
+        }
+
+    def report(self) -> None:
+        """계좌 상태 출력"""
+        print(f"💰 보유 현금: {self.krw_balance:,.2f}원")
+        print(f"₿ 보유 {self.currency}: {self.btc_balance:.8f} {self.currency}")
+        if self.btc_avg_price > 0:
+            print(f"📈 평균 매수가: {self.btc_avg_price:,.0f}원")
+        if not self.current_price:
+            print(f"❌ 현재 {self.symbol} 가격 조회 실패")
+            return
+        print(f"📊 현재 {self.symbol} 가격: {self.current_price:,.0f}원")
+        if self.btc_balance <= 0:
+            return
+        print(f"💎 {self.currency} 평가금액: {self.btc_value:,.2f}원")
+        print(f"🏦 총 자산: {self.total_assets:,.2f}원")
+        print(f"📊 {self.currency} 비중: {self.btc_ratio:.2f}%")
+        if self.btc_avg_price > 0:
+            print(f"💼 총 투자금액: {self.total_investment:,.0f}원")
+            print(f"📊 총 수익/손실: {self.unrealized_pnl:,.0f}원 ({self.unrealized_pnl_percent:+.2f}%)")
+            print(f"🏆 투자 성과 등급: {self.performance_grade}")
+
+class AccountService:
+    """사이클 단위 계좌 스냅샷 캐시 (우리 주문 이벤트로만 무효화)"""
+
+    def __init__(self, upbit, symbol: str = TRADING_SYMBOL,
+                 price_source: Callable[[str], Optional[float]] = get_latest_price):
+        self.upbit = upbit
+        self.symbol = symbol  # snapshot()에 심볼을 주지 않을 때의 기본 심볼
+        self.currency = symbol.split('-')[-1]
+        self.price_source = price_source
+        self.version = 0
+        self.fetches = 0  # 잔고 조회(인증 API) 횟수
+        self._balances: Optional[List[Dict[str, Any]]] = None
+        self._balances_version = -1
+        self._snapshots: Dict[str, AccountSnapshot] = {}
+        self._lock = threading.Lock()
+
+    def _load_balances(self) -> Optional[List[Dict[str, Any]]]:
+        """현재 버전의 잔고 목록 (버전당 1회 조회, 실패 시 None) - 잠금 안에서 호출"""
+        if self._balances is not None and self._balances_version == self.version:
+            return self._balances
+        version = self.version
+        try:
+            balances = self.upbit.get_balances()
+            self.fetches += 1
+        except Exception as e:
+            print(f"❌ 잔고 조회 실패: {e}")
+            return None
+        if balances is None or (isinstance(balances, dict) and 'error' in balances):
+            print(f"❌ 잔고 조회 실패: {balances}")
+            return None
+        if isinstance(balances, dict):
+            balances = [{'currency': name, **data} for name, data in balances.items() if isinstance(data, dict)]
+        self._balances, self._balances_version = list(balances), version
+        self._snapshots = {}
+        return self._balances
+
+    def snapshot(self, symbol: Optional[str] = None,
+                 current_price: Optional[float] = None) -> Optional[AccountSnapshot]:
+        """
+        현재 버전의 심볼 스냅샷 (없거나 무효화되었으면 잔고를 한 번 조회, 실패 시 None)
+
+        current_price를 주면 현재가 조회를 생략합니다 (여러 심볼 현재가를 한 번에 조회한 경우).
+        """
+        symbol = symbol or self.symbol
+        with self._lock:
+            cached = self._snapshots.get(symbol)
+            if cached is not None and cached.version == self.version:
+                return cached
+            balances = self._load_balances()
+            if balances is None:
+                return None
+            krw_balance, coin_balance, avg_buy_price = parse_balances(balances, symbol.split('-')[-1])
+            if current_price is None:
+                current_price = self.price_source(symbol)
+            snapshot = AccountSnapshot(krw_balance, coin_balance, avg_buy_price, float(current_price or 0.0),
+                                       version=self._balances_version, taken_at=time.time(), symbol=symbol)
+            self._snapshots[symbol] = snapshot
+            return snapshot
+
+    def held_symbols(self, quote: str = 'KRW') -> List[str]:
+        """현재 버전 잔고에서 보유 수량이 있는 코인의 마켓 코드 (조회 실패 시 빈 목록)"""
+        with self._lock:
+            balances = self._load_balances() or []
+        return [f"{quote}-{balance['currency']}" for balance in balances
+                if isinstance(balance, dict) and balance.get('currency') not in (None, quote)
+                and float(balance.get('balance', 0) or 0) > 0]
+
+    def invalidate(self, reason: str = '') -> int:
+        """스냅샷 무효화 (우리 주문 체결/사이클 시작 시), 새 버전 반환"""
+        with self._lock:
+            self.version += 1
+            if reason:
+                print(f"🔄 계좌 스냅샷 무효화 (v{self.version}): {reason}")
+            return self.version
+
+    def begin_cycle(self) -> int:
+        """새 트레이딩 사이클 시작 (외부 입출금 등을 반영하도록 다음 조회에서 갱신)"""
+        return self.invalidate()
+
+_services: Dict[int, AccountService] = {}
+_services_lock = threading.Lock()
+
+def get_account_service(upbit) -> AccountService:
+    """업비트 클라이언트별 공용 계좌 서비스 반환 (심볼별 스냅샷은 snapshot(symbol))"""
+    key = id(upbit)
+    with _services_lock:
+        service = _services.get(key)
+        if service is None or service.upbit is not upbit:
+            service = _services[key] = AccountService(upbit)
+        return service
@@ -3,19 +3,60 @@
 AI 결정에 따른 실제 매매를 실행합니다.
 """
 
-import time
 from typing import Optional, Dict, Any
-from config.settings import get_trading_config
+from config.settings import get_trading_config, TRADING_SYMBOL, EXECUTION_ALGORITHM
 from database.trade_recorder import save_trade_record, save_market_data_record, save_system_log_record
+from .order_tracker import OrderFill
+from .execution_algos import ExecutionReport, execute_order
+from .account_snapshot import get_account_service
 # from account.profit_loss import get_total_profit_loss
 
-def execute_trading_decision(upbit, decision: Dict[str, Any], investment_status: Optional[Dict[str, Any]], market_data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-    """AI 결정에 따른 매매 실행"""
+def apply_order_fill(execution_result: Dict[str, Any], fill: OrderFill) -> Dict[str, Any]:
+    """체결 추적 결과로 가격/수량/금액/수수료를 실제 값으로 갱신 (체결 전이면 주문 시점 추정치 유지)"""
+    if fill.filled:
+        execution_result.update({
+            'price': fill.avg_price,
+            'amount': fill.executed_volume,
+            'total_value': fill.funds,
+            'fee': fill.paid_fee,
+        })
+    if fill.timed_out:
+        execution_result['status'] = 'pending'
+    elif not fill.filled:
+        execution_result.update({'status': 'cancelled', 'success': False})
+    execution_result['fill_latency'] = fill.elapsed
+    return execution_result
+
+def apply_execution_report(execution_result: Dict[str, Any], report: ExecutionReport) -> Dict[str, Any]:
+    """실행 알고리즘 결과(자식 주문 합계)와 도착가 대비 슬리피지 반영"""
+    apply_order_fill(execution_result, report.as_fill())
+    execution_result.update({
+        'algorithm': report.algorithm,
+        'order_ids': report.order_ids,
+        'arrival_price': report.arrival_price,
+        'slippage_bps': report.slippage_bps,
+    })
+    if report.live_order_ids:
+        execution_result['live_order_ids'] = list(report.live_order_ids)
+    return execution_result
+
+def execute_trading_decision(upbit, decision: Dict[str, Any], investment_status: Optional[Dict[str, Any]],
+                             market_data: Optional[Dict[str, Any]] = None, symbol: str = TRADING_SYMBOL,
+                             budget: Optional[float] = None, algorithm: str = EXECUTION_ALGORITHM) -> Dict[str, Any]:
+    """
+    AI 결정에 따른 매매 실행
+
+    budget을 주면 매수 금액으로 그 금액을 사용합니다 (여러 심볼이 현금을 나눠 쓰는 포트폴리오 배분).
+    algorithm은 주문 실행 알고리즘입니다 (손절매처럼 바로 체결해야 하는 주문은 'market').
+    investment_status의 btc_* 키는 해당 심볼 코인의 잔고/평균가입니다.
+    """
+    currency = symbol.split('-')[-1]
     print("=" * 50)
-    print("🔄 매매 실행 중")
+    print(f"🔄 매매 실행 중 ({symbol})")
     print("=" * 50)
     
     execution_result = {
+        'symbol': symbol,
         'action': 'none',
         'price': 0,
         'amount': 0,
@@ -40,9 +81,15 @@ def execute_trading_decision(upbit, decision: Dict[str, Any], investment_status:
     current_price = investment_status.get('current_price', 0)
     
     print(f"💰 보유 현금: {krw_balance:,.2f}원")
-    print(f"₿ 보유 비트코인: {btc_balance:.8f} BTC")
+    print(f"₿ 보유 {currency}: {btc_balance:.8f} {currency}")
     print(f"📊 현재 가격: {current_price:,.0f}원")
     
+    if decision['decision'] in ('buy', 'sell') and not (current_price and current_price > 0):
+        # 가격을 모르면 수량/금액 계산과 체결 기록을 할 수 없으므로 주문하지 않음
+        print(f"❌ {symbol} 현재 가격을 알 수 없어 매매를 건너뜁니다.")
+        execution_result['status'] = 'no_price'
+        return execution_result
+    
     if decision['decision'] == 'buy':
         print("🟢 매수 신호 감지")
         
@@ -59,10 +106,17 @@ def execute_trading_decision(upbit, decision: Dict[str, Any], investment_status:
                 pass
             return execution_result
         
-        # 매수 금액 계산 (전체 현금의 95% 사용, 수수료 고려)
-        buy_amount = krw_balance * trade_ratio
-        if buy_amount < min_trade_amount:
-            buy_amount = min_trade_amount
+        # 매수 금액 계산 (전체 현금의 95% 사용, 수수료 고려 - 배분 금액이 있으면 그 금액)
+        if budget is not None:
+            buy_amount = min(budget, krw_balance)
+            if buy_amount < min_trade_amount:
+                print(f"❌ 배분 금액이 최소 거래금액보다 작아 매수 건너뜀: {buy_amount:,.2f}원")
+                execution_result['status'] = 'insufficient_balance'
+                return execution_result
+        else:
+            buy_amount = krw_balance * trade_ratio
+            if buy_amount < min_trade_amount:
+                buy_amount = min_trade_amount
         
         print(f"💰 매수 금액: {buy_amount:,.2f}원")
         
@@ -74,19 +128,20 @@ def execute_trading_decision(upbit, decision: Dict[str, Any], investment_status:
         print(f"📦 실제 구매 금액: {actual_buy_amount:,.2f}원")
         
         # 예상 구매 수량
-        if current_price > 0:
-            expected_btc = actual_buy_amount / current_price
-            print(f"📊 예상 구매 수량: {expected_btc:.8f} BTC")
+        expected_btc = actual_buy_amount / current_price
+        print(f"📊 예상 구매 수량: {expected_btc:.8f} {currency}")
         
         # 매수 실행
-        print(f"\n🚀 {buy_amount:,.2f}원 비트코인 매수를 실행합니다...")
+        print(f"\n🚀 {buy_amount:,.2f}원 {symbol} 매수를 실행합니다...")
         print("⚠️ 실제 거래가 발생합니다!")
         
         try:
-            result = upbit.buy_market_order("KRW-BTC", buy_amount)
-            if result:
+            # 설정된 실행 알고리즘으로 주문 (지정가 대기/TWAP/호가 잔량 내 시장가)
+            report = execute_order(upbit, symbol, 'bid', buy_amount, arrival_price=current_price,
+                                   algorithm=algorithm)
+            if report.order_ids:
                 print("✅ 매수 주문 성공!")
-                print(f"📋 주문 결과: {result}")
+                print(f"📋 주문: {', '.join(report.order_ids)}")
                 
                 # 거래 결과 정보 업데이트
                 execution_result.update({
@@ -95,19 +150,15 @@ def execute_trading_decision(upbit, decision: Dict[str, Any], investment_status:
                     'amount': expected_btc,
                     'total_value': buy_amount,
                     'fee': fee_amount,
-                    'order_id': result.get('uuid', ''),
+                    'order_id': report.order_ids[0],
                     'status': 'executed',
                     'success': True
                 })
                 
-                # 주문 후 잠시 대기
-                print("⏳ 주문 처리 중... (3초 대기)")
-                time.sleep(3)
-                
-                # 매수 후 계좌 상태 재확인
-                print("\n📊 매수 후 계좌 상태:")
-                from .account import get_investment_status
-                get_investment_status(upbit)
+                # 주문별 체결 조회 결과 합계로 실제 체결 내역 반영
+                apply_execution_report(execution_result, report)
+                # 잔고가 바뀌었으므로 다음 계좌 조회에서 새 스냅샷 사용
+                get_account_service(upbit).invalidate(f"매수 주문 {execution_result['order_id']}")
                 
                 # 거래 기록 저장
                 save_trade_record(decision, execution_result, investment_status, market_data)
@@ -127,9 +178,9 @@ def execute_trading_decision(upbit, decision: Dict[str, Any], investment_status:
         
         # 최소 거래금액 확인
         if btc_balance * current_price < min_trade_amount:
-            print(f"❌ 보유 비트코인이 부족하여 매도 건너뜀")
+            print(f"❌ 보유 {currency}이(가) 부족하여 매도 건너뜀")
             print(f"   필요 금액: {min_trade_amount:,}원")
-            print(f"   보유 비트코인 가치: {btc_balance * current_price:,.2f}원")
+            print(f"   보유 {currency} 가치: {btc_balance * current_price:,.2f}원")
             execution_result['status'] = 'insufficient_balance'
             # 시스템 로그 저장 (DB)
             try:
@@ -138,26 +189,27 @@ def execute_trading_decision(upbit, decision: Dict[str, Any], investment_status:
                 pass
             return execution_result
         
-        # 매도 수량 계산 (전체 비트코인의 95% 매도, 수수료 고려)
+        # 매도 수량 계산 (보유 수량의 95% 매도, 수수료 고려)
         sell_amount = btc_balance * trade_ratio
         if sell_amount * current_price < min_trade_amount:
             sell_amount = btc_balance  # 전체 매도
         
-        print(f"₿ 매도 수량: {sell_amount:.8f} BTC")
+        print(f"₿ 매도 수량: {sell_amount:.8f} {currency}")
         
         # 예상 매도 금액
         expected_sell_amount = sell_amount * current_price
         print(f"💰 예상 매도 금액: {expected_sell_amount:,.2f}원")
         
         # 매도 실행
-        print(f"\n🚀 {sell_amount:.8f} BTC 비트코인 매도를 실행합니다...")
+        print(f"\n🚀 {sell_amount:.8f} {currency} 매도를 실행합니다...")
         print("⚠️ 실제 거래가 발생합니다!")
         
         try:
-            result = upbit.sell_market_order("KRW-BTC", sell_amount)
-            if result:
+            report = execute_order(upbit, symbol, 'ask', sell_amount, arrival_price=current_price,
+                                   algorithm=algorithm)
+            if report.order_ids:
                 print("✅ 매도 주문 성공!")
-                print(f"📋 주문 결과: {result}")
+                print(f"📋 주문: {', '.join(report.order_ids)}")
                 
                 # 거래 결과 정보 업데이트
                 execution_result.update({
@@ -166,19 +218,13 @@ def execute_trading_decision(upbit, decision: Dict[str, Any], investment_status:
                     'amount': sell_amount,
                     'total_value': expected_sell_amount,
                     'fee': expected_sell_amount * fee_rate,
-                    'order_id': result.get('uuid', ''),
+                    'order_id': report.order_ids[0],
                     'status': 'executed',
                     'success': True
                 })
                 
-                # 주문 후 잠시 대기
-                print("⏳ 주문 처리 중... (3초 대기)")
-                time.sleep(3)
-                
-                # 매도 후 계좌 상태 재확인
-                print("\n📊 매도 후 계좌 상태:")
-                from .account import get_investment_status
-                get_investment_status(upbit)
+                apply_execution_report(execution_result, report)
+                get_account_service(upbit).invalidate(f"매도 주문 {execution_result['order_id']}")
                 
                 # 거래 기록 저장
                 save_trade_record(decision, execution_result, investment_status, market_data)
@@ -0,0 +1,341 @@
+"""
+주문 실행 알고리즘 모듈
+전량을 시장가 한 번으로 주문하는 대신 호가를 보고 나눠서 주문합니다.
+
+- market: 최우선 호가 대비 EXECUTION_MAX_IMPACT_BPS 안의 잔량만큼씩 시장가 (호가를 훑지 않음)
+- passive: 최우선 호가(매수는 매수 1호가, 매도는 매도 1호가)에 지정가로 대기, 시간 초과 시 취소 후 남은 수량 market
+- twap: 전체 수량을 N개 조각으로 나눠 일정 간격으로 passive, 못 채운 수량은 다음 조각으로 이월하고 마지막에 market
+- 체결마다 도착 가격(주문 시작 시점 중간 호가) 대비 슬리피지(bp)를 계산
+- 지정가 취소가 확인되지 않으면(취소 실패/지연) 과다 체결을 막기 위해 시장가로 넘어가지 않고 대기 주문을 보고
+
+매수 수량은 원화 금액, 매도 수량은 코인 수량 단위입니다.
+"""
+
+import math
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import pyupbit
+from config.settings import (
+    TRADING_SYMBOL, MIN_TRADE_AMOUNT, EXECUTION_ALGORITHM, EXECUTION_PASSIVE_TIMEOUT, EXECUTION_CANCEL_TIMEOUT,
+    EXECUTION_CANCEL_RETRIES, EXECUTION_MAX_IMPACT_BPS, EXECUTION_REFILL_WAIT, EXECUTION_MAX_CHILDREN,
+    EXECUTION_TWAP_SLICES, EXECUTION_TWAP_INTERVAL
+)
+from data.realtime_feed import get_market_feed
+from .order_tracker import OrderTracker, OrderFill
+
+BID, ASK = 'bid', 'ask'
+ALGORITHMS = ('market', 'passive', 'twap')
+
+def best_quotes(orderbook: Optional[Dict[str, Any]]) -> Optional[Tuple[float, float]]:
+    """(최우선 매수호가, 최우선 매도호가), 호가가 없으면 None"""
+    units = (orderbook or {}).get('orderbook_units') or []
+    if not units:
+        return None
+    bid, ask = float(units[0].get('bid_price') or 0), float(units[0].get('ask_price') or 0)
+    return (bid, ask) if bid > 0 and ask > 0 else None
+
+def mid_price(orderbook: Optional[Dict[str, Any]]) -> Optional[float]:
+    quotes = best_quotes(orderbook)
+    return (quotes[0] + quotes[1]) / 2 if quotes else None
+
+def depth_within(orderbook: Optional[Dict[str, Any]], side: str, max_impact_bps: float) -> Tuple[float, float]:
+    """
+    최우선 호가 대비 max_impact_bps 안에 있는 상대 호가 잔량 (수량, 원화 금액)
+
+    매수는 매도 호가, 매도는 매수 호가를 소진하므로 그쪽 잔량을 합산합니다.
+    """
+    units = (orderbook or {}).get('orderbook_units') or []
+    price_key, size_key = ('ask_price', 'ask_size') if side == BID else ('bid_price', 'bid_size')
+    volume = funds = 0.0
+    best = None
+    for unit in units:
+        price, size = float(unit.get(price_key) or 0), float(unit.get(size_key) or 0)
+        if price <= 0:
+            continue
+        best = best or price
+        impact = (price - best) / best if side == BID else (best - price) / best
+        if impact * 10000 > max_impact_bps + 1e-9:
+            break
+        volume += size
+        funds += size * price
+    return volume, funds
+
+def slippage_bps(side: str, arrival_price: float, avg_price: float) -> float:
+    """도착 가격 대비 불리한 방향 슬리피지 (bp, 양수면 비용 - 매수는 비싸게, 매도는 싸게 체결)"""
+    if not arrival_price or not avg_price:
+        return 0.0
+    sign = 1 if side == BID else -1
+    return sign * (avg_price - arrival_price) / arrival_price * 10000
+
+@dataclass
+class ExecutionReport:
+    """알고리즘 실행 결과 (자식 주문 체결 목록과 집계)"""
+    symbol: str
+    side: str
+    algorithm: str
+    target: float  # 매수는 원화 금액, 매도는 코인 수량
+    arrival_price: float = 0.0
+    fills: List[OrderFill] = field(default_factory=list)
+    elapsed: float = 0.0  # 초
+    live_order_ids: List[str] = field(default_factory=list)  # 취소가 확인되지 않아 아직 대기 중일 수 있는 지정가 주문
+
+    @property
+    def executed_volume(self) -> float:
+        return sum(fill.executed_volume for fill in self.fills)
+
+    @property
+    def funds(self) -> float:
+        return sum(fill.funds for fill in self.fills)
+
+    @property
+    def paid_fee(self) -> float:
+        return sum(fill.paid_fee for fill in self.fills)
+
+    @property
+    def avg_price(self) -> float:
+        return self.funds / self.executed_volume if self.executed_volume else 0.0
+
+    @property
+    def executed(self) -> float:
+        """target 단위 체결량"""
+        return self.funds if self.side == BID else self.executed_volume
+
+    @property
+    def slippage_bps(self) -> float:
+        return slippage_bps(self.side, self.arrival_price, self.avg_price)
+
+    @property
+    def order_ids(self) -> List[str]:
+        return [fill.uuid for fill in self.fills if fill.uuid]
+
+    def as_fill(self) -> OrderFill:
+        """기존 체결 결과 형식으로 집계 (execution.apply_order_fill 입력)"""
+        return OrderFill(
+            uuid=self.order_ids[0] if self.order_ids else '',
+            side=self.side,
+            state='wait' if self.live_order_ids else 'done' if self.executed_volume > 0 else 'cancel',
+            executed_volume=self.executed_volume,
+            avg_price=self.avg_price,
+            funds=self.funds,
+            paid_fee=self.paid_fee,
+            trades_count=sum(fill.trades_count for fill in self.fills),
+            elapsed=self.elapsed,
+            polls=sum(fill.polls for fill in self.fills),
+            timed_out=bool(self.live_order_ids) or any(fill.timed_out for fill in self.fills),
+        )
+
+    def print_summary(self) -> None:
+        print(f"📐 실행 알고리즘 {self.algorithm}: 주문 {len(self.fills)}건, "
+              f"{self.executed_volume:.8f} @ {self.avg_price:,.2f}원, "
+              f"도착가 {self.arrival_price:,.2f}원 대비 슬리피지 {self.slippage_bps:+.2f}bp ({self.elapsed:.1f}초)")
+        if self.live_order_ids:
+            print(f"⚠️ 취소 미확인 지정가 주문 (대기 중일 수 있음): {', '.join(self.live_order_ids)}")
+
+class ExecutionAlgorithm:
+    """호가 기반 주문 실행 (지정가 대기, TWAP 분할, 호가 잔량 기준 시장가 분할)"""
+
+    def __init__(self, upbit, symbol: str = TRADING_SYMBOL,
+                 orderbook_source: Optional[Callable[[str], Optional[Dict[str, Any]]]] = None,
+                 min_order: float = MIN_TRADE_AMOUNT,
+                 passive_timeout: float = EXECUTION_PASSIVE_TIMEOUT,
+                 cancel_timeout: float = EXECUTION_CANCEL_TIMEOUT,
+                 cancel_retries: int = EXECUTION_CANCEL_RETRIES,
+                 max_impact_bps: float = EXECUTION_MAX_IMPACT_BPS,
+                 refill_wait: float = EXECUTION_REFILL_WAIT,
+                 max_children: int = EXECUTION_MAX_CHILDREN,
+                 sleep: Callable[[float], None] = time.sleep,
+                 clock: Callable[[], float] = time.monotonic):
+        self.upbit = upbit
+        self.symbol = symbol
+        self.orderbook_source = orderbook_source
+        self.min_order = min_order
+        self.passive_timeout = passive_timeout
+        self.cancel_timeout = cancel_timeout
+        self.cancel_retries = max(1, int(cancel_retries))
+        self.max_impact_bps = max_impact_bps
+        self.refill_wait = refill_wait
+        self.max_children = max_children
+        self.sleep = sleep
+        self.clock = clock
+
+    def orderbook(self) -> Optional[Dict[str, Any]]:
+        """현재 호가 (실시간 피드 스냅샷 우선, 없으면 클라이언트 조회, 조회 불가 시 None)"""
+        try:
+            if self.orderbook_source is not None:
+                return self.orderbook_source(self.symbol)
+            feed = get_market_feed()
+            orderbook = feed.get_orderbook(self.symbol) if feed is not None else None
+            if orderbook is None and hasattr(self.upbit, 'get_orderbook'):
+                orderbook = self.upbit.get_orderbook(self.symbol)
+            return orderbook if isinstance(orderbook, dict) else None
+        except Exception as e:
+            print(f"⚠️ 호가 조회 실패: {e}")
+            return None
+
+    def tracker(self, timeout: Optional[float] = None) -> OrderTracker:
+        if timeout is None:
+            return OrderTracker(self.upbit, sleep=self.sleep, clock=self.clock)
+        return OrderTracker(self.upbit, timeout=timeout, sleep=self.sleep, clock=self.clock)
+
+    def execute(self, side: str, amount: float, algorithm: str = EXECUTION_ALGORITHM,
+                arrival_price: Optional[float] = None, slices: int = EXECUTION_TWAP_SLICES,
+                interval: float = EXECUTION_TWAP_INTERVAL) -> ExecutionReport:
+        """
+        주문 실행
+
+        Args:
+            side: 'bid'(매수) 또는 'ask'(매도)
+            amount: 매수는 원화 금액, 매도는 코인 수량
+            algorithm: market, passive, twap (알 수 없는 값은 market)
+            arrival_price: 호가를 조회할 수 없을 때 슬리피지 기준 가격
+
+        지정가 주문 취소가 확인되지 않으면 남은 수량을 시장가로 주문하지 않고 중단하며,
+        해당 주문은 report.live_order_ids로 보고합니다.
+        """
+        started = self.clock()
+        orderbook = self.orderbook()
+        report = ExecutionReport(self.symbol, side, algorithm if algorithm in ALGORITHMS else 'market',
+                                 amount, mid_price(orderbook) or float(arrival_price or 0))
+
+        if orderbook is None or report.algorithm == 'market':
+            # 호가를 모르면 지정가 가격을 정할 수 없으므로 바로 시장가
+            report.algorithm = 'market'
+            self._cross(report, amount)
+        elif report.algorithm == 'passive':
+            self._passive(report, amount, self.passive_timeout)
+            if not report.live_order_ids:
+                self._cross(report, amount - report.executed)
+        else:
+            slices = max(1, int(slices))
+            for index in range(slices):
+                slice_started = self.clock()
+                remaining = amount - report.executed
+                target = remaining / (slices - index)
+                if not self._below_min(side, target, report.arrival_price):
+                    self._passive(report, target, min(self.passive_timeout, interval))
+                    if report.live_order_ids:
+                        break
+                elif index < slices - 1:
+                    continue  # 조각이 최소 주문금액보다 작으면 다음 조각에 합침
+                if index < slices - 1:
+                    self.sleep(max(0.0, interval - (self.clock() - slice_started)))
+            if not report.live_order_ids:
+                self._cross(report, amount - report.executed)
+
+        report.elapsed = self.clock() - started
+        for fill in report.fills:
+            print(f"  • {fill.uuid}: {fill.executed_volume:.8f} @ {fill.avg_price:,.2f}원 "
+                  f"(슬리피지 {slippage_bps(side, report.arrival_price, fill.avg_price):+.2f}bp)")
+        report.print_summary()
+        return report
+
+    def _below_min(self, side: str, amount: float, price: float) -> bool:
+        """target 단위 수량이 최소 주문금액 미만인지 (매도인데 가격을 모르면 판단하지 않음)"""
+        if side == BID:
+            return amount < self.min_order
+        return amount * price < self.min_order if price else amount <= 0
+
+    def _place_limit(self, side: str, price: float, volume: float) -> Optional[Dict[str, Any]]:
+        price = pyupbit.get_tick_size(price, 'floor' if side == BID else 'ceil')
+        volume = math.floor(volume * 1e8) / 1e8
+        if volume <= 0:
+            return None
+        if side == BID:
+            return self.upbit.buy_limit_order(self.symbol, price, volume)
+        return self.upbit.sell_limit_order(self.symbol, price, volume)
+
+    def _place_market(self, side: str, amount: float) -> Optional[Dict[str, Any]]:
+        if side == BID:
+            return self.upbit.buy_market_order(self.symbol, math.floor(amount))
+        return self.upbit.sell_market_order(self.symbol, math.floor(amount * 1e8) / 1e8)
+
+    def _record(self, report: ExecutionReport, fill: OrderFill) -> float:
+        """체결 기록, target 단위 체결량 반환"""
+        report.fills.append(fill)
+        return fill.funds if report.side == BID else fill.executed_volume
+
+    def _passive(self, report: ExecutionReport, amount: float, timeout: float) -> float:
+        """최우선 호가 지정가 주문 후 timeout까지 대기, 미체결분은 취소 (체결량 반환)"""
+        quotes = best_quotes(self.orderbook())
+        if quotes is None:
+            return 0.0
+        price = quotes[0] if report.side == BID else quotes[1]
+        if self._below_min(report.side, amount, price):
+            return 0.0
+        volume = amount / price if report.side == BID else amount
+        try:
+            result = self._place_limit(report.side, price, volume)
+        except Exception as e:
+            print(f"❌ 지정가 주문 오류: {e}")
+            return 0.0
+        if not result or not result.get('uuid'):
+            print(f"❌ 지정가 주문 실패: {result}")
+            return 0.0
+        uuid = result['uuid']
+        print(f"⏳ 지정가 {'매수' if report.side == BID else '매도'} {volume:.8f} @ {price:,.2f}원 대기 (최대 {timeout:.0f}초)")
+        fill = self.tracker(timeout).wait_for_fill(uuid)
+        if not fill.is_final:
+            fill = self._cancel(uuid, fill)
+            if not fill.is_final:
+                # 주문이 남아 있을 수 있으므로 남은 수량을 시장가로 주문하면 과다 체결
+                report.live_order_ids.append(uuid)
+        return self._record(report, fill)
+
+    def _cancel(self, uuid: str, fill: OrderFill) -> OrderFill:
+        """지정가 주문 취소 후 종료 상태 확인 (실패하거나 반영되지 않으면 cancel_retries번까지 재시도, 마지막 조회 결과 반환)"""
+        for attempt in range(1, self.cancel_retries + 1):
+            try:
+                result = self.upbit.cancel_order(uuid)
+            except Exception as e:
+                result = None
+                print(f"⚠️ 지정가 주문 취소 오류 ({uuid}, {attempt}/{self.cancel_retries}회): {e}")
+            else:
+                if not isinstance(result, dict) or 'error' in result:
+                    print(f"⚠️ 지정가 주문 취소 실패 ({uuid}, {attempt}/{self.cancel_retries}회): {result}")
+            # 취소 요청이 실패해도 그 사이 전량 체결/취소됐을 수 있으므로 상태를 다시 확인
+            fill = self.tracker(self.cancel_timeout).wait_for_fill(uuid)
+            if fill.is_final:
+                break
+        return fill
+
+    def _cross(self, report: ExecutionReport, amount: float) -> float:
+        """남은 수량을 호가 잔량 안에서 시장가로 나눠 체결 (마지막 조각은 남은 수량 전부)"""
+        executed = 0.0
+        price = report.arrival_price
+        for child in range(self.max_children):
+            remaining = amount - executed
+            orderbook = self.orderbook()
+            quotes = best_quotes(orderbook)
+            if quotes is not None:
+                price = quotes[1] if report.side == BID else quotes[0]
+            if remaining <= 0 or self._below_min(report.side, remaining, price):
+                break
+            size = remaining
+            if quotes is not None and child < self.max_children - 1:
+                volume, funds = depth_within(orderbook, report.side, self.max_impact_bps)
+                capacity = funds if report.side == BID else volume
+                minimum = self.min_order if report.side == BID else self.min_order / price
+                # 호가 잔량만큼만 주문하되, 조각과 남는 수량 모두 최소 주문금액 이상일 때만 나눔
+                if 0 < capacity < remaining and not self._below_min(report.side, remaining - max(capacity, minimum), price):
+                    size = max(capacity, minimum)
+            try:
+                result = self._place_market(report.side, size)
+            except Exception as e:
+                print(f"❌ 시장가 주문 오류: {e}")
+                break
+            if not result or not result.get('uuid'):
+                print(f"❌ 시장가 주문 실패: {result}")
+                break
+            fill = self.tracker().wait_for_fill(result['uuid'])
+            executed += self._record(report, fill)
+            if not fill.filled:
+                break
+            if size < remaining:
+                self.sleep(self.refill_wait)  # 소진한 호가가 다시 채워질 시간
+        return executed
+
+def execute_order(upbit, symbol: str, side: str, amount: float, arrival_price: Optional[float] = None,
+                  algorithm: str = EXECUTION_ALGORITHM) -> ExecutionReport:
+    """설정된 실행 알고리즘으로 주문 (매수 amount는 원화, 매도 amount는 코인 수량)"""
+    return ExecutionAlgorithm(upbit, symbol).execute(side, amount, algorithm, arrival_price=arrival_price)
@@ -0,0 +1,118 @@
+"""
+주문 체결 추적 모듈
+주문 UUID를 점점 늘어나는 간격으로 조회하여 체결이 끝나면 실제 체결 수량/평균 체결가/수수료를 반환합니다.
+
+- 고정 3초 대기 대신 0.1초부터 조회를 시작하므로 시장가 주문은 보통 수백 ms 안에 사이클이 이어짐
+- 체결 정보는 주문 조회 결과의 trades 목록으로 계산 (주문 전 가격이 아닌 실제 체결가)
+- 업비트 시장가 매수는 잔여 금액이 남으면 'cancel' 상태로 끝나므로 done/cancel을 모두 종료 상태로 처리
+"""
+
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+from config.settings import ORDER_POLL_INITIAL_DELAY, ORDER_POLL_MAX_DELAY, ORDER_POLL_BACKOFF, ORDER_FILL_TIMEOUT
+
+FINAL_STATES = ('done', 'cancel')
+
+def _float(value: Any) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+@dataclass
+class OrderFill:
+    """주문 체결 결과"""
+    uuid: str
+    side: str = ''
+    state: str = ''
+    executed_volume: float = 0.0  # 체결 수량
+    avg_price: float = 0.0  # 평균 체결가
+    funds: float = 0.0  # 체결 금액 합계 (수수료 제외)
+    paid_fee: float = 0.0  # 실제 지불 수수료
+    trades_count: int = 0
+    elapsed: float = 0.0  # 조회 시작부터 종료까지 (초)
+    polls: int = 0
+    timed_out: bool = False
+
+    @property
+    def is_final(self) -> bool:
+        return self.state in FINAL_STATES
+
+    @property
+    def filled(self) -> bool:
+        return self.executed_volume > 0
+
+def summarize_order(order: Dict[str, Any]) -> OrderFill:
+    """업비트 주문 조회 결과를 체결 결과로 변환"""
+    trades = order.get('trades') or []
+    volume = sum(_float(trade.get('volume')) for trade in trades)
+    funds = sum(_float(trade.get('funds')) for trade in trades)
+    executed_volume = _float(order.get('executed_volume')) or volume
+    if not funds and executed_volume:
+        # trades가 없는 응답은 주문 가격 기준 (지정가)
+        funds = executed_volume * _float(order.get('price'))
+    return OrderFill(
+        uuid=order.get('uuid', ''),
+        side=order.get('side', ''),
+        state=order.get('state', ''),
+        executed_volume=executed_volume,
+        avg_price=funds / executed_volume if executed_volume else 0.0,
+        funds=funds,
+        paid_fee=_float(order.get('paid_fee')),
+        trades_count=int(order.get('trades_count') or len(trades)),
+    )
+
+class OrderTracker:
+    """주문 UUID 조회 기반 체결 추적"""
+
+    def __init__(self, upbit, initial_delay: float = ORDER_POLL_INITIAL_DELAY,
+                 max_delay: float = ORDER_POLL_MAX_DELAY, backoff: float = ORDER_POLL_BACKOFF,
+                 timeout: float = ORDER_FILL_TIMEOUT, sleep: Callable[[float], None] = time.sleep,
+                 clock: Callable[[], float] = time.monotonic):
+        self.upbit = upbit
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.backoff = backoff
+        self.timeout = timeout
+        self.sleep = sleep
+        self.clock = clock
+
+    def _fetch(self, uuid: str) -> Optional[Dict[str, Any]]:
+        try:
+            order = self.upbit.get_order(uuid)
+        except Exception as e:
+            print(f"⚠️ 주문 조회 실패 ({uuid}): {e}")
+            return None
+        if not isinstance(order, dict) or 'error' in order:
+            print(f"⚠️ 주문 조회 응답 오류 ({uuid}): {order}")
+            return None
+        return order
+
+    def wait_for_fill(self, uuid: str) -> OrderFill:
+        """주문이 종료 상태가 될 때까지 조회 (timeout 초과 시 마지막 조회 결과, timed_out=True)"""
+        started = self.clock()
+        delay = self.initial_delay
+        fill = OrderFill(uuid=uuid)
+        polls = 0
+        while True:
+            self.sleep(delay)
+            order = self._fetch(uuid)
+            polls += 1
+            if order is not None:
+                fill = summarize_order(order)
+                fill.uuid = fill.uuid or uuid
+            elapsed = self.clock() - started
+            if fill.is_final or elapsed >= self.timeout:
+                break
+            delay = min(self.max_delay, delay * self.backoff, max(0.0, self.timeout - elapsed))
+
+        fill.elapsed = self.clock() - started
+        fill.polls = polls
+        fill.timed_out = not fill.is_final
+        if fill.timed_out:
+            print(f"⏰ 주문 체결 대기 시간 초과 ({uuid}, 상태: {fill.state or '알 수 없음'}, {fill.elapsed:.1f}초)")
+        else:
+            print(f"✅ 주문 체결 확인 ({fill.elapsed * 1000:.0f}ms, 조회 {polls}회): "
+                  f"{fill.executed_volume:.8f} @ {fill.avg_price:,.0f}원, 수수료 {fill.paid_fee:,.2f}원")
+        return fill
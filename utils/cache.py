@@ -0,0 +1,208 @@
+"""
+공용 TTL 캐시 모듈
+외부 API 응답을 키별 TTL로 프로세스 내에 캐시합니다.
+
+- stale-while-revalidate: TTL이 지나도 stale_ttl 이내면 이전 값을 즉시 반환하고 백그라운드에서 갱신
+- single-flight: 같은 키의 동시 미스는 한 번만 조회하고 나머지는 결과를 기다림
+- 디스크 계층(선택): JSON 파일로 저장하여 재시작 후에도 사용
+"""
+
+import os
+import json
+import time
+import hashlib
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+from config.settings import CACHE_DIR
+
+@dataclass
+class CacheEntry:
+    """캐시 항목"""
+    value: Any
+    stored_at: float  # time.time()
+    ttl: float
+    stale_ttl: float = 0.0
+
+    def age(self, now: float) -> float:
+        return now - self.stored_at
+
+    def is_fresh(self, now: float) -> bool:
+        return self.age(now) < self.ttl
+
+    def is_usable(self, now: float) -> bool:
+        """신선하거나 stale 허용 구간 이내"""
+        return self.age(now) < self.ttl + self.stale_ttl
+
+class _Flight:
+    """진행 중인 조회 (single-flight)"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+
+class TTLCache:
+    """키별 TTL 캐시"""
+
+    def __init__(self, directory: Optional[str] = CACHE_DIR, clock: Callable[[], float] = time.time):
+        self.directory = directory
+        self.clock = clock
+        self.stats = {'hits': 0, 'stale_hits': 0, 'misses': 0, 'disk_hits': 0,
+                      'loads': 0, 'load_errors': 0, 'coalesced': 0, 'refreshes': 0}
+        self._entries: Dict[str, CacheEntry] = {}
+        self._flights: Dict[str, _Flight] = {}
+        self._lock = threading.Lock()
+
+    def get_or_load(self, key: str, loader: Callable[[], Any], ttl: float,
+                    stale_ttl: float = 0.0, persist: bool = False) -> Any:
+        """
+        캐시 값 반환, 없으면 loader로 조회하여 저장
+
+        Args:
+            key: 캐시 키
+            loader: 값 조회 함수 (None 반환 시 캐시하지 않음)
+            ttl: 신선 유지 시간 (초)
+            stale_ttl: TTL 이후 이전 값을 반환하며 백그라운드 갱신할 시간 (초)
+            persist: 디스크 계층 사용 여부 (값은 JSON 직렬화 가능해야 함)
+        """
+        now = self.clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None and persist:
+                entry = self._read_disk(key, ttl, stale_ttl)
+                if entry is not None:
+                    self._entries[key] = entry
+                    self.stats['disk_hits'] += 1
+
+            if entry is not None and entry.is_fresh(now):
+                self.stats['hits'] += 1
+                return entry.value
+
+            if entry is not None and entry.is_usable(now):
+                self.stats['stale_hits'] += 1
+                if key not in self._flights:
+                    self._flights[key] = _Flight()
+                    self.stats['refreshes'] += 1
+                    threading.Thread(target=self._refresh, args=(key, loader, ttl, stale_ttl, persist),
+                                     name=f"cache-refresh-{key}", daemon=True).start()
+                return entry.value
+
+            self.stats['misses'] += 1
+            flight = self._flights.get(key)
+            if flight is None:
+                self._flights[key] = _Flight()
+                leader = True
+            else:
+                self.stats['coalesced'] += 1
+                leader = False
+
+        if leader:
+            return self._load(key, loader, ttl, stale_ttl, persist)
+
+        flight.done.wait()
+        if flight.error is not None:
+            raise flight.error
+        return flight.value
+
+    def _load(self, key: str, loader: Callable[[], Any], ttl: float,
+              stale_ttl: float, persist: bool) -> Any:
+        """조회 실행 후 대기 중인 호출자에게 결과 전달"""
+        flight = self._flights[key]
+        try:
+            value = loader()
+            with self._lock:
+                self.stats['loads'] += 1
+                if value is not None:
+                    entry = CacheEntry(value, self.clock(), ttl, stale_ttl)
+                    self._entries[key] = entry
+            if value is not None and persist:
+                self._write_disk(key, entry)
+            flight.value = value
+            return value
+        except BaseException as e:
+            with self._lock:
+                self.stats['load_errors'] += 1
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                self._flights.pop(key, None)
+            flight.done.set()
+
+    def _refresh(self, key: str, loader: Callable[[], Any], ttl: float,
+                 stale_ttl: float, persist: bool) -> None:
+        """백그라운드 갱신 (실패 시 이전 값 유지)"""
+        try:
+            self._load(key, loader, ttl, stale_ttl, persist)
+        except Exception as e:
+            print(f"⚠️ 캐시 백그라운드 갱신 실패 ({key}): {e}")
+
+    def peek(self, key: str) -> Optional[CacheEntry]:
+        """메모리 캐시 항목 조회 (조회/통계 없음)"""
+        with self._lock:
+            return self._entries.get(key)
+
+    def invalidate(self, key: str) -> None:
+        """키 삭제 (메모리 및 디스크)"""
+        with self._lock:
+            self._entries.pop(key, None)
+        path = self._disk_path(key)
+        if path and os.path.exists(path):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def clear(self) -> None:
+        """메모리 캐시 전체 삭제"""
+        with self._lock:
+            self._entries.clear()
+
+    # ---- 디스크 계층 ----
+
+    def _disk_path(self, key: str) -> Optional[str]:
+        if not self.directory:
+            return None
+        digest = hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]
+        return os.path.join(self.directory, f"{digest}.json")
+
+    def _read_disk(self, key: str, ttl: float, stale_ttl: float) -> Optional[CacheEntry]:
+        path = self._disk_path(key)
+        if not path or not os.path.exists(path):
+            return None
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                stored = json.load(f)
+            if stored.get('key') != key:
+                return None
+            entry = CacheEntry(stored['value'], float(stored['stored_at']), ttl, stale_ttl)
+        except Exception as e:
+            print(f"⚠️ 캐시 파일 읽기 실패 ({key}): {e}")
+            return None
+        return entry if entry.is_usable(self.clock()) else None
+
+    def _write_disk(self, key: str, entry: CacheEntry) -> None:
+        path = self._disk_path(key)
+        if not path:
+            return
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            temp_path = f"{path}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump({'key': key, 'stored_at': entry.stored_at, 'value': entry.value},
+                          f, ensure_ascii=False)
+            os.replace(temp_path, path)
+        except Exception as e:
+            print(f"⚠️ 캐시 파일 저장 실패 ({key}): {e}")
+
+_cache = TTLCache()
+
+def get_cache() -> TTLCache:
+    """공용 캐시 반환"""
+    return _cache
+
+def cached_call(key: str, loader: Callable[[], Any], ttl: float,
+                stale_ttl: float = 0.0, persist: bool = False) -> Any:
+    """공용 캐시를 통한 조회"""
+    return _cache.get_or_load(key, loader, ttl, stale_ttl=stale_ttl, persist=persist)
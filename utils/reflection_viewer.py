@@ -5,7 +5,8 @@
 import json
 from datetime import datetime, timedelta
 from typing import Dict, Any, List, Optional
-from database.connection import get_db_connection
+from database.connection import pooled_connection
+from database.rollup import get_reflection_totals
 from mysql.connector import Error
 from utils.logger import get_logger
 
@@ -14,26 +15,26 @@ class ReflectionViewer:
     
     def __init__(self):
         self.logger = get_logger(__name__)
-        self.connection = get_db_connection()
     
     def get_recent_reflections(self, limit: int = 10) -> List[Dict[str, Any]]:
         """최근 반성 데이터 조회"""
         try:
-            cursor = self.connection.cursor(dictionary=True)
+            with pooled_connection() as connection:
+                cursor = connection.cursor(dictionary=True)
             
-            select_query = """
-            SELECT tr.*, t.decision, t.action, t.price, t.amount, t.total_value
-            FROM trading_reflections tr
-            JOIN trades t ON tr.trade_id = t.id
-            ORDER BY tr.created_at DESC
-            LIMIT %s
-            """
+                select_query = """
+                SELECT tr.*, t.decision, t.action, t.price, t.amount, t.total_value
+                FROM trading_reflections tr
+                JOIN trades t ON tr.trade_id = t.id
+                ORDER BY tr.created_at DESC
+                LIMIT %s
+                """
             
-            cursor.execute(select_query, (limit,))
-            reflections = cursor.fetchall()
+                cursor.execute(select_query, (limit,))
+                reflections = cursor.fetchall()
             
-            cursor.close()
-            return reflections
+                cursor.close()
+                return reflections
             
         except Error as e:
             self.logger.error(f"최근 반성 데이터 조회 오류: {e}")
@@ -42,20 +43,21 @@ class ReflectionViewer:
     def get_performance_metrics(self, period_type: str = 'daily', days: int = 30) -> List[Dict[str, Any]]:
         """성과 지표 조회"""
         try:
-            cursor = self.connection.cursor(dictionary=True)
+            with pooled_connection() as connection:
+                cursor = connection.cursor(dictionary=True)
             
-            select_query = """
-            SELECT * FROM performance_metrics
-            WHERE period_type = %s
-            AND period_start >= DATE_SUB(NOW(), INTERVAL %s DAY)
-            ORDER BY period_start DESC
-            """
+                select_query = """
+                SELECT * FROM performance_metrics
+                WHERE period_type = %s
+                AND period_start >= DATE_SUB(NOW(), INTERVAL %s DAY)
+                ORDER BY period_start DESC
+                """
             
-            cursor.execute(select_query, (period_type, days))
-            metrics = cursor.fetchall()
+                cursor.execute(select_query, (period_type, days))
+                metrics = cursor.fetchall()
             
-            cursor.close()
-            return metrics
+                cursor.close()
+                return metrics
             
         except Error as e:
             self.logger.error(f"성과 지표 조회 오류: {e}")
@@ -64,28 +66,29 @@ class ReflectionViewer:
     def get_learning_insights(self, insight_type: str = None, limit: int = 20) -> List[Dict[str, Any]]:
         """학습 인사이트 조회"""
         try:
-            cursor = self.connection.cursor(dictionary=True)
+            with pooled_connection() as connection:
+                cursor = connection.cursor(dictionary=True)
             
-            if insight_type:
-                select_query = """
-                SELECT * FROM learning_insights
-                WHERE insight_type = %s
-                ORDER BY created_at DESC
-                LIMIT %s
-                """
-                cursor.execute(select_query, (insight_type, limit))
-            else:
-                select_query = """
-                SELECT * FROM learning_insights
-                ORDER BY created_at DESC
-                LIMIT %s
-                """
-                cursor.execute(select_query, (limit,))
+                if insight_type:
+                    select_query = """
+                    SELECT * FROM learning_insights
+                    WHERE insight_type = %s
+                    ORDER BY created_at DESC
+                    LIMIT %s
+                    """
+                    cursor.execute(select_query, (insight_type, limit))
+                else:
+                    select_query = """
+                    SELECT * FROM learning_insights
+                    ORDER BY created_at DESC
+                    LIMIT %s
+                    """
+                    cursor.execute(select_query, (limit,))
             
-            insights = cursor.fetchall()
+                insights = cursor.fetchall()
             
-            cursor.close()
-            return insights
+                cursor.close()
+                return insights
             
         except Error as e:
             self.logger.error(f"학습 인사이트 조회 오류: {e}")
@@ -94,28 +97,29 @@ class ReflectionViewer:
     def get_strategy_improvements(self, status: str = None, limit: int = 20) -> List[Dict[str, Any]]:
         """전략 개선 제안 조회"""
         try:
-            cursor = self.connection.cursor(dictionary=True)
+            with pooled_connection() as connection:
+                cursor = connection.cursor(dictionary=True)
             
-            if status:
-                select_query = """
-                SELECT * FROM strategy_improvements
-                WHERE status = %s
-                ORDER BY created_at DESC
-                LIMIT %s
-                """
-                cursor.execute(select_query, (status, limit))
-            else:
-                select_query = """
-                SELECT * FROM strategy_improvements
-                ORDER BY created_at DESC
-                LIMIT %s
-                """
-                cursor.execute(select_query, (limit,))
+                if status:
+                    select_query = """
+                    SELECT * FROM strategy_improvements
+                    WHERE status = %s
+                    ORDER BY created_at DESC
+                    LIMIT %s
+                    """
+                    cursor.execute(select_query, (status, limit))
+                else:
+                    select_query = """
+                    SELECT * FROM strategy_improvements
+                    ORDER BY created_at DESC
+                    LIMIT %s
+                    """
+                    cursor.execute(select_query, (limit,))
             
-            improvements = cursor.fetchall()
+                improvements = cursor.fetchall()
             
-            cursor.close()
-            return improvements
+                cursor.close()
+                return improvements
             
         except Error as e:
             self.logger.error(f"전략 개선 제안 조회 오류: {e}")
@@ -124,59 +128,40 @@ class ReflectionViewer:
     def get_reflection_summary(self, days: int = 30) -> Dict[str, Any]:
         """반성 요약 정보"""
         try:
-            cursor = self.connection.cursor(dictionary=True)
-            
-            # 전체 반성 수
-            cursor.execute("""
-                SELECT COUNT(*) as total_reflections
-                FROM trading_reflections
-                WHERE created_at >= DATE_SUB(NOW(), INTERVAL %s DAY)
-            """, (days,))
-            total_reflections = cursor.fetchone()['total_reflections']
-            
-            # 반성 유형별 통계
-            cursor.execute("""
-                SELECT reflection_type, COUNT(*) as count
-                FROM trading_reflections
-                WHERE created_at >= DATE_SUB(NOW(), INTERVAL %s DAY)
-                GROUP BY reflection_type
-            """, (days,))
-            reflection_types = {row['reflection_type']: row['count'] for row in cursor.fetchall()}
+            with pooled_connection() as connection:
+                cursor = connection.cursor(dictionary=True)
             
-            # 평균 성과 점수
-            cursor.execute("""
-                SELECT AVG(performance_score) as avg_performance_score
-                FROM trading_reflections
-                WHERE created_at >= DATE_SUB(NOW(), INTERVAL %s DAY)
-            """, (days,))
-            avg_performance = cursor.fetchone()['avg_performance_score'] or 0
+                # 반성 수/유형별 통계/평균 성과 점수 (시간별/일별 집계 테이블 사용)
+                totals_cursor = connection.cursor()
+                totals = get_reflection_totals(totals_cursor, datetime.now() - timedelta(days=days))
+                totals_cursor.close()
             
-            # 최근 학습 인사이트 수
-            cursor.execute("""
-                SELECT COUNT(*) as recent_insights
-                FROM learning_insights
-                WHERE created_at >= DATE_SUB(NOW(), INTERVAL %s DAY)
-            """, (days,))
-            recent_insights = cursor.fetchone()['recent_insights']
+                # 최근 학습 인사이트 수
+                cursor.execute("""
+                    SELECT COUNT(*) as recent_insights
+                    FROM learning_insights
+                    WHERE created_at >= DATE_SUB(NOW(), INTERVAL %s DAY)
+                """, (days,))
+                recent_insights = cursor.fetchone()['recent_insights']
             
-            # 최근 전략 개선 제안 수
-            cursor.execute("""
-                SELECT COUNT(*) as recent_improvements
-                FROM strategy_improvements
-                WHERE created_at >= DATE_SUB(NOW(), INTERVAL %s DAY)
-            """, (days,))
-            recent_improvements = cursor.fetchone()['recent_improvements']
+                # 최근 전략 개선 제안 수
+                cursor.execute("""
+                    SELECT COUNT(*) as recent_improvements
+                    FROM strategy_improvements
+                    WHERE created_at >= DATE_SUB(NOW(), INTERVAL %s DAY)
+                """, (days,))
+                recent_improvements = cursor.fetchone()['recent_improvements']
             
-            cursor.close()
+                cursor.close()
             
-            return {
-                'total_reflections': total_reflections,
-                'reflection_types': reflection_types,
-                'avg_performance_score': avg_performance,
-                'recent_insights': recent_insights,
-                'recent_improvements': recent_improvements,
-                'period_days': days
-            }
+                return {
+                    'total_reflections': totals.total_reflections,
+                    'reflection_types': totals.reflection_types,
+                    'avg_performance_score': totals.avg_performance_score,
+                    'recent_insights': recent_insights,
+                    'recent_improvements': recent_improvements,
+                    'period_days': days
+                }
             
         except Error as e:
             self.logger.error(f"반성 요약 정보 조회 오류: {e}")